@@ -0,0 +1,94 @@
+"""Shared helpers for pg-mcp benchmarks.
+
+Benchmarks run against the fixture databases in ``fixtures/`` (see
+``fixtures/Makefile``) and read connection settings from the usual
+``DATABASE_*`` environment variables. ``DATABASE_NAME`` defaults to the large
+fixture, ``saas_crm_large``.
+"""
+
+import os
+import statistics
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from pg_mcp.config.settings import DatabaseConfig
+
+LARGE_FIXTURE_DB = "saas_crm_large"
+
+
+def fixture_db_config(name: str | None = None) -> DatabaseConfig:
+    """Build a DatabaseConfig for a fixture database.
+
+    Args:
+        name: Database name; defaults to ``$DATABASE_NAME`` or the large fixture.
+
+    Returns:
+        DatabaseConfig: Configuration with small pool sizes suited to benchmarks.
+    """
+    return DatabaseConfig(
+        name=name or os.environ.get("DATABASE_NAME", LARGE_FIXTURE_DB),
+        min_pool_size=1,
+        max_pool_size=4,
+    )
+
+
+class CountingConnection:
+    """Connection proxy that counts query round trips."""
+
+    _QUERY_METHODS = frozenset({"fetch", "fetchval", "fetchrow", "execute", "executemany"})
+
+    def __init__(self, conn: Any, counter: list[int]) -> None:
+        """Wrap ``conn`` and record round trips into ``counter[0]``."""
+        self._conn = conn
+        self._counter = counter
+
+    def __getattr__(self, name: str) -> Any:
+        """Proxy attribute access, counting query methods."""
+        attr = getattr(self._conn, name)
+        if name in self._QUERY_METHODS:
+
+            async def counted(*args: Any, **kwargs: Any) -> Any:
+                self._counter[0] += 1
+                return await attr(*args, **kwargs)
+
+            return counted
+        return attr
+
+
+class CountingPool:
+    """Pool proxy whose connections count query round trips."""
+
+    def __init__(self, pool: Any) -> None:
+        """Wrap an asyncpg pool."""
+        self._pool = pool
+        self.round_trips = [0]
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[CountingConnection]:
+        """Acquire a counting connection from the wrapped pool."""
+        async with self._pool.acquire() as conn:
+            yield CountingConnection(conn, self.round_trips)
+
+    def reset(self) -> None:
+        """Reset the round-trip counter."""
+        self.round_trips[0] = 0
+
+
+async def time_async(func: Callable[[], Awaitable[Any]], repeat: int = 5) -> tuple[float, float]:
+    """Time an async callable.
+
+    Args:
+        func: Zero-argument coroutine factory to time.
+        repeat: Number of timed runs.
+
+    Returns:
+        tuple: (median_ms, min_ms) over all runs.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), min(samples)
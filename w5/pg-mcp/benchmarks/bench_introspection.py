@@ -0,0 +1,82 @@
+"""Benchmark: schema introspection round trips and latency.
+
+Introspects the large fixture database, then adds synthetic tables in a
+scratch schema and introspects again. The round-trip count must stay constant
+while the table count grows.
+
+Usage:
+    make -C fixtures create-large
+    uv run python benchmarks/bench_introspection.py [--extra 0,250,1000]
+"""
+
+import argparse
+import asyncio
+
+from _common import CountingPool, fixture_db_config, time_async
+
+from pg_mcp.db.introspection import SchemaIntrospector
+from pg_mcp.db.pool import create_pool
+
+SCRATCH_SCHEMA = "pg_mcp_bench"
+
+
+async def add_synthetic_tables(pool: object, count: int) -> None:
+    """Create ``count`` tables with a PK, FK, unique column and index."""
+    async with pool.acquire() as conn:  # type: ignore[attr-defined]
+        await conn.execute(f"DROP SCHEMA IF EXISTS {SCRATCH_SCHEMA} CASCADE")
+        await conn.execute(f"CREATE SCHEMA {SCRATCH_SCHEMA}")
+        await conn.execute(f"CREATE TABLE {SCRATCH_SCHEMA}.root (id serial PRIMARY KEY)")
+        for i in range(count):
+            await conn.execute(
+                f"""
+                CREATE TABLE {SCRATCH_SCHEMA}.t{i} (
+                    id serial PRIMARY KEY,
+                    root_id integer REFERENCES {SCRATCH_SCHEMA}.root(id),
+                    code text UNIQUE,
+                    created_at timestamptz DEFAULT now()
+                );
+                CREATE INDEX ON {SCRATCH_SCHEMA}.t{i} (created_at);
+                """
+            )
+
+
+async def drop_synthetic_tables(pool: object) -> None:
+    """Drop the scratch schema."""
+    async with pool.acquire() as conn:  # type: ignore[attr-defined]
+        await conn.execute(f"DROP SCHEMA IF EXISTS {SCRATCH_SCHEMA} CASCADE")
+
+
+async def main(extra_counts: list[int]) -> None:
+    """Run the benchmark for each synthetic table count."""
+    config = fixture_db_config()
+    pool = await create_pool(config)
+    counting = CountingPool(pool)
+    introspector = SchemaIntrospector(counting, config.name)  # type: ignore[arg-type]
+
+    print(f"database={config.name}")
+    print(f"{'extra':>8} {'tables':>8} {'round_trips':>12} {'median_ms':>10} {'min_ms':>10}")
+    try:
+        for extra in extra_counts:
+            if extra:
+                await add_synthetic_tables(pool, extra)
+            else:
+                await drop_synthetic_tables(pool)
+
+            counting.reset()
+            schema = await introspector.introspect()
+            round_trips = counting.round_trips[0]
+            median_ms, min_ms = await time_async(introspector.introspect)
+            print(
+                f"{extra:>8} {len(schema.tables):>8} {round_trips:>12} "
+                f"{median_ms:>10.1f} {min_ms:>10.1f}"
+            )
+    finally:
+        await drop_synthetic_tables(pool)
+        await pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--extra", default="0,250,1000", help="Synthetic table counts")
+    args = parser.parse_args()
+    asyncio.run(main([int(n) for n in args.extra.split(",")]))
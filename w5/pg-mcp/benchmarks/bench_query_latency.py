@@ -0,0 +1,99 @@
+"""Benchmark: per-query vs. per-connection session setup.
+
+Runs a trivial ``SELECT 1`` through SQLExecutor on two pools:
+
+- per-query: a plain pool; every query opens a read-only transaction and
+  sets statement_timeout, search_path (and the role, if configured) first
+- per-connection: a pool created with session setup; the query runs alone,
+  read-only through ``default_transaction_read_only``
+
+Reports latency and the statements sent per query (the pool's reset on
+release is the same in both modes and not counted).
+
+Usage:
+    make -C fixtures create-large
+    uv run python benchmarks/bench_query_latency.py [--queries 2000] [--role readonly]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from _common import CountingPool, fixture_db_config
+
+from pg_mcp.config.settings import SecurityConfig
+from pg_mcp.db.pool import create_pool
+from pg_mcp.services.sql_executor import SQLExecutor
+
+
+class TransactionCountingPool(CountingPool):
+    """Counting pool that also counts BEGIN and COMMIT round trips."""
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """Acquire a connection whose transactions are counted as two round trips."""
+        async with super().acquire() as conn:
+            transaction = conn.transaction
+
+            def counted_transaction(**kwargs: Any) -> Any:
+                self.round_trips[0] += 2
+                return transaction(**kwargs)
+
+            conn.transaction = counted_transaction
+            yield conn
+
+
+async def measure(
+    executor: SQLExecutor, pool: CountingPool, queries: int
+) -> tuple[float, float, float]:
+    """Run ``SELECT 1`` sequentially; return median and p95 ms and round trips per query."""
+    for _ in range(50):  # Warm up connections and the statement cache
+        await executor.execute("SELECT 1")
+
+    pool.reset()
+    samples = []
+    for _ in range(queries):
+        start = time.perf_counter()
+        await executor.execute("SELECT 1")
+        samples.append((time.perf_counter() - start) * 1000)
+    p95 = statistics.quantiles(samples, n=20)[-1]
+    return statistics.median(samples), p95, pool.round_trips[0] / queries
+
+
+async def main(queries: int, role: str | None) -> None:
+    """Compare SELECT 1 latency with per-query and per-connection session setup."""
+    config = fixture_db_config()
+    security = SecurityConfig(readonly_role=role)
+    plain_pool = await create_pool(config)
+    session_pool = await create_pool(config, security)
+    try:
+        per_query_pool = TransactionCountingPool(plain_pool)
+        per_connection_pool = TransactionCountingPool(session_pool)
+        modes = {
+            "per-query": (SQLExecutor(per_query_pool, security, config), per_query_pool),
+            "per-connection": (
+                SQLExecutor(per_connection_pool, security, config, session_preconfigured=True),
+                per_connection_pool,
+            ),
+        }
+
+        print(f"database={config.name} queries={queries} role={role}")
+        print(f"{'setup':<15} {'median_ms':>10} {'p95_ms':>8} {'round_trips':>12}")
+        for name, (executor, pool) in modes.items():
+            median, p95, round_trips = await measure(executor, pool, queries)
+            print(f"{name:<15} {median:>10.3f} {p95:>8.3f} {round_trips:>12.1f}")
+    finally:
+        await plain_pool.close()
+        await session_pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=2000, help="Timed queries per mode")
+    parser.add_argument("--role", default=None, help="Read-only role to switch to")
+    args = parser.parse_args()
+    asyncio.run(main(args.queries, args.role))
@@ -0,0 +1,138 @@
+"""Benchmark: memory and construction time of cached schema representations.
+
+Introspects the large fixture once and replicates its tables (renamed, with
+foreign keys pointing into the same replica) until the schema reaches the
+requested size, then compares the pydantic models with CompactSchema:
+
+- build: pydantic models validated from the catalog data, and the compact
+  copy built from those models
+- memory: traced allocations of each representation held on its own, and
+  ``estimate_schema_bytes`` (what the cache weighs entries by)
+- materialize: pydantic models rebuilt from the compact form, for the whole
+  schema and for a prompt-sized subset of tables
+
+Usage:
+    make -C fixtures create-large
+    uv run python benchmarks/bench_schema_memory.py [--tables 10000] [--repeat 3]
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from _common import fixture_db_config
+
+from pg_mcp.cache import CompactSchema, estimate_schema_bytes
+from pg_mcp.db.introspection import SchemaIntrospector
+from pg_mcp.db.pool import create_pool
+from pg_mcp.models.schema import DatabaseSchema
+
+PROMPT_TABLES = 12
+
+
+async def load_fixture() -> dict[str, Any]:
+    """Introspect the fixture database and dump it to plain data."""
+    config = fixture_db_config()
+    pool = await create_pool(config)
+    try:
+        schema = await SchemaIntrospector(pool, config.name).introspect()
+    finally:
+        await pool.close()
+    return schema.model_dump()
+
+
+def replicate(document: dict[str, Any], table_count: int) -> dict[str, Any]:
+    """Grow a dumped schema to ``table_count`` tables by renaming copies.
+
+    The result is round-tripped through JSON so that, like rows fetched from
+    the catalog, no two string values share an object.
+    """
+    base = document["tables"]
+    tables = []
+    for n in range(-(-table_count // len(base))):
+        suffix = f"_r{n}" if n else ""
+        for table in base:
+            copy = json.loads(json.dumps(table))
+            copy["table_name"] += suffix
+            for fk in copy["foreign_keys"]:
+                fk["referenced_table"] += suffix
+                fk["constraint_name"] += suffix
+            for idx in copy["indexes"]:
+                idx["name"] += suffix
+            tables.append(copy)
+    return json.loads(json.dumps({**document, "tables": tables[:table_count]}))
+
+
+def timed(func: Callable[[], Any], repeat: int) -> tuple[Any, float]:
+    """Run ``func`` ``repeat`` times; return the last result and median ms."""
+    samples = []
+    result = None
+    for _ in range(repeat):
+        result = None
+        gc.collect()
+        start = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return result, statistics.median(samples)
+
+
+def traced_mb(build: Callable[[], Any]) -> tuple[Any, float]:
+    """Build an object and measure the memory it retains, in MiB."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current / 2**20
+
+
+def build_compact(document: dict[str, Any]) -> CompactSchema:
+    """Build a compact schema via the models, keeping only the compact form."""
+    return CompactSchema(DatabaseSchema.model_validate(document))
+
+
+def measure_build(document: dict[str, Any], repeat: int) -> tuple[float, float, int, int]:
+    """Time building both forms; return their build ms and estimated bytes."""
+    schema, model_ms = timed(lambda: DatabaseSchema.model_validate(document), repeat)
+    compact, compact_ms = timed(lambda: CompactSchema(schema), repeat)
+    return model_ms, compact_ms, estimate_schema_bytes(schema), estimate_schema_bytes(compact)
+
+
+async def main(table_count: int, repeat: int) -> None:
+    """Compare pydantic and compact schema representations."""
+    document = replicate(await load_fixture(), table_count)
+    columns = sum(len(table["columns"]) for table in document["tables"])
+
+    model_ms, compact_ms, model_bytes, compact_bytes = measure_build(document, repeat)
+    _, model_mb = traced_mb(lambda: DatabaseSchema.model_validate(document))
+    compact, compact_mb = traced_mb(lambda: build_compact(document))
+
+    gc.collect()
+    _, full_ms = timed(lambda: compact.to_schema(), repeat)
+    subset = range(0, table_count, max(table_count // PROMPT_TABLES, 1))
+    _, subset_ms = timed(lambda: compact.to_schema(list(subset)[:PROMPT_TABLES]), repeat)
+
+    print(f"database={document['database_name']} tables={table_count} columns={columns}")
+    print(f"{'form':<8} {'build_ms':>9} {'traced_mb':>10} {'estimated_mb':>13}")
+    print(f"{'pydantic':<8} {model_ms:>9.1f} {model_mb:>10.1f} {model_bytes / 2**20:>13.1f}")
+    print(
+        f"{'compact':<8} {compact_ms:>9.1f} {compact_mb:>10.1f} {compact_bytes / 2**20:>13.1f}"
+        "  (build_ms: from models)"
+    )
+    print(f"materialize_full_ms={full_ms:.1f}")
+    print(f"materialize_{PROMPT_TABLES}_tables_ms={subset_ms:.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tables", type=int, default=10_000, help="Tables after replication")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per measurement")
+    args = parser.parse_args()
+    asyncio.run(main(args.tables, args.repeat))
@@ -0,0 +1,113 @@
+"""Benchmark: prompt size and latency with relevance-based schema pruning.
+
+Builds the SQL generation prompt for a set of questions against the fixture
+databases, once with the full schema and once with the schema pruned by
+SchemaRetriever, and reports approximate prompt tokens (also for the pruned schema in the
+compact format) and retrieval time.
+With ``--e2e`` it also times SQL generation end to end (needs OPENAI_*).
+
+Usage:
+    make -C fixtures create-all
+    uv run python benchmarks/bench_schema_pruning.py [--e2e]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from _common import fixture_db_config, time_async
+
+from pg_mcp.config.settings import OpenAIConfig, SchemaRetrievalConfig
+from pg_mcp.db.introspection import SchemaIntrospector
+from pg_mcp.db.pool import create_pool
+from pg_mcp.models.schema import DatabaseSchema
+from pg_mcp.prompts.schema_context import estimate_tokens, render_compact_context
+from pg_mcp.prompts.sql_generation import SQL_GENERATION_SYSTEM_PROMPT, build_user_prompt
+from pg_mcp.services.schema_retriever import SchemaRetriever
+from pg_mcp.services.sql_generator import SQLGenerator
+
+QUESTIONS = {
+    "blog_small": [
+        "How many users are there?",
+        "Show all posts with their author names",
+        "Which tags are used by the most posts?",
+    ],
+    "ecommerce_medium": [
+        "Total order amount per customer in the last 30 days",
+        "Which products have the highest average review rating?",
+        "List warehouses with low inventory for product variants",
+    ],
+    "saas_crm_large": [
+        "Open deals by pipeline stage with their account names",
+        "Invoices with unpaid payments per subscription plan",
+        "Tickets per category created this month and their comments count",
+        "Which campaign members became leads?",
+    ],
+}
+
+
+async def load_schema(name: str) -> DatabaseSchema:
+    """Introspect a fixture database."""
+    pool = await create_pool(fixture_db_config(name))
+    try:
+        return await SchemaIntrospector(pool, name).introspect()
+    finally:
+        await pool.close()
+
+
+async def main(e2e: bool) -> None:
+    """Run the benchmark for every fixture database."""
+    retriever = SchemaRetriever(SchemaRetrievalConfig(enabled=True))
+    generator = SQLGenerator(OpenAIConfig()) if e2e else None
+    system_tokens = estimate_tokens(SQL_GENERATION_SYSTEM_PROMPT)
+
+    print(f"system_prompt_tokens={system_tokens}")
+    print(
+        f"{'database':<18} {'tables':>6} {'kept':>5} {'full_tok':>9} {'pruned_tok':>10} "
+        f"{'compact_tok':>11} {'select_ms':>9} {'full_ms':>8} {'pruned_ms':>9}  question"
+    )
+    for name, questions in QUESTIONS.items():
+        schema = await load_schema(name)
+        retriever.select("warm up index", schema)
+        for question in questions:
+            start = time.perf_counter()
+            pruned = retriever.select(question, schema)
+            select_ms = (time.perf_counter() - start) * 1000
+
+            full_tokens = estimate_tokens(build_user_prompt(question, schema))
+            pruned_tokens = estimate_tokens(build_user_prompt(question, pruned))
+            compact_tokens = estimate_tokens(
+                build_user_prompt(question, pruned, schema_context=render_compact_context(pruned))
+            )
+
+            full_ms = pruned_ms = float("nan")
+            if generator is not None:
+                full_ms, _ = await time_async(
+                    lambda s=schema, q=question: generator.generate(q, s), 3
+                )
+                pruned_ms, _ = await time_async(
+                    lambda s=pruned, q=question: generator.generate(q, s), 3
+                )
+
+            print(
+                f"{name:<18} {len(schema.tables):>6} {len(pruned.tables):>5} "
+                f"{full_tokens:>9} {pruned_tokens:>10} {compact_tokens:>11} {select_ms:>9.2f} "
+                f"{full_ms:>8.0f} {pruned_ms:>9.0f}  {question}"
+            )
+
+    # Index build cost for the largest schema
+    schema = await load_schema("saas_crm_large")
+    builds = []
+    for _ in range(5):
+        start = time.perf_counter()
+        SchemaRetriever(SchemaRetrievalConfig(enabled=True)).select("deal", schema)
+        builds.append((time.perf_counter() - start) * 1000)
+    print(f"index_build_ms(saas_crm_large)={statistics.median(builds):.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--e2e", action="store_true", help="Also time SQL generation via OpenAI")
+    args = parser.parse_args()
+    asyncio.run(main(args.e2e))
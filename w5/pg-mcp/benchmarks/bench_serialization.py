@@ -0,0 +1,169 @@
+"""Benchmark: per-value vs. column-wise result serialization, and payload size.
+
+Serializes synthetic query results (rows as returned by asyncpg, converted to
+dicts) with the previous per-value serializer, which ran an ``isinstance``
+chain on every cell, and with ``SQLExecutor._serialize_results``, which picks
+one converter per column and skips JSON-compatible columns. Checks that both
+produce identical output. Also times ``SQLExecutor._serialize_columns`` on
+the same values as row tuples (the arrays and columnar result formats, which
+build no dicts), and reports the JSON size of the result in each format.
+Needs no database.
+
+Shapes:
+
+- numeric: wide, numeric-heavy (integers, numerics, floats)
+- mixed: typical column types (text, timestamptz, numeric, uuid, bool, jsonb,
+  int[], bytea, interval) with some NULLs
+- plain: integers, text and booleans only (every column is skipped, so no
+  speedup is reported)
+
+``per_value_ms`` and ``column_ms`` serialize prepared row dicts;
+``columnar_ms`` includes transposing the row tuples into columns.
+
+Usage:
+    uv run python benchmarks/bench_serialization.py [--rows 100000] [--repeat 5]
+"""
+
+import argparse
+import datetime
+import decimal
+import json
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock
+
+from pg_mcp.config.settings import DatabaseConfig, SecurityConfig
+from pg_mcp.services.sql_executor import SQLExecutor
+
+
+def legacy_serialize(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Serialize results value by value, as SQLExecutor did previously."""
+
+    def serialize_value(value: Any) -> Any:
+        if value is None:
+            return None
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            return value.isoformat()
+        if isinstance(value, datetime.timedelta):
+            return str(value)
+        if isinstance(value, decimal.Decimal):
+            return float(value)
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        if isinstance(value, bytes):
+            return value.hex()
+        if isinstance(value, (list, tuple)):
+            return [serialize_value(v) for v in value]
+        if isinstance(value, dict):
+            return {k: serialize_value(v) for k, v in value.items()}
+        return value
+
+    return [{key: serialize_value(value) for key, value in row.items()} for row in results]
+
+
+def numeric_row(i: int) -> dict[str, Any]:
+    """Build a wide, numeric-heavy row."""
+    row: dict[str, Any] = {"id": i, "account_id": i % 977}
+    for n in range(6):
+        row[f"amount_{n}"] = decimal.Decimal(i * (n + 1)) / 100
+    for n in range(4):
+        row[f"ratio_{n}"] = i / (n + 3)
+    return row
+
+
+def mixed_row(i: int) -> dict[str, Any]:
+    """Build a row with typical column types."""
+    start = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+    return {
+        "id": i,
+        "email": f"user{i}@example.com",
+        "created_at": start + datetime.timedelta(minutes=i),
+        "birthday": datetime.date(1990, 1, 1) + datetime.timedelta(days=i % 9000),
+        "balance": decimal.Decimal(i) / 7 if i % 5 else None,
+        "external_id": uuid.UUID(int=i),
+        "is_active": i % 2 == 0,
+        "settings": json.dumps({"theme": "dark", "n": i}),
+        "tag_ids": [i, i + 1, i + 2],
+        "avatar": i.to_bytes(8, "big") if i % 3 else None,
+        "session_length": datetime.timedelta(seconds=i % 86400),
+    }
+
+
+def plain_row(i: int) -> dict[str, Any]:
+    """Build a row of natively JSON-compatible values."""
+    return {"id": i, "name": f"name {i}", "status": "active", "score": i % 100, "flag": True}
+
+
+SHAPES: dict[str, Callable[[int], dict[str, Any]]] = {
+    "numeric": numeric_row,
+    "mixed": mixed_row,
+    "plain": plain_row,
+}
+
+
+def timed(serialize: Callable[[Any], Any], make_input: Callable[[], Any], repeat: int) -> float:
+    """Serialize fresh input from ``make_input``; return the median ms."""
+    samples = []
+    for _ in range(repeat):
+        data = make_input()
+        start = time.perf_counter()
+        serialize(data)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(row_count: int, repeat: int) -> None:
+    """Compare per-value and column-wise serialization and result formats."""
+    executor = SQLExecutor(MagicMock(), SecurityConfig(), DatabaseConfig())
+
+    def serialize_columnar(records: list[tuple[Any, ...]]) -> list[list[Any]]:
+        return executor._serialize_columns([list(c) for c in zip(*records, strict=True)])
+
+    sizes = {}
+    print(f"rows={row_count}")
+    print(
+        f"{'shape':<8} {'columns':>8} {'per_value_ms':>13} {'column_ms':>10} {'speedup':>8}"
+        f" {'columnar_ms':>12}"
+    )
+    for name, make_row in SHAPES.items():
+        rows = [make_row(i) for i in range(row_count)]
+        expected = legacy_serialize(rows)
+        if executor._serialize_results([dict(row) for row in rows]) != expected:
+            raise AssertionError(f"{name}: column-wise output differs")
+        records = [tuple(row.values()) for row in rows]
+        columnar = serialize_columnar(records)
+        if columnar != [[row[c] for row in expected] for c in rows[0]]:
+            raise AssertionError(f"{name}: columnar output differs")
+
+        def copy_rows(rows: list[dict[str, Any]] = rows) -> list[dict[str, Any]]:
+            return [dict(row) for row in rows]
+
+        legacy_ms = timed(legacy_serialize, copy_rows, repeat)
+        column_ms = timed(executor._serialize_results, copy_rows, repeat)
+        columnar_ms = timed(serialize_columnar, lambda records=records: records, repeat)
+        speedup = f"{legacy_ms / column_ms:.1f}x" if column_ms >= 0.1 else "-"
+        print(
+            f"{name:<8} {len(rows[0]):>8} {legacy_ms:>13.1f} {column_ms:>10.1f} {speedup:>8}"
+            f" {columnar_ms:>12.1f}"
+        )
+
+        sizes[name] = [
+            len(json.dumps(payload))
+            for payload in (expected, [list(r) for r in zip(*columnar, strict=True)], columnar)
+        ]
+
+    print(f"{'shape':<8} {'objects_kb':>11} {'arrays_kb':>10} {'columnar_kb':>12}")
+    for name, (objects, arrays, columnar_size) in sizes.items():
+        objects_kb, arrays_kb, columnar_kb = objects / 1024, arrays / 1024, columnar_size / 1024
+        print(f"{name:<8} {objects_kb:>11.0f} {arrays_kb:>10.0f} {columnar_kb:>12.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows per result")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per serializer")
+    args = parser.parse_args()
+    main(args.rows, args.repeat)
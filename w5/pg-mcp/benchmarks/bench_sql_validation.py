@@ -0,0 +1,178 @@
+"""Benchmark: single-pass vs. per-check SQL validation of large queries.
+
+Validates generated queries with deep CTE chains and nested subqueries using
+``SQLValidator.find_violations``, which walks the AST once and dispatches
+each node by type, and with the previous checks, which ran one ``find_all``
+traversal each for blocked functions, tables, columns and subquery safety.
+Checks that both give the same verdict on every query, including variants
+that call a blocked function, read a blocked table or column, or nest a
+non-SELECT subquery. Parsing is timed separately and excluded from the
+validation timings. Needs no database.
+
+Shapes (``--depth`` sets the nesting):
+
+- cte_chain: a WITH chain of ``depth`` CTEs, each filtering the previous one
+  with a correlated subquery
+- nested: subqueries nested ``depth`` levels deep in FROM and WHERE
+- wide: a single SELECT with ``depth * 10`` computed columns
+
+Usage:
+    uv run python benchmarks/bench_sql_validation.py [--depth 40] [--repeat 20]
+"""
+
+# ruff: noqa: S608  (the queries are built from constants, for parsing only)
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+
+from sqlglot import exp
+
+from pg_mcp.config.settings import SecurityConfig
+from pg_mcp.services.sql_analysis import analyze_sql
+from pg_mcp.services.sql_validator import SQLValidator
+
+
+def legacy_violation(validator: SQLValidator, statement: exp.Expression) -> str | None:
+    """Find the first violation with one traversal per check, as previously."""
+    for func in statement.find_all(exp.Func):
+        func_name = func.name.lower() if func.name else ""
+        if func_name in validator.blocked_functions:
+            return f"Function '{func_name}' is blocked for security reasons"
+    if validator.blocked_tables:
+        for table in statement.find_all(exp.Table):
+            table_name = table.name.lower() if table.name else ""
+            if table_name in validator.blocked_tables:
+                return f"Access to table '{table_name}' is not allowed"
+    if validator.blocked_columns:
+        for column in statement.find_all(exp.Column):
+            column_name = column.name.lower() if column.name else ""
+            if column_name in validator.blocked_columns:
+                return f"Access to column '{column_name}' is not allowed"
+            if column.table:
+                qualified_name = f"{column.table.lower()}.{column_name}"
+                if qualified_name in validator.blocked_columns:
+                    return f"Access to column '{qualified_name}' is not allowed"
+    for subquery in statement.find_all(exp.Subquery):
+        inner_stmt = subquery.this
+        if inner_stmt:
+            for forbidden_type in validator.FORBIDDEN_STATEMENT_TYPES:
+                if isinstance(inner_stmt, forbidden_type):
+                    stmt_name = forbidden_type.__name__.upper()
+                    return f"{stmt_name} statements in subqueries are not allowed"
+            if not isinstance(inner_stmt, (exp.Select, exp.With)):
+                return "Subqueries must contain only SELECT statements"
+    return None
+
+
+def cte_chain(depth: int, inject: str = "") -> str:
+    """Build a WITH chain of ``depth`` CTEs with correlated subqueries."""
+    ctes = ["c0 AS (SELECT id, account_id, amount, created_at FROM orders)"]
+    for i in range(1, depth):
+        ctes.append(
+            f"c{i} AS (SELECT p.id, p.account_id, p.amount * 1.0{i % 10} AS amount, "
+            f"date_trunc('day', p.created_at) AS created_at FROM c{i - 1} p "
+            f"WHERE p.amount > (SELECT avg(o.amount) FROM orders o "
+            f"WHERE o.account_id = p.account_id AND o.status <> 'void{i}'))"
+        )
+    return (
+        f"WITH {', '.join(ctes)} SELECT a.name, sum(c.amount) AS total{inject} "
+        f"FROM c{depth - 1} c JOIN accounts a ON a.id = c.account_id "
+        f"GROUP BY a.name ORDER BY total DESC"
+    )
+
+
+def nested(depth: int, inject: str = "") -> str:
+    """Build subqueries nested ``depth`` levels deep."""
+    sql = f"SELECT id, account_id, amount, coalesce(status, 'new') AS status{inject} FROM orders"
+    for i in range(depth):
+        sql = (
+            f"SELECT s{i}.id, s{i}.account_id, s{i}.amount + {i} AS amount, s{i}.status "
+            f"FROM ({sql}) AS s{i} "
+            f"WHERE s{i}.account_id IN (SELECT id FROM accounts WHERE tier >= {i % 3})"
+        )
+    return sql
+
+
+def wide(depth: int, inject: str = "") -> str:
+    """Build a single SELECT with ``depth * 10`` computed columns."""
+    columns = [
+        f"round(o.amount * {i}, 2) AS a{i}, upper(a.name || '{i}') AS n{i}"
+        for i in range(depth * 5)
+    ]
+    return (
+        f"SELECT {', '.join(columns)}{inject} FROM orders o "
+        f"JOIN accounts a ON a.id = o.account_id WHERE o.created_at > now() - interval '7 days'"
+    )
+
+
+SHAPES: dict[str, Callable[..., str]] = {"cte_chain": cte_chain, "nested": nested, "wide": wide}
+
+# Select-list additions that make a query unsafe, by violated check
+INJECTIONS = {
+    "safe": "",
+    "function": ", pg_sleep(1) AS pause",
+    "table": ", (SELECT count(*) FROM audit_log) AS audits",
+    "column": ", (SELECT max(u.password_hash) FROM users u) AS hash",
+    "subquery": ", (SELECT id FROM accounts UNION SELECT id FROM orders) AS ids",
+}
+
+
+def timed(func: Callable[[], object], repeat: int) -> float:
+    """Run ``func`` ``repeat`` times; return the median ms."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(depth: int, repeat: int) -> None:
+    """Compare single-pass and per-check validation on large queries."""
+    validator = SQLValidator(
+        SecurityConfig(),
+        blocked_tables=["audit_log", "api_keys"],
+        blocked_columns=["password_hash", "users.ssn"],
+    )
+
+    print(f"depth={depth}")
+    print(
+        f"{'shape':<10} {'nodes':>7} {'parse_ms':>9} {'per_check_ms':>13} "
+        f"{'single_ms':>10} {'speedup':>8} {'queries/s':>10}"
+    )
+    for name, build in SHAPES.items():
+        for injection, addition in INJECTIONS.items():
+            statement = analyze_sql(build(depth, addition)).statement
+            if statement is None:
+                raise AssertionError(f"{name}/{injection}: not a single statement")
+            violations = validator.find_violations(statement)
+            expected = legacy_violation(validator, statement)
+            if (violations[0] if violations else None) != expected:
+                raise AssertionError(f"{name}/{injection}: verdicts differ")
+            if (expected is None) != (injection == "safe"):
+                raise AssertionError(f"{name}/{injection}: unexpected verdict {expected!r}")
+
+        sql = build(depth)
+        statement = analyze_sql(sql).statement
+        if statement is None:
+            raise AssertionError(f"{name}: not a single statement")
+        nodes = sum(1 for _ in statement.walk())
+        parse_ms = timed(lambda sql=sql: analyze_sql(sql), repeat)
+        legacy_ms = timed(
+            lambda statement=statement: legacy_violation(validator, statement), repeat
+        )
+        single_ms = timed(lambda statement=statement: validator.find_violations(statement), repeat)
+        print(
+            f"{name:<10} {nodes:>7} {parse_ms:>9.2f} {legacy_ms:>13.2f} {single_ms:>10.2f} "
+            f"{legacy_ms / single_ms:>7.1f}x {1000 / single_ms:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depth", type=int, default=40, help="CTEs, nesting levels or width")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per validator")
+    args = parser.parse_args()
+    main(args.depth, args.repeat)
@@ -0,0 +1,61 @@
+"""Benchmark: cold vs. warm schema cache startup.
+
+Cold start introspects the database on boot; warm start serves the on-disk
+snapshot written by the previous run and revalidates it in the background.
+Reports time until the schema is servable and the snapshot file size.
+
+Usage:
+    make -C fixtures create-large
+    uv run python benchmarks/bench_startup.py [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import tempfile
+
+from _common import fixture_db_config, time_async
+
+from pg_mcp.cache import SchemaCache, SchemaSnapshotStore
+from pg_mcp.config.settings import CacheConfig
+from pg_mcp.db.pool import create_pool
+
+
+async def main(repeat: int) -> None:
+    """Time cold and warm startup of the schema cache."""
+    config = fixture_db_config()
+    pool = await create_pool(config)
+    started: list[SchemaCache] = []
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        cache_config = CacheConfig(snapshot_dir=snapshot_dir)
+
+        async def cold_start() -> None:
+            await SchemaCache(cache_config).load(config.name, pool)
+
+        async def warm_start() -> None:
+            cache = SchemaCache(cache_config)
+            if await cache.warm_start(config.name, pool) is None:
+                raise RuntimeError("snapshot missing")
+            started.append(cache)
+
+        try:
+            cold_median, cold_min = await time_async(cold_start, repeat)
+            warm_median, warm_min = await time_async(warm_start, repeat)
+            # Cancel pending background revalidations before reporting
+            for cache in started:
+                await cache.stop_auto_refresh()
+
+            snapshot = SchemaSnapshotStore(snapshot_dir).path_for(config.name)
+            print(f"database={config.name} snapshot_bytes={snapshot.stat().st_size}")
+            print(f"{'mode':>6} {'median_ms':>10} {'min_ms':>10}")
+            print(f"{'cold':>6} {cold_median:>10.1f} {cold_min:>10.1f}")
+            print(f"{'warm':>6} {warm_median:>10.1f} {warm_min:>10.1f}")
+        finally:
+            await pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per mode")
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
@@ -4,8 +4,17 @@ This package provides caching functionality to improve performance by
 reducing repeated schema introspection queries.
 """
 
-from pg_mcp.cache.schema_cache import SchemaCache
+from pg_mcp.cache.compact import CompactSchema, CompactTable, StringPool, as_database_schema
+from pg_mcp.cache.schema_cache import SchemaCache, estimate_schema_bytes
+from pg_mcp.cache.snapshot import SchemaSnapshot, SchemaSnapshotStore
 
 __all__ = [
+    "CompactSchema",
+    "CompactTable",
     "SchemaCache",
+    "SchemaSnapshot",
+    "SchemaSnapshotStore",
+    "StringPool",
+    "as_database_schema",
+    "estimate_schema_bytes",
 ]
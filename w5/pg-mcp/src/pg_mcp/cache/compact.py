@@ -0,0 +1,433 @@
+"""Compact in-memory representation of cached schemas.
+
+The pydantic schema models cost roughly a kilobyte per column (instance,
+field dict and fields-set of every ColumnInfo), so a catalog with hundreds of
+thousands of columns takes hundreds of megabytes per database. CompactSchema
+holds the same information in slotted table records whose columns are stored
+as parallel tuples, with every name and type string pooled so that each
+distinct string is stored once per schema.
+
+Pydantic models are built from the compact form only where they are needed:
+for the tables that make it into a prompt, for snapshots and for incremental
+refreshes that find added, dropped or altered relations (refreshes that only
+see new row estimates patch the compact form in place). Materialized models
+are memoized weakly, so callers that use the same tables at the same time
+share one set of models.
+"""
+
+import weakref
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from pg_mcp.models.schema import DatabaseSchema, EnumTypeInfo, TableInfo
+
+# Bits of CompactTable.column_flags
+_NULLABLE = 1
+_PRIMARY_KEY = 2
+_UNIQUE = 4
+
+
+class CompactForeignKey(NamedTuple):
+    """Foreign key of a compact table."""
+
+    constraint_name: str
+    column_name: str
+    referenced_table: str
+    referenced_column: str
+
+
+class CompactIndex(NamedTuple):
+    """Index of a compact table."""
+
+    name: str
+    columns: tuple[str, ...]
+    is_unique: bool
+    index_type: str
+
+
+class StringPool:
+    """Deduplicates strings so that equal values share one object.
+
+    Example:
+        >>> pool = StringPool()
+        >>> pool("integer") is pool("".join(["int", "eger"]))
+        True
+    """
+
+    __slots__ = ("_strings",)
+
+    def __init__(self) -> None:
+        """Initialize an empty pool."""
+        self._strings: dict[str, str] = {}
+
+    def __call__(self, value: str) -> str:
+        """Get the pooled instance of a string.
+
+        Args:
+            value: String to pool.
+
+        Returns:
+            str: An equal string shared by every caller.
+        """
+        return self._strings.setdefault(value, value)
+
+    def optional(self, value: str | None) -> str | None:
+        """Get the pooled instance of an optional string.
+
+        Args:
+            value: String to pool, or None.
+
+        Returns:
+            str | None: Pooled string, or None.
+        """
+        return None if value is None else self._strings.setdefault(value, value)
+
+
+class CompactTable:
+    """Array-backed table record.
+
+    Columns are stored as parallel tuples indexed by column position; column
+    defaults and comments are None when no column has one.
+
+    Attributes:
+        schema_name: Schema name.
+        table_name: Table name.
+        comment: Table comment.
+        row_count_estimate: Estimated row count. Setting it also updates the
+            materialized table, if any.
+        column_names: Column names.
+        column_types: Column data types.
+        column_flags: Per-column bit set of nullable, primary key and unique.
+        column_defaults: Column default expressions, or None if there are none.
+        column_comments: Column comments, or None if there are none.
+        foreign_keys: Foreign keys.
+        indexes: Indexes.
+    """
+
+    __slots__ = (
+        "_materialized",
+        "_row_count_estimate",
+        "column_comments",
+        "column_defaults",
+        "column_flags",
+        "column_names",
+        "column_types",
+        "comment",
+        "foreign_keys",
+        "indexes",
+        "schema_name",
+        "table_name",
+    )
+
+    def __init__(self, table: TableInfo, pool: StringPool) -> None:
+        """Build a compact copy of a table.
+
+        Args:
+            table: Table to copy.
+            pool: String pool shared by the tables of one schema.
+        """
+        columns = table.columns
+        self.schema_name = pool(table.schema_name)
+        self.table_name = pool(table.table_name)
+        self.comment = table.comment
+        self._row_count_estimate = table.row_count_estimate
+        self.column_names = tuple(pool(col.name) for col in columns)
+        self.column_types = tuple(pool(col.data_type) for col in columns)
+        self.column_flags = bytes(
+            (_NULLABLE if col.is_nullable else 0)
+            | (_PRIMARY_KEY if col.is_primary_key else 0)
+            | (_UNIQUE if col.is_unique else 0)
+            for col in columns
+        )
+        defaults = tuple(pool.optional(col.default_value) for col in columns)
+        self.column_defaults = defaults if any(defaults) else None
+        comments = tuple(col.comment for col in columns)
+        self.column_comments = comments if any(comments) else None
+        self.foreign_keys = tuple(
+            CompactForeignKey(
+                pool(fk.constraint_name),
+                pool(fk.column_name),
+                pool(fk.referenced_table),
+                pool(fk.referenced_column),
+            )
+            for fk in table.foreign_keys
+        )
+        self.indexes = tuple(
+            CompactIndex(
+                pool(idx.name),
+                tuple(pool(name) for name in idx.columns),
+                idx.is_unique,
+                pool(idx.index_type),
+            )
+            for idx in table.indexes
+        )
+        self._materialized: weakref.ref[TableInfo] | None = weakref.ref(table)
+
+    @property
+    def full_name(self) -> str:
+        """Get fully qualified table name.
+
+        Returns:
+            str: Schema-qualified table name.
+        """
+        return f"{self.schema_name}.{self.table_name}"
+
+    @property
+    def row_count_estimate(self) -> int | None:
+        """Get the estimated row count.
+
+        Returns:
+            int | None: Estimated row count.
+        """
+        return self._row_count_estimate
+
+    @row_count_estimate.setter
+    def row_count_estimate(self, value: int | None) -> None:
+        """Set the estimated row count, on the materialized table too.
+
+        Args:
+            value: Estimated row count.
+        """
+        self._row_count_estimate = value
+        table = self._materialized() if self._materialized is not None else None
+        if table is not None:
+            table.row_count_estimate = value
+
+    def to_table(self) -> TableInfo:
+        """Materialize the table as a pydantic model.
+
+        Returns the model this record was built from, or one previously
+        materialized, while it is still referenced elsewhere.
+
+        Returns:
+            TableInfo: The table.
+        """
+        table = self._materialized() if self._materialized is not None else None
+        if table is not None:
+            return table
+
+        count = len(self.column_names)
+        defaults = self.column_defaults or (None,) * count
+        comments = self.column_comments or (None,) * count
+        # Validating plain data in one call is several times faster than
+        # constructing each nested model separately
+        table = TableInfo.model_validate(
+            {
+                "schema_name": self.schema_name,
+                "table_name": self.table_name,
+                "columns": [
+                    {
+                        "name": name,
+                        "data_type": data_type,
+                        "is_nullable": bool(flags & _NULLABLE),
+                        "default_value": default,
+                        "is_primary_key": bool(flags & _PRIMARY_KEY),
+                        "is_unique": bool(flags & _UNIQUE),
+                        "comment": comment,
+                    }
+                    for name, data_type, flags, default, comment in zip(
+                        self.column_names,
+                        self.column_types,
+                        self.column_flags,
+                        defaults,
+                        comments,
+                        strict=True,
+                    )
+                ],
+                "foreign_keys": [fk._asdict() for fk in self.foreign_keys],
+                "indexes": [idx._asdict() for idx in self.indexes],
+                "comment": self.comment,
+                "row_count_estimate": self.row_count_estimate,
+            }
+        )
+        self._materialized = weakref.ref(table)
+        return table
+
+
+class CompactSchema:
+    """Compact copy of a DatabaseSchema.
+
+    Setting ``enum_types`` or ``revision`` (or a table's row estimate) also
+    updates the materialized schema, if any, so that incremental refreshes
+    can patch a compact schema in place.
+
+    Once the full schema has been materialized, it is kept for as long as
+    this copy, so that requests needing every table reuse the same models
+    (and the prompt renderer's output memoized for them). Subsets are not
+    kept.
+
+    Example:
+        >>> compact = CompactSchema(schema)
+        >>> orders = compact.get_table("orders")  # Materializes one table
+        >>> pruned = compact.to_schema([0, 3])  # Materializes two tables
+        >>> full = compact.to_schema()  # Materializes everything
+    """
+
+    __slots__ = (
+        "_enum_types",
+        "_full",
+        "_materialized",
+        "_positions",
+        "_positions_by_name",
+        "_revision",
+        "database_name",
+        "tables",
+        "version",
+    )
+
+    def __init__(self, schema: DatabaseSchema) -> None:
+        """Build a compact copy of a schema.
+
+        Args:
+            schema: Schema to copy.
+        """
+        pool = StringPool()
+        self.database_name = schema.database_name
+        self.version = schema.version
+        self._revision = schema.revision
+        # Enum types are few; keep the models
+        self._enum_types = tuple(schema.enum_types)
+        self.tables = tuple(CompactTable(table, pool) for table in schema.tables)
+        self._positions: dict[tuple[str, str], int] = {}
+        self._positions_by_name: dict[str, list[int]] = {}
+        for i, table in enumerate(self.tables):
+            self._positions[(table.schema_name, table.table_name)] = i
+            self._positions_by_name.setdefault(table.table_name, []).append(i)
+        self._materialized: weakref.ref[DatabaseSchema] | None = weakref.ref(schema)
+        # Set by to_schema(); the source schema is only weakly referenced
+        self._full: DatabaseSchema | None = None
+
+    @property
+    def enum_types(self) -> tuple[EnumTypeInfo, ...]:
+        """Get the enum types.
+
+        Returns:
+            tuple[EnumTypeInfo, ...]: Enum types.
+        """
+        return self._enum_types
+
+    @enum_types.setter
+    def enum_types(self, value: Iterable[EnumTypeInfo]) -> None:
+        """Replace the enum types, on the materialized schema too.
+
+        Args:
+            value: Enum types.
+        """
+        self._enum_types = tuple(value)
+        schema = self._materialized() if self._materialized is not None else None
+        if schema is not None:
+            schema.enum_types = list(self._enum_types)
+
+    @property
+    def revision(self) -> int:
+        """Get the revision, incremented whenever the schema is patched.
+
+        Returns:
+            int: Revision.
+        """
+        return self._revision
+
+    @revision.setter
+    def revision(self, value: int) -> None:
+        """Set the revision, on the materialized schema too.
+
+        Args:
+            value: Revision.
+        """
+        self._revision = value
+        schema = self._materialized() if self._materialized is not None else None
+        if schema is not None:
+            schema.revision = value
+
+    @property
+    def column_count(self) -> int:
+        """Get the total number of columns.
+
+        Returns:
+            int: Number of columns across all tables.
+        """
+        return sum(len(table.column_names) for table in self.tables)
+
+    def get_table(self, table_name: str, schema_name: str = "public") -> TableInfo | None:
+        """Find and materialize a table by name.
+
+        Args:
+            table_name: Name of the table to find.
+            schema_name: Schema name (defaults to 'public').
+
+        Returns:
+            TableInfo if found, None otherwise.
+        """
+        position = self._positions.get((schema_name, table_name))
+        return None if position is None else self.tables[position].to_table()
+
+    def resolve(self, table_name: str, schema_name: str) -> list[CompactTable]:
+        """Resolve an unqualified table reference, preferring a schema.
+
+        Same resolution as ``SchemaIndex.resolve``.
+
+        Args:
+            table_name: Unqualified table name.
+            schema_name: Preferred schema.
+
+        Returns:
+            list[CompactTable]: Matching tables (empty if unknown).
+        """
+        position = self._positions.get((schema_name, table_name))
+        if position is not None:
+            return [self.tables[position]]
+        return [self.tables[i] for i in self._positions_by_name.get(table_name, [])]
+
+    def to_schema(self, positions: Iterable[int] | None = None) -> DatabaseSchema:
+        """Materialize the schema, or a subset of its tables, as pydantic models.
+
+        Args:
+            positions: Indexes into ``tables`` of the tables to include, in
+                the order to include them. All tables if omitted.
+
+        Returns:
+            DatabaseSchema: The materialized schema. The full schema is the
+                one this copy was built from, while it is still referenced
+                elsewhere, or the one previously materialized.
+        """
+        if positions is None:
+            if self._full is None:
+                schema = self._materialized() if self._materialized is not None else None
+                if schema is None:
+                    schema = self._build([table.to_table() for table in self.tables])
+                    self._materialized = weakref.ref(schema)
+                self._full = schema
+            return self._full
+        return self._build([self.tables[i].to_table() for i in positions])
+
+    def _build(self, tables: list[TableInfo]) -> DatabaseSchema:
+        """Create a DatabaseSchema with this schema's metadata.
+
+        Args:
+            tables: Materialized tables.
+
+        Returns:
+            DatabaseSchema: The schema.
+        """
+        return DatabaseSchema(
+            database_name=self.database_name,
+            tables=tables,
+            enum_types=list(self.enum_types),
+            version=self.version,
+            revision=self.revision,
+        )
+
+
+def as_database_schema(schema: DatabaseSchema | CompactSchema) -> DatabaseSchema:
+    """Get a schema as pydantic models, materializing a compact schema.
+
+    Args:
+        schema: Schema in either representation.
+
+    Returns:
+        DatabaseSchema: The schema itself, or the materialized compact schema.
+
+    Example:
+        >>> prompt_schema = as_database_schema(cache.get("mydb", materialize=False))
+    """
+    return schema.to_schema() if isinstance(schema, CompactSchema) else schema
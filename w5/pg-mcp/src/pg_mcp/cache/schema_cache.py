@@ -6,23 +6,94 @@ repeated introspection queries and improve performance.
 
 import asyncio
 import contextlib
+import hashlib
 import logging
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
+from typing import Any, overload
 
 from asyncpg import Pool
+from pydantic import BaseModel
 
+from pg_mcp.cache.compact import CompactSchema, as_database_schema
+from pg_mcp.cache.snapshot import SchemaSnapshotStore
 from pg_mcp.config.settings import CacheConfig
 from pg_mcp.db.introspection import SchemaIntrospector
-from pg_mcp.models.schema import DatabaseSchema
+from pg_mcp.models.schema import DatabaseSchema, RelationFingerprint
+from pg_mcp.observability.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
+# Maps lookup results to their counter in SchemaCache.get_stats()
+_LOOKUP_STATS = {"hit": "hits", "miss": "misses", "stale": "stale_hits"}
+
+
+def estimate_schema_bytes(schema: DatabaseSchema | CompactSchema) -> int:
+    """Estimate the in-memory size of a schema.
+
+    Walks the object graph summing ``sys.getsizeof`` of every model, its field
+    dict, slotted object, container and leaf value. Objects shared within the
+    schema (e.g. pooled strings) are counted once.
+
+    Args:
+        schema: Schema to measure, in either representation.
+
+    Returns:
+        int: Estimated size in bytes.
+
+    Example:
+        >>> estimate_schema_bytes(schema)
+        48213
+    """
+    seen: set[int] = set()
+    total = 0
+    stack: list[Any] = [schema]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, BaseModel):
+            stack.append(obj.__dict__)
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, list | tuple | set | frozenset):
+            stack.extend(obj)
+        elif hasattr(type(obj), "__slots__"):
+            stack.extend(getattr(obj, name) for name in type(obj).__slots__ if hasattr(obj, name))
+    return total
+
 
 class SchemaCache:
     """Schema cache manager with TTL and auto-refresh capabilities.
 
     This class manages cached database schemas with configurable TTL and
-    supports automatic background refresh.
+    supports automatic background refresh. Refreshes are incremental when
+    enabled: only relations whose catalog fingerprint changed since the last
+    load are re-introspected and patched into the cached schema.
+
+    When a snapshot directory is configured, every load or changed refresh is
+    persisted to disk, and ``warm_start`` serves the persisted schema at boot
+    while revalidating it against the live catalog in the background.
+
+    The cache is bounded: entries are evicted least-recently-used first when
+    there are more than ``max_size`` of them or their combined weight exceeds
+    ``max_memory_mb``. An entry's weight is its estimated size in bytes unless
+    a custom ``weigher`` is supplied.
+
+    With ``compact_storage`` enabled, entries are held as CompactSchema and
+    ``get`` materializes pydantic models on demand; callers that only need a
+    few tables (such as the schema retriever) can ask for the compact form.
+
+    Loads and refreshes are single-flight per database: concurrent callers
+    share one in-flight introspection instead of each starting their own. With
+    ``stale_while_revalidate`` enabled, expired entries keep being served while
+    one background refresh replaces them.
 
     Attributes:
         config: Cache configuration.
@@ -34,27 +105,71 @@ class SchemaCache:
         >>> await cache.start_auto_refresh(60, pools)  # Refresh every 60 minutes
     """
 
-    def __init__(self, config: CacheConfig):
+    def __init__(
+        self,
+        config: CacheConfig,
+        weigher: Callable[[DatabaseSchema | CompactSchema], int] | None = None,
+    ):
         """Initialize schema cache.
 
         Args:
             config: Cache configuration with TTL and size limits.
+            weigher: Computes an entry's weight, counted against
+                ``max_memory_mb`` in bytes. Defaults to ``estimate_schema_bytes``.
         """
         self.config = config
-        self._cache: dict[str, DatabaseSchema] = {}
+        self._weigher = weigher or estimate_schema_bytes
+        self._max_bytes = config.max_memory_mb * 1024 * 1024
+        # Ordered least to most recently used
+        self._cache: OrderedDict[str, DatabaseSchema | CompactSchema] = OrderedDict()
+        self._weights: dict[str, int] = {}
         self._cache_timestamps: dict[str, datetime] = {}
+        self._fingerprints: dict[str, dict[int, RelationFingerprint]] = {}
+        # Schema fingerprints by database, with the relation fingerprints
+        # they were computed from
+        self._schema_fingerprints: dict[str, tuple[dict[int, RelationFingerprint], str]] = {}
+        self._snapshots = SchemaSnapshotStore(config.snapshot_dir) if config.snapshot_dir else None
+        self._background_tasks: set[asyncio.Task[None]] = set()
+        self._inflight: dict[str, asyncio.Task[DatabaseSchema | CompactSchema]] = {}
+        self._pools: dict[str, Pool] = {}
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stale_hits": 0,
+            "coalesced_loads": 0,
+            "loads": 0,
+            "refreshes": 0,
+            "refresh_seconds_total": 0.0,
+            "evictions": 0,
+        }
         self._refresh_task: asyncio.Task[None] | None = None
         self._stop_refresh = False
 
-    def get(self, database_name: str) -> DatabaseSchema | None:
+    @overload
+    def get(self, database_name: str) -> DatabaseSchema | None: ...
+
+    @overload
+    def get(
+        self, database_name: str, materialize: bool
+    ) -> DatabaseSchema | CompactSchema | None: ...
+
+    def get(
+        self, database_name: str, materialize: bool = True
+    ) -> DatabaseSchema | CompactSchema | None:
         """Get cached schema if available and not expired.
 
+        With ``stale_while_revalidate`` enabled, an expired schema is still
+        returned and a single background refresh is started for it, provided
+        the pool it was loaded from is known.
+
         Args:
             database_name: Name of the database.
+            materialize: Return compactly stored schemas as pydantic models.
+                If False, the schema is returned as stored.
 
         Returns:
-            DatabaseSchema | None: Cached schema if available and valid,
-                None otherwise.
+            DatabaseSchema | CompactSchema | None: Cached schema if available
+                and valid (or stale and being revalidated), None otherwise.
 
         Example:
             >>> schema = cache.get("mydb")
@@ -65,17 +180,39 @@ class SchemaCache:
             return None
 
         if database_name not in self._cache:
+            self._record_lookup(database_name, "miss")
             return None
 
         # Check if cache is expired
         cache_age = self.get_cache_age(database_name)
         if cache_age is None or cache_age > self.config.schema_ttl:
+            pool = self._pools.get(database_name)
+            if self.config.stale_while_revalidate and pool is not None:
+                self._record_lookup(database_name, "stale")
+                self._schedule_refresh(database_name, pool)
+                return self._entry(database_name, materialize)
+
             # Cache expired, remove it
-            self._cache.pop(database_name, None)
-            self._cache_timestamps.pop(database_name, None)
+            self.clear(database_name)
+            self._record_lookup(database_name, "miss")
             return None
 
-        return self._cache[database_name]
+        self._record_lookup(database_name, "hit")
+        self._cache.move_to_end(database_name)
+        return self._entry(database_name, materialize)
+
+    def _entry(self, database_name: str, materialize: bool) -> DatabaseSchema | CompactSchema:
+        """Get a cached schema, materializing it if requested.
+
+        Args:
+            database_name: Name of a cached database.
+            materialize: Convert a compact schema to pydantic models.
+
+        Returns:
+            DatabaseSchema | CompactSchema: The cached schema.
+        """
+        entry = self._cache[database_name]
+        return as_database_schema(entry) if materialize else entry
 
     async def load(
         self,
@@ -85,7 +222,8 @@ class SchemaCache:
         """Load and cache database schema.
 
         This method performs schema introspection and stores the result
-        in cache with current timestamp.
+        in cache with current timestamp. If a load or refresh of the same
+        database is already in flight, its result is awaited instead.
 
         Args:
             database_name: Name of the database to introspect.
@@ -101,15 +239,250 @@ class SchemaCache:
             >>> schema = await cache.load("mydb", pool)
             >>> print(f"Loaded {len(schema.tables)} tables")
         """
+        flight = self._join_flight(database_name, lambda: self._load_now(database_name, pool))
+        # A joined refresh may return the schema as stored
+        return as_database_schema(await asyncio.shield(flight))
+
+    async def _load_now(self, database_name: str, pool: Pool) -> DatabaseSchema:
+        """Introspect a database in full and cache the result.
+
+        Args:
+            database_name: Name of the database to introspect.
+            pool: Connection pool for the database.
+
+        Returns:
+            DatabaseSchema: Loaded database schema.
+        """
+        start = time.perf_counter()
         introspector = SchemaIntrospector(pool, database_name)
         schema = await introspector.introspect()
+        self._record_refresh("full", time.perf_counter() - start)
 
-        if self.config.enabled:
-            self._cache[database_name] = schema
-            self._cache_timestamps[database_name] = datetime.now(UTC)
+        if self.config.enabled and await self._store(
+            database_name, schema, introspector.fingerprints, pool
+        ):
+            await self._save_snapshot(database_name)
 
         return schema
 
+    async def _store(
+        self,
+        database_name: str,
+        schema: DatabaseSchema,
+        fingerprints: dict[int, RelationFingerprint],
+        pool: Pool,
+    ) -> bool:
+        """Insert or replace a cache entry and enforce the size bounds.
+
+        Args:
+            database_name: Name of the database.
+            schema: Schema to cache.
+            fingerprints: Relation fingerprints the schema was built from.
+            pool: Connection pool the schema was loaded from.
+
+        Returns:
+            bool: False if the entry alone exceeds the memory budget and was
+                not cached.
+        """
+        entry = CompactSchema(schema) if self.config.compact_storage else schema
+        weight = await self._weigh(entry)
+        self._cache[database_name] = entry
+        self._cache.move_to_end(database_name)
+        self._cache_timestamps[database_name] = datetime.now(UTC)
+        self._fingerprints[database_name] = fingerprints
+        self._pools[database_name] = pool
+        return self._reweigh(database_name, weight)
+
+    async def _weigh(self, entry: DatabaseSchema | CompactSchema) -> int:
+        """Compute an entry's weight in a worker thread.
+
+        The default weigher walks the whole schema, which takes long enough on
+        large catalogs to stall the event loop. Entries are weighed when they
+        are stored and when a refresh changes their relations, not when a
+        refresh only updates row estimates.
+
+        Args:
+            entry: Schema as it will be stored.
+
+        Returns:
+            int: The entry's weight.
+        """
+        return await asyncio.to_thread(self._weigher, entry)
+
+    def _reweigh(self, database_name: str, weight: int) -> bool:
+        """Record an entry's weight and evict entries until within bounds.
+
+        Args:
+            database_name: Name of the database whose entry changed.
+            weight: The entry's new weight.
+
+        Returns:
+            bool: False if the entry alone exceeds the memory budget and was
+                evicted.
+        """
+        self._weights[database_name] = weight
+
+        if self._max_bytes and weight > self._max_bytes:
+            logger.warning(
+                "Schema for '%s' (%d bytes) exceeds the cache memory budget (%d bytes); "
+                "not caching it",
+                database_name,
+                weight,
+                self._max_bytes,
+            )
+            self._evict(database_name, "oversize")
+            return False
+
+        while len(self._cache) > self.config.max_size:
+            self._evict(next(iter(self._cache)), "size")
+        while self._max_bytes and self.get_cache_bytes() > self._max_bytes:
+            self._evict(next(iter(self._cache)), "memory")
+        metrics.set_schema_cache_bytes(self.get_cache_bytes())
+        return True
+
+    def _evict(self, database_name: str, reason: str) -> None:
+        """Drop an entry to respect the cache bounds.
+
+        Args:
+            database_name: Name of the database to evict.
+            reason: Why it was evicted (size, memory, oversize).
+        """
+        logger.debug("Evicting schema for '%s' from cache (%s)", database_name, reason)
+        self.clear(database_name)
+        self._stats["evictions"] += 1
+        metrics.increment_schema_cache_eviction(reason)
+
+    def _join_flight(
+        self,
+        database_name: str,
+        factory: Callable[[], Awaitable[DatabaseSchema | CompactSchema]],
+    ) -> asyncio.Task[DatabaseSchema | CompactSchema]:
+        """Get the in-flight load of a database, starting one if needed.
+
+        Args:
+            database_name: Name of the database.
+            factory: Creates the load coroutine when nothing is in flight.
+
+        Returns:
+            asyncio.Task: The shared load task.
+        """
+        flight = self._inflight.get(database_name)
+        if flight is not None:
+            self._stats["coalesced_loads"] += 1
+            metrics.increment_schema_cache_coalesced(database_name)
+            return flight
+
+        flight = asyncio.create_task(factory())
+        self._inflight[database_name] = flight
+
+        def _done(task: asyncio.Task[DatabaseSchema | CompactSchema]) -> None:
+            if self._inflight.get(database_name) is task:
+                del self._inflight[database_name]
+            # Waiters may all have been cancelled; mark the exception retrieved
+            if not task.cancelled():
+                task.exception()
+
+        flight.add_done_callback(_done)
+        return flight
+
+    def _schedule_refresh(self, database_name: str, pool: Pool) -> None:
+        """Start a background refresh of a stale schema unless one is running.
+
+        Args:
+            database_name: Name of the database.
+            pool: Connection pool for the database.
+        """
+        if database_name in self._inflight:
+            return
+
+        flight = self._join_flight(database_name, lambda: self._refresh_now(database_name, pool))
+
+        def _log_failure(task: asyncio.Task[DatabaseSchema | CompactSchema]) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning(
+                    "Background schema refresh failed for '%s', serving stale schema: %s",
+                    database_name,
+                    task.exception(),
+                )
+
+        flight.add_done_callback(_log_failure)
+
+    async def warm_start(
+        self,
+        database_name: str,
+        pool: Pool,
+    ) -> DatabaseSchema | None:
+        """Serve a database's schema from its on-disk snapshot.
+
+        If a compatible snapshot exists, it is cached immediately and an
+        incremental refresh is started in the background to revalidate it
+        against the live catalog fingerprints.
+
+        Args:
+            database_name: Name of the database.
+            pool: Connection pool used for background revalidation.
+
+        Returns:
+            DatabaseSchema | None: The snapshot schema, or None if snapshots are
+                disabled or no usable snapshot exists (callers should ``load``).
+
+        Example:
+            >>> schema = await cache.warm_start("mydb", pool)
+            >>> if schema is None:
+            ...     schema = await cache.load("mydb", pool)
+        """
+        if not self.config.enabled or self._snapshots is None:
+            return None
+
+        snapshot = await asyncio.to_thread(self._snapshots.load, database_name)
+        if snapshot is None:
+            return None
+
+        if not await self._store(database_name, snapshot.schema, snapshot.fingerprints, pool):
+            return None
+        logger.info(
+            "Serving schema for '%s' from snapshot saved at %s",
+            database_name,
+            snapshot.saved_at.isoformat(),
+        )
+
+        task = asyncio.create_task(self._revalidate(database_name, pool))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return snapshot.schema
+
+    async def _revalidate(self, database_name: str, pool: Pool) -> None:
+        """Refresh a snapshot-served schema, logging instead of raising.
+
+        Args:
+            database_name: Name of the database.
+            pool: Connection pool for the database.
+        """
+        try:
+            await self.refresh(database_name, pool)
+        except Exception as e:
+            logger.warning("Schema snapshot revalidation failed for '%s': %s", database_name, e)
+
+    async def _save_snapshot(self, database_name: str) -> None:
+        """Persist the cached schema of a database if snapshots are enabled.
+
+        Failures are logged and never propagate to the caller.
+
+        Args:
+            database_name: Name of the database.
+        """
+        if self._snapshots is None or database_name not in self._cache:
+            return
+
+        try:
+            await asyncio.to_thread(
+                self._snapshots.save,
+                as_database_schema(self._cache[database_name]),
+                self._fingerprints.get(database_name, {}),
+            )
+        except Exception as e:
+            logger.warning("Failed to write schema snapshot for '%s': %s", database_name, e)
+
     async def refresh(
         self,
         database_name: str,
@@ -117,7 +490,10 @@ class SchemaCache:
     ) -> None:
         """Refresh schema cache for a specific database.
 
-        This method reloads the schema and updates the cache.
+        When incremental refresh is enabled and the database was previously
+        loaded, only added, dropped or altered relations are re-introspected
+        and the cached schema is patched in place. Otherwise the schema is
+        reloaded in full. Joins a load or refresh already in flight.
 
         Args:
             database_name: Name of the database to refresh.
@@ -126,7 +502,54 @@ class SchemaCache:
         Example:
             >>> await cache.refresh("mydb", pool)
         """
-        await self.load(database_name, pool)
+        flight = self._join_flight(database_name, lambda: self._refresh_now(database_name, pool))
+        await asyncio.shield(flight)
+
+    async def _refresh_now(self, database_name: str, pool: Pool) -> DatabaseSchema | CompactSchema:
+        """Refresh a database's schema, incrementally when possible.
+
+        A compactly stored schema is patched in place while only row estimates
+        or enum types change, and is only materialized (and compacted again)
+        when relations were added, dropped or altered.
+
+        Args:
+            database_name: Name of the database to refresh.
+            pool: Connection pool for the database.
+
+        Returns:
+            DatabaseSchema | CompactSchema: The refreshed schema, as stored.
+        """
+        entry = self._cache.get(database_name)
+        previous = self._fingerprints.get(database_name)
+        if not self.config.incremental_refresh or entry is None or not previous:
+            return await self._load_now(database_name, pool)
+
+        start = time.perf_counter()
+        introspector = SchemaIntrospector(pool, database_name)
+        changed = await introspector.introspect_changes(entry, previous)
+        self._record_refresh("incremental", time.perf_counter() - start)
+        schema = entry
+        if changed and isinstance(entry, CompactSchema):
+            schema = CompactSchema(introspector.patched_schema)
+        # Patched schemas may have grown
+        weight = await self._weigh(schema) if changed else None
+        if self._cache.get(database_name) is not entry:
+            # Evicted, cleared or reloaded while refreshing
+            return schema
+        self._fingerprints[database_name] = introspector.fingerprints
+        self._cache_timestamps[database_name] = datetime.now(UTC)
+        self._pools[database_name] = pool
+        self._cache[database_name] = schema
+        if weight is not None and not self._reweigh(database_name, weight):
+            return schema
+        logger.debug(
+            "Incremental schema refresh for '%s' updated %d relations",
+            database_name,
+            changed,
+        )
+        if changed:
+            await self._save_snapshot(database_name)
+        return schema
 
     async def start_auto_refresh(
         self,
@@ -159,7 +582,8 @@ class SchemaCache:
     async def stop_auto_refresh(self) -> None:
         """Stop automatic refresh task.
 
-        This method immediately cancels the background refresh task if running.
+        This method immediately cancels the background refresh task if running,
+        along with any pending snapshot revalidations and in-flight loads.
 
         Example:
             >>> await cache.stop_auto_refresh()
@@ -174,6 +598,12 @@ class SchemaCache:
                 await self._refresh_task
             logger.debug("Auto-refresh task cancelled")
 
+        pending = [*self._background_tasks, *self._inflight.values()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
     async def _auto_refresh_loop(
         self,
         interval_minutes: int,
@@ -195,8 +625,8 @@ class SchemaCache:
                 if self._stop_refresh:
                     break
 
-                # Refresh all cached schemas
-                for database_name, pool in pools.items():
+                # Refresh all cached schemas (pools may be added meanwhile)
+                for database_name, pool in list(pools.items()):
                     if database_name in self._cache:
                         with contextlib.suppress(Exception):
                             await self.refresh(database_name, pool)
@@ -228,6 +658,43 @@ class SchemaCache:
         age = datetime.now(UTC) - timestamp
         return age.total_seconds()
 
+    def get_fingerprint(self, database_name: str) -> str | None:
+        """Get a fingerprint of a database's cached schema.
+
+        The fingerprint is a hash of the catalog signatures of all relations
+        the schema was built from, so it changes when a refresh observes a
+        change to any table or view (columns, defaults, constraints, indexes
+        or comments) and stays the same otherwise. Caches of results derived
+        from the schema use it to detect schema changes.
+
+        Args:
+            database_name: Name of the database.
+
+        Returns:
+            str | None: Hex digest, or None if the database has no relation
+                fingerprints (not cached, or loaded without introspection).
+
+        Example:
+            >>> fingerprint = cache.get_fingerprint("mydb")
+        """
+        fingerprints = self._fingerprints.get(database_name)
+        if not fingerprints:
+            return None
+        cached = self._schema_fingerprints.get(database_name)
+        if cached is not None and cached[0] is fingerprints:
+            return cached[1]
+
+        digest = hashlib.blake2b(digest_size=16)
+        for oid in sorted(fingerprints):
+            fingerprint = fingerprints[oid]
+            digest.update(
+                f"{oid}:{fingerprint.schema_name}.{fingerprint.table_name}:"
+                f"{fingerprint.signature}\n".encode()
+            )
+        value = digest.hexdigest()
+        self._schema_fingerprints[database_name] = (fingerprints, value)
+        return value
+
     def clear(self, database_name: str | None = None) -> None:
         """Clear cache for a specific database or all databases.
 
@@ -241,9 +708,29 @@ class SchemaCache:
         if database_name is None:
             self._cache.clear()
             self._cache_timestamps.clear()
+            self._fingerprints.clear()
+            self._schema_fingerprints.clear()
+            self._pools.clear()
+            self._weights.clear()
         else:
             self._cache.pop(database_name, None)
             self._cache_timestamps.pop(database_name, None)
+            self._fingerprints.pop(database_name, None)
+            self._schema_fingerprints.pop(database_name, None)
+            self._pools.pop(database_name, None)
+            self._weights.pop(database_name, None)
+        metrics.set_schema_cache_bytes(self.get_cache_bytes())
+
+    def get_cache_bytes(self) -> int:
+        """Get the combined weight of all cached schemas.
+
+        Returns:
+            int: Total weight, in estimated bytes unless a custom weigher is used.
+
+        Example:
+            >>> print(f"Schema cache uses ~{cache.get_cache_bytes() // 1024} KiB")
+        """
+        return sum(self._weights.values())
 
     def get_cached_databases(self) -> list[str]:
         """Get list of currently cached database names.
@@ -256,3 +743,40 @@ class SchemaCache:
             >>> print(f"Cached: {', '.join(databases)}")
         """
         return list(self._cache.keys())
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get schema cache statistics.
+
+        Returns:
+            Dictionary containing lookup counters (hits, misses, stale hits),
+            the number of loads that joined an in-flight load, completed loads
+            and refreshes, cumulative refresh time, evictions and the current
+            entry count and weight.
+        """
+        return {
+            **self._stats,
+            "cached_databases": len(self._cache),
+            "cache_bytes": self.get_cache_bytes(),
+            "inflight": len(self._inflight),
+        }
+
+    def _record_lookup(self, database_name: str, result: str) -> None:
+        """Count a cache lookup.
+
+        Args:
+            database_name: Name of the database.
+            result: Lookup result (hit, miss, stale).
+        """
+        self._stats[_LOOKUP_STATS[result]] += 1
+        metrics.increment_schema_cache_request(database_name, result)
+
+    def _record_refresh(self, mode: str, duration: float) -> None:
+        """Record a completed load or refresh.
+
+        Args:
+            mode: Refresh mode (full, incremental).
+            duration: Duration in seconds.
+        """
+        self._stats["loads" if mode == "full" else "refreshes"] += 1
+        self._stats["refresh_seconds_total"] += duration
+        metrics.observe_schema_cache_refresh(mode, duration)
@@ -0,0 +1,175 @@
+"""On-disk schema snapshots.
+
+This module persists introspected database schemas to local disk so that a
+restarted server (or a new worker) can serve from the last known schema
+immediately and revalidate it in the background, instead of blocking startup
+on a full introspection.
+
+Snapshots are gzip-compressed JSON documents carrying a format version; files
+written by an incompatible version are ignored rather than migrated.
+"""
+
+import gzip
+import json
+import logging
+import os
+import re
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from pg_mcp.models.schema import DatabaseSchema, RelationFingerprint
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the snapshot layout or the schema models change incompatibly
+SNAPSHOT_FORMAT_VERSION = 1
+
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class SchemaSnapshot:
+    """A persisted schema together with the catalog fingerprints it was built from.
+
+    Attributes:
+        schema: The cached database schema.
+        fingerprints: Relation fingerprints keyed by OID, used to revalidate
+            the snapshot against the live catalog.
+        saved_at: When the snapshot was written.
+    """
+
+    def __init__(
+        self,
+        schema: DatabaseSchema,
+        fingerprints: dict[int, RelationFingerprint],
+        saved_at: datetime,
+    ) -> None:
+        """Initialize snapshot.
+
+        Args:
+            schema: The cached database schema.
+            fingerprints: Relation fingerprints keyed by OID.
+            saved_at: When the snapshot was written.
+        """
+        self.schema = schema
+        self.fingerprints = fingerprints
+        self.saved_at = saved_at
+
+
+class SchemaSnapshotStore:
+    """File-based store of schema snapshots, one file per database.
+
+    Example:
+        >>> store = SchemaSnapshotStore("/var/cache/pg-mcp")
+        >>> store.save(schema, fingerprints)
+        >>> snapshot = store.load("mydb")
+        >>> if snapshot is not None:
+        ...     print(f"Snapshot from {snapshot.saved_at}")
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize snapshot store.
+
+        Args:
+            directory: Directory holding snapshot files (created on first save).
+        """
+        self.directory = Path(directory)
+
+    def path_for(self, database_name: str) -> Path:
+        """Get the snapshot file path for a database.
+
+        Args:
+            database_name: Name of the database.
+
+        Returns:
+            Path: Snapshot file location.
+        """
+        safe_name = _UNSAFE_FILENAME_CHARS.sub("_", database_name)
+        return self.directory / f"{safe_name}.schema.json.gz"
+
+    def save(
+        self,
+        schema: DatabaseSchema,
+        fingerprints: dict[int, RelationFingerprint],
+    ) -> Path:
+        """Write a snapshot atomically.
+
+        Default-valued fields are omitted and fingerprints are stored as
+        compact tuples to keep snapshots small for very large catalogs.
+
+        Args:
+            schema: Schema to persist.
+            fingerprints: Relation fingerprints the schema was built from.
+
+        Returns:
+            Path: The written snapshot file.
+        """
+        document: dict[str, Any] = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "saved_at": datetime.now(UTC).isoformat(),
+            "schema": schema.model_dump(mode="json", exclude_defaults=True),
+            "fingerprints": [
+                [fp.oid, fp.schema_name, fp.table_name, fp.signature]
+                for fp in fingerprints.values()
+            ],
+        }
+        payload = gzip.compress(
+            json.dumps(document, separators=(",", ":")).encode("utf-8"), compresslevel=6
+        )
+
+        path = self.path_for(schema.database_name)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(payload)
+        tmp_path.replace(path)
+        return path
+
+    def load(self, database_name: str) -> SchemaSnapshot | None:
+        """Read a snapshot if a compatible one exists.
+
+        Missing, corrupt or incompatible snapshots are treated as absent.
+
+        Args:
+            database_name: Name of the database.
+
+        Returns:
+            SchemaSnapshot | None: The snapshot, or None if unavailable.
+        """
+        path = self.path_for(database_name)
+        if not path.exists():
+            return None
+
+        try:
+            document = json.loads(gzip.decompress(path.read_bytes()))
+            if document.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+                logger.info(
+                    "Ignoring schema snapshot %s with format version %s",
+                    path,
+                    document.get("format_version"),
+                )
+                return None
+
+            schema = DatabaseSchema.model_validate(document["schema"])
+            fingerprints = {
+                oid: RelationFingerprint(
+                    oid=oid, schema_name=schema_name, table_name=table_name, signature=signature
+                )
+                for oid, schema_name, table_name, signature in document["fingerprints"]
+            }
+            saved_at = datetime.fromisoformat(document["saved_at"])
+        except Exception as e:
+            logger.warning("Ignoring unreadable schema snapshot %s: %s", path, e)
+            return None
+
+        if schema.database_name != database_name:
+            return None
+
+        return SchemaSnapshot(schema=schema, fingerprints=fingerprints, saved_at=saved_at)
+
+    def delete(self, database_name: str) -> None:
+        """Remove a database's snapshot if present.
+
+        Args:
+            database_name: Name of the database.
+        """
+        self.path_for(database_name).unlink(missing_ok=True)
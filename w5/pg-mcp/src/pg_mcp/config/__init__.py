@@ -2,12 +2,18 @@
 
 from pg_mcp.config.settings import (
     CacheConfig,
+    CostGuardConfig,
     DatabaseConfig,
+    GenerationCacheConfig,
     ObservabilityConfig,
     OpenAIConfig,
+    PagingConfig,
+    PromptConfig,
     ResilienceConfig,
+    SchemaRetrievalConfig,
     SecurityConfig,
     Settings,
+    StartupConfig,
     ValidationConfig,
     get_settings,
     reset_settings,
@@ -15,12 +21,18 @@ from pg_mcp.config.settings import (
 
 __all__ = [
     "CacheConfig",
+    "CostGuardConfig",
     "DatabaseConfig",
+    "GenerationCacheConfig",
     "ObservabilityConfig",
     "OpenAIConfig",
+    "PagingConfig",
+    "PromptConfig",
     "ResilienceConfig",
+    "SchemaRetrievalConfig",
     "SecurityConfig",
     "Settings",
+    "StartupConfig",
     "ValidationConfig",
     "get_settings",
     "reset_settings",
@@ -7,7 +7,7 @@ sensible defaults.
 
 from typing import Literal
 
-from pydantic import Field, SecretStr, field_validator
+from pydantic import Field, SecretStr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -89,12 +89,43 @@ class SecurityConfig(BaseSettings):
         description="List of blocked PostgreSQL functions",
     )
     max_rows: int = Field(default=10000, ge=1, le=100000, description="Maximum rows to return")
+    limit_pushdown: bool = Field(
+        default=True,
+        description="Add or tighten an outer LIMIT max_rows + 1 on generated queries so "
+        "PostgreSQL stops producing rows beyond max_rows",
+    )
+    stream_results: bool = Field(
+        default=False,
+        description="Read results through a server-side cursor and stop at max_rows "
+        "instead of fetching the whole result set",
+    )
+    fetch_batch_size: int = Field(
+        default=500, ge=1, le=100000, description="Rows per cursor fetch when streaming results"
+    )
+    max_result_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        ge=0,
+        description="Approximate maximum size of a result's values in bytes; rows past the "
+        "budget are dropped (0 disables)",
+    )
+    max_cell_bytes: int = Field(
+        default=64 * 1024,
+        ge=0,
+        description="Maximum size of a text or binary value in UTF-8 bytes; longer values "
+        "are truncated on a character boundary with a marker (0 disables)",
+    )
     max_execution_time: float = Field(
         default=30.0, ge=1.0, le=300.0, description="Maximum query execution time in seconds"
     )
     readonly_role: str | None = Field(
         default=None, description="PostgreSQL role to switch to for read-only access"
     )
+    validation_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description="Validation verdicts cached by SQL fingerprint, so repeated queries "
+        "are not parsed and checked again (0 disables)",
+    )
     safe_search_path: str = Field(
         default="public", description="Safe search_path to set during query execution"
     )
@@ -142,7 +173,183 @@ class CacheConfig(BaseSettings):
         default=3600, ge=60, le=86400, description="Schema cache TTL in seconds"
     )
     max_size: int = Field(default=100, ge=1, le=1000, description="Maximum cache entries")
+    max_memory_mb: int = Field(
+        default=0,
+        ge=0,
+        le=65536,
+        description="Maximum estimated memory of cached schemas in MB (0 for no limit)",
+    )
+    compact_storage: bool = Field(
+        default=False,
+        description="Hold cached schemas in a compact array-backed form and build "
+        "pydantic models only for the tables a request uses",
+    )
     enabled: bool = Field(default=True, description="Enable schema caching")
+    refresh_interval: int = Field(
+        default=0,
+        ge=0,
+        le=1440,
+        description="Background schema refresh interval in minutes (0 disables)",
+    )
+    incremental_refresh: bool = Field(
+        default=True,
+        description="Re-introspect only changed relations when refreshing cached schemas",
+    )
+    stale_while_revalidate: bool = Field(
+        default=False,
+        description="Serve expired schemas while a single background refresh replaces them",
+    )
+    snapshot_dir: str | None = Field(
+        default=None,
+        description="Directory for on-disk schema snapshots used for warm startup "
+        "(disabled if unset)",
+    )
+
+
+class PagingConfig(BaseSettings):
+    """Paged result configuration (server-held result cursors)."""
+
+    model_config = SettingsConfigDict(env_prefix="PAGING_")
+
+    enabled: bool = Field(
+        default=True, description="Allow queries to return a first page and a cursor token"
+    )
+    max_page_size: int = Field(default=1000, ge=1, le=100000, description="Maximum rows per page")
+    cursor_ttl: float = Field(
+        default=300.0,
+        ge=5.0,
+        le=3600.0,
+        description="Seconds an unused cursor is kept open before it is closed",
+    )
+    max_open_cursors: int = Field(
+        default=4,
+        ge=1,
+        le=100,
+        description="Maximum cursors held open; each holds a pool connection and transaction",
+    )
+    max_cursors_per_client: int = Field(
+        default=2, ge=1, le=100, description="Maximum cursors held open for one client"
+    )
+
+
+class CostGuardConfig(BaseSettings):
+    """Pre-execution cost guard configuration (EXPLAIN estimates)."""
+
+    model_config = SettingsConfigDict(env_prefix="COST_GUARD_")
+
+    enabled: bool = Field(
+        default=False, description="Check the planner's estimates before executing queries"
+    )
+    max_total_cost: float = Field(
+        default=1_000_000.0,
+        ge=0.0,
+        description="Maximum estimated total cost of a query (0 for no limit)",
+    )
+    max_plan_rows: int = Field(
+        default=10_000_000,
+        ge=0,
+        description="Maximum estimated rows produced by a query, before the pushed-down "
+        "row limit (0 for no limit)",
+    )
+    cache_size: int = Field(
+        default=1024, ge=0, le=1_000_000, description="Plan estimates kept in cache (0 disables)"
+    )
+    cache_ttl: float = Field(
+        default=600.0,
+        ge=0.0,
+        le=86400.0,
+        description="Seconds a cached plan estimate is reused",
+    )
+
+
+class GenerationCacheConfig(BaseSettings):
+    """Cache of SQL generated for questions, to skip the LLM for repeats."""
+
+    model_config = SettingsConfigDict(env_prefix="GENERATION_CACHE_")
+
+    enabled: bool = Field(
+        default=False,
+        description="Reuse the SQL generated for a question when it is asked again "
+        "against an unchanged schema",
+    )
+    max_size: int = Field(
+        default=1024, ge=1, le=1_000_000, description="Questions kept in cache, across databases"
+    )
+    ttl: float = Field(
+        default=3600.0,
+        gt=0.0,
+        le=7 * 86400.0,
+        description="Seconds generated SQL is reused",
+    )
+    match_similar: bool = Field(
+        default=False,
+        description="Also reuse the SQL of a cached question worded differently, if it "
+        "mentions the same tables, columns and numbers and is similar enough",
+    )
+    similarity_threshold: float = Field(
+        default=0.9,
+        gt=0.0,
+        le=1.0,
+        description="Minimum TF-IDF cosine similarity of a similar question (1.0 only "
+        "matches questions with the same terms, in any order)",
+    )
+
+
+class StartupConfig(BaseSettings):
+    """Server startup configuration."""
+
+    model_config = SettingsConfigDict(env_prefix="STARTUP_")
+
+    lazy: bool = Field(
+        default=False,
+        description="Accept requests at once and create pools and load schemas in the background",
+    )
+    ready_timeout: float = Field(
+        default=10.0,
+        ge=0.0,
+        le=300.0,
+        description="Seconds a request waits for its database to become ready (0: fail at once)",
+    )
+
+
+class SchemaRetrievalConfig(BaseSettings):
+    """Relevance-based schema pruning configuration."""
+
+    model_config = SettingsConfigDict(env_prefix="SCHEMA_RETRIEVAL_")
+
+    enabled: bool = Field(
+        default=False, description="Send only question-relevant tables to the LLM"
+    )
+    top_k: int = Field(default=8, ge=1, le=100, description="Number of top-ranked tables to keep")
+    fk_depth: int = Field(
+        default=1, ge=0, le=3, description="Foreign key hops to follow from selected tables"
+    )
+    max_join_hops: int = Field(
+        default=3, ge=0, le=6, description="Maximum join path length between selected tables"
+    )
+    min_tables: int = Field(
+        default=20,
+        ge=0,
+        le=1000,
+        description="Schemas with at most this many tables are sent in full",
+    )
+
+
+class PromptConfig(BaseSettings):
+    """SQL generation prompt configuration."""
+
+    model_config = SettingsConfigDict(env_prefix="PROMPT_")
+
+    schema_format: Literal["verbose", "compact"] = Field(
+        default="verbose",
+        description="Schema rendering in prompts: verbose sections or compact DDL-like lines",
+    )
+    schema_token_budget: int = Field(
+        default=0,
+        ge=0,
+        le=200000,
+        description="Maximum estimated tokens of compact schema context (0 for no limit)",
+    )
 
 
 class ResilienceConfig(BaseSettings):
@@ -196,13 +403,43 @@ class Settings(BaseSettings):
 
     # Nested configurations
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+    databases: list[DatabaseConfig] = Field(
+        default_factory=list,
+        description="Databases to serve, as a JSON list of database configurations; "
+        "replaces the single DATABASE_* database when set",
+    )
     openai: OpenAIConfig = Field(default_factory=OpenAIConfig)
     security: SecurityConfig = Field(default_factory=SecurityConfig)
     validation: ValidationConfig = Field(default_factory=ValidationConfig)
     cache: CacheConfig = Field(default_factory=CacheConfig)
+    paging: PagingConfig = Field(default_factory=PagingConfig)
+    cost_guard: CostGuardConfig = Field(default_factory=CostGuardConfig)
+    generation_cache: GenerationCacheConfig = Field(default_factory=GenerationCacheConfig)
+    schema_retrieval: SchemaRetrievalConfig = Field(default_factory=SchemaRetrievalConfig)
+    prompt: PromptConfig = Field(default_factory=PromptConfig)
     resilience: ResilienceConfig = Field(default_factory=ResilienceConfig)
+    startup: StartupConfig = Field(default_factory=StartupConfig)
     observability: ObservabilityConfig = Field(default_factory=ObservabilityConfig)
 
+    @model_validator(mode="after")
+    def validate_database_names(self) -> "Settings":
+        """Ensure every configured database has a distinct name."""
+        names = [config.name for config in self.database_configs]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate database names: {', '.join(duplicates)}")
+        return self
+
+    @property
+    def database_configs(self) -> list[DatabaseConfig]:
+        """Get the configurations of all databases to serve.
+
+        Returns:
+            list[DatabaseConfig]: The ``databases`` list or, if it is empty,
+                the single ``database``.
+        """
+        return self.databases or [self.database]
+
     @property
     def is_production(self) -> bool:
         """Check if running in production environment."""
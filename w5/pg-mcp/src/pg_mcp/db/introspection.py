@@ -3,8 +3,15 @@
 This module provides functionality to introspect PostgreSQL database schemas,
 extracting comprehensive metadata about tables, columns, constraints, indexes,
 and custom types.
+
+Metadata is fetched with a fixed number of set-based catalog queries (one per
+kind of metadata) and assembled in memory, so the number of round trips does
+not grow with the number of tables in the database.
 """
 
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
 
 from asyncpg import Pool
 from asyncpg.connection import Connection
@@ -15,19 +22,164 @@ from pg_mcp.models.schema import (
     EnumTypeInfo,
     ForeignKeyInfo,
     IndexInfo,
+    RelationFingerprint,
     TableInfo,
 )
 
+if TYPE_CHECKING:
+    from pg_mcp.cache.compact import CompactSchema
+
+logger = logging.getLogger(__name__)
+
+# Catalog queries. Every per-relation query is filtered by an array of
+# relation OIDs so it covers any number of tables in a single round trip.
+# The relations query also computes a per-relation signature from catalog row
+# versions (xmin) so later refreshes can detect which relations changed.
+
+_RELATIONS_QUERY = """
+    SELECT
+        c.oid AS oid,
+        c.relkind AS relkind,
+        n.nspname AS schema_name,
+        c.relname AS table_name,
+        obj_description(c.oid, 'pg_class') AS comment,
+        c.reltuples::bigint AS row_estimate,
+        md5(concat_ws(
+            '|',
+            c.relfilenode::text,
+            c.xmin::text,
+            (SELECT string_agg(a.attnum::text || ':' || a.xmin::text, ',' ORDER BY a.attnum)
+             FROM pg_attribute a WHERE a.attrelid = c.oid AND a.attnum > 0),
+            (SELECT string_agg(ad.oid::text || ':' || ad.xmin::text, ',' ORDER BY ad.oid)
+             FROM pg_attrdef ad WHERE ad.adrelid = c.oid),
+            (SELECT string_agg(con.oid::text || ':' || con.xmin::text, ',' ORDER BY con.oid)
+             FROM pg_constraint con WHERE con.conrelid = c.oid),
+            (SELECT string_agg(ic.oid::text || ':' || ic.xmin::text, ',' ORDER BY ic.oid)
+             FROM pg_index i JOIN pg_class ic ON ic.oid = i.indexrelid
+             WHERE i.indrelid = c.oid),
+            (SELECT string_agg(d.objsubid::text || ':' || d.xmin::text, ',' ORDER BY d.objsubid)
+             FROM pg_description d
+             WHERE d.objoid = c.oid AND d.classoid = 'pg_class'::regclass)
+        )) AS signature
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE (
+            c.relkind = 'r'  -- regular tables
+            AND n.nspname NOT IN ('pg_catalog', 'information_schema', 'pg_toast')
+        ) OR (
+            c.relkind = 'v'  -- views
+            AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+        )
+    ORDER BY c.relkind, n.nspname, c.relname
+"""
+
+_COLUMNS_QUERY = """
+    SELECT
+        a.attrelid AS oid,
+        a.attname AS column_name,
+        pg_catalog.format_type(a.atttypid, a.atttypmod) AS data_type,
+        NOT a.attnotnull AS is_nullable,
+        pg_get_expr(ad.adbin, ad.adrelid) AS default_value,
+        col_description(a.attrelid, a.attnum) AS comment
+    FROM pg_attribute a
+    LEFT JOIN pg_attrdef ad ON a.attrelid = ad.adrelid AND a.attnum = ad.adnum
+    WHERE a.attrelid = ANY($1::oid[])
+      AND a.attnum > 0
+      AND NOT a.attisdropped
+    ORDER BY a.attrelid, a.attnum
+"""
+
+_UNIQUE_COLUMNS_QUERY = """
+    SELECT DISTINCT
+        con.conrelid AS oid,
+        a.attname AS column_name
+    FROM pg_constraint con
+    JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = ANY(con.conkey)
+    WHERE con.conrelid = ANY($1::oid[])
+      AND con.contype = 'u'  -- unique constraint
+"""
+
+_PRIMARY_KEYS_QUERY = """
+    SELECT
+        i.indrelid AS oid,
+        a.attname AS column_name
+    FROM pg_index i
+    JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+    WHERE i.indrelid = ANY($1::oid[])
+      AND i.indisprimary
+"""
+
+_FOREIGN_KEYS_QUERY = """
+    SELECT
+        con.conrelid AS oid,
+        con.conname AS constraint_name,
+        a.attname AS column_name,
+        ref_c.relname AS referenced_table,
+        ref_a.attname AS referenced_column
+    FROM pg_constraint con
+    JOIN pg_attribute a
+        ON a.attrelid = con.conrelid AND a.attnum = ANY(con.conkey)
+    JOIN pg_class ref_c ON con.confrelid = ref_c.oid
+    JOIN pg_attribute ref_a
+        ON ref_a.attrelid = ref_c.oid
+        AND ref_a.attnum = ANY(con.confkey)
+    WHERE con.conrelid = ANY($1::oid[])
+      AND con.contype = 'f'  -- foreign key
+    ORDER BY con.conrelid, con.conname
+"""
+
+_INDEXES_QUERY = """
+    SELECT
+        idx.indrelid AS oid,
+        i.relname AS index_name,
+        idx.indisunique AS is_unique,
+        am.amname AS index_type,
+        ARRAY(
+            SELECT a.attname
+            FROM pg_attribute a
+            WHERE a.attrelid = idx.indrelid
+              AND a.attnum = ANY(idx.indkey)
+            ORDER BY array_position(idx.indkey, a.attnum)
+        ) AS columns
+    FROM pg_index idx
+    JOIN pg_class i ON i.oid = idx.indexrelid
+    JOIN pg_am am ON i.relam = am.oid
+    WHERE idx.indrelid = ANY($1::oid[])
+      AND NOT idx.indisprimary  -- exclude primary key indexes
+    ORDER BY idx.indrelid, i.relname
+"""
+
+_ENUM_TYPES_QUERY = """
+    SELECT
+        n.nspname AS schema_name,
+        t.typname AS type_name,
+        ARRAY(
+            SELECT e.enumlabel
+            FROM pg_enum e
+            WHERE e.enumtypid = t.oid
+            ORDER BY e.enumsortorder
+        ) AS values
+    FROM pg_type t
+    JOIN pg_namespace n ON t.typnamespace = n.oid
+    WHERE t.typtype = 'e'  -- enum types only
+      AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+    ORDER BY n.nspname, t.typname
+"""
+
 
 class SchemaIntrospector:
     """PostgreSQL schema introspection service.
 
     This class provides methods to extract complete schema metadata from
-    a PostgreSQL database using system catalogs.
+    a PostgreSQL database using system catalogs. Each kind of metadata is
+    fetched for all relations at once, so a full introspection costs a
+    constant number of round trips regardless of schema size.
 
     Attributes:
         pool: Database connection pool.
         database_name: Name of the database being introspected.
+        fingerprints: Relation fingerprints observed by the most recent
+            ``introspect`` or ``introspect_changes`` call, keyed by OID.
     """
 
     def __init__(self, pool: Pool, database_name: str):
@@ -39,6 +191,8 @@ class SchemaIntrospector:
         """
         self.pool = pool
         self.database_name = database_name
+        self.fingerprints: dict[int, RelationFingerprint] = {}
+        self.patched_schema: DatabaseSchema | CompactSchema | None = None
 
     async def introspect(self) -> DatabaseSchema:
         """Execute complete schema introspection.
@@ -59,309 +213,309 @@ class SchemaIntrospector:
             version_result = await conn.fetchval("SELECT version()")
             version = version_result.split(",")[0] if version_result else None
 
-            # Fetch all schema components concurrently
-            tables = await self._get_tables(conn)
-            views = await self._get_views(conn)
+            relations = await conn.fetch(_RELATIONS_QUERY)
+            tables = await self._build_tables(conn, relations)
             enum_types = await self._get_enum_types(conn)
 
-            # Enrich tables with detailed information
-            for table in tables + views:
-                table.columns = await self._get_columns(conn, table.table_name, table.schema_name)
-                primary_keys = await self._get_primary_keys(
-                    conn, table.table_name, table.schema_name
-                )
-
-                # Mark primary key columns
-                for col in table.columns:
-                    if col.name in primary_keys:
-                        col.is_primary_key = True
-
-                table.foreign_keys = await self._get_foreign_keys(
-                    conn, table.table_name, table.schema_name
-                )
-                table.indexes = await self._get_indexes(conn, table.table_name, table.schema_name)
-                table.row_count_estimate = await self._get_row_count_estimate(
-                    conn, table.table_name, table.schema_name
-                )
+            self.fingerprints = self._fingerprints_from_rows(relations)
 
             return DatabaseSchema(
                 database_name=self.database_name,
-                tables=tables + views,
+                tables=tables,
                 enum_types=enum_types,
                 version=version,
             )
 
-    async def _get_tables(self, conn: Connection) -> list[TableInfo]:
-        """Get all user tables (excluding system tables).
+    async def introspect_changes(
+        self,
+        schema: "DatabaseSchema | CompactSchema",
+        previous: dict[int, RelationFingerprint],
+    ) -> int:
+        """Patch a previously introspected schema in place with catalog changes.
+
+        Only relations that were added, dropped or altered since ``previous``
+        was taken are re-introspected. Tables whose foreign keys reference a
+        changed or dropped relation are re-introspected too, since a rename
+        changes how their foreign keys are reported. Row estimates and enum
+        types are refreshed for every relation, as they are cheap to fetch.
+
+        If no relation was added, dropped or altered, the schema keeps its
+        ``tables`` list: estimates are updated in place, and ``revision`` is
+        only incremented if an estimate or the enum types changed.
+
+        Otherwise a DatabaseSchema has its ``tables`` and ``enum_types``
+        replaced and its ``revision`` incremented. A CompactSchema cannot hold
+        the new tables, so it is materialized and the materialized copy is
+        patched instead. Either way, the patched schema is left in
+        ``patched_schema``.
 
         Args:
-            conn: Database connection.
+            schema: Schema to patch.
+            previous: Fingerprints recorded when ``schema`` was introspected.
 
         Returns:
-            list[TableInfo]: List of table information objects.
-        """
-        query = """
-            SELECT
-                n.nspname AS schema_name,
-                c.relname AS table_name,
-                obj_description(c.oid, 'pg_class') AS comment
-            FROM pg_class c
-            JOIN pg_namespace n ON n.oid = c.relnamespace
-            WHERE c.relkind = 'r'  -- regular tables only
-              AND n.nspname NOT IN ('pg_catalog', 'information_schema', 'pg_toast')
-            ORDER BY n.nspname, c.relname
-        """
+            int: Number of relations that were added, dropped or re-introspected.
 
-        rows = await conn.fetch(query)
-
-        return [
-            TableInfo(
-                schema_name=row["schema_name"],
-                table_name=row["table_name"],
-                comment=row["comment"],
-                row_count_estimate=None,
-            )
-            for row in rows
-        ]
+        Example:
+            >>> changed = await introspector.introspect_changes(schema, fingerprints)
+            >>> schema, fingerprints = introspector.patched_schema, introspector.fingerprints
+        """
+        async with self.pool.acquire() as conn:
+            relations = await conn.fetch(_RELATIONS_QUERY)
+            current = self._fingerprints_from_rows(relations)
+            existing = {(t.schema_name, t.table_name): t for t in schema.tables}
+
+            changed = {
+                oid
+                for oid, fingerprint in current.items()
+                if oid not in previous
+                or previous[oid].signature != fingerprint.signature
+                or (fingerprint.schema_name, fingerprint.table_name) not in existing
+            }
+            dropped = [fp for oid, fp in previous.items() if oid not in current]
+
+            # Referencing tables report the referenced table by name
+            touched_names = {previous[oid].table_name for oid in changed if oid in previous}
+            touched_names.update(fp.table_name for fp in dropped)
+            if touched_names:
+                for oid, fingerprint in current.items():
+                    table = existing.get((fingerprint.schema_name, fingerprint.table_name))
+                    if table is not None and any(
+                        fk.referenced_table in touched_names for fk in table.foreign_keys
+                    ):
+                        changed.add(oid)
 
-    async def _get_columns(
-        self, conn: Connection, table_name: str, schema_name: str
-    ) -> list[ColumnInfo]:
-        """Get column information for a specific table.
+            enum_types = await self._get_enum_types(conn)
+            if not changed and not dropped:
+                # Keep the table list, and everything cached by its identity
+                # or the schema revision, unless an estimate or enum changed
+                updated = self._update_estimates(existing, relations)
+                if enum_types != list(schema.enum_types):
+                    schema.enum_types = enum_types
+                    updated = True
+                if updated:
+                    schema.revision += 1
+                tables = schema.tables
+            else:
+                if not isinstance(schema, DatabaseSchema):
+                    schema = schema.to_schema()
+                    existing = {(t.schema_name, t.table_name): t for t in schema.tables}
+                changed_rows = [row for row in relations if row["oid"] in changed]
+                fresh = dict(
+                    zip(
+                        [row["oid"] for row in changed_rows],
+                        await self._build_tables(conn, changed_rows),
+                        strict=True,
+                    )
+                )
+                unchanged = [row for row in relations if row["oid"] not in fresh]
+                self._update_estimates(existing, unchanged)
+
+                tables = [
+                    fresh.get(row["oid"]) or existing[(row["schema_name"], row["table_name"])]
+                    for row in relations
+                ]
+                schema.tables = tables
+                schema.enum_types = enum_types
+                schema.revision += 1
+            self.fingerprints = current
+            self.patched_schema = schema
+
+        logger.debug(
+            "Incremental introspection of '%s': %d changed, %d dropped, %d total",
+            self.database_name,
+            len(changed),
+            len(dropped),
+            len(tables),
+        )
+        return len(changed) + len(dropped)
+
+    @staticmethod
+    def _update_estimates(existing: dict[tuple[str, str], Any], relations: list[Any]) -> bool:
+        """Update the row estimates of already introspected tables in place.
 
         Args:
-            conn: Database connection.
-            table_name: Name of the table.
-            schema_name: Schema name.
+            existing: Tables by (schema name, table name).
+            relations: Rows from the relations query for tables in ``existing``.
 
         Returns:
-            list[ColumnInfo]: List of column information objects.
-        """
-        query = """
-            SELECT
-                a.attname AS column_name,
-                pg_catalog.format_type(a.atttypid, a.atttypmod) AS data_type,
-                NOT a.attnotnull AS is_nullable,
-                pg_get_expr(ad.adbin, ad.adrelid) AS default_value,
-                col_description(a.attrelid, a.attnum) AS comment
-            FROM pg_attribute a
-            JOIN pg_class c ON a.attrelid = c.oid
-            JOIN pg_namespace n ON c.relnamespace = n.oid
-            LEFT JOIN pg_attrdef ad ON a.attrelid = ad.adrelid AND a.attnum = ad.adnum
-            WHERE c.relname = $1
-              AND n.nspname = $2
-              AND a.attnum > 0
-              AND NOT a.attisdropped
-            ORDER BY a.attnum
+            bool: True if any estimate changed.
         """
+        updated = False
+        for row in relations:
+            table = existing[(row["schema_name"], row["table_name"])]
+            estimate = row["row_estimate"]
+            estimate = int(estimate) if estimate is not None else 0
+            if table.row_count_estimate != estimate:
+                table.row_count_estimate = estimate
+                updated = True
+        return updated
+
+    @staticmethod
+    def _fingerprints_from_rows(relations: list[Any]) -> dict[int, RelationFingerprint]:
+        """Build relation fingerprints from relations query rows.
 
-        rows = await conn.fetch(query, table_name, schema_name)
-
-        columns = []
-        for row in rows:
-            # Check if column has unique constraint
-            is_unique = await self._is_column_unique(
-                conn, table_name, schema_name, row["column_name"]
-            )
+        Args:
+            relations: Rows from the relations query.
 
-            columns.append(
-                ColumnInfo(
-                    name=row["column_name"],
-                    data_type=row["data_type"],
-                    is_nullable=row["is_nullable"],
-                    default_value=row["default_value"],
-                    is_unique=is_unique,
-                    comment=row["comment"],
-                )
+        Returns:
+            dict[int, RelationFingerprint]: Fingerprints keyed by relation OID.
+        """
+        return {
+            row["oid"]: RelationFingerprint(
+                oid=row["oid"],
+                schema_name=row["schema_name"],
+                table_name=row["table_name"],
+                signature=row["signature"],
             )
+            for row in relations
+        }
 
-        return columns
-
-    async def _is_column_unique(
-        self, conn: Connection, table_name: str, schema_name: str, column_name: str
-    ) -> bool:
-        """Check if a column has a unique constraint (excluding primary key).
+    async def _build_tables(self, conn: Connection, relations: list[Any]) -> list[TableInfo]:
+        """Fetch per-relation metadata in bulk and assemble TableInfo objects.
 
         Args:
             conn: Database connection.
-            table_name: Name of the table.
-            schema_name: Schema name.
-            column_name: Name of the column.
+            relations: Rows from the relations query (oid, names, comment,
+                row estimate), in the order tables should appear.
 
         Returns:
-            bool: True if column has a unique constraint.
+            list[TableInfo]: Fully populated tables, in the order of ``relations``.
         """
-        query = """
-            SELECT EXISTS(
-                SELECT 1
-                FROM pg_constraint con
-                JOIN pg_class c ON con.conrelid = c.oid
-                JOIN pg_namespace n ON c.relnamespace = n.oid
-                JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum = ANY(con.conkey)
-                WHERE c.relname = $1
-                  AND n.nspname = $2
-                  AND a.attname = $3
-                  AND con.contype = 'u'  -- unique constraint
+        oids = [row["oid"] for row in relations]
+        if not oids:
+            return []
+
+        columns = await self._get_columns(conn, oids)
+        primary_keys = await self._get_key_columns(conn, _PRIMARY_KEYS_QUERY, oids)
+        unique_columns = await self._get_key_columns(conn, _UNIQUE_COLUMNS_QUERY, oids)
+        foreign_keys = await self._get_foreign_keys(conn, oids)
+        indexes = await self._get_indexes(conn, oids)
+
+        tables = []
+        for row in relations:
+            oid = row["oid"]
+            table_columns = columns.get(oid, [])
+
+            # Mark primary key and unique columns
+            pk_names = primary_keys.get(oid, set())
+            unique_names = unique_columns.get(oid, set())
+            for col in table_columns:
+                col.is_primary_key = col.name in pk_names
+                col.is_unique = col.name in unique_names
+
+            estimate = row["row_estimate"]
+            tables.append(
+                TableInfo(
+                    schema_name=row["schema_name"],
+                    table_name=row["table_name"],
+                    comment=row["comment"],
+                    columns=table_columns,
+                    foreign_keys=foreign_keys.get(oid, []),
+                    indexes=indexes.get(oid, []),
+                    row_count_estimate=int(estimate) if estimate is not None else 0,
+                )
             )
-        """
 
-        result = await conn.fetchval(query, table_name, schema_name, column_name)
-        return bool(result) if result is not None else False
+        return tables
 
-    async def _get_primary_keys(
-        self, conn: Connection, table_name: str, schema_name: str
-    ) -> list[str]:
-        """Get primary key column names for a table.
+    async def _get_columns(self, conn: Connection, oids: list[int]) -> dict[int, list[ColumnInfo]]:
+        """Get column information for a set of relations.
 
         Args:
             conn: Database connection.
-            table_name: Name of the table.
-            schema_name: Schema name.
+            oids: Relation OIDs to fetch columns for.
 
         Returns:
-            list[str]: List of primary key column names.
-        """
-        query = """
-            SELECT a.attname AS column_name
-            FROM pg_index i
-            JOIN pg_class c ON i.indrelid = c.oid
-            JOIN pg_namespace n ON c.relnamespace = n.oid
-            JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum = ANY(i.indkey)
-            WHERE c.relname = $1
-              AND n.nspname = $2
-              AND i.indisprimary
-            ORDER BY array_position(i.indkey, a.attnum)
+            dict[int, list[ColumnInfo]]: Columns grouped by relation OID,
+                in attribute order.
         """
+        rows = await conn.fetch(_COLUMNS_QUERY, oids)
 
-        rows = await conn.fetch(query, table_name, schema_name)
-        return [row["column_name"] for row in rows]
+        columns: dict[int, list[ColumnInfo]] = defaultdict(list)
+        for row in rows:
+            columns[row["oid"]].append(
+                ColumnInfo(
+                    name=row["column_name"],
+                    data_type=row["data_type"],
+                    is_nullable=row["is_nullable"],
+                    default_value=row["default_value"],
+                    comment=row["comment"],
+                )
+            )
+        return columns
 
-    async def _get_foreign_keys(
-        self, conn: Connection, table_name: str, schema_name: str
-    ) -> list[ForeignKeyInfo]:
-        """Get foreign key relationships for a table.
+    async def _get_key_columns(
+        self, conn: Connection, query: str, oids: list[int]
+    ) -> dict[int, set[str]]:
+        """Get the names of columns covered by a key (primary key or unique).
 
         Args:
             conn: Database connection.
-            table_name: Name of the table.
-            schema_name: Schema name.
+            query: Catalog query returning ``oid`` and ``column_name`` rows.
+            oids: Relation OIDs to restrict the query to.
 
         Returns:
-            list[ForeignKeyInfo]: List of foreign key information objects.
-        """
-        query = """
-            SELECT
-                con.conname AS constraint_name,
-                a.attname AS column_name,
-                ref_c.relname AS referenced_table,
-                ref_a.attname AS referenced_column
-            FROM pg_constraint con
-            JOIN pg_class c ON con.conrelid = c.oid
-            JOIN pg_namespace n ON c.relnamespace = n.oid
-            JOIN pg_attribute a
-                ON a.attrelid = c.oid AND a.attnum = ANY(con.conkey)
-            JOIN pg_class ref_c ON con.confrelid = ref_c.oid
-            JOIN pg_attribute ref_a
-                ON ref_a.attrelid = ref_c.oid
-                AND ref_a.attnum = ANY(con.confkey)
-            WHERE c.relname = $1
-              AND n.nspname = $2
-              AND con.contype = 'f'  -- foreign key
-            ORDER BY con.conname
+            dict[int, set[str]]: Column names grouped by relation OID.
         """
+        rows = await conn.fetch(query, oids)
 
-        rows = await conn.fetch(query, table_name, schema_name)
-
-        return [
-            ForeignKeyInfo(
-                constraint_name=row["constraint_name"],
-                column_name=row["column_name"],
-                referenced_table=row["referenced_table"],
-                referenced_column=row["referenced_column"],
-            )
-            for row in rows
-        ]
+        key_columns: dict[int, set[str]] = defaultdict(set)
+        for row in rows:
+            key_columns[row["oid"]].add(row["column_name"])
+        return key_columns
 
-    async def _get_indexes(
-        self, conn: Connection, table_name: str, schema_name: str
-    ) -> list[IndexInfo]:
-        """Get index information for a table.
+    async def _get_foreign_keys(
+        self, conn: Connection, oids: list[int]
+    ) -> dict[int, list[ForeignKeyInfo]]:
+        """Get foreign key relationships for a set of relations.
 
         Args:
             conn: Database connection.
-            table_name: Name of the table.
-            schema_name: Schema name.
+            oids: Relation OIDs to fetch foreign keys for.
 
         Returns:
-            list[IndexInfo]: List of index information objects.
-        """
-        query = """
-            SELECT
-                i.relname AS index_name,
-                idx.indisunique AS is_unique,
-                am.amname AS index_type,
-                ARRAY(
-                    SELECT a.attname
-                    FROM pg_attribute a
-                    WHERE a.attrelid = idx.indrelid
-                      AND a.attnum = ANY(idx.indkey)
-                    ORDER BY array_position(idx.indkey, a.attnum)
-                ) AS columns
-            FROM pg_index idx
-            JOIN pg_class i ON i.oid = idx.indexrelid
-            JOIN pg_class c ON c.oid = idx.indrelid
-            JOIN pg_namespace n ON c.relnamespace = n.oid
-            JOIN pg_am am ON i.relam = am.oid
-            WHERE c.relname = $1
-              AND n.nspname = $2
-              AND NOT idx.indisprimary  -- exclude primary key indexes
-            ORDER BY i.relname
+            dict[int, list[ForeignKeyInfo]]: Foreign keys grouped by relation
+                OID, ordered by constraint name.
         """
+        rows = await conn.fetch(_FOREIGN_KEYS_QUERY, oids)
 
-        rows = await conn.fetch(query, table_name, schema_name)
-
-        return [
-            IndexInfo(
-                name=row["index_name"],
-                columns=list(row["columns"]),
-                is_unique=row["is_unique"],
-                index_type=row["index_type"],
+        foreign_keys: dict[int, list[ForeignKeyInfo]] = defaultdict(list)
+        for row in rows:
+            foreign_keys[row["oid"]].append(
+                ForeignKeyInfo(
+                    constraint_name=row["constraint_name"],
+                    column_name=row["column_name"],
+                    referenced_table=row["referenced_table"],
+                    referenced_column=row["referenced_column"],
+                )
             )
-            for row in rows
-        ]
+        return foreign_keys
 
-    async def _get_views(self, conn: Connection) -> list[TableInfo]:
-        """Get all user views.
+    async def _get_indexes(self, conn: Connection, oids: list[int]) -> dict[int, list[IndexInfo]]:
+        """Get index information for a set of relations.
 
         Args:
             conn: Database connection.
+            oids: Relation OIDs to fetch indexes for.
 
         Returns:
-            list[TableInfo]: List of view information objects.
-        """
-        query = """
-            SELECT
-                n.nspname AS schema_name,
-                c.relname AS table_name,
-                obj_description(c.oid, 'pg_class') AS comment
-            FROM pg_class c
-            JOIN pg_namespace n ON n.oid = c.relnamespace
-            WHERE c.relkind = 'v'  -- views only
-              AND n.nspname NOT IN ('pg_catalog', 'information_schema')
-            ORDER BY n.nspname, c.relname
+            dict[int, list[IndexInfo]]: Non-primary indexes grouped by relation
+                OID, ordered by index name.
         """
+        rows = await conn.fetch(_INDEXES_QUERY, oids)
 
-        rows = await conn.fetch(query)
-
-        return [
-            TableInfo(
-                schema_name=row["schema_name"],
-                table_name=row["table_name"],
-                comment=row["comment"],
-                row_count_estimate=None,
+        indexes: dict[int, list[IndexInfo]] = defaultdict(list)
+        for row in rows:
+            indexes[row["oid"]].append(
+                IndexInfo(
+                    name=row["index_name"],
+                    columns=list(row["columns"]),
+                    is_unique=row["is_unique"],
+                    index_type=row["index_type"],
+                )
             )
-            for row in rows
-        ]
+        return indexes
 
     async def _get_enum_types(self, conn: Connection) -> list[EnumTypeInfo]:
         """Get custom ENUM type definitions.
@@ -372,24 +526,7 @@ class SchemaIntrospector:
         Returns:
             list[EnumTypeInfo]: List of enum type information objects.
         """
-        query = """
-            SELECT
-                n.nspname AS schema_name,
-                t.typname AS type_name,
-                ARRAY(
-                    SELECT e.enumlabel
-                    FROM pg_enum e
-                    WHERE e.enumtypid = t.oid
-                    ORDER BY e.enumsortorder
-                ) AS values
-            FROM pg_type t
-            JOIN pg_namespace n ON t.typnamespace = n.oid
-            WHERE t.typtype = 'e'  -- enum types only
-              AND n.nspname NOT IN ('pg_catalog', 'information_schema')
-            ORDER BY n.nspname, t.typname
-        """
-
-        rows = await conn.fetch(query)
+        rows = await conn.fetch(_ENUM_TYPES_QUERY)
 
         return [
             EnumTypeInfo(
@@ -399,30 +536,3 @@ class SchemaIntrospector:
             )
             for row in rows
         ]
-
-    async def _get_row_count_estimate(
-        self, conn: Connection, table_name: str, schema_name: str
-    ) -> int:
-        """Get estimated row count for a table.
-
-        This uses PostgreSQL's statistics rather than COUNT(*) for better
-        performance on large tables.
-
-        Args:
-            conn: Database connection.
-            table_name: Name of the table.
-            schema_name: Schema name.
-
-        Returns:
-            int: Estimated number of rows.
-        """
-        query = """
-            SELECT reltuples::bigint AS estimate
-            FROM pg_class c
-            JOIN pg_namespace n ON c.relnamespace = n.oid
-            WHERE c.relname = $1
-              AND n.nspname = $2
-        """
-
-        result = await conn.fetchval(query, table_name, schema_name)
-        return int(result) if result is not None else 0
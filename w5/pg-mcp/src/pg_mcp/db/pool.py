@@ -1,34 +1,117 @@
 """Database connection pool management.
 
 This module provides utilities for creating and managing asyncpg connection
-pools for PostgreSQL databases.
+pools for PostgreSQL databases. Pools can apply the query session settings
+(statement timeout, search_path, read-only default and role) once per
+physical connection, so that queries need no SET round trips of their own.
 """
 
+import asyncio
+from typing import Any
+
 import asyncpg
-from asyncpg import Pool
+from asyncpg import Connection, Pool
+
+from pg_mcp.config.settings import DatabaseConfig, SecurityConfig
+from pg_mcp.models.errors import DatabaseError
+
+
+def validate_session_config(security_config: SecurityConfig) -> None:
+    """Check that session settings are safe to embed in SQL.
+
+    Args:
+        security_config: Security configuration providing the search_path
+            and read-only role.
+
+    Raises:
+        DatabaseError: If the search_path or role contains unsafe characters.
+    """
+    search_path = security_config.safe_search_path
+    if not all(c.isalnum() or c in ("_", ",", " ") for c in search_path):
+        raise DatabaseError(
+            message="Invalid search_path configuration",
+            details={"search_path": search_path},
+        )
+
+    readonly_role = security_config.readonly_role
+    if readonly_role and not all(c.isalnum() or c == "_" for c in readonly_role):
+        raise DatabaseError(
+            message="Invalid readonly_role configuration",
+            details={"readonly_role": readonly_role},
+        )
+
+
+def session_setup(security_config: SecurityConfig) -> dict[str, Any]:
+    """Build pool arguments that configure every connection for queries.
+
+    The statement timeout, search_path and ``default_transaction_read_only``
+    are sent as server settings in the connection startup packet. They
+    become the session defaults, so the ``RESET ALL`` that asyncpg runs when
+    a connection is released restores them. ``RESET ALL`` leaves the role
+    alone, so it is set when a connection is created and set again, in the
+    same round trip as the reset, whenever one is released (a query could
+    have changed it with ``set_config``).
+
+    Args:
+        security_config: Security configuration providing the settings.
 
-from pg_mcp.config.settings import DatabaseConfig
+    Returns:
+        dict: Keyword arguments for ``asyncpg.create_pool``.
+
+    Raises:
+        DatabaseError: If the search_path or role contains unsafe characters.
+    """
+    validate_session_config(security_config)
+    setup: dict[str, Any] = {
+        "server_settings": {
+            "statement_timeout": str(int(security_config.max_execution_time * 1000)),
+            "search_path": security_config.safe_search_path,
+            "default_transaction_read_only": "on",
+        }
+    }
+
+    if security_config.readonly_role:
+        set_role = f"SET ROLE {security_config.readonly_role}"
+
+        async def init(conn: Connection) -> None:
+            await conn.execute(set_role)
 
+        async def reset(conn: Connection) -> None:
+            await conn.execute(f"{conn.get_reset_query()}\n{set_role};")
 
-async def create_pool(config: DatabaseConfig) -> Pool:
+        setup["init"] = init
+        setup["reset"] = reset
+
+    return setup
+
+
+async def create_pool(
+    config: DatabaseConfig, security_config: SecurityConfig | None = None
+) -> Pool:
     """Create a connection pool for a single database.
 
     Args:
         config: Database configuration containing connection parameters
             and pool settings.
+        security_config: If given, every connection is set up with its
+            statement timeout, search_path and role and defaults to read-only
+            transactions (see ``session_setup``). Executors using the pool
+            can then skip per-query session setup.
 
     Returns:
         Pool: An asyncpg connection pool instance.
 
     Raises:
         asyncpg.PostgresError: If connection to the database fails.
+        DatabaseError: If the session settings are invalid.
 
     Example:
         >>> config = DatabaseConfig(host="localhost", name="mydb")
-        >>> pool = await create_pool(config)
+        >>> pool = await create_pool(config, SecurityConfig())
         >>> async with pool.acquire() as conn:
         ...     result = await conn.fetch("SELECT 1")
     """
+    session = session_setup(security_config) if security_config is not None else {}
     pool = await asyncpg.create_pool(
         host=config.host,
         port=config.port,
@@ -39,6 +122,7 @@ async def create_pool(config: DatabaseConfig) -> Pool:
         max_size=config.max_pool_size,
         timeout=config.pool_timeout,
         command_timeout=config.command_timeout,
+        **session,
     )
 
     if pool is None:
@@ -47,20 +131,27 @@ async def create_pool(config: DatabaseConfig) -> Pool:
     return pool
 
 
-async def create_pools(configs: list[DatabaseConfig]) -> dict[str, Pool]:
+async def create_pools(
+    configs: list[DatabaseConfig], security_config: SecurityConfig | None = None
+) -> dict[str, Pool]:
     """Create connection pools for multiple databases.
 
     This function creates pools concurrently for all provided database
-    configurations.
+    configurations, so startup takes about as long as the slowest database
+    rather than the sum of all. If any pool cannot be created, the pools that
+    were created are closed before the error is raised.
 
     Args:
         configs: List of database configurations.
+        security_config: Session settings applied to every connection of
+            every pool (see ``create_pool``).
 
     Returns:
         dict[str, Pool]: Dictionary mapping database names to their pools.
 
     Raises:
         asyncpg.PostgresError: If any database connection fails.
+        DatabaseError: If the session settings are invalid.
 
     Example:
         >>> configs = [
@@ -70,11 +161,19 @@ async def create_pools(configs: list[DatabaseConfig]) -> dict[str, Pool]:
         >>> pools = await create_pools(configs)
         >>> assert "db1" in pools and "db2" in pools
     """
-    pools: dict[str, Pool] = {}
-
-    for config in configs:
-        pool = await create_pool(config)
-        pools[config.name] = pool
+    results = await asyncio.gather(
+        *(create_pool(config, security_config) for config in configs),
+        return_exceptions=True,
+    )
+    pools = {
+        config.name: result
+        for config, result in zip(configs, results, strict=True)
+        if not isinstance(result, BaseException)
+    }
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        await asyncio.gather(*(pool.close() for pool in pools.values()), return_exceptions=True)
+        raise errors[0]
 
     return pools
 
@@ -1,8 +1,10 @@
 """Data models module."""
 
 from pg_mcp.models.errors import (
+    CursorNotFoundError,
     DatabaseConnectionError,
     DatabaseError,
+    DatabaseNotReadyError,
     ErrorCode,
     ErrorDetail,
     ExecutionTimeoutError,
@@ -10,6 +12,7 @@ from pg_mcp.models.errors import (
     LLMTimeoutError,
     LLMUnavailableError,
     PgMcpError,
+    QueryTooExpensiveError,
     RateLimitExceededError,
     SchemaLoadError,
     SecurityViolationError,
@@ -20,7 +23,9 @@ from pg_mcp.models.query import (
     QueryRequest,
     QueryResponse,
     QueryResult,
+    ResultFormat,
     ReturnType,
+    TruncationReason,
     ValidationResult,
 )
 from pg_mcp.models.schema import (
@@ -29,6 +34,8 @@ from pg_mcp.models.schema import (
     EnumTypeInfo,
     ForeignKeyInfo,
     IndexInfo,
+    RelationFingerprint,
+    SchemaIndex,
     TableInfo,
 )
 
@@ -40,8 +47,12 @@ __all__ = [
     "TableInfo",
     "EnumTypeInfo",
     "DatabaseSchema",
+    "RelationFingerprint",
+    "SchemaIndex",
     # Query models
     "ReturnType",
+    "ResultFormat",
+    "TruncationReason",
     "QueryRequest",
     "ValidationResult",
     "QueryResult",
@@ -55,10 +66,13 @@ __all__ = [
     "SQLParseError",
     "DatabaseError",
     "DatabaseConnectionError",
+    "DatabaseNotReadyError",
     "LLMError",
     "LLMTimeoutError",
     "LLMUnavailableError",
     "SchemaLoadError",
     "ExecutionTimeoutError",
     "RateLimitExceededError",
+    "CursorNotFoundError",
+    "QueryTooExpensiveError",
 ]
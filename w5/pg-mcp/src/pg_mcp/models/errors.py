@@ -20,11 +20,14 @@ class ErrorCode(StrEnum):
     SECURITY_VIOLATION = "security_violation"
     SQL_PARSE_ERROR = "sql_parse_error"
     QUESTION_TOO_LONG = "question_too_long"
+    CURSOR_NOT_FOUND = "cursor_not_found"
+    QUERY_TOO_EXPENSIVE = "query_too_expensive"
 
     # Server errors (5xx)
     INTERNAL_ERROR = "internal_error"
     DATABASE_ERROR = "database_error"
     DATABASE_CONNECTION_ERROR = "database_connection_error"
+    DATABASE_NOT_READY = "database_not_ready"
     LLM_ERROR = "llm_error"
     LLM_TIMEOUT = "llm_timeout"
     LLM_UNAVAILABLE = "llm_unavailable"
@@ -192,6 +195,23 @@ class DatabaseConnectionError(PgMcpError):
         super().__init__(message=message, code=ErrorCode.DATABASE_CONNECTION_ERROR, details=details)
 
 
+class DatabaseNotReadyError(PgMcpError):
+    """Exception raised when a database is still starting up.
+
+    The request can be retried once the database's connection pool and
+    schema are ready.
+    """
+
+    def __init__(self, message: str, details: dict[str, Any] | None = None) -> None:
+        """Initialize database not ready error.
+
+        Args:
+            message: Error message describing the pending database.
+            details: Optional warm-up details (e.g., state).
+        """
+        super().__init__(message=message, code=ErrorCode.DATABASE_NOT_READY, details=details)
+
+
 class LLMError(PgMcpError):
     """Base exception for LLM-related errors."""
 
@@ -269,6 +289,32 @@ class ExecutionTimeoutError(PgMcpError):
         super().__init__(message=message, code=ErrorCode.EXECUTION_TIMEOUT, details=details)
 
 
+class CursorNotFoundError(PgMcpError):
+    """Exception raised when a result cursor is unknown, expired or closed."""
+
+    def __init__(self, message: str, details: dict[str, Any] | None = None) -> None:
+        """Initialize cursor not found error.
+
+        Args:
+            message: Error message describing the missing cursor.
+            details: Optional cursor details.
+        """
+        super().__init__(message=message, code=ErrorCode.CURSOR_NOT_FOUND, details=details)
+
+
+class QueryTooExpensiveError(PgMcpError):
+    """Exception raised when a query's planner estimates exceed the limits."""
+
+    def __init__(self, message: str, details: dict[str, Any] | None = None) -> None:
+        """Initialize query too expensive error.
+
+        Args:
+            message: Error message describing the estimates and limits.
+            details: Optional estimate details (e.g., total_cost, plan_rows).
+        """
+        super().__init__(message=message, code=ErrorCode.QUERY_TOO_EXPENSIVE, details=details)
+
+
 class RateLimitExceededError(PgMcpError):
     """Exception raised when rate limit is exceeded."""
 
@@ -17,6 +17,21 @@ class ReturnType(StrEnum):
     RESULT = "result"  # Execute and return query results
 
 
+class ResultFormat(StrEnum):
+    """Layout of result rows in the response."""
+
+    OBJECTS = "objects"  # One object per row, keyed by column name
+    ARRAYS = "arrays"  # One array of values per row, in column order
+    COLUMNAR = "columnar"  # One array of values per column, in row order
+
+
+class TruncationReason(StrEnum):
+    """Limit at which rows were cut from a result."""
+
+    MAX_ROWS = "max_rows"  # Row count limit (max_rows)
+    MAX_RESULT_BYTES = "max_result_bytes"  # Size budget of the result's values
+
+
 class QueryRequest(BaseModel):
     """Query request from client containing natural language question."""
 
@@ -32,6 +47,20 @@ class QueryRequest(BaseModel):
     return_type: ReturnType = Field(
         default=ReturnType.RESULT, description="Whether to return SQL or execute and return results"
     )
+    result_format: ResultFormat = Field(
+        default=ResultFormat.OBJECTS, description="Layout of result rows in the response"
+    )
+    page_size: int | None = Field(
+        None,
+        ge=1,
+        description="Return the result in pages of this many rows, with a cursor token "
+        "for the next page (default: all rows at once)",
+    )
+    use_cache: bool = Field(
+        default=True,
+        description="Reuse SQL generated earlier for the same question, if the generation "
+        "cache is enabled (false always generates new SQL)",
+    )
 
     @field_validator("question")
     @classmethod
@@ -103,12 +132,39 @@ class ResultValidationResult(BaseModel):
 
 
 class QueryResult(BaseModel):
-    """Result data from query execution."""
+    """Result data from query execution.
+
+    Rows are laid out according to ``result_format``: as objects keyed by
+    column name in ``rows`` (the default), as value arrays in ``rows``, or
+    column by column in ``column_values``. The array layouts name each column
+    once, in ``columns``, instead of on every row.
+    """
 
     columns: list[str] = Field(default_factory=list, description="Column names in result set")
-    rows: list[dict[str, Any]] = Field(default_factory=list, description="Result rows as dicts")
+    rows: list[dict[str, Any]] | list[list[Any]] = Field(
+        default_factory=list,
+        description="Result rows as dicts, or as value arrays in column order (arrays format)",
+    )
+    column_values: list[list[Any]] | None = Field(
+        None, description="Values of each column in row order (columnar format)"
+    )
     row_count: int = Field(default=0, ge=0, description="Number of rows returned")
     execution_time_ms: float = Field(default=0.0, ge=0.0, description="Query execution time in ms")
+    truncated: bool = Field(
+        default=False, description="Whether rows beyond a limit were cut from the result"
+    )
+    truncation_reason: TruncationReason | None = Field(
+        None, description="Limit at which rows were cut, if the result was truncated"
+    )
+    truncated_values: int = Field(
+        default=0, ge=0, description="Number of values shortened to the per-value size cap"
+    )
+    cursor: str | None = Field(
+        None, description="Token for fetch_more to read the next page; None on the last page"
+    )
+    result_format: ResultFormat = Field(
+        default=ResultFormat.OBJECTS, description="Layout of the result rows"
+    )
 
     @field_validator("row_count", mode="before")
     @classmethod
@@ -122,6 +178,9 @@ class QueryResult(BaseModel):
         Returns:
             int: Validated row count.
         """
+        # In columnar format, rows are the entries of each column
+        if hasattr(info, "data") and info.data.get("column_values"):
+            return len(info.data["column_values"][0])
         # If rows exist in values, use its length
         if hasattr(info, "data") and "rows" in info.data:
             return len(info.data["rows"])
@@ -4,10 +4,31 @@ This module defines data models representing PostgreSQL database schema
 including tables, columns, foreign keys, indexes, and enum types.
 """
 
+import weakref
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+# Lookup indexes, keyed by model id. They live outside the models so that they
+# never take part in equality, serialization or copies, and are dropped
+# together with the model they index.
+_schema_indexes: dict[int, tuple[weakref.ref[Any], "SchemaIndex"]] = {}
+_column_indexes: dict[int, tuple[weakref.ref[Any], list[Any], dict[str, Any]]] = {}
+
+
+def _weak_entry_ref(model: BaseModel, registry: dict[int, Any]) -> weakref.ref[Any]:
+    """Create a weak reference that removes a model's registry entry on collection.
+
+    Args:
+        model: Indexed model.
+        registry: Registry holding the model's entry under ``id(model)``.
+
+    Returns:
+        weakref.ref: Reference to the model.
+    """
+    key = id(model)
+    return weakref.ref(model, lambda _: registry.pop(key, None))
+
 
 class ColumnInfo(BaseModel):
     """Information about a database column."""
@@ -105,6 +126,28 @@ class TableInfo(BaseModel):
         """
         return f"{self.schema_name}.{self.table_name}"
 
+    def get_column(self, column_name: str) -> ColumnInfo | None:
+        """Find column by name.
+
+        The lookup dictionary is built on first use and rebuilt whenever the
+        ``columns`` list is replaced.
+
+        Args:
+            column_name: Name of the column to find.
+
+        Returns:
+            ColumnInfo if found, None otherwise.
+        """
+        entry = _column_indexes.get(id(self))
+        if entry is None or entry[0]() is not self or entry[1] is not self.columns:
+            entry = (
+                _weak_entry_ref(self, _column_indexes),
+                self.columns,
+                {col.name: col for col in self.columns},
+            )
+            _column_indexes[id(self)] = entry
+        return entry[2].get(column_name)
+
     def to_prompt_section(self) -> str:
         """Format table info for LLM prompt.
 
@@ -162,13 +205,129 @@ class EnumTypeInfo(BaseModel):
         return f"  - {self.type_name}: {values}"
 
 
+class RelationFingerprint(BaseModel):
+    """Cheap catalog signature of a table or view, used for change detection.
+
+    The signature is derived from catalog row versions (pg_class, pg_attribute,
+    pg_attrdef, pg_constraint, pg_index, pg_description) and changes whenever
+    the relation's structure, defaults, constraints, indexes or comments change.
+    """
+
+    oid: int = Field(..., description="Relation OID")
+    schema_name: str = Field(..., description="Schema name")
+    table_name: str = Field(..., description="Table or view name")
+    signature: str = Field(..., description="Hash of the relation's catalog state")
+
+
+class SchemaIndex:
+    """Lookup tables over a DatabaseSchema.
+
+    Built by ``DatabaseSchema`` on first lookup; the schema rebuilds it when
+    its table or enum lists are replaced or its revision changes.
+
+    Attributes:
+        tables: Tables keyed by ``(schema_name, table_name)``.
+        tables_by_name: Tables keyed by unqualified name (several schemas may
+            share a name).
+        referrers: Tables with a foreign key to a table, keyed by the
+            referenced table's ``(schema_name, table_name)``.
+        enums: Enum types keyed by ``(schema_name, type_name)``.
+    """
+
+    def __init__(self, schema: "DatabaseSchema") -> None:
+        """Build the indexes.
+
+        Args:
+            schema: Schema to index.
+        """
+        self.source = (schema.tables, schema.enum_types, schema.revision)
+        self.tables: dict[tuple[str, str], TableInfo] = {}
+        self.tables_by_name: dict[str, list[TableInfo]] = {}
+        for table in schema.tables:
+            self.tables[(table.schema_name, table.table_name)] = table
+            self.tables_by_name.setdefault(table.table_name, []).append(table)
+
+        self.referrers: dict[tuple[str, str], list[TableInfo]] = {}
+        for table in schema.tables:
+            targets = {
+                (target.schema_name, target.table_name)
+                for fk in table.foreign_keys
+                for target in self.resolve(fk.referenced_table, table.schema_name)
+            }
+            for target in targets:
+                self.referrers.setdefault(target, []).append(table)
+
+        self.enums: dict[tuple[str, str], EnumTypeInfo] = {
+            (enum.schema_name, enum.type_name): enum for enum in schema.enum_types
+        }
+
+    def is_current(self, schema: "DatabaseSchema") -> bool:
+        """Check whether the index still matches a schema.
+
+        Args:
+            schema: Schema the index was built from.
+
+        Returns:
+            bool: True if the schema's lists and revision are unchanged.
+        """
+        tables, enum_types, revision = self.source
+        return (
+            tables is schema.tables
+            and enum_types is schema.enum_types
+            and revision == schema.revision
+        )
+
+    def resolve(self, table_name: str, schema_name: str) -> list[TableInfo]:
+        """Resolve an unqualified table reference, preferring a schema.
+
+        Foreign keys reference tables by unqualified name; a table in the
+        referencing table's schema wins over same-named tables elsewhere.
+
+        Args:
+            table_name: Unqualified table name.
+            schema_name: Preferred schema.
+
+        Returns:
+            list[TableInfo]: Matching tables (empty if unknown).
+        """
+        table = self.tables.get((schema_name, table_name))
+        if table is not None:
+            return [table]
+        return self.tables_by_name.get(table_name, [])
+
+
 class DatabaseSchema(BaseModel):
-    """Complete database schema information."""
+    """Complete database schema information.
+
+    Lookups by name (``get_table``, ``get_column``, ``get_referencing_tables``,
+    ``get_enum``) go through a lazily built SchemaIndex and are O(1). Code that
+    patches a schema in place must replace ``tables`` or ``enum_types`` (or
+    bump ``revision``) for the index to be rebuilt, as
+    ``SchemaIntrospector.introspect_changes`` does.
+    """
 
     database_name: str = Field(..., description="Database name")
     tables: list[TableInfo] = Field(default_factory=list, description="Database tables")
     enum_types: list[EnumTypeInfo] = Field(default_factory=list, description="Custom enum types")
     version: str | None = Field(None, description="PostgreSQL version")
+    revision: int = Field(
+        default=0,
+        ge=0,
+        description="Incremented whenever the schema is patched in place by a refresh",
+    )
+
+    @property
+    def index(self) -> SchemaIndex:
+        """Get the lookup index, building or rebuilding it if needed.
+
+        Returns:
+            SchemaIndex: Index over the current tables and enum types.
+        """
+        entry = _schema_indexes.get(id(self))
+        if entry is None or entry[0]() is not self or not entry[1].is_current(self):
+            entry = (_weak_entry_ref(self, _schema_indexes), SchemaIndex(self))
+            _schema_indexes[id(self)] = entry
+        return entry[1]
 
     def get_table(self, table_name: str, schema_name: str = "public") -> TableInfo | None:
         """Find table by name.
@@ -180,17 +339,72 @@ class DatabaseSchema(BaseModel):
         Returns:
             TableInfo if found, None otherwise.
         """
-        for table in self.tables:
-            if table.table_name == table_name and table.schema_name == schema_name:
-                return table
-        return None
+        return self.index.tables.get((schema_name, table_name))
+
+    def find_tables(self, table_name: str) -> list[TableInfo]:
+        """Find tables by unqualified name across all schemas.
+
+        Args:
+            table_name: Name of the tables to find.
+
+        Returns:
+            list[TableInfo]: Matching tables, in schema order.
+        """
+        return list(self.index.tables_by_name.get(table_name, []))
+
+    def get_column(
+        self, table_name: str, column_name: str, schema_name: str = "public"
+    ) -> ColumnInfo | None:
+        """Find a column of a table by name.
+
+        Args:
+            table_name: Name of the table.
+            column_name: Name of the column to find.
+            schema_name: Schema name (defaults to 'public').
+
+        Returns:
+            ColumnInfo if found, None otherwise.
+        """
+        table = self.get_table(table_name, schema_name)
+        return table.get_column(column_name) if table is not None else None
+
+    def get_referencing_tables(
+        self, table_name: str, schema_name: str = "public"
+    ) -> list[TableInfo]:
+        """Find the tables with a foreign key to a table.
+
+        Args:
+            table_name: Name of the referenced table.
+            schema_name: Schema name (defaults to 'public').
+
+        Returns:
+            list[TableInfo]: Referencing tables, in schema order.
+        """
+        return list(self.index.referrers.get((schema_name, table_name), []))
 
-    def to_prompt_context(self) -> str:
+    def get_enum(self, type_name: str, schema_name: str = "public") -> EnumTypeInfo | None:
+        """Find enum type by name.
+
+        Args:
+            type_name: Name of the enum type to find.
+            schema_name: Schema name (defaults to 'public').
+
+        Returns:
+            EnumTypeInfo if found, None otherwise.
+        """
+        return self.index.enums.get((schema_name, type_name))
+
+    def to_prompt_context(self, table_sections: list[str] | None = None) -> str:
         """Generate complete schema context for LLM prompt.
 
         This method creates a comprehensive yet concise representation of the
         database schema suitable for inclusion in LLM prompts for SQL generation.
 
+        Args:
+            table_sections: Pre-rendered ``to_prompt_section`` output for each
+                table, in table order (e.g. from a cache). Rendered on the fly
+                if omitted.
+
         Returns:
             str: Formatted schema context string.
         """
@@ -206,8 +420,9 @@ class DatabaseSchema(BaseModel):
 
         if self.tables:
             lines.append("\n=== Tables ===")
-            for table in self.tables:
-                lines.append(table.to_prompt_section())
+            if table_sections is None:
+                table_sections = [table.to_prompt_section() for table in self.tables]
+            lines.extend(table_sections)
 
         return "\n".join(lines)
 
@@ -18,7 +18,7 @@ class MetricsCollector:
     - LLM metrics: API calls, latency, and token usage
     - Database metrics: Connection pool and query performance
     - Security metrics: Rejected queries
-    - Cache metrics: Schema cache age
+    - Cache metrics: Schema cache age, lookups and refresh latency
 
     Example:
         >>> metrics = MetricsCollector()
@@ -75,6 +75,12 @@ class MetricsCollector:
             labelnames=["operation"],
         )
 
+        self.generation_cache_requests: Counter = Counter(
+            "pg_mcp_generation_cache_requests_total",
+            "Generated SQL cache lookups by result (hit, miss, similar_hit, similar_miss)",
+            labelnames=["database", "result"],
+        )
+
         # Security Metrics
         self.sql_rejected: Counter = Counter(
             "pg_mcp_sql_rejected_total",
@@ -82,6 +88,18 @@ class MetricsCollector:
             labelnames=["reason"],
         )
 
+        self.sql_parse_duration: Histogram = Histogram(
+            "pg_mcp_sql_parse_duration_seconds",
+            "Generated SQL parse duration in seconds (one parse per generated query)",
+            buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5),
+        )
+
+        self.sql_validation_cache_requests: Counter = Counter(
+            "pg_mcp_sql_validation_cache_requests_total",
+            "SQL validation verdict cache lookups by result (hit, miss)",
+            labelnames=["result"],
+        )
+
         # Database Metrics
         self.db_connections_active: Gauge = Gauge(
             "pg_mcp_db_connections_active",
@@ -95,6 +113,12 @@ class MetricsCollector:
             buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0),
         )
 
+        self.query_results_truncated: Counter = Counter(
+            "pg_mcp_query_results_truncated_total",
+            "Query results cut off at a limit, by limit (max_rows, max_result_bytes)",
+            labelnames=["database", "reason"],
+        )
+
         # Cache Metrics
         self.schema_cache_age: Gauge = Gauge(
             "pg_mcp_schema_cache_age_seconds",
@@ -102,6 +126,36 @@ class MetricsCollector:
             labelnames=["database"],
         )
 
+        self.schema_cache_requests: Counter = Counter(
+            "pg_mcp_schema_cache_requests_total",
+            "Schema cache lookups by result (hit, miss, stale)",
+            labelnames=["database", "result"],
+        )
+
+        self.schema_cache_coalesced: Counter = Counter(
+            "pg_mcp_schema_cache_coalesced_loads_total",
+            "Schema loads that joined an already in-flight load",
+            labelnames=["database"],
+        )
+
+        self.schema_cache_evictions: Counter = Counter(
+            "pg_mcp_schema_cache_evictions_total",
+            "Schemas evicted from the cache to respect its size bounds",
+            labelnames=["reason"],
+        )
+
+        self.schema_cache_bytes: Gauge = Gauge(
+            "pg_mcp_schema_cache_bytes",
+            "Estimated memory used by cached schemas in bytes",
+        )
+
+        self.schema_cache_refresh_duration: Histogram = Histogram(
+            "pg_mcp_schema_cache_refresh_duration_seconds",
+            "Schema load and refresh duration in seconds",
+            labelnames=["mode"],
+            buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0),
+        )
+
     def start_metrics_server(self, port: int) -> None:
         """Start the Prometheus metrics HTTP server.
 
@@ -150,6 +204,15 @@ class MetricsCollector:
         """
         self.llm_tokens_used.labels(operation=operation).inc(tokens)
 
+    def increment_generation_cache_request(self, database: str, result: str) -> None:
+        """Increment generated SQL cache lookup counter.
+
+        Args:
+            database: Database name.
+            result: Lookup result (hit, miss, similar_hit, similar_miss).
+        """
+        self.generation_cache_requests.labels(database=database, result=result).inc()
+
     def increment_sql_rejected(self, reason: str) -> None:
         """Increment SQL rejection counter.
 
@@ -158,6 +221,22 @@ class MetricsCollector:
         """
         self.sql_rejected.labels(reason=reason).inc()
 
+    def observe_sql_parse_duration(self, duration: float) -> None:
+        """Record SQL parse duration.
+
+        Args:
+            duration: Duration in seconds.
+        """
+        self.sql_parse_duration.observe(duration)
+
+    def increment_sql_validation_cache_request(self, result: str) -> None:
+        """Increment SQL validation verdict cache lookup counter.
+
+        Args:
+            result: Lookup result (hit, miss).
+        """
+        self.sql_validation_cache_requests.labels(result=result).inc()
+
     def set_db_connections_active(self, database: str, count: int) -> None:
         """Set active database connection count.
 
@@ -175,6 +254,15 @@ class MetricsCollector:
         """
         self.db_query_duration.observe(duration)
 
+    def increment_query_results_truncated(self, database: str, reason: str = "max_rows") -> None:
+        """Increment counter of results cut off at a limit.
+
+        Args:
+            database: Database name.
+            reason: Limit that was reached (max_rows or max_result_bytes).
+        """
+        self.query_results_truncated.labels(database=database, reason=reason).inc()
+
     def set_schema_cache_age(self, database: str, age_seconds: float) -> None:
         """Set schema cache age.
 
@@ -184,6 +272,48 @@ class MetricsCollector:
         """
         self.schema_cache_age.labels(database=database).set(age_seconds)
 
+    def increment_schema_cache_request(self, database: str, result: str) -> None:
+        """Increment schema cache lookup counter.
+
+        Args:
+            database: Database name.
+            result: Lookup result (hit, miss, stale).
+        """
+        self.schema_cache_requests.labels(database=database, result=result).inc()
+
+    def increment_schema_cache_coalesced(self, database: str) -> None:
+        """Increment counter of loads that joined an in-flight load.
+
+        Args:
+            database: Database name.
+        """
+        self.schema_cache_coalesced.labels(database=database).inc()
+
+    def increment_schema_cache_eviction(self, reason: str) -> None:
+        """Increment schema cache eviction counter.
+
+        Args:
+            reason: Eviction reason (size, memory, oversize).
+        """
+        self.schema_cache_evictions.labels(reason=reason).inc()
+
+    def set_schema_cache_bytes(self, size_bytes: int) -> None:
+        """Set estimated schema cache memory use.
+
+        Args:
+            size_bytes: Combined weight of cached schemas in bytes.
+        """
+        self.schema_cache_bytes.set(size_bytes)
+
+    def observe_schema_cache_refresh(self, mode: str, duration: float) -> None:
+        """Record schema load or refresh duration.
+
+        Args:
+            mode: Refresh mode (full, incremental).
+            duration: Duration in seconds.
+        """
+        self.schema_cache_refresh_duration.labels(mode=mode).observe(duration)
+
     def reset_all_metrics(self) -> None:
         """Reset all metrics to initial state.
 
@@ -8,6 +8,12 @@ from pg_mcp.prompts.result_validation import (
     RESULT_VALIDATION_SYSTEM_PROMPT,
     build_validation_prompt,
 )
+from pg_mcp.prompts.schema_context import (
+    SchemaContextRenderer,
+    estimate_tokens,
+    render_compact_context,
+    render_schema_context,
+)
 from pg_mcp.prompts.sql_generation import (
     SQL_GENERATION_SYSTEM_PROMPT,
     build_user_prompt,
@@ -18,4 +24,8 @@ __all__ = [
     "build_user_prompt",
     "RESULT_VALIDATION_SYSTEM_PROMPT",
     "build_validation_prompt",
+    "SchemaContextRenderer",
+    "estimate_tokens",
+    "render_compact_context",
+    "render_schema_context",
 ]
@@ -0,0 +1,459 @@
+"""Schema context rendering for SQL generation prompts.
+
+This module renders a DatabaseSchema into the text embedded in SQL generation
+prompts. Besides the verbose format produced by ``DatabaseSchema.to_prompt_context``
+it provides a dense, DDL-like format that fits a hard token budget by degrading
+detail level by level:
+
+1. Full detail (columns, keys, defaults, comments, row estimates, indexes,
+   every enum type with its values)
+2. Only the enum types that columns use
+3. Without indexes and row estimates
+4. Without column defaults
+5. Without comments
+6. Enum types listed by name only, names cut from the end of the list
+7. Lowest-priority tables collapsed to their names, from the end of the table
+   list (the schema retriever orders tables most relevant first)
+
+Example output::
+
+    Database: shop (PostgreSQL 16.1)
+    Enums: order_status('new','paid','shipped')
+    TABLE customers(id int PK, email varchar NOT NULL UNIQUE) -- Registered buyers
+    TABLE orders(id int PK, customer_id int NOT NULL REF customers.id, status order_status)
+    Other tables: audit_logs, settings
+"""
+
+import weakref
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
+
+from pg_mcp.config.settings import PromptConfig
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from pg_mcp.models.schema import DatabaseSchema, EnumTypeInfo, TableInfo
+
+
+class SchemaDetail(IntEnum):
+    """Detail levels of the compact renderer, from most to least detailed."""
+
+    FULL = 0
+    NO_INDEXES = 1
+    NO_DEFAULTS = 2
+    NO_COMMENTS = 3
+
+
+# Shorter spellings of common PostgreSQL type names (all valid in DDL)
+_TYPE_ALIASES = {
+    "integer": "int",
+    "bigint": "int8",
+    "smallint": "int2",
+    "boolean": "bool",
+    "character varying": "varchar",
+    "character": "char",
+    "double precision": "float8",
+    "real": "float4",
+    "timestamp with time zone": "timestamptz",
+    "timestamp without time zone": "timestamp",
+    "time with time zone": "timetz",
+    "time without time zone": "time",
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in a text.
+
+    Uses the common approximation of four characters per token, which is
+    close for English text, identifiers and SQL.
+
+    Args:
+        text: Text to measure.
+
+    Returns:
+        int: Estimated token count.
+
+    Example:
+        >>> estimate_tokens("SELECT 1")
+        2
+    """
+    return (len(text) + 3) // 4
+
+
+def _short_type(data_type: str) -> str:
+    """Abbreviate a PostgreSQL type name, keeping modifiers and array suffixes.
+
+    Args:
+        data_type: Type as reported by introspection, e.g. ``character varying(255)``.
+
+    Returns:
+        str: Abbreviated type name, e.g. ``varchar(255)``.
+    """
+    base, sep, rest = data_type.partition("(")
+    suffix = ""
+    if base.endswith("[]"):
+        base, suffix = base[:-2], "[]"
+    base = _TYPE_ALIASES.get(base.strip(), base.strip())
+    return f"{base}{sep}{rest}{suffix}"
+
+
+def _table_name(table: "TableInfo") -> str:
+    """Get a table's name, schema-qualified unless it is in ``public``.
+
+    Args:
+        table: Table to name.
+
+    Returns:
+        str: Table name for the compact format.
+    """
+    return table.table_name if table.schema_name == "public" else table.full_name
+
+
+def _enum_name(enum: "EnumTypeInfo") -> str:
+    """Get an enum type's name, schema-qualified unless it is in ``public``.
+
+    Args:
+        enum: Enum type to name.
+
+    Returns:
+        str: Enum type name for the compact format.
+    """
+    return enum.type_name if enum.schema_name == "public" else enum.full_name
+
+
+def _used_enums(schema: "DatabaseSchema") -> list["EnumTypeInfo"]:
+    """Get the enum types that columns of the schema's tables use.
+
+    Args:
+        schema: Schema whose tables and enum types to match.
+
+    Returns:
+        list[EnumTypeInfo]: Used enum types, in schema order.
+    """
+    # Column types name enums as format_type does: qualified unless visible
+    # on the search path, quoted if needed, with [] for arrays
+    used = {
+        col.data_type.removesuffix("[]").replace('"', "")
+        for table in schema.tables
+        for col in table.columns
+    }
+    return [enum for enum in schema.enum_types if enum.type_name in used or enum.full_name in used]
+
+
+def render_table_compact(table: "TableInfo", detail: SchemaDetail = SchemaDetail.FULL) -> str:
+    """Render a table as a single DDL-like line.
+
+    Args:
+        table: Table to render.
+        detail: Detail level to render at.
+
+    Returns:
+        str: Compact table definition.
+
+    Example:
+        >>> render_table_compact(users_table, SchemaDetail.NO_COMMENTS)
+        'TABLE users(id int PK, email text NOT NULL UNIQUE)'
+    """
+    references = {fk.column_name: fk for fk in table.foreign_keys}
+    columns = []
+    for col in table.columns:
+        parts = [col.name, _short_type(col.data_type)]
+        if col.is_primary_key:
+            parts.append("PK")
+        elif not col.is_nullable:
+            parts.append("NOT NULL")
+        if col.is_unique and not col.is_primary_key:
+            parts.append("UNIQUE")
+        fk = references.get(col.name)
+        if fk is not None:
+            parts.append(f"REF {fk.referenced_table}.{fk.referenced_column}")
+        if col.default_value and detail < SchemaDetail.NO_DEFAULTS:
+            parts.append(f"DEFAULT {col.default_value}")
+        if col.comment and detail < SchemaDetail.NO_COMMENTS:
+            parts.append(f"/* {col.comment} */")
+        columns.append(" ".join(parts))
+
+    line = f"TABLE {_table_name(table)}({', '.join(columns)})"
+
+    notes = []
+    if table.comment and detail < SchemaDetail.NO_COMMENTS:
+        notes.append(table.comment)
+    if detail < SchemaDetail.NO_INDEXES:
+        if table.row_count_estimate is not None:
+            notes.append(f"~{table.row_count_estimate:,} rows")
+        for idx in table.indexes:
+            unique = "UNIQUE " if idx.is_unique else ""
+            notes.append(f"{unique}{idx.index_type} idx({', '.join(idx.columns)})")
+    if notes:
+        line += f" -- {'; '.join(notes)}"
+    return line
+
+
+def render_compact_context(
+    schema: "DatabaseSchema",
+    token_budget: int | None = None,
+    render_table: "Callable[[TableInfo, SchemaDetail], str]" = render_table_compact,
+) -> str:
+    """Render a schema in the compact format, fitting a token budget.
+
+    Detail is reduced level by level until the estimated size fits the budget,
+    starting with the enum types no column uses; then enum types are listed
+    by name only and cut from the end of the list, the lowest-priority tables
+    (last in ``schema.tables``) are collapsed to names only, and as a last
+    resort the list of collapsed names is cut.
+
+    Args:
+        schema: Schema to render.
+        token_budget: Maximum estimated tokens, or None for unlimited.
+        render_table: Renders one table at a detail level (e.g. a cached
+            variant of ``render_table_compact``).
+
+    Returns:
+        str: Compact schema context.
+
+    Example:
+        >>> context = render_compact_context(schema, token_budget=2000)
+        >>> estimate_tokens(context) <= 2000
+        True
+    """
+    header = [f"Database: {schema.database_name}"]
+    if schema.version:
+        header[0] += f" ({schema.version})"
+    if schema.enum_types:
+        header.append(_enum_line(schema.enum_types))
+
+    detail = SchemaDetail.FULL
+    lines = [render_table(table, detail) for table in schema.tables]
+    text = "\n".join(header + lines)
+    if token_budget is None or estimate_tokens(text) <= token_budget:
+        return text
+
+    # Only describe the enum types that columns use
+    enums = _used_enums(schema)
+    header[1:] = [_enum_line(enums)] if enums else []
+    text = "\n".join(header + lines)
+    if estimate_tokens(text) <= token_budget:
+        return text
+
+    while detail < SchemaDetail.NO_COMMENTS:
+        detail = SchemaDetail(detail + 1)
+        lines = [render_table(table, detail) for table in schema.tables]
+        text = "\n".join(header + lines)
+        if estimate_tokens(text) <= token_budget:
+            return text
+
+    budget_chars = token_budget * 4
+    if enums:
+        # Enum names only (column types show where they are used), then cut
+        # names from the end of the list
+        names = [_enum_name(enum) for enum in enums]
+        others = len(header[0]) + sum(len(line) + 1 for line in lines) + 1
+        header[1] = _name_list("Enums", names, len(enums))
+        while names and others + len(header[1]) > budget_chars:
+            names.pop()
+            header[1] = _name_list("Enums", names, len(enums))
+        text = "\n".join(header + lines)
+        if estimate_tokens(text) <= token_budget:
+            return text
+
+    # Collapse tables to names only, lowest priority (last) first
+    used = sum(len(line) + 1 for line in header + lines) - 1
+    kept = len(lines)
+    collapsed: list[str] = []
+    names_prefix = "\nOther tables: "
+    while kept and used > budget_chars:
+        kept -= 1
+        name = _table_name(schema.tables[kept])
+        used -= len(lines[kept]) + 1
+        used += len(name) + (len(names_prefix) if not collapsed else 2)
+        collapsed.append(name)
+
+    collapsed.reverse()
+    text = _join_collapsed(header + lines[:kept], collapsed, len(schema.tables) - kept)
+    while collapsed and estimate_tokens(text) > token_budget:
+        # Even names only do not fit: drop names from the end of the list
+        collapsed.pop()
+        text = _join_collapsed(header + lines[:kept], collapsed, len(schema.tables) - kept)
+    return text
+
+
+def _enum_line(enums: "Iterable[EnumTypeInfo]") -> str:
+    """Render enum types with their values as a header line.
+
+    Args:
+        enums: Enum types to list.
+
+    Returns:
+        str: Enums header line.
+    """
+    listed = "; ".join(
+        f"{_enum_name(enum)}({','.join(repr(v) for v in enum.values)})" for enum in enums
+    )
+    return f"Enums: {listed}"
+
+
+def _name_list(label: str, names: list[str], count: int) -> str:
+    """Render a line listing names, counting those cut from the list.
+
+    Args:
+        label: Line label.
+        names: Names to list.
+        count: Total number of names, listed or not.
+
+    Returns:
+        str: The line, e.g. ``Enums: mood, status +3 more``.
+    """
+    omitted = count - len(names)
+    listed = ", ".join(names)
+    more = f"+{omitted} more" if omitted else ""
+    separator = " " if names and more else ""
+    return f"{label}: {listed}{separator}{more}"
+
+
+def _join_collapsed(lines: list[str], names: list[str], collapsed_count: int) -> str:
+    """Join rendered lines with the list of tables collapsed to names.
+
+    Args:
+        lines: Header and fully rendered table lines.
+        names: Collapsed table names to list.
+        collapsed_count: Total number of collapsed tables.
+
+    Returns:
+        str: Schema context text.
+    """
+    if not collapsed_count:
+        return "\n".join(lines)
+    return "\n".join([*lines, _name_list("Other tables", names, collapsed_count)])
+
+
+def render_schema_context(schema: "DatabaseSchema", config: PromptConfig | None = None) -> str:
+    """Render the schema context for a SQL generation prompt.
+
+    Args:
+        schema: Schema to render.
+        config: Prompt configuration selecting the format and token budget.
+            Defaults to the verbose format.
+
+    Returns:
+        str: Schema context text.
+
+    Example:
+        >>> render_schema_context(schema, PromptConfig(schema_format="compact"))
+    """
+    if config is None or config.schema_format == "verbose":
+        return schema.to_prompt_context()
+    return render_compact_context(schema, config.schema_token_budget or None)
+
+
+class SchemaContextRenderer:
+    """Schema context renderer that memoizes its output.
+
+    Whole contexts are cached per schema object, revision and rendering
+    options, so repeated prompts (including retries) for an unchanged schema
+    cost a dictionary lookup. Per-table sections are cached per table object,
+    so after an incremental refresh, which replaces only the changed tables,
+    only those tables are re-rendered. Entries are held through weak
+    references and disappear with the schemas and tables they were built from.
+
+    Example:
+        >>> renderer = SchemaContextRenderer(PromptConfig(schema_format="compact"))
+        >>> context = renderer.render(schema)  # Rendered
+        >>> context = renderer.render(schema)  # Cached
+    """
+
+    def __init__(self, config: PromptConfig | None = None) -> None:
+        """Initialize renderer.
+
+        Args:
+            config: Default prompt configuration (format and token budget).
+        """
+        self.config = config or PromptConfig()
+        # (id(schema), format, budget) -> (schema ref, revision, context)
+        self._contexts: dict[tuple[Any, ...], tuple[weakref.ref[Any], int, str]] = {}
+        # id(table) -> (table ref, row estimate, {detail level: section})
+        self._sections: dict[
+            int, tuple[weakref.ref[Any], int | None, dict[SchemaDetail | None, str]]
+        ] = {}
+        self._stats = {
+            "context_hits": 0,
+            "context_misses": 0,
+            "section_hits": 0,
+            "section_misses": 0,
+        }
+
+    def render(self, schema: "DatabaseSchema", config: PromptConfig | None = None) -> str:
+        """Render a schema's prompt context, reusing cached output.
+
+        Args:
+            schema: Schema to render.
+            config: Prompt configuration for this call; defaults to the
+                renderer's configuration.
+
+        Returns:
+            str: Schema context text, identical to ``render_schema_context``.
+        """
+        config = config or self.config
+        key = (id(schema), config.schema_format, config.schema_token_budget)
+        cached = self._contexts.get(key)
+        if cached is not None and cached[0]() is schema and cached[1] == schema.revision:
+            self._stats["context_hits"] += 1
+            return cached[2]
+
+        self._stats["context_misses"] += 1
+        if config.schema_format == "verbose":
+            context = schema.to_prompt_context(
+                table_sections=[self._section(table, None) for table in schema.tables]
+            )
+        else:
+            context = render_compact_context(
+                schema, config.schema_token_budget or None, render_table=self._section
+            )
+
+        ref = weakref.ref(schema, lambda _, key=key: self._contexts.pop(key, None))
+        self._contexts[key] = (ref, schema.revision, context)
+        return context
+
+    def _section(self, table: "TableInfo", detail: SchemaDetail | None) -> str:
+        """Render one table, reusing a cached section.
+
+        Args:
+            table: Table to render.
+            detail: Compact detail level, or None for the verbose section.
+
+        Returns:
+            str: Rendered table section.
+        """
+        entry = self._sections.get(id(table))
+        if entry is None or entry[0]() is not table or entry[1] != table.row_count_estimate:
+            table_id = id(table)
+            ref = weakref.ref(
+                table, lambda _, table_id=table_id: self._sections.pop(table_id, None)
+            )
+            entry = (ref, table.row_count_estimate, {})
+            self._sections[table_id] = entry
+
+        sections = entry[2]
+        section = sections.get(detail)
+        if section is None:
+            self._stats["section_misses"] += 1
+            section = (
+                table.to_prompt_section() if detail is None else render_table_compact(table, detail)
+            )
+            sections[detail] = section
+        else:
+            self._stats["section_hits"] += 1
+        return section
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get renderer cache statistics.
+
+        Returns:
+            Dictionary containing context and section hit/miss counters and
+            the number of cached contexts and tables.
+        """
+        return {
+            **self._stats,
+            "cached_contexts": len(self._contexts),
+            "cached_tables": len(self._sections),
+        }
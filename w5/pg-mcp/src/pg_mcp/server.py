@@ -5,25 +5,33 @@ functionality as an MCP tool. It includes complete lifespan management for
 initializing and cleaning up all components.
 """
 
+import asyncio
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any
 
 from asyncpg import Pool
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 
 from pg_mcp.cache.schema_cache import SchemaCache
-from pg_mcp.config.settings import Settings
-from pg_mcp.db.pool import close_pools, create_pool
-from pg_mcp.models.query import QueryRequest, QueryResponse, ReturnType
+from pg_mcp.config.settings import DatabaseConfig, Settings
+from pg_mcp.db.pool import close_pools
+from pg_mcp.models.errors import PgMcpError
+from pg_mcp.models.query import QueryRequest, QueryResponse, ResultFormat, ReturnType
 from pg_mcp.observability.logging import configure_logging, get_logger
 from pg_mcp.observability.metrics import MetricsCollector
 from pg_mcp.resilience.circuit_breaker import CircuitBreaker
 from pg_mcp.resilience.rate_limiter import MultiRateLimiter
+from pg_mcp.services.cost_guard import CostGuard
+from pg_mcp.services.database_warmup import DatabaseWarmup
+from pg_mcp.services.generation_cache import GenerationCache
 from pg_mcp.services.orchestrator import QueryOrchestrator
+from pg_mcp.services.result_pager import ResultPager
 from pg_mcp.services.result_validator import ResultValidator
+from pg_mcp.services.schema_retriever import SchemaRetriever
 from pg_mcp.services.sql_executor import SQLExecutor
 from pg_mcp.services.sql_generator import SQLGenerator
+from pg_mcp.services.sql_rewriter import SQLRewriter
 from pg_mcp.services.sql_validator import SQLValidator
 
 logger = get_logger(__name__)
@@ -36,6 +44,8 @@ _orchestrator: QueryOrchestrator | None = None
 _metrics: MetricsCollector | None = None
 _circuit_breaker: CircuitBreaker | None = None
 _rate_limiter: MultiRateLimiter | None = None
+_result_pager: ResultPager | None = None
+_warmup: DatabaseWarmup | None = None
 
 
 @asynccontextmanager
@@ -47,18 +57,22 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
     Startup:
         1. Load configuration from Settings
         2. Configure logging
-        3. Create database connection pools
-        4. Load schema cache for all databases
+        3. Create the connection pool and load the schema of every database
+           concurrently (from snapshots when available); with lazy startup
+           this continues in the background
+        4. Start schema auto-refresh (if enabled)
         5. Initialize metrics collector
         6. Create service components (generators, validators, executors)
         7. Initialize resilience components (circuit breaker, rate limiter)
-        8. Create query orchestrator
+        8. Create query orchestrator (with the result pager, if paging is enabled)
         9. Start metrics HTTP server (optional)
 
     Shutdown:
         1. Stop schema auto-refresh (if enabled)
-        2. Close all database connection pools
-        3. Stop metrics HTTP server (if running)
+        2. Stop database start-ups still in progress
+        3. Close open result cursors
+        4. Close all database connection pools
+        5. Stop metrics HTTP server (if running)
 
     Yields:
         None
@@ -69,7 +83,7 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
         ...     pass
     """
     global _settings, _pools, _schema_cache, _orchestrator, _metrics
-    global _circuit_breaker, _rate_limiter
+    global _circuit_breaker, _rate_limiter, _result_pager, _warmup
 
     logger.info("Starting PostgreSQL MCP Server initialization...")
 
@@ -94,43 +108,47 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
             },
         )
 
-        # 3. Create database connection pools
-        logger.info("Creating database connection pools...")
-        _pools = {}
-        # Note: For single database configuration, we use the main database config
-        pool = await create_pool(_settings.database)
-        _pools[_settings.database.name] = pool
-        logger.info(
-            f"Created connection pool for database '{_settings.database.name}'",
-            extra={
-                "min_size": _settings.database.min_pool_size,
-                "max_size": _settings.database.max_pool_size,
-            },
-        )
-
-        # 4. Load Schema cache
-        logger.info("Initializing schema cache...")
+        # 3. Start databases: each creates its pool and loads its schema
+        # (from snapshots when available) concurrently with the others.
+        # Session settings (timeout, search_path, read-only, role) are
+        # applied once per connection, so queries need no SET round trips
+        database_configs = _settings.database_configs
         _schema_cache = SchemaCache(_settings.cache)
+        sql_executors: dict[str, SQLExecutor] = {}
 
-        for db_name, pool in _pools.items():
-            logger.info(f"Loading schema for database '{db_name}'...")
-            schema = await _schema_cache.load(db_name, pool)
-            logger.info(
-                f"Schema loaded for '{db_name}'",
-                extra={
-                    "tables": len(schema.tables),
-                },
+        def add_executor(db_config: DatabaseConfig, pool: Pool) -> None:
+            sql_executors[db_config.name] = SQLExecutor(
+                pool=pool,
+                security_config=_settings.security,
+                db_config=db_config,
+                session_preconfigured=True,
             )
+            logger.info(f"Created SQL executor for database '{db_config.name}'")
+
+        _warmup = DatabaseWarmup(
+            database_configs,
+            _schema_cache,
+            _settings.startup,
+            security_config=_settings.security,
+            on_pool=add_executor,
+        )
+        _pools = _warmup.pools
+        if _settings.startup.lazy:
+            # Requests wait for their own database only (see the status tool)
+            logger.info(f"Starting {len(database_configs)} database(s) in the background...")
+            _warmup.start()
+        else:
+            logger.info(f"Starting {len(database_configs)} database(s)...")
+            await _warmup.wait_all()
 
         # Optional: Start schema auto-refresh
-        # Disabled by default to avoid unnecessary background tasks
-        # Uncomment to enable:
-        # if _settings.cache.enabled:
-        #     logger.info("Starting schema auto-refresh...")
-        #     await _schema_cache.start_auto_refresh(
-        #         interval_minutes=60,  # Refresh every hour
-        #         pools=_pools,
-        #     )
+        # Disabled by default (CACHE_REFRESH_INTERVAL=0) to avoid background tasks
+        if _settings.cache.enabled and _settings.cache.refresh_interval:
+            logger.info("Starting schema auto-refresh...")
+            await _schema_cache.start_auto_refresh(
+                interval_minutes=_settings.cache.refresh_interval,
+                pools=_pools,
+            )
 
         # 5. Initialize metrics collector
         logger.info("Initializing metrics collector...")
@@ -147,7 +165,7 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
         logger.info("Initializing service components...")
 
         # SQL Generator
-        sql_generator = SQLGenerator(_settings.openai)
+        sql_generator = SQLGenerator(_settings.openai, _settings.prompt)
 
         # SQL Validator
         sql_validator = SQLValidator(
@@ -157,16 +175,21 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
             allow_explain=False,
         )
 
-        # SQL Executor (create one per database)
-        sql_executors: dict[str, SQLExecutor] = {}
-        for db_name, pool in _pools.items():
-            executor = SQLExecutor(
-                pool=pool,
-                security_config=_settings.security,
-                db_config=_settings.database,
-            )
-            sql_executors[db_name] = executor
-            logger.info(f"Created SQL executor for database '{db_name}'")
+        # SQL Rewriter (pushes max_rows down into validated queries)
+        sql_rewriter = SQLRewriter(_settings.security)
+
+        # Cost Guard (rejects queries the planner estimates to be too expensive)
+        cost_guard = CostGuard(_settings.cost_guard) if _settings.cost_guard.enabled else None
+
+        # Generation Cache (reuses the SQL generated for repeated questions)
+        generation_cache = (
+            GenerationCache(_settings.generation_cache)
+            if _settings.generation_cache.enabled
+            else None
+        )
+
+        # Schema Retriever (prunes the schema to question-relevant tables)
+        schema_retriever = SchemaRetriever(_settings.schema_retrieval)
 
         # Result Validator
         result_validator = ResultValidator(
@@ -189,24 +212,37 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
             llm_limit=5,  # Can be made configurable
         )
 
+        # Result Pager (holds paged results open for fetch_more)
+        if _settings.paging.enabled:
+            _result_pager = ResultPager(_settings.paging)
+            await _result_pager.start_eviction()
+
         # 8. Create QueryOrchestrator
         logger.info("Creating query orchestrator...")
         _orchestrator = QueryOrchestrator(
             sql_generator=sql_generator,
             sql_validator=sql_validator,
-            sql_executor=sql_executors[_settings.database.name],  # Use primary executor
+            sql_executor=None,  # Executors by database are added as pools are created
             result_validator=result_validator,
             schema_cache=_schema_cache,
             pools=_pools,
             resilience_config=_settings.resilience,
             validation_config=_settings.validation,
+            schema_retriever=schema_retriever,
+            sql_rewriter=sql_rewriter,
+            result_pager=_result_pager,
+            sql_executors=sql_executors,
+            warmup=_warmup,
+            cost_guard=cost_guard,
+            generation_cache=generation_cache,
         )
 
         logger.info("PostgreSQL MCP Server initialization complete!")
         logger.info(
             "Server ready to accept requests",
             extra={
-                "databases": list(_pools.keys()),
+                "databases": _warmup.database_names,
+                "lazy_startup": _settings.startup.lazy,
                 "cache_enabled": _settings.cache.enabled,
                 "metrics_enabled": _settings.observability.metrics_enabled,
             },
@@ -222,7 +258,6 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
         # Stop schema auto-refresh with timeout
         if _schema_cache is not None:
             try:
-                import asyncio
                 await asyncio.wait_for(
                     _schema_cache.stop_auto_refresh(),
                     timeout=3.0
@@ -233,6 +268,18 @@ async def lifespan(_app: FastMCP) -> AsyncIterator[None]:  # type: ignore[type-a
             except Exception as e:
                 logger.warning(f"Error stopping schema auto-refresh: {e!s}")
 
+        # Stop database start-ups still in progress
+        if _warmup is not None:
+            await _warmup.close()
+
+        # Close open result cursors, returning their connections to the pools
+        if _result_pager is not None:
+            try:
+                await _result_pager.close()
+                logger.info("Result cursors closed")
+            except Exception as e:
+                logger.warning(f"Error closing result cursors: {e!s}")
+
         # Close database connection pools with timeout
         if _pools is not None:
             try:
@@ -252,8 +299,12 @@ mcp = FastMCP("pg-mcp", lifespan=lifespan)
 @mcp.tool()
 async def query(
     question: str,
+    ctx: Context,  # type: ignore[type-arg]
     database: str | None = None,
     return_type: str = "result",
+    result_format: str = "objects",
+    page_size: int | None = None,
+    use_cache: bool = True,
 ) -> dict[str, Any]:
     """Execute a natural language query against PostgreSQL database.
 
@@ -277,6 +328,26 @@ async def query(
                 - "sql": Return only the generated SQL query without executing it
                 - "result": Execute the query and return results (default)
 
+        result_format: Layout of the result rows.
+            Options:
+                - "objects": One object per row, keyed by column name (default)
+                - "arrays": One array of values per row, in ``columns`` order
+                - "columnar": One array of values per column, in
+                  ``data.column_values``; the most compact for large results
+
+        page_size: Return the result in pages of this many rows (optional).
+            The response holds the first page; if more rows follow,
+            ``data.cursor`` is a token for the ``fetch_more`` tool, which
+            returns the next pages without running the query again. Unread
+            cursors expire after a few minutes.
+
+        use_cache: Reuse the SQL generated earlier for the same question
+            against the same, unchanged schema (default: true). Only applies
+            if the server enables the generation cache; cached SQL is still
+            validated before it runs. Pass false to always generate new SQL.
+
+        ctx: MCP request context, identifying the client that owns cursors.
+
     Returns:
         dict: Query response containing:
             - success (bool): Whether the query succeeded
@@ -335,12 +406,28 @@ async def query(
             },
         }
 
+    # Validate result_format
+    formats = [f.value for f in ResultFormat]
+    if result_format not in formats:
+        return {
+            "success": False,
+            "error": {
+                "code": "INVALID_PARAMETER",
+                "message": f"Invalid result_format: '{result_format}'. "
+                f"Must be one of {', '.join(repr(f) for f in formats)}.",
+                "details": {"result_format": result_format},
+            },
+        }
+
     # Build request
     try:
         request = QueryRequest(
             question=question,
             database=database,
             return_type=ReturnType(return_type),
+            result_format=ResultFormat(result_format),
+            page_size=page_size,
+            use_cache=use_cache,
         )
     except Exception as e:
         return {
@@ -354,7 +441,9 @@ async def query(
 
     # Execute query through orchestrator
     try:
-        response: QueryResponse = await _orchestrator.execute_query(request)
+        response: QueryResponse = await _orchestrator.execute_query(
+            request, client_id=_client_id(ctx)
+        )
         result = response.to_dict()
         # Ensure tokens_used is always present
         if "tokens_used" not in result:
@@ -373,6 +462,99 @@ async def query(
         }
 
 
+@mcp.tool()
+async def fetch_more(cursor: str, ctx: Context) -> dict[str, Any]:  # type: ignore[type-arg]
+    """Fetch the next page of a paged query result.
+
+    Reads the next rows of a result opened by the ``query`` tool with a
+    ``page_size``, from the cursor the server holds open. The query is not
+    generated or executed again, so the pages form one consistent result.
+
+    Args:
+        cursor: Token from ``data.cursor`` of the previous page.
+
+        ctx: MCP request context, identifying the client that owns the cursor.
+
+    Returns:
+        dict: Response containing:
+            - success (bool): Whether the page was read
+            - data (dict): The page, in the result format of the query;
+              ``cursor`` is the token for the next page, or None on the last
+            - error (dict): Error information if the cursor expired or the
+              fetch failed
+
+    Examples:
+        >>> result = await query(question="List all orders", page_size=500)
+        >>> while result["data"]["cursor"]:
+        ...     result = await fetch_more(cursor=result["data"]["cursor"])
+    """
+    if _result_pager is None:
+        return {
+            "success": False,
+            "error": {
+                "code": "SERVER_NOT_INITIALIZED",
+                "message": "Result paging is not enabled",
+                "details": None,
+            },
+        }
+
+    try:
+        page = await _result_pager.fetch_more(cursor, client_id=_client_id(ctx))
+        return {"success": True, "data": page.model_dump(), "error": None}
+    except PgMcpError as e:
+        return {
+            "success": False,
+            "data": None,
+            "error": {"code": e.code.value, "message": e.message, "details": e.details},
+        }
+    except Exception as e:
+        logger.exception("Unexpected error in fetch_more tool")
+        return {
+            "success": False,
+            "data": None,
+            "error": {
+                "code": "INTERNAL_ERROR",
+                "message": f"Internal server error: {e!s}",
+                "details": {"error_type": type(e).__name__},
+            },
+        }
+
+
+@mcp.tool()
+async def status() -> dict[str, Any]:
+    """Report whether the server and each of its databases are ready.
+
+    With lazy startup (``STARTUP_LAZY=true``) the server accepts requests
+    before its databases have started; a query for a database that is still
+    starting waits briefly and may fail with ``database_not_ready``, to be
+    retried. Use this tool to see which databases can be queried.
+
+    Returns:
+        dict: Status containing:
+            - ready (bool): Whether every database is ready
+            - lazy_startup (bool): Whether databases start in the background
+            - databases (dict): Per database: state ("pending", "connecting",
+              "loading_schema", "ready" or "failed"), start-up attempts,
+              start-up time in ms (or time elapsed so far), table count and
+              last error
+    """
+    if _warmup is None or _settings is None:
+        return {"ready": False, "lazy_startup": False, "databases": {}}
+    return {**_warmup.get_status(), "lazy_startup": _settings.startup.lazy}
+
+
+def _client_id(ctx: Context) -> str:  # type: ignore[type-arg]
+    """Identify the client of a tool call, which owns the cursors it opens.
+
+    Args:
+        ctx: MCP request context.
+
+    Returns:
+        str: The client ID the client sent or, without one, its session.
+    """
+    return ctx.client_id or f"session-{id(ctx.session)}"
+
+
 if __name__ == "__main__":
     """Run the server when executed directly."""
     import anyio
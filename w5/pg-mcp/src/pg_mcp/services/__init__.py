@@ -4,8 +4,13 @@ This module provides high-level services that orchestrate various components
 including SQL generation, validation, execution, and result validation.
 """
 
+from pg_mcp.services.cost_guard import CostGuard
+from pg_mcp.services.database_warmup import DatabaseWarmup
+from pg_mcp.services.generation_cache import GenerationCache
 from pg_mcp.services.orchestrator import QueryOrchestrator
+from pg_mcp.services.result_pager import ResultPager
 from pg_mcp.services.result_validator import ResultValidator
+from pg_mcp.services.schema_retriever import SchemaRetriever
 from pg_mcp.services.sql_executor import SQLExecutor
 from pg_mcp.services.sql_generator import SQLGenerator
 
@@ -16,6 +21,11 @@ __all__ = [
     "SQLGenerator",
     "SQLExecutor",
     "ResultValidator",
+    "ResultPager",
+    "SchemaRetriever",
     "QueryOrchestrator",
+    "DatabaseWarmup",
+    "CostGuard",
+    "GenerationCache",
     # "SQLValidator",  # Import directly from sql_validator module
 ]
@@ -0,0 +1,230 @@
+"""Pre-execution cost guard based on the planner's estimates.
+
+This module provides the CostGuard class. Validation only checks that a
+query is safe, not that it is affordable: a cross join of two large tables
+passes and then holds a connection until ``statement_timeout`` fires. The
+guard runs a plain ``EXPLAIN (FORMAT JSON)`` of the query that is about to
+be executed (which plans but does not run it) and rejects it if the
+estimated total cost or row count exceeds the configured limits. The
+orchestrator sends rejected queries back to the LLM for regeneration.
+
+The cost is that of the query as executed, with the row limit pushed down.
+The pushed-down ``LIMIT max_rows + 1`` would also cap the estimated rows, so
+for such queries the rows are taken from the input of the plan's top Limit
+node: the rows the generated query produces.
+
+Estimates are cached by database and normalized SQL for ``cache_ttl``
+seconds, so a repeated question skips the EXPLAIN round trip.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+from pg_mcp.config.settings import CostGuardConfig
+from pg_mcp.models.errors import QueryTooExpensiveError, SQLParseError
+from pg_mcp.observability.metrics import metrics
+from pg_mcp.services.sql_analysis import SQLAnalysis, analyze_sql
+from pg_mcp.services.sql_executor import SQLExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class PlanEstimate:
+    """Planner estimates of a query.
+
+    Attributes:
+        total_cost: Estimated total cost of the plan, in planner cost units.
+        plan_rows: Estimated number of rows the query returns.
+        unlimited_rows: Estimated number of rows the query produces before
+            its outer LIMIT, or None if the plan does not end in a Limit node.
+    """
+
+    __slots__ = ("plan_rows", "total_cost", "unlimited_rows")
+
+    def __init__(
+        self, total_cost: float, plan_rows: int, unlimited_rows: int | None = None
+    ) -> None:
+        """Initialize plan estimate.
+
+        Args:
+            total_cost: Estimated total cost.
+            plan_rows: Estimated rows returned.
+            unlimited_rows: Estimated rows before the outer LIMIT, if any.
+        """
+        self.total_cost = total_cost
+        self.plan_rows = plan_rows
+        self.unlimited_rows = unlimited_rows
+
+    def __repr__(self) -> str:
+        """String representation of the estimate.
+
+        Returns:
+            str: String representation.
+        """
+        return f"PlanEstimate(total_cost={self.total_cost}, plan_rows={self.plan_rows})"
+
+
+def normalize_sql(sql: str) -> str:
+    """Normalize SQL for use as a cache key.
+
+    Keyword case, whitespace, comments and a trailing semicolon do not
+    change the key.
+
+    Args:
+        sql: SQL query.
+
+    Returns:
+        str: The query as regenerated by the parser, or with collapsed
+            whitespace if it cannot be parsed.
+    """
+    try:
+        return analyze_sql(sql).normalized
+    except SQLParseError:
+        return " ".join(sql.split()).rstrip(";")
+
+
+class CostGuard:
+    """Rejects queries whose planner estimates exceed the configured limits.
+
+    Example:
+        >>> guard = CostGuard(CostGuardConfig(enabled=True, max_total_cost=1e6))
+        >>> try:
+        ...     await guard.check(executor, "SELECT * FROM a CROSS JOIN b")
+        ... except QueryTooExpensiveError as e:
+        ...     print(e.details["total_cost"])
+    """
+
+    def __init__(self, config: CostGuardConfig) -> None:
+        """Initialize cost guard.
+
+        Args:
+            config: Cost guard configuration providing the limits and the
+                plan cache size and TTL.
+        """
+        self.config = config
+        # Estimates by (database, normalized SQL) with their expiry time,
+        # least recently used first
+        self._plans: OrderedDict[tuple[str, str], tuple[PlanEstimate, float]] = OrderedDict()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._rejected = 0
+
+    async def check(
+        self, executor: SQLExecutor, sql: str | SQLAnalysis, limit_pushed_down: bool = False
+    ) -> PlanEstimate:
+        """Check a query's estimates against the limits.
+
+        Args:
+            executor: Executor for the query's database.
+            sql: SQL query as it will be executed (should already be
+                validated), or its analysis, whose normalized SQL is used as
+                the cache key without parsing again.
+            limit_pushed_down: The query's outer LIMIT was added or tightened
+                by SQLRewriter. Its rows are then checked before that limit.
+
+        Returns:
+            PlanEstimate: The query's estimates, if within the limits.
+
+        Raises:
+            QueryTooExpensiveError: If the estimated cost or rows exceed the limits.
+            ExecutionTimeoutError: If planning exceeds the timeout.
+            DatabaseError: If the query cannot be planned.
+        """
+        estimate = await self.estimate(executor, sql)
+
+        exceeded: list[str] = []
+        details: dict[str, Any] = {
+            "total_cost": estimate.total_cost,
+            "plan_rows": estimate.plan_rows,
+        }
+        max_cost = self.config.max_total_cost
+        if max_cost and estimate.total_cost > max_cost:
+            exceeded.append(f"estimated cost {estimate.total_cost:.0f} exceeds {max_cost:.0f}")
+            details["max_total_cost"] = max_cost
+        rows = estimate.plan_rows
+        if limit_pushed_down and estimate.unlimited_rows is not None:
+            rows = estimate.unlimited_rows
+            details["unlimited_rows"] = rows
+        max_rows = self.config.max_plan_rows
+        if max_rows and rows > max_rows:
+            exceeded.append(f"estimated {rows} rows exceed {max_rows}")
+            details["max_plan_rows"] = max_rows
+
+        if exceeded:
+            self._rejected += 1
+            metrics.increment_sql_rejected("estimated_cost")
+            logger.info(
+                "Query rejected by cost guard",
+                extra={"database": executor.db_config.name, **details},
+            )
+            raise QueryTooExpensiveError(
+                message=f"Query is too expensive to run: {'; '.join(exceeded)}. "
+                "Add join conditions or selective filters, or aggregate instead of "
+                "returning raw rows.",
+                details=details,
+            )
+        return estimate
+
+    async def estimate(self, executor: SQLExecutor, sql: str | SQLAnalysis) -> PlanEstimate:
+        """Get a query's planner estimates, from the cache if possible.
+
+        Args:
+            executor: Executor for the query's database.
+            sql: SQL query, or its analysis.
+
+        Returns:
+            PlanEstimate: The query's estimates.
+
+        Raises:
+            ExecutionTimeoutError: If planning exceeds the timeout.
+            DatabaseError: If the query cannot be planned.
+        """
+        if isinstance(sql, SQLAnalysis):
+            key = (executor.db_config.name, sql.normalized)
+            sql = sql.sql
+        else:
+            key = (executor.db_config.name, normalize_sql(sql))
+        now = time.monotonic()
+        cached = self._plans.get(key)
+        if cached is not None and cached[1] > now:
+            self._plans.move_to_end(key)
+            self._hits += 1
+            return cached[0]
+
+        self._misses += 1
+        plan = await executor.explain(sql)
+        unlimited_rows = None
+        if plan.get("Node Type") == "Limit" and plan.get("Plans"):
+            unlimited_rows = int(plan["Plans"][0]["Plan Rows"])
+        estimate = PlanEstimate(
+            total_cost=float(plan["Total Cost"]),
+            plan_rows=int(plan["Plan Rows"]),
+            unlimited_rows=unlimited_rows,
+        )
+        if self.config.cache_size:
+            self._plans[key] = (estimate, now + self.config.cache_ttl)
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.config.cache_size:
+                self._plans.popitem(last=False)
+        return estimate
+
+    def clear(self) -> None:
+        """Drop all cached estimates (e.g., after the data changed a lot)."""
+        self._plans.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cost guard statistics.
+
+        Returns:
+            dict: Cached estimates, cache hits and misses, and rejected queries.
+        """
+        return {
+            "cached_plans": len(self._plans),
+            "hits": self._hits,
+            "misses": self._misses,
+            "rejected": self._rejected,
+        }
@@ -0,0 +1,309 @@
+"""Background start-up of the served databases.
+
+This module provides the DatabaseWarmup class, which creates the connection
+pool and loads the schema of every configured database in a task of its
+own. The server can then accept requests at once (``STARTUP_LAZY``): a
+request waits only for its own database, for at most ``ready_timeout``
+seconds, and otherwise fails with a retryable ``DatabaseNotReadyError``.
+Databases start independently, so a multi-database server is ready for the
+first one as soon as its own pool and schema are, instead of after the sum
+of all introspections.
+
+A database whose start-up fails is started again by the next request for
+it. The ``status`` tool reports the state of every database.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable
+from enum import StrEnum
+from typing import Any
+
+from asyncpg import Pool
+
+from pg_mcp.cache.schema_cache import SchemaCache
+from pg_mcp.config.settings import DatabaseConfig, SecurityConfig, StartupConfig
+from pg_mcp.db.pool import create_pool
+from pg_mcp.models.errors import DatabaseConnectionError, DatabaseError, DatabaseNotReadyError
+
+logger = logging.getLogger(__name__)
+
+
+class WarmupState(StrEnum):
+    """Start-up state of a database."""
+
+    PENDING = "pending"
+    CONNECTING = "connecting"
+    LOADING_SCHEMA = "loading_schema"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class _Database:
+    """Start-up progress of one database."""
+
+    __slots__ = ("attempts", "config", "error", "ready_at", "started_at", "state", "tables", "task")
+
+    def __init__(self, config: DatabaseConfig) -> None:
+        """Initialize start-up progress.
+
+        Args:
+            config: Database configuration.
+        """
+        self.config = config
+        self.state = WarmupState.PENDING
+        self.task: asyncio.Task[None] | None = None
+        self.error: BaseException | None = None
+        self.attempts = 0
+        self.tables: int | None = None
+        self.started_at: float | None = None
+        self.ready_at: float | None = None
+
+
+async def load_schema(schema_cache: SchemaCache, database_name: str, pool: Pool) -> int:
+    """Load the schema of a database into the cache.
+
+    The on-disk snapshot is served when available (and revalidated in the
+    background); otherwise the database is introspected.
+
+    Args:
+        schema_cache: Schema cache to fill.
+        database_name: Database name.
+        pool: Connection pool of the database.
+
+    Returns:
+        int: Number of tables in the schema.
+
+    Raises:
+        asyncpg.PostgresError: If introspection fails.
+    """
+    schema = await schema_cache.warm_start(database_name, pool)
+    if schema is not None:
+        logger.info(
+            f"Schema for '{database_name}' served from snapshot",
+            extra={"tables": len(schema.tables)},
+        )
+        return len(schema.tables)
+
+    logger.info(f"Loading schema for database '{database_name}'...")
+    schema = await schema_cache.load(database_name, pool)
+    logger.info(
+        f"Schema loaded for '{database_name}'",
+        extra={"tables": len(schema.tables)},
+    )
+    return len(schema.tables)
+
+
+class DatabaseWarmup:
+    """Creates pools and loads schemas of all databases in the background.
+
+    ``pools`` is filled as pools are created, and ``on_pool`` is called with
+    each new pool, so that the orchestrator can share the dictionaries it is
+    given before any database is ready.
+
+    Example:
+        >>> warmup = DatabaseWarmup(configs, schema_cache, StartupConfig())
+        >>> warmup.start()  # Returns at once
+        >>> await warmup.wait_ready("mydb")  # Waits for this database only
+        >>> pool = warmup.pools["mydb"]
+    """
+
+    def __init__(
+        self,
+        configs: list[DatabaseConfig],
+        schema_cache: SchemaCache,
+        config: StartupConfig,
+        security_config: SecurityConfig | None = None,
+        on_pool: Callable[[DatabaseConfig, Pool], None] | None = None,
+    ) -> None:
+        """Initialize database warm-up.
+
+        Args:
+            configs: Configurations of the databases to start.
+            schema_cache: Schema cache to load the schemas into.
+            config: Startup configuration providing the ready timeout.
+            security_config: Session settings for every pool connection
+                (see ``create_pool``).
+            on_pool: Optional callback called with each database's
+                configuration and pool once the pool is created.
+        """
+        self.config = config
+        self.schema_cache = schema_cache
+        self.security_config = security_config
+        self.on_pool = on_pool
+        self.pools: dict[str, Pool] = {}
+        self._databases = {config.name: _Database(config) for config in configs}
+
+    @property
+    def database_names(self) -> list[str]:
+        """Get the names of all configured databases, ready or not."""
+        return list(self._databases)
+
+    def start(self) -> None:
+        """Start every database that is not started yet, in the background."""
+        for database in self._databases.values():
+            if database.state in (WarmupState.PENDING, WarmupState.FAILED):
+                self._launch(database)
+
+    async def wait_ready(self, database_name: str) -> None:
+        """Wait until a database's pool and schema are ready.
+
+        Waits for at most ``ready_timeout`` seconds (with 0, returns or fails
+        at once). A database whose start-up failed is started again.
+
+        Args:
+            database_name: Database name.
+
+        Raises:
+            DatabaseError: If the database is not configured.
+            DatabaseNotReadyError: If the database is still starting when
+                the timeout expires; the request can be retried.
+            DatabaseConnectionError: If the database failed to start.
+        """
+        database = self._databases.get(database_name)
+        if database is None:
+            raise DatabaseError(
+                message=f"Database '{database_name}' not found",
+                details={"requested_database": database_name},
+            )
+        if database.state == WarmupState.READY:
+            return
+        if database.state in (WarmupState.PENDING, WarmupState.FAILED):
+            self._launch(database)
+
+        if self.config.ready_timeout > 0 and database.task is not None:
+            await asyncio.wait({database.task}, timeout=self.config.ready_timeout)
+
+        if database.state == WarmupState.READY:
+            return
+        if database.state == WarmupState.FAILED:
+            raise DatabaseConnectionError(
+                message=f"Database '{database_name}' is unavailable: {database.error!s}",
+                details={"database": database_name, "error": str(database.error)},
+            )
+        raise DatabaseNotReadyError(
+            message=f"Database '{database_name}' is still starting; retry shortly",
+            details={"database": database_name, "state": database.state.value},
+        )
+
+    async def wait_all(self) -> None:
+        """Wait until every database has started or failed.
+
+        Raises:
+            Exception: The error of the first database that failed to start.
+        """
+        self.start()
+        tasks = {database.task for database in self._databases.values() if database.task}
+        if tasks:
+            await asyncio.wait(tasks)
+        for database in self._databases.values():
+            if database.state == WarmupState.FAILED and database.error is not None:
+                raise database.error
+
+    def is_ready(self, database_name: str) -> bool:
+        """Check whether a database's pool and schema are ready.
+
+        Args:
+            database_name: Database name.
+
+        Returns:
+            bool: True if the database is ready.
+        """
+        database = self._databases.get(database_name)
+        return database is not None and database.state == WarmupState.READY
+
+    def get_status(self) -> dict[str, Any]:
+        """Get the start-up state of every database.
+
+        Returns:
+            dict: ``ready`` (all databases ready) and, per database, its
+                state, attempts, start-up time or time elapsed so far, table
+                count and last error.
+        """
+        now = time.monotonic()
+        databases: dict[str, Any] = {}
+        for name, database in self._databases.items():
+            elapsed_ms = None
+            if database.started_at is not None:
+                end = database.ready_at if database.ready_at is not None else now
+                elapsed_ms = round((end - database.started_at) * 1000, 1)
+            databases[name] = {
+                "state": database.state.value,
+                "attempts": database.attempts,
+                "elapsed_ms": elapsed_ms,
+                "tables": database.tables,
+                "error": str(database.error) if database.error is not None else None,
+            }
+        return {
+            "ready": all(db.state == WarmupState.READY for db in self._databases.values()),
+            "databases": databases,
+        }
+
+    async def close(self) -> None:
+        """Stop the start-ups in progress.
+
+        Pools that were created stay in ``pools`` for the caller to close.
+        """
+        tasks = [db.task for db in self._databases.values() if db.task and not db.task.done()]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def _launch(self, database: _Database) -> None:
+        """Start a database in the background unless it is already starting.
+
+        Args:
+            database: Database to start.
+        """
+        if database.task is not None and not database.task.done():
+            return
+        database.state = WarmupState.CONNECTING
+        database.task = asyncio.create_task(self._warm(database))
+
+    async def _warm(self, database: _Database) -> None:
+        """Create a database's pool (unless a previous attempt did) and load its schema.
+
+        Args:
+            database: Database to start.
+        """
+        name = database.config.name
+        database.attempts += 1
+        database.started_at = time.monotonic()
+        database.ready_at = None
+        try:
+            pool = self.pools.get(name)
+            if pool is None:
+                pool = await create_pool(database.config, self.security_config)
+                self.pools[name] = pool
+                logger.info(
+                    f"Created connection pool for database '{name}'",
+                    extra={
+                        "min_size": database.config.min_pool_size,
+                        "max_size": database.config.max_pool_size,
+                    },
+                )
+                if self.on_pool is not None:
+                    self.on_pool(database.config, pool)
+
+            database.state = WarmupState.LOADING_SCHEMA
+            database.tables = await load_schema(self.schema_cache, name, pool)
+        except Exception as e:
+            database.state = WarmupState.FAILED
+            database.error = e
+            logger.error(
+                f"Failed to start database '{name}': {e!s}",
+                extra={"attempts": database.attempts},
+            )
+            return
+
+        database.state = WarmupState.READY
+        database.error = None
+        database.ready_at = time.monotonic()
+        logger.info(
+            f"Database '{name}' ready",
+            extra={"elapsed_ms": round((database.ready_at - database.started_at) * 1000, 1)},
+        )
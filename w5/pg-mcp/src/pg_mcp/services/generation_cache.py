@@ -0,0 +1,316 @@
+"""Cache of SQL generated for natural language questions.
+
+This module provides the GenerationCache class. Generating SQL is an LLM
+round trip of several seconds, while dashboards and scheduled reports ask the
+same questions over and over. The orchestrator looks a question up here
+before generating and stores the SQL of every successful request, so a
+repeated question against an unchanged schema skips the LLM.
+
+Entries are keyed by database and normalized question (case, whitespace and
+trailing punctuation do not matter) and remember the fingerprint of the
+schema the SQL was generated for. An entry is only returned for the same
+schema fingerprint, and is dropped once the schema has changed or its
+``ttl`` has passed. Cached SQL is still validated before it is executed.
+
+With ``match_similar``, questions are also indexed by database in a
+QuestionIndex, so that a question worded differently from a cached one
+("count of users who signed up today" for "how many users signed up
+today?") can reuse its SQL if the two are similar enough.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+from pg_mcp.cache.compact import CompactSchema
+from pg_mcp.config.settings import GenerationCacheConfig
+from pg_mcp.models.schema import DatabaseSchema
+from pg_mcp.observability.metrics import metrics
+from pg_mcp.services.question_index import QuestionIndex, question_terms, schema_identifiers
+
+logger = logging.getLogger(__name__)
+
+# Characters stripped from the end of a question (ASCII, then the CJK full
+# stop and the full-width question mark, exclamation mark and semicolon)
+_TRAILING_PUNCTUATION = "?.!;\u3002\uff1f\uff01\uff1b"
+
+
+def normalize_question(question: str) -> str:
+    """Normalize a question for use as a cache key.
+
+    Args:
+        question: Natural language question.
+
+    Returns:
+        str: The question case-folded, with runs of whitespace folded to one
+            space and trailing punctuation removed.
+    """
+    return " ".join(question.casefold().split()).rstrip(_TRAILING_PUNCTUATION).rstrip()
+
+
+class CachedSQL:
+    """SQL cached for a question.
+
+    Attributes:
+        question: Normalized question the SQL was generated for.
+        sql: Generated SQL (as generated, before any rewrite).
+        schema_fingerprint: Fingerprint of the schema the SQL was generated for.
+        expires_at: time.monotonic() after which the entry is not used.
+    """
+
+    __slots__ = ("expires_at", "question", "schema_fingerprint", "sql")
+
+    def __init__(self, question: str, sql: str, schema_fingerprint: str, expires_at: float) -> None:
+        """Initialize cached SQL.
+
+        Args:
+            question: Normalized question.
+            sql: Generated SQL.
+            schema_fingerprint: Fingerprint of the schema.
+            expires_at: Expiry time (monotonic clock).
+        """
+        self.question = question
+        self.sql = sql
+        self.schema_fingerprint = schema_fingerprint
+        self.expires_at = expires_at
+
+
+class GenerationCache:
+    """LRU cache of generated SQL by database and question.
+
+    Example:
+        >>> cache = GenerationCache(GenerationCacheConfig(enabled=True))
+        >>> cache.put("mydb", fingerprint, "How many users?", "SELECT count(*) FROM users")
+        >>> cache.get("mydb", fingerprint, "how many users")
+        'SELECT count(*) FROM users'
+    """
+
+    def __init__(self, config: GenerationCacheConfig) -> None:
+        """Initialize generation cache.
+
+        Args:
+            config: Generation cache configuration providing size, TTL and
+                similar-question matching.
+        """
+        self.config = config
+        # Least recently used first
+        self._entries: OrderedDict[tuple[str, str], CachedSQL] = OrderedDict()
+        # Question indexes by database, if matching similar questions
+        self._indexes: dict[str, QuestionIndex] = {}
+        # Schema identifier terms by database, with their schema fingerprint
+        self._identifiers: dict[str, tuple[str, frozenset[str]]] = {}
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._similar_hits = 0
+        self._similar_misses = 0
+        self._invalidated = 0
+
+    def get(self, database: str, schema_fingerprint: str, question: str) -> str | None:
+        """Get the SQL cached for a question.
+
+        Args:
+            database: Database name.
+            schema_fingerprint: Fingerprint of the database's current schema.
+            question: Natural language question.
+
+        Returns:
+            str | None: Cached SQL, or None if the question is not cached, its
+                entry has expired or the schema has changed since.
+        """
+        key = (database, normalize_question(question))
+        entry = self._entries.get(key)
+        if entry is not None and not self._is_current(entry, schema_fingerprint):
+            self._remove(key)
+            self._invalidated += 1
+            entry = None
+
+        if entry is None:
+            self._misses += 1
+            metrics.increment_generation_cache_request(database, "miss")
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        metrics.increment_generation_cache_request(database, "hit")
+        return entry.sql
+
+    def get_similar(
+        self,
+        database: str,
+        schema_fingerprint: str,
+        question: str,
+        schema: DatabaseSchema | CompactSchema,
+    ) -> CachedSQL | None:
+        """Get the SQL cached for the most similar question.
+
+        Used after get missed. Cached questions must mention the same schema
+        identifiers, numbers and negation as the question and reach the
+        configured ``similarity_threshold``; see QuestionIndex.
+
+        Args:
+            database: Database name.
+            schema_fingerprint: Fingerprint of the database's current schema.
+            question: Natural language question.
+            schema: The database's current schema, for its identifiers.
+
+        Returns:
+            CachedSQL | None: The cached entry of the most similar question,
+                or None if matching similar questions is disabled or no
+                current entry is similar enough.
+        """
+        index = self._indexes.get(database)
+        if not self.config.match_similar or index is None:
+            return None
+
+        identifiers = self._identifiers_for(database, schema_fingerprint, schema)
+        ranked = index.rank(question_terms(question), identifiers, self.config.similarity_threshold)
+        for matched, similarity in ranked:
+            key = (database, matched)
+            entry = self._entries[key]
+            if not self._is_current(entry, schema_fingerprint):
+                self._remove(key)
+                self._invalidated += 1
+                continue
+
+            self._entries.move_to_end(key)
+            self._similar_hits += 1
+            metrics.increment_generation_cache_request(database, "similar_hit")
+            logger.debug(
+                "Matched similar cached question",
+                extra={"database": database, "matched": matched, "similarity": similarity},
+            )
+            return entry
+
+        self._similar_misses += 1
+        metrics.increment_generation_cache_request(database, "similar_miss")
+        return None
+
+    def put(self, database: str, schema_fingerprint: str, question: str, sql: str) -> None:
+        """Cache the SQL generated for a question.
+
+        Args:
+            database: Database name.
+            schema_fingerprint: Fingerprint of the schema the SQL was generated for.
+            question: Natural language question.
+            sql: Generated SQL that was validated (and executed successfully,
+                for queries that were executed).
+        """
+        normalized = normalize_question(question)
+        key = (database, normalized)
+        self._entries[key] = CachedSQL(
+            normalized, sql, schema_fingerprint, time.monotonic() + self.config.ttl
+        )
+        self._entries.move_to_end(key)
+        if self.config.match_similar:
+            index = self._indexes.setdefault(database, QuestionIndex())
+            index.add(normalized, question_terms(normalized))
+        while len(self._entries) > self.config.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def discard(self, database: str, question: str) -> None:
+        """Drop the SQL cached for a question (e.g., after it failed validation).
+
+        Args:
+            database: Database name.
+            question: Natural language question.
+        """
+        key = (database, normalize_question(question))
+        if key in self._entries:
+            self._remove(key)
+            self._invalidated += 1
+
+    def invalidate(self, database: str | None = None) -> int:
+        """Drop cached SQL for a database, or for all databases.
+
+        Args:
+            database: Database name; None drops everything.
+
+        Returns:
+            int: Number of entries dropped.
+        """
+        if database is None:
+            count = len(self._entries)
+            self._entries.clear()
+            self._indexes.clear()
+            self._identifiers.clear()
+        else:
+            keys = [key for key in self._entries if key[0] == database]
+            for key in keys:
+                del self._entries[key]
+            self._indexes.pop(database, None)
+            self._identifiers.pop(database, None)
+            count = len(keys)
+        self._invalidated += count
+        return count
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get generation cache statistics.
+
+        Returns:
+            dict: Cached questions, exact and similar-question hits and
+                misses, the share of lookups answered by either, and entries
+                dropped for expiry, schema changes or invalidation.
+        """
+        lookups = self._hits + self._misses
+        return {
+            "cached_questions": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "similar_hits": self._similar_hits,
+            "similar_misses": self._similar_misses,
+            "hit_rate": (self._hits + self._similar_hits) / lookups if lookups else 0.0,
+            "invalidated": self._invalidated,
+        }
+
+    def _is_current(self, entry: CachedSQL, schema_fingerprint: str) -> bool:
+        """Check that an entry is for the current schema and has not expired.
+
+        Args:
+            entry: Cached entry.
+            schema_fingerprint: Fingerprint of the database's current schema.
+
+        Returns:
+            bool: True if the entry can be used.
+        """
+        return (
+            entry.schema_fingerprint == schema_fingerprint and entry.expires_at > time.monotonic()
+        )
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        """Remove an entry, and its question from the database's index.
+
+        Args:
+            key: (database, normalized question) key of the entry.
+        """
+        del self._entries[key]
+        index = self._indexes.get(key[0])
+        if index is not None:
+            index.remove(key[1])
+
+    def _identifiers_for(
+        self,
+        database: str,
+        schema_fingerprint: str,
+        schema: DatabaseSchema | CompactSchema,
+    ) -> frozenset[str]:
+        """Get the identifier terms of a database's schema.
+
+        Computed once per schema fingerprint.
+
+        Args:
+            database: Database name.
+            schema_fingerprint: Fingerprint of the schema.
+            schema: The schema.
+
+        Returns:
+            frozenset[str]: Terms of the schema's table and column names.
+        """
+        cached = self._identifiers.get(database)
+        if cached is not None and cached[0] == schema_fingerprint:
+            return cached[1]
+        identifiers = schema_identifiers(schema)
+        self._identifiers[database] = (schema_fingerprint, identifiers)
+        return identifiers
@@ -11,13 +11,16 @@ from typing import Any
 
 from asyncpg import Pool
 
+from pg_mcp.cache.compact import as_database_schema
 from pg_mcp.cache.schema_cache import SchemaCache
 from pg_mcp.config.settings import ResilienceConfig, ValidationConfig
 from pg_mcp.models.errors import (
     DatabaseError,
     ErrorCode,
+    ExecutionTimeoutError,
     LLMError,
     PgMcpError,
+    QueryTooExpensiveError,
     SchemaLoadError,
     SecurityViolationError,
     SQLParseError,
@@ -27,13 +30,21 @@ from pg_mcp.models.query import (
     QueryRequest,
     QueryResponse,
     QueryResult,
+    ResultFormat,
     ReturnType,
     ValidationResult,
 )
 from pg_mcp.resilience.circuit_breaker import CircuitBreaker
+from pg_mcp.services.cost_guard import CostGuard
+from pg_mcp.services.database_warmup import DatabaseWarmup
+from pg_mcp.services.generation_cache import GenerationCache
+from pg_mcp.services.result_pager import ResultPager
 from pg_mcp.services.result_validator import ResultValidator
-from pg_mcp.services.sql_executor import SQLExecutor
+from pg_mcp.services.schema_retriever import SchemaRetriever
+from pg_mcp.services.sql_analysis import SQLAnalysis, analyze_sql
+from pg_mcp.services.sql_executor import SQLExecutor, TruncationReport
 from pg_mcp.services.sql_generator import SQLGenerator
+from pg_mcp.services.sql_rewriter import SQLRewriter
 from pg_mcp.services.sql_validator import SQLValidator
 
 logger = logging.getLogger(__name__)
@@ -67,24 +78,54 @@ class QueryOrchestrator:
         self,
         sql_generator: SQLGenerator,
         sql_validator: SQLValidator,
-        sql_executor: SQLExecutor,
+        sql_executor: SQLExecutor | None,
         result_validator: ResultValidator,
         schema_cache: SchemaCache,
         pools: dict[str, Pool],
         resilience_config: ResilienceConfig,
         validation_config: ValidationConfig,
+        schema_retriever: SchemaRetriever | None = None,
+        sql_rewriter: SQLRewriter | None = None,
+        result_pager: ResultPager | None = None,
+        sql_executors: dict[str, SQLExecutor] | None = None,
+        warmup: DatabaseWarmup | None = None,
+        cost_guard: CostGuard | None = None,
+        generation_cache: GenerationCache | None = None,
     ) -> None:
         """Initialize query orchestrator.
 
         Args:
             sql_generator: SQL generation service.
             sql_validator: SQL validation service.
-            sql_executor: SQL execution service.
+            sql_executor: SQL execution service (may be None if
+                sql_executors is given).
             result_validator: Result validation service.
             schema_cache: Schema cache instance.
             pools: Dictionary mapping database names to connection pools.
             resilience_config: Resilience configuration for retries and circuit breaker.
             validation_config: Validation configuration including thresholds.
+            schema_retriever: Optional retriever that prunes the schema to
+                question-relevant tables before SQL generation.
+            sql_rewriter: Optional rewriter that pushes the row limit down
+                into validated SQL before execution.
+            result_pager: Optional pager that serves requests with a
+                page_size from server-held cursors; without it, such requests
+                return all rows at once.
+            sql_executors: Optional executors by database name, for serving
+                several databases; requests run on the executor of their
+                resolved database. Without it, every request runs on
+                ``sql_executor``. The dictionary may be filled after
+                construction, as databases start.
+            warmup: Optional background start-up of the databases; requests
+                then wait for their database to be ready, and ``pools`` and
+                ``sql_executors`` should be the dictionaries it fills.
+            cost_guard: Optional guard that checks the planner's estimates of
+                queries to be executed; queries over its limits are sent back
+                for regeneration like queries that fail validation.
+            generation_cache: Optional cache of the SQL generated for
+                questions; repeated questions against an unchanged schema
+                reuse it (after validating it again) instead of calling the
+                LLM, unless the request opts out.
         """
         self.sql_generator = sql_generator
         self.sql_validator = sql_validator
@@ -94,6 +135,13 @@ class QueryOrchestrator:
         self.pools = pools
         self.resilience_config = resilience_config
         self.validation_config = validation_config
+        self.schema_retriever = schema_retriever
+        self.sql_rewriter = sql_rewriter
+        self.result_pager = result_pager
+        self.sql_executors = sql_executors
+        self.warmup = warmup
+        self.cost_guard = cost_guard
+        self.generation_cache = generation_cache
 
         # Create circuit breaker for LLM calls
         self.circuit_breaker = CircuitBreaker(
@@ -101,20 +149,26 @@ class QueryOrchestrator:
             recovery_timeout=resilience_config.circuit_breaker_timeout,
         )
 
-    async def execute_query(self, request: QueryRequest) -> QueryResponse:
+    async def execute_query(
+        self, request: QueryRequest, client_id: str = "default"
+    ) -> QueryResponse:
         """Execute complete query flow from question to results.
 
         This method orchestrates the entire pipeline:
         1. Generate request_id for tracking
         2. Resolve and validate database name
-        3. Load schema from cache
-        4. Generate and validate SQL with retry logic
-        5. Execute SQL (if return_type == RESULT)
+        3. Load schema from cache (pruned to relevant tables if configured)
+        4. Generate and validate SQL with retry logic, or reuse the validated
+           SQL cached for the question
+        5. Execute SQL (if return_type == RESULT); with a page_size, return
+           the first page and keep the rest open for ``ResultPager.fetch_more``
         6. Validate results (optional)
         7. Return structured response
 
         Args:
             request: Query request containing question and parameters.
+            client_id: Client making the request, which owns any result
+                cursor it opens.
 
         Returns:
             QueryResponse: Complete response with SQL, results, or error information.
@@ -140,9 +194,16 @@ class QueryOrchestrator:
                 "Resolved database",
                 extra={"request_id": request_id, "database": database_name},
             )
-
-            # Step 2: Get schema from cache
-            schema = self.schema_cache.get(database_name)
+            if self.warmup is not None:
+                # Lazy startup: wait for this database's pool and schema only
+                await self.warmup.wait_ready(database_name)
+
+            # Step 2: Get schema from cache (the retriever accepts compactly
+            # stored schemas and materializes only the tables it keeps)
+            if self.schema_retriever is None:
+                schema = self.schema_cache.get(database_name)
+            else:
+                schema = self.schema_cache.get(database_name, materialize=False)
             if schema is None:
                 # Schema not in cache, load it
                 pool = self.pools.get(database_name)
@@ -168,12 +229,48 @@ class QueryOrchestrator:
                 },
             )
 
-            # Step 3: Generate and validate SQL with retry logic
-            generated_sql, validation_result, tokens_used = await self._generate_sql_with_retry(
-                question=request.question,
-                schema=schema,
-                request_id=request_id,
-            )
+            # Step 3: Generate and validate SQL with retry logic (queries to be
+            # executed are also checked against the cost guard), unless SQL
+            # generated for the question earlier is cached and still passes
+            cost_executor = None
+            if self.cost_guard is not None and request.return_type == ReturnType.RESULT:
+                cost_executor = self._executor_for(database_name)
+            cache = self.generation_cache if request.use_cache else None
+            schema_fingerprint = None
+            if cache is not None:
+                schema_fingerprint = self.schema_cache.get_fingerprint(database_name)
+            cached = None
+            if cache is not None and schema_fingerprint is not None:
+                cached = await self._get_cached_sql(
+                    cache,
+                    database_name,
+                    schema_fingerprint,
+                    request.question,
+                    schema,
+                    cost_executor,
+                    request_id,
+                )
+
+            # Question the reused SQL is cached under, if any
+            cached_question = None
+            if cached is not None:
+                analysis, cached_question = cached
+                validation_result = self._passed_validation()
+                tokens_used = None
+            else:
+                # Narrow the schema to the tables relevant to the question
+                prompt_schema = schema
+                if self.schema_retriever is not None:
+                    prompt_schema = self.schema_retriever.select(request.question, schema)
+
+                analysis, validation_result, tokens_used = await self._generate_sql_with_retry(
+                    question=request.question,
+                    schema=prompt_schema,
+                    request_id=request_id,
+                    fallback_schema=schema,
+                    executor=cost_executor,
+                )
+            generated_sql = analysis.sql
 
             # Step 4: If return_type is SQL, return early
             if request.return_type == ReturnType.SQL:
@@ -181,6 +278,7 @@ class QueryOrchestrator:
                     "Returning SQL only",
                     extra={"request_id": request_id, "sql_length": len(generated_sql)},
                 )
+                # Not cached: SQL that was never executed is not reused
                 return QueryResponse(
                     success=True,
                     generated_sql=generated_sql,
@@ -195,7 +293,41 @@ class QueryOrchestrator:
             logger.debug("Executing SQL", extra={"request_id": request_id})
             start_time = self._get_current_time_ms()
 
-            results, total_count = await self.sql_executor.execute(generated_sql)
+            executed_sql = self._executed(analysis).sql
+            executor = self._executor_for(database_name)
+            columnar = request.result_format == ResultFormat.COLUMNAR
+            report = TruncationReport()
+            page: QueryResult | None = None
+            data: list[Any]
+            try:
+                if request.page_size is not None and self.result_pager is not None:
+                    # First page; the following ones are read with fetch_more
+                    page = await self.result_pager.open_result(
+                        executor,
+                        executed_sql,
+                        request.page_size,
+                        request.result_format,
+                        client_id,
+                    )
+                    columns = page.columns
+                    data = (page.column_values or []) if columnar else page.rows
+                    total_count = page.row_count
+                elif request.result_format == ResultFormat.OBJECTS:
+                    data, total_count = await executor.execute(executed_sql, report=report)
+                    columns = list(data[0].keys()) if data else []
+                else:
+                    columns, data, total_count = await executor.execute_table(
+                        executed_sql, columnar=columnar, report=report
+                    )
+            except Exception:
+                if cache is not None and cached_question is not None:
+                    # Reused SQL that fails would keep failing until it expires
+                    cache.discard(database_name, cached_question)
+                raise
+            if request.result_format == ResultFormat.OBJECTS:
+                results = data
+            else:
+                results = self._sample_rows(columns, data, columnar)
 
             execution_time_ms = self._get_current_time_ms() - start_time
             logger.info(
@@ -206,6 +338,9 @@ class QueryOrchestrator:
                     "execution_time_ms": execution_time_ms,
                 },
             )
+            if cache is not None and schema_fingerprint is not None and cached_question is None:
+                # Only SQL that executed successfully is reused
+                cache.put(database_name, schema_fingerprint, request.question, generated_sql)
 
             # Step 6: Validate results (non-blocking, failures don't fail the request)
             result_confidence = await self._validate_results_safely(
@@ -217,12 +352,21 @@ class QueryOrchestrator:
             )
 
             # Step 7: Build successful response
-            query_result = QueryResult(
-                columns=list(results[0].keys()) if results else [],
-                rows=results,
-                row_count=len(results),  # Limited row count (after max_rows applied)
-                execution_time_ms=execution_time_ms,
-            )
+            if page is not None:
+                query_result = page.model_copy(update={"execution_time_ms": execution_time_ms})
+            else:
+                returned = len(data[0]) if columnar and data else len(data)
+                query_result = QueryResult(
+                    columns=columns,
+                    rows=[] if columnar else data,
+                    column_values=data if columnar else None,
+                    row_count=returned,  # Limited row count (after max_rows applied)
+                    execution_time_ms=execution_time_ms,
+                    truncated=total_count > returned,
+                    truncation_reason=report.reason,
+                    truncated_values=report.truncated_values,
+                    result_format=request.result_format,
+                )
 
             return QueryResponse(
                 success=True,
@@ -296,20 +440,23 @@ class QueryOrchestrator:
             >>> name = orchestrator._resolve_database("mydb")  # Validates "mydb" exists
             >>> name = orchestrator._resolve_database(None)  # Auto-selects if only one DB
         """
+        # Databases that are still starting can be requested as well
+        available_dbs = (
+            self.warmup.database_names if self.warmup is not None else list(self.pools.keys())
+        )
         if database is not None:
             # Validate specified database exists
-            if database not in self.pools:
+            if database not in available_dbs:
                 raise DatabaseError(
                     message=f"Database '{database}' not found",
                     details={
                         "requested_database": database,
-                        "available_databases": list(self.pools.keys()),
+                        "available_databases": available_dbs,
                     },
                 )
             return database
 
         # Auto-select if only one database available
-        available_dbs = list(self.pools.keys())
         if len(available_dbs) == 0:
             raise DatabaseError(
                 message="No databases configured",
@@ -324,36 +471,73 @@ class QueryOrchestrator:
             details={"available_databases": available_dbs},
         )
 
+    def _executor_for(self, database_name: str) -> SQLExecutor:
+        """Get the executor of a resolved database.
+
+        Args:
+            database_name: Resolved database name.
+
+        Returns:
+            SQLExecutor: The database's executor, or ``sql_executor`` if no
+                executors by database were given.
+
+        Raises:
+            DatabaseError: If no executor serves this database.
+        """
+        if self.sql_executors is None:
+            executor = self.sql_executor
+        else:
+            executor = self.sql_executors.get(database_name)
+        if executor is None:
+            raise DatabaseError(
+                message=f"No executor available for database '{database_name}'",
+                details={"database": database_name},
+            )
+        return executor
+
     async def _generate_sql_with_retry(
         self,
         question: str,
         schema: Any,
         request_id: str,
-    ) -> tuple[str, ValidationResult, int | None]:
+        fallback_schema: Any | None = None,
+        executor: SQLExecutor | None = None,
+    ) -> tuple[SQLAnalysis, ValidationResult, int | None]:
         """Generate and validate SQL with retry logic on validation failures.
 
         This method implements a retry loop that:
         1. Checks circuit breaker state
         2. Generates SQL using LLM
-        3. Validates the generated SQL
-        4. On validation failure, retries with error feedback
+        3. Parses the generated SQL once, validates the analysis and, with a
+           cost guard and an executor, checks its planner estimates
+        4. On validation failure or a too expensive query, retries with
+           error feedback
         5. Records success/failure to circuit breaker
 
         Args:
             question: User's natural language question.
             schema: Database schema for context.
             request_id: Request ID for tracking.
+            fallback_schema: Schema used for retries instead of ``schema``,
+                typically the full schema when ``schema`` was pruned. A
+                compact schema is materialized only if a retry happens.
+            executor: Executor of the database the SQL will run on, for the
+                cost guard; None skips the cost check.
 
         Returns:
-            tuple: (generated_sql, validation_result, tokens_used)
+            tuple: (analysis, validation_result, tokens_used), where analysis
+                is the parsed generated SQL (its ``sql`` is the SQL as
+                generated).
 
         Raises:
             LLMError: If circuit breaker is open or generation fails.
             SecurityViolationError: If SQL fails validation after all retries.
             SQLParseError: If SQL cannot be parsed.
+            QueryTooExpensiveError: If SQL exceeds the cost limits after all retries.
+            DatabaseError: If the cost guard cannot plan the SQL.
 
         Example:
-            >>> sql, validation, tokens = await orchestrator._generate_sql_with_retry(
+            >>> analysis, validation, tokens = await orchestrator._generate_sql_with_retry(
             ...     question="Count users",
             ...     schema=db_schema,
             ...     request_id="123",
@@ -385,7 +569,9 @@ class QueryOrchestrator:
                     },
                 )
 
-                # Generate SQL
+                # Generate SQL (retries fall back to the full schema if pruned)
+                if attempt and fallback_schema is not None:
+                    schema = fallback_schema = as_database_schema(fallback_schema)
                 generated_sql = await self.sql_generator.generate(
                     question=question,
                     schema=schema,
@@ -404,10 +590,18 @@ class QueryOrchestrator:
                     },
                 )
 
-                # Validate SQL
+                # Parse once, validate, then check the estimates of the SQL
+                # as executed
                 try:
-                    self.sql_validator.validate_or_raise(generated_sql)
-                except (SecurityViolationError, SQLParseError) as validation_error:
+                    analysis = analyze_sql(generated_sql)
+                    self.sql_validator.validate_or_raise(analysis)
+                    if executor is not None:
+                        await self._check_cost(executor, analysis)
+                except (
+                    SecurityViolationError,
+                    SQLParseError,
+                    QueryTooExpensiveError,
+                ) as validation_error:
                     if attempt < max_retries:
                         # Record as failure and retry with feedback
                         logger.warning(
@@ -441,22 +635,21 @@ class QueryOrchestrator:
                     extra={
                         "request_id": request_id,
                         "attempts": attempt + 1,
+                        "tables": analysis.tables,
                     },
                 )
 
-                # Build validation result
-                validation_result = ValidationResult(
-                    is_valid=True,
-                    is_select=True,
-                    allows_data_modification=False,
-                    uses_blocked_functions=[],
-                    error_message=None,
-                )
-
-                return generated_sql, validation_result, tokens_used
-
-            except (LLMError, SecurityViolationError, SQLParseError):
-                # Re-raise known errors
+                return analysis, self._passed_validation(), tokens_used
+
+            except (
+                LLMError,
+                SecurityViolationError,
+                SQLParseError,
+                QueryTooExpensiveError,
+                DatabaseError,
+                ExecutionTimeoutError,
+            ):
+                # Re-raise known errors (database errors come from the cost guard)
                 raise
             except Exception as e:
                 # Unexpected error during generation
@@ -477,6 +670,145 @@ class QueryOrchestrator:
             details={"max_retries": max_retries},
         )
 
+    async def _get_cached_sql(
+        self,
+        cache: GenerationCache,
+        database_name: str,
+        schema_fingerprint: str,
+        question: str,
+        schema: Any,
+        executor: SQLExecutor | None,
+        request_id: str,
+    ) -> tuple[SQLAnalysis, str] | None:
+        """Get the SQL cached for a question, validated again.
+
+        Without an exact match, the SQL of the most similar cached question
+        is used if the cache matches similar questions.
+
+        Cached SQL passed validation when it was generated, but the security
+        configuration or cost limits may have changed since, and SQL matched
+        through a similar question was generated for another question. It is
+        therefore validated (and, with an executor, checked against the cost
+        guard) like generated SQL; cached SQL that fails is dropped from the
+        cache, and new SQL is generated for the question.
+
+        Args:
+            cache: Generation cache to look the question up in.
+            database_name: Resolved database name.
+            schema_fingerprint: Fingerprint of the database's current schema.
+            question: User's natural language question.
+            schema: The database's current schema, for matching similar
+                questions.
+            executor: Executor of the database the SQL will run on, for the
+                cost guard; None skips the cost check.
+            request_id: Request ID for tracking.
+
+        Returns:
+            tuple[SQLAnalysis, str] | None: Analysis of the cached SQL and the
+                question it is cached under, or None if no SQL is cached for
+                the question or it no longer passes.
+
+        Raises:
+            DatabaseError: If the cost guard cannot plan the SQL.
+        """
+        cached_question = question
+        sql = cache.get(database_name, schema_fingerprint, question)
+        if sql is None:
+            similar = cache.get_similar(database_name, schema_fingerprint, question, schema)
+            if similar is None:
+                return None
+            cached_question, sql = similar.question, similar.sql
+
+        try:
+            analysis = analyze_sql(sql)
+            self.sql_validator.validate_or_raise(analysis)
+            if executor is not None:
+                await self._check_cost(executor, analysis)
+        except (SecurityViolationError, SQLParseError, QueryTooExpensiveError) as e:
+            logger.warning(
+                "Cached SQL no longer passes validation, generating new SQL",
+                extra={"request_id": request_id, "error": str(e)},
+            )
+            cache.discard(database_name, cached_question)
+            return None
+
+        logger.info(
+            "Reusing cached SQL",
+            extra={
+                "request_id": request_id,
+                "cached_question": cached_question[:100],
+                "tables": analysis.tables,
+            },
+        )
+        return analysis, cached_question
+
+    @staticmethod
+    def _passed_validation() -> ValidationResult:
+        """Build the validation result of SQL that passed validation.
+
+        Returns:
+            ValidationResult: Result of a valid, read-only SELECT.
+        """
+        return ValidationResult(
+            is_valid=True,
+            is_select=True,
+            allows_data_modification=False,
+            uses_blocked_functions=[],
+            error_message=None,
+        )
+
+    def _executed(self, analysis: SQLAnalysis) -> SQLAnalysis:
+        """Get the analysis of the SQL that is executed for generated SQL.
+
+        The response reports the SQL as generated; the rewrite only makes
+        PostgreSQL stop at the row limit. It works on the parsed query, so
+        the SQL is not parsed again.
+
+        Args:
+            analysis: Analysis of the validated SQL.
+
+        Returns:
+            SQLAnalysis: The analysis with the row limit pushed down, if
+                configured.
+        """
+        if self.sql_rewriter is None:
+            return analysis
+        return self.sql_rewriter.rewrite(analysis)
+
+    async def _check_cost(self, executor: SQLExecutor, analysis: SQLAnalysis) -> None:
+        """Check the estimates of generated SQL as it will be executed.
+
+        Args:
+            executor: Executor for the query's database.
+            analysis: Analysis of the validated SQL.
+
+        Raises:
+            QueryTooExpensiveError: If the estimates exceed the cost guard's limits.
+        """
+        if self.cost_guard is None:
+            return
+        executed = self._executed(analysis)
+        await self.cost_guard.check(executor, executed, limit_pushed_down=executed is not analysis)
+
+    def _sample_rows(
+        self, columns: list[str], data: list[list[Any]], columnar: bool
+    ) -> list[dict[str, Any]]:
+        """Convert the first rows of an array-format result to dicts.
+
+        The result validator reads rows as dicts, and only a sample of them.
+
+        Args:
+            columns: Column names.
+            data: Row value arrays or, if columnar, column value arrays.
+            columnar: Whether ``data`` holds columns.
+
+        Returns:
+            list: Up to ``validation_config.sample_rows`` rows as dicts.
+        """
+        limit = self.validation_config.sample_rows
+        rows = zip(*(values[:limit] for values in data), strict=True) if columnar else data[:limit]
+        return [dict(zip(columns, row, strict=True)) for row in rows]
+
     async def _validate_results_safely(
         self,
         question: str,
@@ -0,0 +1,238 @@
+"""Similarity index of previously answered questions.
+
+This module provides the QuestionIndex class, which the generation cache uses
+to find a cached question worded differently from a new one: "how many users
+signed up today?" and "count of users who signed up today" ask for the same
+SQL but miss an exact-match cache. It is local and needs no network access.
+
+Questions are reduced to terms (stemmed words, canonical forms of words that
+name the same aggregate or filter, CJK character bigrams) and compared by
+TF-IDF cosine similarity against the other questions of the same database.
+Similarity alone would match "users signed up in 2023" with "users signed up
+in 2024", so a candidate must also mention the same schema identifiers (words
+of table and column names), the same numbers and the same negation as the new
+question before its similarity is considered.
+"""
+
+import logging
+import math
+import re
+from collections import Counter, defaultdict
+
+from pg_mcp.cache.compact import CompactSchema
+from pg_mcp.models.schema import DatabaseSchema
+from pg_mcp.services.schema_retriever import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Latin words/digits, or runs of CJK ideographs
+_WORD_PATTERN = re.compile(r"[a-z0-9]+|[\u4e00-\u9fff]+")
+
+# Words that carry no meaning for the SQL of a question
+_FILLER = frozenset(
+    {
+        "a", "all", "an", "and", "any", "are", "at", "can", "could", "did", "do",
+        "does", "has", "have", "how", "i", "in", "is", "it", "me", "my", "need",
+        "of", "on", "please", "tell", "the", "there", "to", "us", "want", "was",
+        "we", "were", "what", "which", "who", "would", "you",
+    }
+)  # fmt: skip
+
+# Words that name the same aggregate, listing or filter, by canonical term
+_CANONICAL = {
+    "many": "count", "number": "count", "count": "count",
+    "list": "list", "show": "list", "display": "list", "get": "list", "give": "list",
+    "fetch": "list", "find": "list", "return": "list", "select": "list",
+    "average": "avg", "avg": "avg", "mean": "avg",
+    "sum": "sum", "much": "sum",
+    "max": "max", "maximum": "max", "highest": "max", "largest": "max", "biggest": "max",
+    "most": "max",
+    "min": "min", "minimum": "min", "lowest": "min", "smallest": "min", "least": "min",
+    "fewest": "min",
+    "per": "per", "each": "per", "every": "per", "by": "per",
+    "not": "not", "no": "not", "without": "not", "never": "not", "excluding": "not",
+    "or": "or",
+}  # fmt: skip
+
+# Terms that change the meaning of a question in ways similarity may miss
+_GUARDED_TERMS = frozenset({"not", "or"})
+
+
+def question_terms(question: str) -> list[str]:
+    """Reduce a question to terms for similarity matching.
+
+    Unlike the schema retriever's tokenize, words that decide the shape of
+    the SQL (how many, list, per, not, ...) are kept, as canonical terms.
+
+    Args:
+        question: Natural language question.
+
+    Returns:
+        list[str]: Terms in order of appearance.
+
+    Example:
+        >>> question_terms("Count of users who signed up per country?")
+        ['count', 'user', 'signed', 'up', 'per', 'country']
+    """
+    terms = []
+    for word in _WORD_PATTERN.findall(question.lower()):
+        if word in _FILLER:
+            continue
+        canonical = _CANONICAL.get(word)
+        if canonical is not None:
+            terms.append(canonical)
+        else:
+            terms.extend(tokenize(word))
+    return terms
+
+
+def schema_identifiers(schema: DatabaseSchema | CompactSchema) -> frozenset[str]:
+    """Collect the terms of a schema's table and column names.
+
+    Args:
+        schema: Database schema in either representation.
+
+    Returns:
+        frozenset[str]: Terms of all table and column names.
+    """
+    identifiers: set[str] = set()
+    for table in schema.tables:
+        identifiers.update(tokenize(table.table_name))
+        if isinstance(schema, CompactSchema):
+            names = table.column_names
+        else:
+            names = tuple(column.name for column in table.columns)
+        for name in names:
+            identifiers.update(tokenize(name))
+    return frozenset(identifiers)
+
+
+class QuestionIndex:
+    """TF-IDF index of the questions answered for one database.
+
+    Example:
+        >>> index = QuestionIndex()
+        >>> cached = "how many users signed up today"
+        >>> index.add(cached, question_terms(cached))
+        >>> index.rank(question_terms("Count of users who signed up today"), identifiers, 0.9)
+        [('how many users signed up today', 1.0)]
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty question index."""
+        self._terms: dict[str, Counter[str]] = {}
+        # Questions containing each term
+        self._postings: defaultdict[str, set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        """Get the number of indexed questions.
+
+        Returns:
+            int: Number of indexed questions.
+        """
+        return len(self._terms)
+
+    def add(self, key: str, terms: list[str]) -> None:
+        """Index a question, replacing it if already indexed.
+
+        Args:
+            key: Key of the question (its normalized text).
+            terms: Terms of the question.
+        """
+        self.remove(key)
+        counts = Counter(terms)
+        self._terms[key] = counts
+        for term in counts:
+            self._postings[term].add(key)
+
+    def remove(self, key: str) -> None:
+        """Remove a question from the index, if indexed.
+
+        Args:
+            key: Key of the question.
+        """
+        counts = self._terms.pop(key, None)
+        if counts is None:
+            return
+        for term in counts:
+            keys = self._postings[term]
+            keys.discard(key)
+            if not keys:
+                del self._postings[term]
+
+    def rank(
+        self, terms: list[str], identifiers: frozenset[str], threshold: float
+    ) -> list[tuple[str, float]]:
+        """Rank indexed questions by similarity to a question.
+
+        Only questions that mention the same schema identifiers, numbers and
+        negation as the question are ranked.
+
+        Args:
+            terms: Terms of the question.
+            identifiers: Terms of the schema's table and column names.
+            threshold: Minimum cosine similarity (0-1).
+
+        Returns:
+            list[tuple[str, float]]: (key, similarity) of the questions at or
+                above the threshold, most similar first.
+        """
+        counts = Counter(terms)
+        if not counts:
+            return []
+        guard = self._guarded(counts, identifiers)
+
+        candidates: set[str] = set()
+        for term in counts:
+            candidates.update(self._postings.get(term, ()))
+        if not candidates:
+            return []
+
+        total = len(self._terms)
+        idf: dict[str, float] = {}
+
+        def weight(term: str, count: int) -> float:
+            if term not in idf:
+                # Smoothed IDF over the indexed questions
+                df = len(self._postings.get(term, ()))
+                idf[term] = math.log((1 + total) / (1 + df)) + 1
+            return count * idf[term]
+
+        query = {term: weight(term, count) for term, count in counts.items()}
+        query_norm = math.sqrt(sum(w * w for w in query.values()))
+
+        ranked = []
+        for key in candidates:
+            other = self._terms[key]
+            if self._guarded(other, identifiers) != guard:
+                continue
+            dot = 0.0
+            norm = 0.0
+            for term, count in other.items():
+                w = weight(term, count)
+                norm += w * w
+                if term in query:
+                    dot += w * query[term]
+            similarity = dot / (query_norm * math.sqrt(norm))
+            if similarity >= threshold - 1e-9:
+                ranked.append((key, min(similarity, 1.0)))
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked
+
+    @staticmethod
+    def _guarded(counts: Counter[str], identifiers: frozenset[str]) -> frozenset[str]:
+        """Get the terms two questions must share to be considered similar.
+
+        Args:
+            counts: Term counts of a question.
+            identifiers: Terms of the schema's table and column names.
+
+        Returns:
+            frozenset[str]: The question's schema identifiers, numbers and
+                guarded terms.
+        """
+        return frozenset(
+            term
+            for term in counts
+            if term in identifiers or term in _GUARDED_TERMS or term.isdigit()
+        )
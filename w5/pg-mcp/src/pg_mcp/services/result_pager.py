@@ -0,0 +1,343 @@
+"""Paged query results held open between MCP calls.
+
+This module provides the ResultPager class. A query that asks for pages
+returns its first page together with a cursor token; the ``fetch_more`` tool
+passes the token back to read the following pages. Each token refers to a
+server-side cursor (see ``SQLExecutor.open_cursor``), so paging through a
+large result executes the query once instead of regenerating and re-running
+SQL for every page.
+
+Every open cursor holds a pool connection and a read-only transaction, so
+the number of open cursors is bounded, in total and per client. Opening a
+cursor beyond a bound closes the least recently used one, and cursors that
+are not read for ``cursor_ttl`` seconds are closed in the background.
+"""
+
+import asyncio
+import contextlib
+import logging
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any
+
+from pg_mcp.config.settings import PagingConfig
+from pg_mcp.models.errors import CursorNotFoundError
+from pg_mcp.models.query import QueryResult, ResultFormat
+from pg_mcp.services.sql_executor import ResultCursor, SQLExecutor, TruncationReport
+
+logger = logging.getLogger(__name__)
+
+
+class _HeldCursor:
+    """Open cursor with its token, owner and page settings."""
+
+    __slots__ = ("client_id", "cursor", "last_used", "lock", "page_size", "result_format", "token")
+
+    def __init__(
+        self,
+        token: str,
+        client_id: str,
+        cursor: ResultCursor,
+        page_size: int,
+        result_format: ResultFormat,
+    ) -> None:
+        """Initialize a held cursor.
+
+        Args:
+            token: Token handed to the client.
+            client_id: Client that opened the cursor.
+            cursor: Open result cursor.
+            page_size: Rows per page.
+            result_format: Layout of the pages.
+        """
+        self.token = token
+        self.client_id = client_id
+        self.cursor = cursor
+        self.page_size = page_size
+        self.result_format = result_format
+        self.last_used = time.monotonic()
+        # Serializes fetches, and closing, on the cursor's connection
+        self.lock = asyncio.Lock()
+
+
+class ResultPager:
+    """Serves query results page by page from server-held cursors.
+
+    Example:
+        >>> pager = ResultPager(PagingConfig())
+        >>> await pager.start_eviction()
+        >>> first = await pager.open_result(executor, sql, page_size=100)
+        >>> while first.cursor:
+        ...     first = await pager.fetch_more(first.cursor)
+        >>> await pager.close()
+    """
+
+    def __init__(self, config: PagingConfig) -> None:
+        """Initialize result pager.
+
+        Args:
+            config: Paging configuration.
+        """
+        self.config = config
+        # Open cursors by token, least recently used first
+        self._cursors: OrderedDict[str, _HeldCursor] = OrderedDict()
+        self._eviction_task: asyncio.Task[None] | None = None
+
+        # Statistics
+        self._opened = 0
+        self._pages = 0
+        self._expired = 0
+        self._evicted = 0
+
+    async def open_result(
+        self,
+        executor: SQLExecutor,
+        sql: str,
+        page_size: int,
+        result_format: ResultFormat = ResultFormat.OBJECTS,
+        client_id: str = "default",
+    ) -> QueryResult:
+        """Execute a query and return its first page.
+
+        If more rows follow, the cursor is kept open and the page carries its
+        token; to stay within the limits, the least recently used cursor of
+        the client (or, at the overall limit, of any client) is closed.
+
+        Args:
+            executor: Executor for the query's database.
+            sql: SQL query to execute (should already be validated).
+            page_size: Rows per page (capped at ``max_page_size``).
+            result_format: Layout of the pages.
+            client_id: Client the cursor belongs to.
+
+        Returns:
+            QueryResult: The first page, with a cursor token if more rows follow.
+
+        Raises:
+            ExecutionTimeoutError: If the query exceeds the timeout.
+            DatabaseError: If database operation fails.
+        """
+        await self.evict_expired()
+
+        cursor = await executor.open_cursor(sql)
+        held = _HeldCursor(
+            token=secrets.token_urlsafe(16),
+            client_id=client_id,
+            cursor=cursor,
+            page_size=min(page_size, self.config.max_page_size),
+            result_format=result_format,
+        )
+        try:
+            page = await self._next_page(held)
+        except BaseException:
+            await cursor.close()
+            raise
+
+        if cursor.has_more:
+            await self._make_room(client_id)
+            self._cursors[held.token] = held
+            self._opened += 1
+            logger.debug(
+                "Result cursor opened",
+                extra={"client_id": client_id, "open_cursors": len(self._cursors)},
+            )
+        else:
+            await cursor.close()
+        return page
+
+    async def fetch_more(self, token: str, client_id: str = "default") -> QueryResult:
+        """Return the next page of an open result.
+
+        The cursor is closed after its last page, and after a failed fetch.
+
+        Args:
+            token: Cursor token from the previous page.
+            client_id: Client requesting the page; must be the cursor's owner.
+
+        Returns:
+            QueryResult: The next page, with a cursor token if more rows follow.
+
+        Raises:
+            CursorNotFoundError: If the token is unknown, expired or closed,
+                or belongs to another client.
+            ExecutionTimeoutError: If the fetch exceeds the timeout.
+            DatabaseError: If database operation fails.
+        """
+        await self.evict_expired()
+
+        held = self._cursors.get(token)
+        if held is None or held.client_id != client_id:
+            raise CursorNotFoundError(
+                message="Result cursor not found; it may have expired or been closed. "
+                "Run the query again to read the result.",
+                details={"cursor": token},
+            )
+
+        async with held.lock:
+            if held.cursor.closed:
+                raise CursorNotFoundError(
+                    message="Result cursor was closed. Run the query again to read the result.",
+                    details={"cursor": token},
+                )
+            held.last_used = time.monotonic()
+            try:
+                page = await self._next_page(held)
+            except BaseException:
+                self._cursors.pop(token, None)
+                await held.cursor.close()
+                raise
+
+            if held.cursor.has_more:
+                held.last_used = time.monotonic()
+                if token in self._cursors:
+                    self._cursors.move_to_end(token)
+            else:
+                self._cursors.pop(token, None)
+                await held.cursor.close()
+        return page
+
+    async def close_cursor(self, token: str) -> bool:
+        """Close an open cursor before its result has been read.
+
+        Args:
+            token: Cursor token.
+
+        Returns:
+            bool: True if the cursor was open.
+        """
+        held = self._cursors.pop(token, None)
+        if held is None:
+            return False
+        await self._close(held)
+        return True
+
+    async def evict_expired(self) -> int:
+        """Close the cursors that have not been read for ``cursor_ttl`` seconds.
+
+        Returns:
+            int: Number of cursors closed.
+        """
+        deadline = time.monotonic() - self.config.cursor_ttl
+        expired = [held for held in self._cursors.values() if held.last_used < deadline]
+        for held in expired:
+            self._cursors.pop(held.token, None)
+            await self._close(held)
+        if expired:
+            self._expired += len(expired)
+            logger.debug("Closed %d expired result cursors", len(expired))
+        return len(expired)
+
+    async def start_eviction(self) -> None:
+        """Start closing expired cursors in the background.
+
+        Checks every half ``cursor_ttl``, so an unused cursor is closed at most
+        one and a half TTLs after its last page even without further calls.
+        """
+        if self._eviction_task is not None and not self._eviction_task.done():
+            return
+        self._eviction_task = asyncio.create_task(self._eviction_loop())
+
+    async def close(self) -> None:
+        """Stop background eviction and close all open cursors."""
+        if self._eviction_task is not None and not self._eviction_task.done():
+            self._eviction_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._eviction_task
+        held_cursors = list(self._cursors.values())
+        self._cursors.clear()
+        for held in held_cursors:
+            await self._close(held)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get pager statistics.
+
+        Returns:
+            dict: Open cursors and counts of cursors opened, pages served and
+                cursors closed on expiry or to make room.
+        """
+        return {
+            "open_cursors": len(self._cursors),
+            "max_open_cursors": self.config.max_open_cursors,
+            "opened": self._opened,
+            "pages": self._pages,
+            "expired": self._expired,
+            "evicted": self._evicted,
+        }
+
+    async def _next_page(self, held: _HeldCursor) -> QueryResult:
+        """Read the next page of a cursor.
+
+        Args:
+            held: Cursor to read.
+
+        Returns:
+            QueryResult: The page, with the cursor's token if more rows follow.
+        """
+        start = time.perf_counter()
+        report = TruncationReport()
+        columnar = held.result_format == ResultFormat.COLUMNAR
+        if held.result_format == ResultFormat.OBJECTS:
+            rows = await held.cursor.fetch(held.page_size, report=report)
+            columns = list(rows[0].keys()) if rows else []
+            data: list[Any] = rows
+        else:
+            columns, data = await held.cursor.fetch_table(
+                held.page_size, columnar=columnar, report=report
+            )
+        self._pages += 1
+
+        return QueryResult(
+            columns=columns,
+            rows=[] if columnar else data,
+            column_values=data if columnar else None,
+            row_count=len(data[0]) if columnar and data else len(data),
+            execution_time_ms=(time.perf_counter() - start) * 1000,
+            truncated=report.reason is not None,
+            truncation_reason=report.reason,
+            truncated_values=report.truncated_values,
+            result_format=held.result_format,
+            cursor=held.token if held.cursor.has_more else None,
+        )
+
+    async def _make_room(self, client_id: str) -> None:
+        """Close least recently used cursors so that one more can be held.
+
+        Args:
+            client_id: Client about to hold another cursor.
+        """
+        owned = [held for held in self._cursors.values() if held.client_id == client_id]
+        victims = owned[: max(len(owned) - self.config.max_cursors_per_client + 1, 0)]
+        remaining = [held for held in self._cursors.values() if held not in victims]
+        victims += remaining[: max(len(remaining) - self.config.max_open_cursors + 1, 0)]
+        for held in victims:
+            self._cursors.pop(held.token, None)
+            await self._close(held)
+        if victims:
+            self._evicted += len(victims)
+            logger.debug(
+                "Closed %d result cursors to stay within limits",
+                len(victims),
+                extra={"client_id": client_id},
+            )
+
+    async def _close(self, held: _HeldCursor) -> None:
+        """Close a cursor once any fetch in progress has finished.
+
+        Args:
+            held: Cursor to close.
+        """
+        async with held.lock:
+            try:
+                await held.cursor.close()
+            except Exception as e:
+                logger.warning("Error closing result cursor: %s", e)
+
+    async def _eviction_loop(self) -> None:
+        """Background loop closing expired cursors."""
+        while True:
+            await asyncio.sleep(self.config.cursor_ttl / 2)
+            try:
+                await self.evict_expired()
+            except Exception as e:
+                logger.exception("Error closing expired result cursors: %s", e)
@@ -0,0 +1,339 @@
+"""Relevance-based schema pruning for SQL generation.
+
+This module provides the SchemaRetriever class, a local retrieval stage that
+runs between the schema cache and the SQL generator. It ranks tables against
+the user's question with BM25 over table names, column names and comments,
+keeps the top matches, and expands the selection along foreign keys so that
+join paths between the selected tables stay complete.
+
+Schemas held in compact form by the cache are ranked without materializing
+them; only the selected tables are converted to pydantic models.
+"""
+
+import logging
+import math
+import re
+from collections import Counter, deque
+from collections.abc import Iterator, Sequence
+from itertools import repeat
+
+from pg_mcp.cache.compact import CompactSchema, CompactTable, as_database_schema
+from pg_mcp.config.settings import SchemaRetrievalConfig
+from pg_mcp.models.schema import DatabaseSchema, TableInfo
+
+logger = logging.getLogger(__name__)
+
+# Latin words/digits, or runs of CJK ideographs (indexed as character bigrams)
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+|[\u4e00-\u9fff]+")
+_CAMEL_CASE_PATTERN = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+
+_STOPWORDS = frozenset(
+    {
+        "a", "all", "an", "and", "are", "as", "at", "by", "each", "every", "for",
+        "from", "get", "give", "how", "in", "is", "list", "many", "me", "much",
+        "of", "on", "or", "per", "show", "that", "the", "their", "there", "to",
+        "was", "were", "what", "which", "who", "with",
+    }
+)  # fmt: skip
+
+# Field boosts applied by repeating tokens in a table's document
+_TABLE_NAME_BOOST = 3
+_COLUMN_NAME_BOOST = 1
+_COMMENT_BOOST = 1
+
+# BM25 parameters
+_K1 = 1.2
+_B = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text or an identifier into normalized search terms.
+
+    Identifiers are split on underscores and camelCase, words are lowercased
+    and crudely singularized, stopwords are dropped and CJK runs become
+    character bigrams.
+
+    Args:
+        text: Text to tokenize.
+
+    Returns:
+        list[str]: Search terms in order of appearance.
+
+    Example:
+        >>> tokenize("orderItems per_customer")
+        ['order', 'item', 'customer']
+    """
+    terms = []
+    for token in _TOKEN_PATTERN.findall(_CAMEL_CASE_PATTERN.sub(" ", text).lower()):
+        if not token.isascii():
+            terms.extend(token[i : i + 2] for i in range(max(len(token) - 1, 1)))
+        elif token not in _STOPWORDS:
+            terms.append(_singularize(token))
+    return terms
+
+
+def _singularize(word: str) -> str:
+    """Strip common English plural suffixes.
+
+    Args:
+        word: Lowercase word.
+
+    Returns:
+        str: Singular form, or the word unchanged.
+    """
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def _column_texts(table: TableInfo | CompactTable) -> Iterator[tuple[str, str | None]]:
+    """Iterate over a table's column names and comments.
+
+    Args:
+        table: Table in either representation.
+
+    Returns:
+        Iterator: (name, comment) pairs.
+    """
+    if isinstance(table, CompactTable):
+        return zip(table.column_names, table.column_comments or repeat(None), strict=False)
+    return ((column.name, column.comment) for column in table.columns)
+
+
+class _BM25Index:
+    """BM25 index with one document per table."""
+
+    def __init__(self, tables: Sequence[TableInfo | CompactTable]) -> None:
+        """Build the index.
+
+        Args:
+            tables: Tables to index, in schema order.
+        """
+        self.term_freqs: list[Counter[str]] = []
+        doc_freqs: Counter[str] = Counter()
+        for table in tables:
+            terms = tokenize(table.table_name) * _TABLE_NAME_BOOST
+            if table.comment:
+                terms += tokenize(table.comment) * _COMMENT_BOOST
+            for name, comment in _column_texts(table):
+                terms += tokenize(name) * _COLUMN_NAME_BOOST
+                if comment:
+                    terms += tokenize(comment) * _COMMENT_BOOST
+            freqs = Counter(terms)
+            self.term_freqs.append(freqs)
+            doc_freqs.update(freqs.keys())
+
+        self.doc_lengths = [sum(freqs.values()) for freqs in self.term_freqs]
+        self.avg_length = sum(self.doc_lengths) / len(self.doc_lengths) if tables else 0.0
+        total = len(tables)
+        self.idf = {
+            term: math.log(1 + (total - df + 0.5) / (df + 0.5)) for term, df in doc_freqs.items()
+        }
+
+    def scores(self, query_terms: list[str]) -> list[float]:
+        """Score every table against a query.
+
+        Args:
+            query_terms: Tokenized query.
+
+        Returns:
+            list[float]: BM25 score per table, in index order.
+        """
+        terms = [term for term in set(query_terms) if term in self.idf]
+        scores = []
+        for freqs, length in zip(self.term_freqs, self.doc_lengths, strict=True):
+            norm = _K1 * (1 - _B + _B * length / self.avg_length) if self.avg_length else _K1
+            score = 0.0
+            for term in terms:
+                tf = freqs.get(term)
+                if tf:
+                    score += self.idf[term] * tf * (_K1 + 1) / (tf + norm)
+            scores.append(score)
+        return scores
+
+
+class _ForeignKeyGraph:
+    """Foreign key adjacency between the tables of a schema, by table index."""
+
+    def __init__(self, schema: DatabaseSchema | CompactSchema) -> None:
+        """Build the graph.
+
+        Args:
+            schema: Database schema whose foreign keys to resolve.
+        """
+        tables = schema.tables
+        resolve = schema.resolve if isinstance(schema, CompactSchema) else schema.index.resolve
+        position = {id(table): i for i, table in enumerate(tables)}
+
+        # Tables each table references, and the undirected adjacency
+        self.references: list[set[int]] = [set() for _ in tables]
+        self.neighbors: list[set[int]] = [set() for _ in tables]
+        for i, table in enumerate(tables):
+            for fk in table.foreign_keys:
+                for target in resolve(fk.referenced_table, table.schema_name):
+                    j = position[id(target)]
+                    self.references[i].add(j)
+                    self.neighbors[i].add(j)
+                    self.neighbors[j].add(i)
+
+
+class SchemaRetriever:
+    """Selects the part of a schema relevant to a question.
+
+    The index and foreign key graph for each database are built lazily and
+    rebuilt when the cached schema's table list is replaced (full reloads and
+    incremental refreshes that find changed relations).
+    Whenever pruning is disabled, the schema is small, or nothing in the
+    question matches the schema lexically, the full schema is returned.
+
+    Example:
+        >>> retriever = SchemaRetriever(SchemaRetrievalConfig(top_k=8))
+        >>> pruned = retriever.select("Top customers by order total", schema)
+        >>> prompt = build_user_prompt(question, pruned)
+    """
+
+    def __init__(self, config: SchemaRetrievalConfig) -> None:
+        """Initialize schema retriever.
+
+        Args:
+            config: Retrieval configuration (top-k, expansion, thresholds).
+        """
+        self.config = config
+        # database name -> (indexed table list, index, foreign key graph)
+        self._indexes: dict[
+            str, tuple[Sequence[TableInfo | CompactTable], _BM25Index, _ForeignKeyGraph]
+        ] = {}
+
+    def select(self, question: str, schema: DatabaseSchema | CompactSchema) -> DatabaseSchema:
+        """Prune a schema to the tables relevant to a question.
+
+        Args:
+            question: User's natural language question.
+            schema: Full database schema, in either representation.
+
+        Returns:
+            DatabaseSchema: A copy of the schema restricted to the relevant
+                tables, ranked tables first by decreasing relevance followed by
+                the tables added through foreign keys; or the full schema if
+                pruning does not apply.
+        """
+        tables = schema.tables
+        if not self.config.enabled or len(tables) <= self.config.min_tables:
+            return as_database_schema(schema)
+
+        index, graph = self._index_for(schema)
+        scores = index.scores(tokenize(question))
+        ranked = sorted(
+            (i for i, score in enumerate(scores) if score > 0),
+            key=lambda i: scores[i],
+            reverse=True,
+        )
+        if not ranked:
+            logger.debug(
+                "No schema terms matched the question, using full schema",
+                extra={"database": schema.database_name},
+            )
+            return as_database_schema(schema)
+
+        seeds = ranked[: self.config.top_k]
+        selected = self._expand(graph, seeds)
+        logger.debug(
+            "Pruned schema for prompt",
+            extra={
+                "database": schema.database_name,
+                "tables": len(selected),
+                "total_tables": len(tables),
+            },
+        )
+        # Most relevant first, so budgeted renderers can collapse from the end
+        order = seeds + sorted(selected.difference(seeds))
+        if isinstance(schema, CompactSchema):
+            return schema.to_schema(order)
+        return schema.model_copy(update={"tables": [schema.tables[i] for i in order]})
+
+    def _index_for(
+        self, schema: DatabaseSchema | CompactSchema
+    ) -> tuple[_BM25Index, _ForeignKeyGraph]:
+        """Get the index and foreign key graph for a schema.
+
+        Both are rebuilt if the schema's tables changed.
+
+        Args:
+            schema: Database schema.
+
+        Returns:
+            tuple: (index over the schema's tables, their foreign key graph).
+        """
+        cached = self._indexes.get(schema.database_name)
+        if cached is not None and cached[0] is schema.tables:
+            return cached[1], cached[2]
+
+        index = _BM25Index(schema.tables)
+        graph = _ForeignKeyGraph(schema)
+        self._indexes[schema.database_name] = (schema.tables, index, graph)
+        return index, graph
+
+    def _expand(self, graph: _ForeignKeyGraph, seeds: list[int]) -> set[int]:
+        """Expand seed tables along foreign keys.
+
+        Adds tables referenced by the seeds (up to ``fk_depth`` hops) and the
+        intermediate tables on the shortest foreign key path between every
+        pair of seeds (up to ``max_join_hops`` hops).
+
+        Args:
+            graph: Foreign key graph of the full schema.
+            seeds: Indexes of the top-ranked tables.
+
+        Returns:
+            set[int]: Indexes of the selected tables.
+        """
+        selected = set(seeds)
+
+        # Tables the seeds point at (lookup and parent tables)
+        frontier = set(seeds)
+        for _ in range(self.config.fk_depth):
+            frontier = {j for i in frontier for j in graph.references[i]} - selected
+            selected |= frontier
+
+        # Connect seeds through intermediate (e.g. junction) tables
+        for n, source in enumerate(seeds):
+            path = self._shortest_paths(graph.neighbors, source, set(seeds[n + 1 :]))
+            selected.update(path)
+
+        return selected
+
+    def _shortest_paths(
+        self, neighbors: list[set[int]], source: int, targets: set[int]
+    ) -> set[int]:
+        """Collect tables on shortest foreign key paths from a source to targets.
+
+        Args:
+            neighbors: Undirected foreign key adjacency.
+            source: Starting table index.
+            targets: Table indexes to connect to.
+
+        Returns:
+            set[int]: Tables on the found paths, including the reached targets.
+        """
+        parents = {source: source}
+        depth = {source: 0}
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            if depth[node] >= self.config.max_join_hops:
+                continue
+            for nxt in neighbors[node]:
+                if nxt not in parents:
+                    parents[nxt] = node
+                    depth[nxt] = depth[node] + 1
+                    queue.append(nxt)
+
+        on_path: set[int] = set()
+        for target in targets & parents.keys():
+            node = target
+            while node != source:
+                on_path.add(node)
+                node = parents[node]
+        return on_path
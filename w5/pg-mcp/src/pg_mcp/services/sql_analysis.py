@@ -0,0 +1,197 @@
+"""Parse-once analysis of generated SQL.
+
+This module provides the SQLAnalysis class and the analyze_sql function.
+Parsing is the most expensive step of handling a generated query on the
+server side, and validation, LIMIT pushdown and the cost guard's cache key
+all need the parsed statement. The orchestrator therefore parses each
+generated query once with analyze_sql and passes the resulting analysis to
+every step. The AST is never modified: rewrites work on a copy and produce a
+new analysis of their own.
+
+The normalized SQL and the referenced tables, columns and functions are
+computed from the AST on first use, so callers only pay for what they read.
+"""
+
+import logging
+import time
+
+import sqlglot
+from sqlglot import exp
+
+from pg_mcp.models.errors import SQLParseError
+from pg_mcp.observability.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class SQLAnalysis:
+    """SQL text with its parsed statements and facts derived from them.
+
+    Create instances with analyze_sql (which parses) or from_statement
+    (which wraps an already parsed statement).
+
+    Attributes:
+        sql: SQL text, as generated or as regenerated from a rewritten AST.
+        statements: Parsed statements; None entries stand for empty
+            statements (e.g. comment-only SQL).
+
+    Example:
+        >>> analysis = analyze_sql("SELECT u.name FROM users u JOIN orders o ON o.user_id = u.id")
+        >>> analysis.tables
+        ['orders', 'users']
+        >>> analysis.columns
+        ['o.user_id', 'u.id', 'u.name']
+    """
+
+    __slots__ = ("_columns", "_functions", "_normalized", "_tables", "sql", "statements")
+
+    def __init__(self, sql: str, statements: list[exp.Expression | None]) -> None:
+        """Initialize SQL analysis.
+
+        Args:
+            sql: SQL text the statements were parsed from.
+            statements: Parsed statements.
+        """
+        self.sql = sql
+        self.statements = statements
+        self._normalized: str | None = None
+        self._tables: list[str] | None = None
+        self._columns: list[str] | None = None
+        self._functions: list[str] | None = None
+
+    @classmethod
+    def from_statement(cls, statement: exp.Expression) -> "SQLAnalysis":
+        """Create an analysis of a statement without parsing.
+
+        Used for rewritten statements, whose SQL text is generated from the
+        AST.
+
+        Args:
+            statement: Parsed (and possibly rewritten) statement.
+
+        Returns:
+            SQLAnalysis: Analysis whose SQL is the statement's PostgreSQL text.
+        """
+        return cls(statement.sql(dialect="postgres"), [statement])
+
+    @property
+    def statement(self) -> exp.Expression | None:
+        """The parsed statement, if the SQL holds exactly one.
+
+        Returns:
+            exp.Expression | None: The statement, or None for multiple or
+                empty statements.
+        """
+        if len(self.statements) != 1:
+            return None
+        return self.statements[0]
+
+    @property
+    def normalized(self) -> str:
+        """SQL regenerated from the AST, for comparisons and cache keys.
+
+        Keyword case, whitespace, comments and a trailing semicolon do not
+        change it; literals and identifiers do.
+
+        Returns:
+            str: Normalized SQL (statements joined with "; ").
+        """
+        if self._normalized is None:
+            self._normalized = "; ".join(
+                statement.sql(dialect="postgres", comments=False)
+                for statement in self.statements
+                if statement is not None
+            )
+        return self._normalized
+
+    @property
+    def tables(self) -> list[str]:
+        """Names of the referenced tables.
+
+        Returns:
+            list[str]: Sorted, lowercase table names without schema.
+        """
+        if self._tables is None:
+            self._collect()
+        return self._tables  # type: ignore[return-value]
+
+    @property
+    def columns(self) -> list[str]:
+        """Referenced columns.
+
+        Returns:
+            list[str]: Sorted, lowercase column names, as ``table.column``
+                when qualified in the query.
+        """
+        if self._columns is None:
+            self._collect()
+        return self._columns  # type: ignore[return-value]
+
+    @property
+    def functions(self) -> list[str]:
+        """Names of the called functions.
+
+        Returns:
+            list[str]: Sorted, lowercase function names.
+        """
+        if self._functions is None:
+            self._collect()
+        return self._functions  # type: ignore[return-value]
+
+    def _collect(self) -> None:
+        """Collect tables, columns and functions in one walk over the AST."""
+        tables: set[str] = set()
+        columns: set[str] = set()
+        functions: set[str] = set()
+        for statement in self.statements:
+            if statement is None:
+                continue
+            for node in statement.walk():
+                if isinstance(node, exp.Table):
+                    if node.name:
+                        tables.add(node.name.lower())
+                elif isinstance(node, exp.Column):
+                    if node.name:
+                        name = node.name.lower()
+                        columns.add(f"{node.table.lower()}.{name}" if node.table else name)
+                elif isinstance(node, exp.Func):
+                    name = node.name if isinstance(node, exp.Anonymous) else node.sql_name()
+                    if name:
+                        functions.add(name.lower())
+        self._tables = sorted(tables)
+        self._columns = sorted(columns)
+        self._functions = sorted(functions)
+
+    def __repr__(self) -> str:
+        """String representation of the analysis.
+
+        Returns:
+            str: String representation.
+        """
+        return f"SQLAnalysis(sql={self.sql[:50]!r}, statements={len(self.statements)})"
+
+
+def analyze_sql(sql: str) -> SQLAnalysis:
+    """Parse SQL once into an analysis shared by the pipeline.
+
+    Args:
+        sql: SQL text.
+
+    Returns:
+        SQLAnalysis: Analysis of the SQL.
+
+    Raises:
+        SQLParseError: If the SQL is empty or cannot be parsed.
+    """
+    if not sql or not sql.strip():
+        raise SQLParseError("SQL query cannot be empty")
+
+    start = time.perf_counter()
+    try:
+        statements = sqlglot.parse(sql, read="postgres")
+    except Exception as e:
+        raise SQLParseError(f"Failed to parse SQL: {e}") from e
+    finally:
+        metrics.observe_sql_parse_duration(time.perf_counter() - start)
+
+    return SQLAnalysis(sql, statements)
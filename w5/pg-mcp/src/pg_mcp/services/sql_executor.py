@@ -1,30 +1,135 @@
 """SQL executor for PostgreSQL queries.
 
 This module provides safe SQL execution with session parameter configuration,
-result serialization, and row limiting to prevent memory overflow.
+result serialization, and row limiting to prevent memory overflow. Results can
+be streamed through a server-side cursor so that rows beyond the limit are
+never transferred. Session parameters are either set per query or, on pools
+created with session setup, once per connection by the pool. Besides the row
+limit, results are held to a byte budget: long text and binary values are cut
+to a per-value cap and rows past the budget are dropped.
 """
 
 import asyncio
+import bisect
+import contextlib
 import datetime
 import decimal
+import itertools
+import json
+import logging
+import operator
 import uuid
+from collections.abc import Callable
 from typing import Any
 
 import asyncpg
-from asyncpg import Connection, Pool
+from asyncpg import Connection, Pool, Record
+from asyncpg.transaction import Transaction
 
 from pg_mcp.config.settings import DatabaseConfig, SecurityConfig
-from pg_mcp.models.errors import DatabaseError, ExecutionTimeoutError
+from pg_mcp.db.pool import validate_session_config
+from pg_mcp.models.errors import DatabaseError, ExecutionTimeoutError, PgMcpError
+from pg_mcp.models.query import TruncationReason
+from pg_mcp.observability.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Estimated response size of values that are not text, binary or arrays
+# (numbers, timestamps, UUIDs, NULL), and of the marker of a truncated value
+_SCALAR_SIZE = 16
+_MARKER_SIZE = 40
+
+
+class TruncationReport:
+    """How a result was cut down to the configured limits.
+
+    Passed to ``SQLExecutor.execute`` or ``execute_table``, which fill it in.
+
+    Attributes:
+        reason: Limit at which rows were cut, or None if no rows were cut.
+        truncated_values: Number of values shortened to ``max_cell_bytes``.
+
+    Example:
+        >>> report = TruncationReport()
+        >>> results, count = await executor.execute(sql, report=report)
+        >>> report.reason  # TruncationReason.MAX_RESULT_BYTES
+    """
+
+    __slots__ = ("reason", "truncated_values")
+
+    def __init__(self) -> None:
+        """Initialize a report of an untruncated result."""
+        self.reason: TruncationReason | None = None
+        self.truncated_values = 0
+
+
+class _ByteBudget:
+    """Estimated response size of fetched records, against a byte budget.
+
+    The estimate approximates the JSON-serialized size of the values (not of
+    the column names), counting text and binary values as truncated to the
+    per-value cap. Rows are measured once, while streaming or when fitting.
+    """
+
+    __slots__ = ("cell_limit", "limit", "sizes", "used")
+
+    def __init__(self, limit: int, cell_limit: int) -> None:
+        """Initialize an empty budget.
+
+        Args:
+            limit: Budget in bytes.
+            cell_limit: Per-value cap in UTF-8 bytes (0 for none).
+        """
+        self.limit = limit
+        self.cell_limit = cell_limit
+        self.sizes: list[int] = []
+        self.used = 0
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether the measured records exceed the budget."""
+        return self.used > self.limit
+
+    def measure(self, records: list[Record]) -> None:
+        """Add the estimated size of records following those measured.
+
+        Args:
+            records: Records in fetch order.
+        """
+        cell_limit = self.cell_limit
+        for record in records:
+            size = sum(_value_size(value, cell_limit) for value in record.values())
+            self.sizes.append(size)
+            self.used += size
+
+    def fit(self, records: list[Record]) -> int:
+        """Count the leading records that fit into the budget.
+
+        Args:
+            records: Records in fetch order, starting with any measured ones.
+
+        Returns:
+            int: Number of records, from the first, whose total size is
+                within the budget.
+        """
+        self.measure(records[len(self.sizes) :])
+        totals = list(itertools.accumulate(self.sizes[: len(records)]))
+        return bisect.bisect_right(totals, self.limit)
 
 
 class SQLExecutor:
     """SQL executor using asyncpg with security measures.
 
     This executor ensures safe query execution by:
-    1. Setting session parameters (timeout, search_path, role)
+    1. Setting session parameters (timeout, search_path, role), unless the
+       pool already set them up for each connection
     2. Running queries in read-only transactions
-    3. Limiting the number of returned rows
-    4. Serializing PostgreSQL-specific data types
+    3. Limiting the number of returned rows, optionally reading them through
+       a server-side cursor that stops at the limit
+    4. Limiting the size of the result: values longer than
+       ``max_cell_bytes`` are truncated and rows past ``max_result_bytes``
+       dropped
+    5. Serializing PostgreSQL-specific data types
 
     Example:
         >>> executor = SQLExecutor(pool, security_config, db_config)
@@ -37,6 +142,7 @@ class SQLExecutor:
         pool: Pool,
         security_config: SecurityConfig,
         db_config: DatabaseConfig,
+        session_preconfigured: bool = False,
     ) -> None:
         """Initialize SQL executor.
 
@@ -44,36 +150,58 @@ class SQLExecutor:
             pool: asyncpg connection pool for database connections.
             security_config: Security configuration including timeouts and limits.
             db_config: Database configuration including connection parameters.
+            session_preconfigured: Whether the pool was created with session
+                setup for ``security_config`` (``create_pool(db_config,
+                security_config)``). Queries then skip the SET statements and,
+                unless streaming, the explicit transaction: the session's
+                ``default_transaction_read_only`` makes them read-only. Only a
+                timeout other than the configured one costs a SET.
         """
         self.pool = pool
         self.security_config = security_config
         self.db_config = db_config
+        self.session_preconfigured = session_preconfigured
 
     async def execute(
         self,
         sql: str,
         timeout: float | None = None,  # noqa: ASYNC109
         max_rows: int | None = None,
+        stream: bool | None = None,
+        report: TruncationReport | None = None,
     ) -> tuple[list[dict[str, Any]], int]:
         """Execute SQL query with security measures.
 
         This method:
         1. Acquires a connection from the pool
-        2. Starts a read-only transaction
-        3. Sets session parameters (timeout, search_path, role)
-        4. Executes the query with timeout
-        5. Limits the number of returned rows
-        6. Serializes special PostgreSQL types
+        2. Starts a read-only transaction (unless the pool set up the session
+           and the result is not streamed)
+        3. Sets session parameters (timeout, search_path, role); with a
+           pool-configured session, only a non-default timeout
+        4. Executes the query with timeout, fetching all rows or, when
+           streaming, at most ``max_rows + 1`` rows in batches from a cursor
+        5. Limits the number of returned rows, and their size to the byte
+           budget (when streaming, no rows are fetched past the budget)
+        6. Serializes special PostgreSQL types and truncates long values
 
         Args:
             sql: SQL query to execute (should already be validated).
             timeout: Query timeout in seconds (uses config default if None).
             max_rows: Maximum rows to return (uses config default if None).
+            stream: Read rows through a server-side cursor and stop after
+                ``max_rows`` (uses config default if None).
+            report: Filled in with the limit at which rows were cut and the
+                number of truncated values.
 
         Returns:
             tuple: (results, total_row_count) where:
                 - results: List of row dictionaries with serialized values
-                - total_row_count: Total number of rows (before limiting)
+                - total_row_count: Total number of rows (before limiting).
+                  When streaming, or when the SQL has a pushed-down
+                  ``LIMIT max_rows + 1`` (see SQLRewriter), rows past the limit
+                  are not read and a truncated result reports ``max_rows + 1``.
+                  In all cases the result was truncated (at the row limit or
+                  the byte budget) if ``total_row_count > len(results)``.
 
         Raises:
             ExecutionTimeoutError: If query execution exceeds timeout.
@@ -87,68 +215,405 @@ class SQLExecutor:
             ... )
             >>> print(f"Retrieved {len(results)} of {count} total rows")
         """
+        records, total_count = await self._fetch(sql, timeout, max_rows, stream, report)
+        return self._to_rows(records, report), total_count
+
+    async def execute_table(
+        self,
+        sql: str,
+        timeout: float | None = None,  # noqa: ASYNC109
+        max_rows: int | None = None,
+        stream: bool | None = None,
+        columnar: bool = False,
+        report: TruncationReport | None = None,
+    ) -> tuple[list[str], list[list[Any]], int]:
+        """Execute SQL query, returning values in arrays instead of row dicts.
+
+        Runs the query like ``execute`` but lays the result out as arrays:
+        one per row or, if ``columnar``, one per column. Values are read from
+        the records column by column, without building a dict per row.
+
+        Args:
+            sql: SQL query to execute (should already be validated).
+            timeout: Query timeout in seconds (uses config default if None).
+            max_rows: Maximum rows to return (uses config default if None).
+            stream: Read rows through a server-side cursor and stop after
+                ``max_rows`` (uses config default if None).
+            columnar: Return one array per column instead of one per row.
+            report: Filled in like with ``execute``.
+
+        Returns:
+            tuple: (columns, data, total_row_count) where:
+                - columns: Column names
+                - data: Serialized values of each row in column order or, if
+                  columnar, of each column in row order
+                - total_row_count: As returned by ``execute``
+
+        Raises:
+            ExecutionTimeoutError: If query execution exceeds timeout.
+            DatabaseError: If database operation fails.
+
+        Example:
+            >>> columns, values, count = await executor.execute_table(
+            ...     "SELECT id, name FROM users", columnar=True
+            ... )
+            >>> dict(zip(columns, values))  # {"id": [1, 2], "name": ["Alice", "Bob"]}
+        """
+        records, total_count = await self._fetch(sql, timeout, max_rows, stream, report)
+        columns, data = self._to_table(records, columnar, report)
+        return columns, data, total_count
+
+    async def open_cursor(
+        self,
+        sql: str,
+        timeout: float | None = None,  # noqa: ASYNC109
+        max_rows: int | None = None,
+    ) -> "ResultCursor":
+        """Execute SQL query and keep its result open for reading in pages.
+
+        Acquires a connection, starts a read-only transaction, sets the
+        session parameters and declares a server-side cursor for the query.
+        The connection stays checked out of the pool until the cursor is
+        closed, so callers must bound the number of open cursors.
+
+        Args:
+            sql: SQL query to execute (should already be validated).
+            timeout: Timeout in seconds for opening the cursor and for each
+                fetch (uses config default if None).
+            max_rows: Maximum rows to read through the cursor in total (uses
+                config default if None).
+
+        Returns:
+            ResultCursor: The open cursor.
+
+        Raises:
+            ExecutionTimeoutError: If the query exceeds the timeout.
+            DatabaseError: If database operation fails.
+
+        Example:
+            >>> cursor = await executor.open_cursor("SELECT * FROM events")
+            >>> try:
+            ...     page = await cursor.fetch(100)
+            ... finally:
+            ...     await cursor.close()
+        """
+        timeout = timeout or self.security_config.max_execution_time
+        max_rows = max_rows or self.security_config.max_rows
+
+        connection = await self.pool.acquire()
+        transaction = connection.transaction(readonly=True)
+        try:
+            await transaction.start()
+            if self.session_preconfigured:
+                await self._override_timeout(connection, timeout)
+            else:
+                await self._set_session_params(connection, timeout)
+            cursor = await asyncio.wait_for(connection.cursor(sql), timeout=timeout)
+        except BaseException as e:
+            # Releasing the connection rolls back the transaction. Cancellation
+            # must release it too, or it stays checked out for good
+            await self.pool.release(connection)
+            if isinstance(e, PgMcpError) or not isinstance(e, Exception):
+                raise
+            if isinstance(e, TimeoutError):
+                raise _timeout_error(sql, timeout) from e
+            raise _query_error(e, sql) from e
+
+        return ResultCursor(self, connection, transaction, cursor, sql, timeout, max_rows)
+
+    async def explain(
+        self,
+        sql: str,
+        timeout: float | None = None,  # noqa: ASYNC109
+    ) -> dict[str, Any]:
+        """Get the planner's estimates for a query without running it.
+
+        Runs a plain ``EXPLAIN (FORMAT JSON)`` (no ANALYZE) with the same
+        session settings as queries.
+
+        Args:
+            sql: SQL query to plan (should already be validated).
+            timeout: Timeout in seconds (uses config default if None).
+
+        Returns:
+            dict: Root node of the plan, with keys such as ``"Node Type"``,
+                ``"Total Cost"`` and ``"Plan Rows"``.
+
+        Raises:
+            ExecutionTimeoutError: If planning exceeds the timeout.
+            DatabaseError: If the query cannot be planned.
+
+        Example:
+            >>> plan = await executor.explain("SELECT * FROM a CROSS JOIN b")
+            >>> plan["Total Cost"], plan["Plan Rows"]
+            (150012500.0, 10000000000)
+        """
+        timeout = timeout or self.security_config.max_execution_time
+        try:
+            async with (
+                self.pool.acquire() as connection,
+                self._transaction(connection, stream=False),
+            ):
+                if self.session_preconfigured:
+                    await self._override_timeout(connection, timeout)
+                else:
+                    await self._set_session_params(connection, timeout)
+                try:
+                    document = await asyncio.wait_for(
+                        connection.fetchval(f"EXPLAIN (FORMAT JSON) {sql}"),
+                        timeout=timeout,
+                    )
+                except TimeoutError as e:
+                    raise _timeout_error(sql, timeout) from e
+        except ExecutionTimeoutError:
+            raise
+        except Exception as e:
+            raise _query_error(e, sql) from e
+
+        # asyncpg returns json values as text unless a codec is set
+        if isinstance(document, str):
+            document = json.loads(document)
+        plan: dict[str, Any] = document[0]["Plan"]
+        return plan
+
+    async def _fetch(
+        self,
+        sql: str,
+        timeout: float | None,  # noqa: ASYNC109
+        max_rows: int | None,
+        stream: bool | None,
+        report: TruncationReport | None = None,
+    ) -> tuple[list[Record], int]:
+        """Run a query and fetch its records, at most ``max_rows``.
+
+        Records that do not fit into the byte budget are dropped as well.
+
+        Args:
+            sql: SQL query to execute.
+            timeout: Query timeout in seconds (uses config default if None).
+            max_rows: Maximum rows to return (uses config default if None).
+            stream: Read rows through a server-side cursor (uses config
+                default if None).
+            report: Filled in with the limit at which records were cut.
+
+        Returns:
+            tuple: (records, total_row_count), see ``execute``.
+
+        Raises:
+            ExecutionTimeoutError: If query execution exceeds timeout.
+            DatabaseError: If database operation fails.
+        """
         # Use configured defaults if not specified
         timeout = timeout or self.security_config.max_execution_time
         max_rows = max_rows or self.security_config.max_rows
+        if stream is None:
+            stream = self.security_config.stream_results
+        budget = self._byte_budget()
 
         try:
             async with (
                 self.pool.acquire() as connection,
-                connection.transaction(readonly=True),
+                self._transaction(connection, stream),
             ):
                 # Set session parameters for security
-                await self._set_session_params(connection, timeout)
+                if self.session_preconfigured:
+                    await self._override_timeout(connection, timeout)
+                else:
+                    await self._set_session_params(connection, timeout)
 
                 # Execute query with timeout
                 try:
-                    records = await asyncio.wait_for(
-                        connection.fetch(sql),
-                        timeout=timeout,
-                    )
+                    if stream:
+                        records = await asyncio.wait_for(
+                            self._fetch_streaming(connection, sql, max_rows + 1, budget),
+                            timeout=timeout,
+                        )
+                    else:
+                        records = await asyncio.wait_for(
+                            connection.fetch(sql),
+                            timeout=timeout,
+                        )
                 except TimeoutError as e:
-                    raise ExecutionTimeoutError(
-                        message=f"Query execution exceeded timeout of {timeout} seconds",
-                        details={
-                            "timeout_seconds": timeout,
-                            "sql": sql[:200],  # Include truncated SQL for debugging
-                        },
-                    ) from e
+                    raise _timeout_error(sql, timeout) from e
 
                 # Track total count before limiting
                 total_count = len(records)
 
-                # Limit number of returned rows
+                # Limit number of returned rows, then their size
+                reason = None
                 if len(records) > max_rows:
                     records = records[:max_rows]
+                    reason = TruncationReason.MAX_ROWS
+                if budget is not None:
+                    fitting = budget.fit(records)
+                    if fitting < len(records):
+                        records = records[:fitting]
+                        reason = TruncationReason.MAX_RESULT_BYTES
 
-                # Convert asyncpg.Record to dict
-                results = [dict(record) for record in records]
-
-                # Serialize special PostgreSQL types
-                results = self._serialize_results(results)
+                if reason is not None:
+                    logger.debug(
+                        "Query result truncated at %d rows (%s)",
+                        len(records),
+                        reason,
+                        extra={"database": self.db_config.name, "streamed": stream},
+                    )
+                    metrics.increment_query_results_truncated(self.db_config.name, reason)
+                if report is not None:
+                    report.reason = reason
 
-                return results, total_count
+                return records, total_count
 
         except ExecutionTimeoutError:
             # Re-raise timeout errors as-is
             raise
+        except Exception as e:
+            # Wrap PostgreSQL and unexpected errors
+            raise _query_error(e, sql) from e
+
+    async def _fetch_streaming(
+        self, conn: Connection, sql: str, limit: int, budget: _ByteBudget | None = None
+    ) -> list[Record]:
+        """Fetch up to ``limit`` rows through a server-side cursor.
+
+        Rows are pulled in batches of ``fetch_batch_size``; the last batch
+        only asks for the rows still needed, so no more than ``limit`` rows
+        are transferred regardless of the size of the result set. With a
+        byte budget, fetching also stops after the batch that exhausts it.
+        Must run inside a transaction.
+
+        Args:
+            conn: Database connection with an open transaction.
+            sql: SQL query to execute.
+            limit: Maximum number of rows to fetch.
+            budget: Byte budget that measures the fetched rows.
+
+        Returns:
+            list: Fetched records, at most ``limit``.
+        """
+        cursor = await conn.cursor(sql)
+        batch_size = self.security_config.fetch_batch_size
+        records: list[Record] = []
+        while len(records) < limit:
+            wanted = min(batch_size, limit - len(records))
+            batch = await cursor.fetch(wanted)
+            records.extend(batch)
+            if len(batch) < wanted:
+                break
+            if budget is not None:
+                budget.measure(batch)
+                if budget.exhausted:
+                    break
+        return records
+
+    def _byte_budget(self) -> _ByteBudget | None:
+        """Create a budget for the rows of one result.
+
+        Returns:
+            _ByteBudget | None: Empty budget of ``max_result_bytes``, or None
+                if the budget is disabled.
+        """
+        if not self.security_config.max_result_bytes:
+            return None
+        return _ByteBudget(
+            self.security_config.max_result_bytes, self.security_config.max_cell_bytes
+        )
+
+    def _to_rows(
+        self, records: list[Record], report: TruncationReport | None
+    ) -> list[dict[str, Any]]:
+        """Convert records to serialized row dictionaries.
+
+        Args:
+            records: Fetched records.
+            report: Filled in with the number of truncated values.
+
+        Returns:
+            list: Row dictionaries with serialized, size-capped values.
+        """
+        # Convert asyncpg.Record to dict
+        results = [dict(record) for record in records]
+
+        # Serialize special PostgreSQL types
+        results = self._serialize_results(results)
+
+        truncated_values = self._truncate_rows(results)
+        if report is not None:
+            report.truncated_values = truncated_values
+        return results
+
+    def _to_table(
+        self, records: list[Record], columnar: bool, report: TruncationReport | None
+    ) -> tuple[list[str], list[list[Any]]]:
+        """Convert records to column names and serialized value arrays.
+
+        Args:
+            records: Fetched records.
+            columnar: Return one array per column instead of one per row.
+            report: Filled in with the number of truncated values.
+
+        Returns:
+            tuple: (columns, data), see ``execute_table``.
+        """
+        if not records:
+            return [], []
+
+        columns = list(records[0].keys())
+        values = self._serialize_columns(
+            [list(column) for column in zip(*(record.values() for record in records), strict=True)]
+        )
+        truncated_values = self._truncate_columns(values)
+        if report is not None:
+            report.truncated_values = truncated_values
+        if columnar:
+            return columns, values
+        rows = [list(row) for row in zip(*values, strict=True)] if values else [[] for _ in records]
+        return columns, rows
+
+    def _transaction(
+        self, conn: Connection, stream: bool
+    ) -> Transaction | contextlib.nullcontext[None]:
+        """Get the transaction a query runs in.
+
+        Args:
+            conn: Database connection.
+            stream: Whether the result is read through a cursor.
+
+        Returns:
+            A read-only transaction, or a no-op context manager when the
+            session is read-only by default and no cursor is needed (a single
+            statement runs in its own implicit transaction).
+        """
+        if self.session_preconfigured and not stream:
+            return contextlib.nullcontext()
+        return conn.transaction(readonly=True)
+
+    async def _override_timeout(
+        self,
+        conn: Connection,
+        timeout: float,  # noqa: ASYNC109
+    ) -> None:
+        """Set the statement timeout if it differs from the pool's default.
+
+        The setting lasts until the pool resets the connection on release.
+
+        Args:
+            conn: Database connection with a pool-configured session.
+            timeout: Query timeout in seconds.
+
+        Raises:
+            DatabaseError: If setting the timeout fails.
+        """
+        timeout_ms = int(timeout * 1000)
+        if timeout_ms == int(self.security_config.max_execution_time * 1000):
+            return
+        try:
+            await conn.execute(f"SET statement_timeout = {timeout_ms}")
         except asyncpg.PostgresError as e:
-            # Wrap PostgreSQL errors
             raise DatabaseError(
-                message=f"Database query failed: {e!s}",
+                message=f"Failed to set session parameters: {e!s}",
                 details={
                     "error_code": e.sqlstate if hasattr(e, "sqlstate") else None,
-                    "error_message": str(e),
-                    "sql": sql[:200],  # Include truncated SQL for debugging
-                },
-            ) from e
-        except Exception as e:
-            # Catch-all for unexpected errors
-            raise DatabaseError(
-                message=f"Unexpected error during query execution: {e!s}",
-                details={
-                    "error_type": type(e).__name__,
-                    "error_message": str(e),
+                    "timeout_ms": timeout_ms,
                 },
             ) from e
 
@@ -180,27 +645,17 @@ class SQLExecutor:
             timeout_ms = int(timeout * 1000)
             await conn.execute(f"SET statement_timeout = {timeout_ms}")
 
+            # Validate search_path and role contain only safe characters
+            validate_session_config(self.security_config)
+
             # Set safe search_path to prevent schema injection
             # Using execute with literal to avoid SQL injection
             search_path = self.security_config.safe_search_path
-            # Validate search_path contains only safe characters
-            if not all(c.isalnum() or c in ("_", ",", " ") for c in search_path):
-                raise DatabaseError(
-                    message="Invalid search_path configuration",
-                    details={"search_path": search_path},
-                )
             await conn.execute(f"SET search_path = '{search_path}'")
 
             # Switch to read-only role if configured
             if self.security_config.readonly_role:
-                readonly_role = self.security_config.readonly_role
-                # Validate role name contains only safe characters
-                if not all(c.isalnum() or c == "_" for c in readonly_role):
-                    raise DatabaseError(
-                        message="Invalid readonly_role configuration",
-                        details={"readonly_role": readonly_role},
-                    )
-                await conn.execute(f"SET ROLE {readonly_role}")
+                await conn.execute(f"SET ROLE {self.security_config.readonly_role}")
 
         except asyncpg.PostgresError as e:
             raise DatabaseError(
@@ -224,8 +679,15 @@ class SQLExecutor:
         - bytes: converted to hexadecimal string
         - Nested lists/dicts: recursively serialized
 
+        Values are converted column by column: the converter for a column is
+        chosen once, from the type of its first non-null value (asyncpg
+        decodes each PostgreSQL type to a single Python type), and columns
+        of natively JSON-compatible types are skipped. Rows are updated in
+        place.
+
         Args:
-            results: List of row dictionaries with potentially unserializable values.
+            results: List of row dictionaries with potentially unserializable
+                values; all rows have the columns of the first.
 
         Returns:
             list: Results with all values serialized to JSON-compatible types.
@@ -239,50 +701,494 @@ class SQLExecutor:
             >>> serialized[0]["created"]  # "2024-01-01T12:00:00"
             >>> serialized[1]["price"]  # 99.99
         """
+        if not results:
+            return results
+
+        for column in results[0]:
+            sample = next((row[column] for row in results if row[column] is not None), None)
+            if sample is None:
+                continue
+            convert = _column_converter(sample)
+            if convert is None:
+                continue
+            for row in results:
+                value = row[column]
+                if value is not None:
+                    row[column] = convert(value)
+
+        return results
+
+    def _serialize_columns(self, columns: list[list[Any]]) -> list[list[Any]]:
+        """Serialize column value lists to JSON-compatible types.
+
+        Converts values like ``_serialize_results``, with one converter per
+        column; columns of natively JSON-compatible types are returned as
+        they are.
+
+        Args:
+            columns: Values of each column, in row order.
+
+        Returns:
+            list: Serialized values of each column.
+
+        Example:
+            >>> executor._serialize_columns([[1, 2], [decimal.Decimal("1.5"), None]])
+            [[1, 2], [1.5, None]]
+        """
+        serialized = []
+        for values in columns:
+            sample = next((value for value in values if value is not None), None)
+            convert = None if sample is None else _column_converter(sample)
+            if convert is not None:
+                values = [None if value is None else convert(value) for value in values]
+            serialized.append(values)
+        return serialized
+
+    def _truncate_rows(self, results: list[dict[str, Any]]) -> int:
+        """Truncate serialized text values longer than ``max_cell_bytes``.
+
+        Text, JSON kept as text and binary values (serialized as hex) whose
+        UTF-8 encoding exceeds the cap are cut to it, on a character
+        boundary, and end in a marker that gives the number of characters
+        removed. Every string value is checked, whatever the other values of
+        its column; strings nested in arrays or decoded JSON are not
+        truncated. Rows are updated in place.
+
+        Args:
+            results: Serialized row dictionaries.
+
+        Returns:
+            int: Number of truncated values.
+        """
+        limit = self.security_config.max_cell_bytes
+        if not limit or not results:
+            return 0
+
+        truncated = 0
+        for row in results:
+            for column, value in row.items():
+                if isinstance(value, str):
+                    short = _truncate_text(value, limit)
+                    if short is not None:
+                        row[column] = short
+                        truncated += 1
+        return truncated
+
+    def _truncate_columns(self, columns: list[list[Any]]) -> int:
+        """Truncate serialized text values longer than ``max_cell_bytes``.
+
+        Same as ``_truncate_rows``, for column value lists.
+
+        Args:
+            columns: Serialized values of each column, updated in place.
+
+        Returns:
+            int: Number of truncated values.
+        """
+        limit = self.security_config.max_cell_bytes
+        if not limit:
+            return 0
+
+        truncated = 0
+        for values in columns:
+            for i, value in enumerate(values):
+                if isinstance(value, str):
+                    short = _truncate_text(value, limit)
+                    if short is not None:
+                        values[i] = short
+                        truncated += 1
+        return truncated
+
+
+class ResultCursor:
+    """Query result held open on the server and read in pages.
+
+    Holds a pool connection with a read-only transaction and a server-side
+    cursor until closed, so that every page comes from the one execution of
+    the query (and from one snapshot). Rows are read with one row of
+    look-ahead, which tells whether more rows follow. Pages are limited like
+    results of ``SQLExecutor.execute``: in total to ``max_rows`` rows, and each
+    to the byte budget, rows past which are left for the next page.
+
+    Attributes:
+        sql: Query the cursor reads.
+        returned: Number of rows returned so far.
+        has_more: Whether rows remain to be read.
+        closed: Whether the cursor has been closed.
+
+    Example:
+        >>> cursor = await executor.open_cursor("SELECT * FROM events")
+        >>> while cursor.has_more:
+        ...     columns, rows = await cursor.fetch_table(500)
+        >>> await cursor.close()
+    """
+
+    def __init__(
+        self,
+        executor: SQLExecutor,
+        connection: Connection,
+        transaction: Transaction,
+        cursor: Any,
+        sql: str,
+        timeout: float,
+        max_rows: int,
+    ) -> None:
+        """Initialize a cursor; use ``SQLExecutor.open_cursor`` instead.
+
+        Args:
+            executor: Executor whose pool the connection belongs to.
+            connection: Connection checked out for the cursor.
+            transaction: Open read-only transaction.
+            cursor: asyncpg cursor over the query.
+            sql: Query the cursor reads.
+            timeout: Timeout for each fetch in seconds.
+            max_rows: Maximum rows to return in total.
+        """
+        self._executor = executor
+        self._connection = connection
+        self._transaction = transaction
+        self._cursor = cursor
+        self._timeout = timeout
+        self._max_rows = max_rows
+        self._pending: list[Record] = []
+        self._exhausted = False
+        self.sql = sql
+        self.returned = 0
+        self.has_more = True
+        self.closed = False
+
+    async def fetch(
+        self, count: int, report: TruncationReport | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch the next page as row dictionaries.
+
+        Args:
+            count: Maximum rows in the page.
+            report: Filled in with the number of truncated values and, if
+                the result ends at ``max_rows`` with rows left, the reason.
+
+        Returns:
+            list: Serialized row dictionaries; at least one row unless the
+                result has no more rows.
+
+        Raises:
+            ExecutionTimeoutError: If a fetch exceeds the timeout.
+            DatabaseError: If database operation fails.
+        """
+        records = await self._next_records(count, report)
+        return self._executor._to_rows(records, report)
+
+    async def fetch_table(
+        self, count: int, columnar: bool = False, report: TruncationReport | None = None
+    ) -> tuple[list[str], list[list[Any]]]:
+        """Fetch the next page as value arrays.
+
+        Args:
+            count: Maximum rows in the page.
+            columnar: Return one array per column instead of one per row.
+            report: Filled in like with ``fetch``.
+
+        Returns:
+            tuple: (columns, data), see ``SQLExecutor.execute_table``.
+
+        Raises:
+            ExecutionTimeoutError: If a fetch exceeds the timeout.
+            DatabaseError: If database operation fails.
+        """
+        records = await self._next_records(count, report)
+        return self._executor._to_table(records, columnar, report)
+
+    async def close(self) -> None:
+        """Roll back the transaction and return the connection to the pool."""
+        if self.closed:
+            return
+        self.closed = True
+        self.has_more = False
+        try:
+            with contextlib.suppress(Exception):
+                await self._transaction.rollback()
+        finally:
+            await self._executor.pool.release(self._connection)
+
+    async def _next_records(self, count: int, report: TruncationReport | None) -> list[Record]:
+        """Read the records of the next page.
+
+        Args:
+            count: Maximum records in the page.
+            report: Filled in with the reason if the result ends at
+                ``max_rows`` with rows left.
+
+        Returns:
+            list: Records of the page.
+        """
+        if self.closed:
+            raise DatabaseError(message="Result cursor is closed", details={"sql": self.sql[:200]})
+
+        wanted = min(count, self._max_rows - self.returned)
+        needed = wanted + 1 - len(self._pending)
+        if needed > 0 and not self._exhausted:
+            try:
+                batch = await asyncio.wait_for(self._cursor.fetch(needed), timeout=self._timeout)
+            except TimeoutError as e:
+                raise _timeout_error(self.sql, self._timeout) from e
+            except asyncpg.PostgresError as e:
+                raise _query_error(e, self.sql) from e
+            if len(batch) < needed:
+                self._exhausted = True
+            self._pending.extend(batch)
+
+        records = self._pending[:wanted]
+        budget = self._executor._byte_budget()
+        if budget is not None and records:
+            # Always return a row, so that every page makes progress
+            records = records[: max(budget.fit(records), 1)]
+        del self._pending[: len(records)]
+        self.returned += len(records)
+
+        if self._pending and self.returned >= self._max_rows:
+            # The rows past max_rows are not returned
+            self._pending.clear()
+            self._exhausted = True
+            metrics.increment_query_results_truncated(
+                self._executor.db_config.name, TruncationReason.MAX_ROWS
+            )
+            if report is not None:
+                report.reason = TruncationReason.MAX_ROWS
+        self.has_more = bool(self._pending)
+        return records
+
+
+def _timeout_error(sql: str, timeout: float) -> ExecutionTimeoutError:
+    """Create the error for a query that exceeded its timeout.
+
+    Args:
+        sql: SQL query.
+        timeout: Timeout in seconds.
+
+    Returns:
+        ExecutionTimeoutError: The error.
+    """
+    return ExecutionTimeoutError(
+        message=f"Query execution exceeded timeout of {timeout} seconds",
+        details={
+            "timeout_seconds": timeout,
+            "sql": sql[:200],  # Include truncated SQL for debugging
+        },
+    )
+
+
+def _query_error(error: Exception, sql: str) -> DatabaseError:
+    """Wrap an error raised while running a query.
+
+    Args:
+        error: asyncpg or unexpected error.
+        sql: SQL query.
+
+    Returns:
+        DatabaseError: The wrapped error.
+    """
+    if isinstance(error, asyncpg.PostgresError):
+        return DatabaseError(
+            message=f"Database query failed: {error!s}",
+            details={
+                "error_code": error.sqlstate if hasattr(error, "sqlstate") else None,
+                "error_message": str(error),
+                "sql": sql[:200],  # Include truncated SQL for debugging
+            },
+        )
+    return DatabaseError(
+        message=f"Unexpected error during query execution: {error!s}",
+        details={
+            "error_type": type(error).__name__,
+            "error_message": str(error),
+        },
+    )
 
-        def serialize_value(value: Any) -> Any:
-            """Recursively serialize a single value.
 
-            Args:
-                value: Value to serialize.
+def _value_size(value: Any, cell_limit: int) -> int:
+    """Estimate the size of a value in a JSON response.
 
-            Returns:
-                Serialized value that is JSON-compatible.
-            """
-            # Handle None
-            if value is None:
-                return None
+    Args:
+        value: Value as decoded by asyncpg.
+        cell_limit: Per-value cap in UTF-8 bytes that text and binary values
+            are truncated to (0 for none).
 
-            # Handle datetime types
-            if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
-                return value.isoformat()
+    Returns:
+        int: Approximate size in bytes.
+    """
+    if isinstance(value, str):
+        size = len(value) if value.isascii() else len(value.encode())
+    elif isinstance(value, bytes):
+        size = 2 * len(value)
+    elif isinstance(value, (list, tuple)):
+        return sum(_value_size(v, 0) + 1 for v in value) + 2
+    elif isinstance(value, dict):
+        return sum(len(str(k)) + _value_size(v, 0) + 4 for k, v in value.items()) + 2
+    else:
+        return _SCALAR_SIZE
+    if cell_limit and size > cell_limit:
+        size = cell_limit + _MARKER_SIZE
+    return size + 2
+
+
+def _truncate_text(value: str, limit: int) -> str | None:
+    """Cut a string to a size in UTF-8 bytes and mark the truncation.
+
+    Args:
+        value: String to cap.
+        limit: Maximum UTF-8 bytes to keep.
+
+    Returns:
+        str | None: The longest prefix of whole characters that fits in
+            ``limit`` bytes followed by a marker, or None if the string fits.
+
+    Example:
+        >>> _truncate_text("abcdefgh", 3)
+        'abc...[truncated 5 characters]'
+        >>> _truncate_text("\u6570\u636e\u5e93", 7)  # 3 bytes per character
+        '\u6570\u636e...[truncated 1 characters]'
+    """
+    # UTF-8 takes at most 4 bytes per character
+    if len(value) * 4 <= limit:
+        return None
+    if value.isascii():
+        if len(value) <= limit:
+            return None
+        kept = value[:limit]
+    else:
+        data = value.encode()
+        if len(data) <= limit:
+            return None
+        # Drops a character cut in the middle
+        kept = data[:limit].decode(errors="ignore")
+    return f"{kept}...[truncated {len(value) - len(kept)} characters]"
+
+
+def _serialize_value(value: Any) -> Any:
+    """Recursively serialize a single value.
+
+    Used for values whose structure varies from row to row (arrays, JSON
+    decoded to Python objects) and for elements nested in them.
+
+    Args:
+        value: Value to serialize.
+
+    Returns:
+        Serialized value that is JSON-compatible.
+    """
+    # Handle None
+    if value is None:
+        return None
+
+    # Handle datetime types
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+
+    # Handle timedelta
+    if isinstance(value, datetime.timedelta):
+        return str(value)
+
+    # Handle Decimal (convert to float)
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+
+    # Handle UUID
+    if isinstance(value, uuid.UUID):
+        return str(value)
+
+    # Handle bytes (convert to hex string)
+    if isinstance(value, bytes):
+        return value.hex()
 
-            # Handle timedelta
-            if isinstance(value, datetime.timedelta):
-                return str(value)
+    # Handle lists and tuples (recursively serialize)
+    if isinstance(value, (list, tuple)):
+        return [_serialize_value(v) for v in value]
 
-            # Handle Decimal (convert to float)
-            if isinstance(value, decimal.Decimal):
-                return float(value)
+    # Handle dicts (recursively serialize values)
+    if isinstance(value, dict):
+        return {k: _serialize_value(v) for k, v in value.items()}
 
-            # Handle UUID
-            if isinstance(value, uuid.UUID):
-                return str(value)
+    # Return other types as-is (str, int, float, bool, etc.)
+    return value
 
-            # Handle bytes (convert to hex string)
-            if isinstance(value, bytes):
-                return value.hex()
 
-            # Handle lists and tuples (recursively serialize)
-            if isinstance(value, (list, tuple)):
-                return [serialize_value(v) for v in value]
+# Converters by value type, applied to every non-null value of a column.
+# Method calls stay dynamic so that subclasses (e.g. asyncpg's UUID) behave
+# as with _serialize_value; None marks types returned as-is.
+_CONVERTERS: dict[type, Callable[[Any], Any] | None] = {
+    str: None,
+    int: None,
+    float: None,
+    datetime.datetime: operator.methodcaller("isoformat"),
+    datetime.date: operator.methodcaller("isoformat"),
+    datetime.time: operator.methodcaller("isoformat"),
+    datetime.timedelta: str,
+    decimal.Decimal: float,
+    uuid.UUID: str,
+    bytes: operator.methodcaller("hex"),
+    list: _serialize_value,
+    tuple: _serialize_value,
+    dict: _serialize_value,
+}
 
-            # Handle dicts (recursively serialize values)
-            if isinstance(value, dict):
-                return {k: serialize_value(v) for k, v in value.items()}
 
-            # Return other types as-is (str, int, float, bool, etc.)
-            return value
+def _column_converter(sample: Any) -> Callable[[Any], Any] | None:
+    """Get the converter for a column from one of its non-null values.
 
-        # Serialize all values in all rows
-        return [{key: serialize_value(value) for key, value in row.items()} for row in results]
+    Args:
+        sample: A non-null value of the column.
+
+    Returns:
+        Converter for the column's values, or None if they are returned as-is.
+    """
+    if isinstance(sample, (list, tuple)):
+        return _array_converter(sample)
+    return _converter_for(type(sample))
+
+
+def _array_converter(sample: list[Any] | tuple[Any, ...]) -> Callable[[Any], Any]:
+    """Get the converter for an array column from one of its values.
+
+    PostgreSQL arrays have a single element type, so elements of that type
+    are converted directly; anything else (NULLs, the sub-arrays of
+    multidimensional values) is serialized recursively.
+
+    Args:
+        sample: A non-null value of the column.
+
+    Returns:
+        Converter producing a list of serialized elements.
+    """
+    element = next((v for v in sample if v is not None), None)
+    if element is None or isinstance(element, (list, tuple, dict)):
+        return _serialize_value
+
+    element_type = type(element)
+    convert = _converter_for(element_type)
+    if convert is None:
+
+        def convert_array(value: Any) -> list[Any]:
+            return [v if type(v) is element_type else _serialize_value(v) for v in value]
+
+    else:
+
+        def convert_array(value: Any) -> list[Any]:
+            return [convert(v) if type(v) is element_type else _serialize_value(v) for v in value]
+
+    return convert_array
+
+
+def _converter_for(value_type: type) -> Callable[[Any], Any] | None:
+    """Get the converter for values of a type.
+
+    Args:
+        value_type: Type of a column's values.
+
+    Returns:
+        Converter for the type or its nearest registered base class, or None
+        if values of the type are returned as-is.
+    """
+    for base in value_type.__mro__:
+        if base in _CONVERTERS:
+            return _CONVERTERS[base]
+    return None
@@ -9,8 +9,9 @@ from typing import TYPE_CHECKING
 
 from openai import AsyncOpenAI
 
-from pg_mcp.config.settings import OpenAIConfig
+from pg_mcp.config.settings import OpenAIConfig, PromptConfig
 from pg_mcp.models.errors import LLMError, LLMTimeoutError, LLMUnavailableError
+from pg_mcp.prompts.schema_context import SchemaContextRenderer
 from pg_mcp.prompts.sql_generation import SQL_GENERATION_SYSTEM_PROMPT, build_user_prompt
 
 if TYPE_CHECKING:
@@ -35,13 +36,17 @@ class SQLGenerator:
         ... )
     """
 
-    def __init__(self, config: OpenAIConfig) -> None:
+    def __init__(self, config: OpenAIConfig, prompt_config: PromptConfig | None = None) -> None:
         """Initialize SQL generator with OpenAI configuration.
 
         Args:
             config: OpenAI configuration including API key and model settings.
+            prompt_config: Prompt configuration selecting the schema format and
+                token budget. Defaults to the verbose schema format.
         """
         self.config = config
+        self.prompt_config = prompt_config or PromptConfig()
+        self.context_renderer = SchemaContextRenderer(self.prompt_config)
         self.client = AsyncOpenAI(api_key=config.api_key.get_secret_value(), timeout=config.timeout)
 
     async def generate(
@@ -93,6 +98,7 @@ class SQLGenerator:
             context=context,
             previous_attempt=previous_attempt,
             error_feedback=error_feedback,
+            schema_context=self.context_renderer.render(schema),
         )
 
         try:
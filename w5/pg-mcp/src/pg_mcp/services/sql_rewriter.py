@@ -0,0 +1,144 @@
+"""SQL rewriting of validated queries before execution.
+
+This module provides the SQLRewriter class, which pushes the row limit down
+into generated queries. Without it PostgreSQL computes, and the executor
+receives, the complete result of queries such as ``SELECT * FROM events``
+only for all but ``max_rows`` rows to be discarded. With an outer
+``LIMIT max_rows + 1`` the server stops producing rows early (and can pick a
+plan optimized for the first rows); the one extra row tells the executor
+that the result was truncated.
+
+Rewrites work on the query's SQLAnalysis and never modify its AST; a
+rewritten query gets a new analysis built from a copy.
+"""
+
+import logging
+
+from sqlglot import exp
+
+from pg_mcp.config.settings import SecurityConfig
+from pg_mcp.models.errors import SQLParseError
+from pg_mcp.services.sql_analysis import SQLAnalysis, analyze_sql
+
+logger = logging.getLogger(__name__)
+
+
+class SQLRewriter:
+    """Rewrites validated SQL so that PostgreSQL enforces the row limit.
+
+    The limit is applied to the top-level query only, which covers plain
+    SELECTs as well as set operations (UNION, INTERSECT, EXCEPT) and queries
+    with CTEs: the LIMIT is appended after the outermost ORDER BY and any
+    OFFSET is kept, so the rows that are returned are unchanged. An existing
+    literal LIMIT (or FETCH FIRST) is tightened if it is larger than the cap
+    and kept otherwise; ``LIMIT ALL`` is replaced. Limits given as parameters
+    or expressions, and FETCH FIRST with PERCENT or WITH TIES, are left
+    as written because they cannot be compared with the cap.
+
+    Example:
+        >>> rewriter = SQLRewriter(SecurityConfig(max_rows=100))
+        >>> rewriter.push_down_limit("SELECT * FROM users ORDER BY id")
+        'SELECT * FROM users ORDER BY id LIMIT 101'
+        >>> rewriter.push_down_limit("SELECT * FROM users LIMIT 10")
+        'SELECT * FROM users LIMIT 10'
+    """
+
+    def __init__(self, config: SecurityConfig) -> None:
+        """Initialize SQL rewriter.
+
+        Args:
+            config: Security configuration providing max_rows and whether
+                the limit is pushed down.
+        """
+        self.config = config
+
+    def push_down_limit(self, sql: str, max_rows: int | None = None) -> str:
+        """Add or tighten the outer LIMIT of a query to ``max_rows + 1``.
+
+        The query is expected to have passed validation. Statements that are
+        not queries (e.g. EXPLAIN) and SQL that cannot be parsed are returned
+        unchanged, as is any query whose limit already fits.
+
+        Args:
+            sql: Validated SQL query.
+            max_rows: Maximum rows returned to the client (defaults to
+                config.max_rows).
+
+        Returns:
+            str: SQL to execute; the input itself if no rewrite was needed.
+        """
+        if not self.config.limit_pushdown:
+            return sql
+
+        try:
+            analysis = analyze_sql(sql)
+        except SQLParseError as e:
+            logger.debug("Skipping LIMIT pushdown, SQL could not be parsed: %s", e)
+            return sql
+
+        rewritten = self.rewrite(analysis, max_rows)
+        return sql if rewritten is analysis else rewritten.sql
+
+    def rewrite(self, analysis: SQLAnalysis, max_rows: int | None = None) -> SQLAnalysis:
+        """Push the row limit down into an analyzed query.
+
+        Like push_down_limit, but without parsing: the rewrite is applied to
+        a copy of the analysis's AST.
+
+        Args:
+            analysis: Analysis of a validated SQL query.
+            max_rows: Maximum rows returned to the client (defaults to
+                config.max_rows).
+
+        Returns:
+            SQLAnalysis: Analysis of the SQL to execute; the input itself if
+                no rewrite was needed.
+        """
+        if not self.config.limit_pushdown:
+            return analysis
+
+        cap = (max_rows or self.config.max_rows) + 1
+        statement = analysis.statement
+        if not isinstance(statement, exp.Query):
+            return analysis
+
+        if not self._exceeds(statement, cap):
+            return analysis
+
+        return SQLAnalysis.from_statement(statement.limit(cap))
+
+    @staticmethod
+    def _exceeds(statement: exp.Query, cap: int) -> bool:
+        """Check whether a query's outer LIMIT allows more rows than a cap.
+
+        Args:
+            statement: Parsed query.
+            cap: Row cap.
+
+        Returns:
+            bool: True if the query is unlimited (no clause, or ``LIMIT ALL``)
+                or has a literal limit above the cap; False if the limit fits
+                or cannot be determined.
+        """
+        clause = statement.args.get("limit")
+        if clause is None:
+            return True
+
+        if isinstance(clause, exp.Fetch):
+            options = clause.args.get("limit_options")
+            if options is not None and (
+                options.args.get("percent") or options.args.get("with_ties")
+            ):
+                return False
+            value = clause.args.get("count")
+            if value is None:
+                # FETCH FIRST ROW ONLY
+                return False
+        else:
+            value = clause.expression
+
+        if isinstance(value, exp.Var) and value.name.upper() == "ALL":
+            return True
+        if isinstance(value, exp.Literal) and value.is_int:
+            return int(value.name) > cap
+        return False
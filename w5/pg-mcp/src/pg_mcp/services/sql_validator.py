@@ -3,15 +3,58 @@
 This module provides SQL validation and security checking using SQLGlot parser.
 It ensures that only safe, read-only queries are executed and blocks potentially
 dangerous operations.
+
+Verdicts are cached in a bounded LRU keyed by a fingerprint of the SQL text,
+so identical and whitespace-variant queries (e.g. on retries) are not parsed
+and checked again.
 """
 
-from typing import ClassVar
+import hashlib
+import re
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, ClassVar
 
-import sqlglot
 from sqlglot import exp
 
 from pg_mcp.config.settings import SecurityConfig
 from pg_mcp.models.errors import SecurityViolationError, SQLParseError
+from pg_mcp.observability.metrics import metrics
+from pg_mcp.services.sql_analysis import SQLAnalysis, analyze_sql
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Cached validation verdict: None for valid SQL, else the error's type,
+# message and details
+_Verdict = tuple[type[SecurityViolationError] | type[SQLParseError], str, dict[str, Any]] | None
+
+# Quoted strings and identifiers and line comments (kept as written, with the
+# newline ending a comment), or a run of whitespace (folded to one space)
+_FOLDABLE_WHITESPACE = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*"|--[^\n]*\n?)|\s+""")
+
+# Characters that start quoting the simple pattern above cannot delimit
+# (dollar quotes, backslash escapes, block comments)
+_UNFOLDABLE_MARKERS = ("$", "\\", "/*")
+
+
+def sql_fingerprint(sql: str) -> bytes:
+    """Fingerprint SQL text for the verdict cache.
+
+    Runs of whitespace outside quoted strings, quoted identifiers and
+    comments are folded to one space, so whitespace variants of a query
+    share a fingerprint. SQL with dollar quotes, backslash escapes or block
+    comments is only stripped, because folding could change its tokens.
+
+    Args:
+        sql: SQL text.
+
+    Returns:
+        bytes: 16-byte BLAKE2b digest of the folded text.
+    """
+    text = sql.strip()
+    if not any(marker in text for marker in _UNFOLDABLE_MARKERS):
+        text = _FOLDABLE_WHITESPACE.sub(lambda m: m.group(1) or " ", text)
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
 
 
 class SQLValidator:
@@ -30,6 +73,8 @@ class SQLValidator:
         exp.Select, exp.Union, exp.Intersect, exp.Except
     }
 
+    _ALLOWED_STATEMENT_TUPLE: ClassVar = tuple(ALLOWED_STATEMENT_TYPES)
+
     # Allowed top-level expressions (including CTEs)
     ALLOWED_TOP_LEVEL: ClassVar = {
         exp.Select, exp.Union, exp.Intersect, exp.Except, exp.With, exp.Subquery
@@ -51,6 +96,22 @@ class SQLValidator:
         exp.Merge,
     }
 
+    # Forbidden statement type name by node type, filled on first lookup
+    _FORBIDDEN_NAMES: ClassVar[dict[type, str | None]] = {}
+
+    # Node checks run by find_violations, in the order their violations are
+    # reported: (node base type, check method name)
+    _NODE_CHECKS: ClassVar = (
+        (exp.Func, "_visit_function"),
+        (exp.Table, "_visit_table"),
+        (exp.Column, "_visit_column"),
+        (exp.Subquery, "_visit_subquery"),
+    )
+
+    # Index into _NODE_CHECKS by node type (None: no check applies),
+    # precomputed for all sqlglot expression types below the class
+    _CHECK_INDEX: ClassVar[dict[type, int | None]] = {}
+
     # Built-in dangerous PostgreSQL functions
     BUILTIN_DANGEROUS_FUNCTIONS: ClassVar = {
         "pg_sleep",
@@ -99,11 +160,45 @@ class SQLValidator:
             f.lower() for f in config.blocked_functions
         }
 
-    def validate(self, sql: str) -> tuple[bool, str | None]:
+        # Verdicts by SQL fingerprint, least recently used first: None for
+        # valid SQL, else (error type, message, details)
+        self._cache_size = config.validation_cache_size
+        self._verdicts: OrderedDict[bytes, _Verdict] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+        self._configure()
+
+    def _configure(self) -> None:
+        """Set up checks and the verdict cache for the current configuration.
+
+        Called on construction and whenever blocked_functions,
+        blocked_tables, blocked_columns or allow_explain change, which
+        clears the cached verdicts.
+        """
+        # Bound node checks by _NODE_CHECKS index; table and column checks
+        # are skipped when nothing is blocked
+        enabled = {
+            "_visit_table": bool(self.blocked_tables),
+            "_visit_column": bool(self.blocked_columns),
+        }
+        self._checks: tuple[Callable[[Any], str | None] | None, ...] = tuple(
+            getattr(self, name) if enabled.get(name, True) else None
+            for _, name in self._NODE_CHECKS
+        )
+        self._cache_config = (
+            frozenset(self.blocked_functions),
+            frozenset(self.blocked_tables),
+            frozenset(self.blocked_columns),
+            self.allow_explain,
+        )
+        self._verdicts.clear()
+
+    def validate(self, sql: str | SQLAnalysis) -> tuple[bool, str | None]:
         """Validate SQL query for security compliance.
 
         Args:
-            sql: SQL query string to validate.
+            sql: SQL query string, or its analysis, to validate.
 
         Returns:
             Tuple of (is_valid, error_message). If valid, error_message is None.
@@ -114,25 +209,94 @@ class SQLValidator:
         except (SecurityViolationError, SQLParseError) as e:
             return (False, str(e))
 
-    def validate_or_raise(self, sql: str) -> None:
+    def validate_or_raise(self, sql: str | SQLAnalysis) -> None:
         """Validate SQL query and raise exception on violation.
 
+        The verdict is looked up in, or stored to, the verdict cache. A
+        cached rejection is raised again as a new exception with the same
+        type, message and details.
+
         Args:
-            sql: SQL query string to validate.
+            sql: SQL query string to validate, or its analysis (which avoids
+                parsing the query again).
 
         Raises:
-            SQLParseError: If SQL cannot be parsed.
+            SQLParseError: If SQL is empty or cannot be parsed.
             SecurityViolationError: If SQL violates security constraints.
         """
-        # Check for empty or whitespace-only SQL
-        if not sql or not sql.strip():
-            raise SQLParseError("SQL query cannot be empty")
-
-        # Parse SQL using SQLGlot
+        if (
+            self.blocked_functions,
+            self.blocked_tables,
+            self.blocked_columns,
+            self.allow_explain,
+        ) != self._cache_config:
+            self._configure()
+
+        if not self._cache_size:
+            self._validate(sql)
+            return
+
+        key = sql_fingerprint(sql.sql if isinstance(sql, SQLAnalysis) else sql)
         try:
-            parsed = sqlglot.parse(sql, read="postgres")
-        except Exception as e:
-            raise SQLParseError(f"Failed to parse SQL: {e}") from e
+            verdict = self._verdicts[key]
+        except KeyError:
+            pass
+        else:
+            self._verdicts.move_to_end(key)
+            self._hits += 1
+            metrics.increment_sql_validation_cache_request("hit")
+            if verdict is not None:
+                error_type, message, details = verdict
+                raise error_type(message, details=dict(details))
+            return
+
+        self._misses += 1
+        metrics.increment_sql_validation_cache_request("miss")
+        try:
+            self._validate(sql)
+        except (SecurityViolationError, SQLParseError) as e:
+            self._store(key, (type(e), e.message, dict(e.details)))
+            raise
+        self._store(key, None)
+
+    def _store(self, key: bytes, verdict: _Verdict) -> None:
+        """Cache a verdict, evicting the least recently used beyond the size.
+
+        Args:
+            key: SQL fingerprint.
+            verdict: None for valid SQL, else (error type, message, details).
+        """
+        self._verdicts[key] = verdict
+        while len(self._verdicts) > self._cache_size:
+            self._verdicts.popitem(last=False)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get verdict cache statistics.
+
+        Returns:
+            dict: Cached verdicts, cache size, hits, misses and hit rate.
+        """
+        lookups = self._hits + self._misses
+        return {
+            "cached_verdicts": len(self._verdicts),
+            "cache_size": self._cache_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+        }
+
+    def _validate(self, sql: str | SQLAnalysis) -> None:
+        """Validate SQL query without the verdict cache.
+
+        Args:
+            sql: SQL query string to validate, or its analysis.
+
+        Raises:
+            SQLParseError: If SQL is empty or cannot be parsed.
+            SecurityViolationError: If SQL violates security constraints.
+        """
+        analysis = sql if isinstance(sql, SQLAnalysis) else analyze_sql(sql)
+        parsed = analysis.statements
 
         # Check for multiple statements
         if len(parsed) > 1:
@@ -181,17 +345,36 @@ class SQLValidator:
         if error := self._check_statement_type(main_query):
             raise SecurityViolationError(error)
 
-        if error := self._check_dangerous_functions(statement):
-            raise SecurityViolationError(error)
+        if violations := self.find_violations(statement):
+            raise SecurityViolationError(violations[0], details={"violations": violations})
 
-        if error := self._check_blocked_tables(statement):
-            raise SecurityViolationError(error)
+    @classmethod
+    def _forbidden_name(cls, node_type: type) -> str | None:
+        """Get the name of the forbidden statement type a node type is.
 
-        if error := self._check_blocked_columns(statement):
-            raise SecurityViolationError(error)
+        The answer is computed once per node type and then looked up.
 
-        if error := self._check_subquery_safety(statement):
-            raise SecurityViolationError(error)
+        Args:
+            node_type: Type of a parsed expression.
+
+        Returns:
+            Upper-case name of the forbidden statement type (e.g. "DELETE"),
+            or None if the type is not forbidden.
+        """
+        try:
+            return cls._FORBIDDEN_NAMES[node_type]
+        except KeyError:
+            pass
+        name = next(
+            (
+                base.__name__.upper()
+                for base in node_type.__mro__
+                if base in cls.FORBIDDEN_STATEMENT_TYPES
+            ),
+            None,
+        )
+        cls._FORBIDDEN_NAMES[node_type] = name
+        return name
 
     def _check_statement_type(self, statement: exp.Expression) -> str | None:
         """Check if statement type is allowed.
@@ -203,119 +386,150 @@ class SQLValidator:
             Error message if check fails, None otherwise.
         """
         # Check for forbidden statement types
-        for forbidden_type in self.FORBIDDEN_STATEMENT_TYPES:
-            if isinstance(statement, forbidden_type):
-                stmt_name = forbidden_type.__name__.upper()
-                return f"{stmt_name} statements are not allowed. Only SELECT queries are permitted."
+        if stmt_name := self._forbidden_name(type(statement)):
+            return f"{stmt_name} statements are not allowed. Only SELECT queries are permitted."
 
         # Ensure statement is an allowed type (SELECT or set operations)
-        if not isinstance(statement, tuple(self.ALLOWED_STATEMENT_TYPES)):
+        if not isinstance(statement, self._ALLOWED_STATEMENT_TUPLE):
             stmt_type = type(statement).__name__
             return f"Statement type {stmt_type} is not allowed. Only SELECT queries are permitted."
 
         return None
 
-    def _check_dangerous_functions(self, statement: exp.Expression) -> str | None:
-        """Check for use of blocked/dangerous functions.
+    def find_violations(self, statement: exp.Expression) -> list[str]:
+        """Find all security violations in a statement in one walk over its AST.
+
+        Every node is dispatched by its type, through the precomputed
+        _CHECK_INDEX table, to the check for that kind of node (function
+        call, table, column or subquery). Nodes that no check applies to are
+        skipped after a single dict lookup.
 
         Args:
             statement: Parsed SQL statement.
 
         Returns:
-            Error message if check fails, None otherwise.
+            Error messages, ordered by check (blocked functions, blocked
+            tables, blocked columns, subquery safety) and within a check in
+            breadth-first order; empty if the statement is safe.
         """
-        # Find all function calls in the query
-        for func in statement.find_all(exp.Func):
-            func_name = func.name.lower() if func.name else ""
+        check_index = self._CHECK_INDEX
+        checks = self._checks
+        found: list[list[str]] = [[] for _ in checks]
+        for node in statement.walk():
+            node_type = type(node)
+            index = check_index.get(node_type, -1)
+            if index == -1:
+                index = self._resolve_check_index(node_type)
+            if index is None:
+                continue
+            check = checks[index]
+            if check is not None and (error := check(node)):
+                found[index].append(error)
+        return [error for errors in found for error in errors]
+
+    @classmethod
+    def _resolve_check_index(cls, node_type: type) -> int | None:
+        """Find the node check for a type and record it in _CHECK_INDEX.
 
-            if func_name in self.blocked_functions:
-                return f"Function '{func_name}' is blocked for security reasons"
+        Args:
+            node_type: Type of a parsed expression.
 
-        return None
+        Returns:
+            Index into _NODE_CHECKS, or None if no check applies to the type.
+        """
+        index = next(
+            (i for i, (base, _) in enumerate(cls._NODE_CHECKS) if issubclass(node_type, base)),
+            None,
+        )
+        cls._CHECK_INDEX[node_type] = index
+        return index
 
-    def _check_blocked_tables(self, statement: exp.Expression) -> str | None:
-        """Check for access to blocked tables.
+    def _visit_function(self, func: exp.Func) -> str | None:
+        """Check a function call against the blocked functions.
 
         Args:
-            statement: Parsed SQL statement.
+            func: Function call node.
 
         Returns:
-            Error message if check fails, None otherwise.
+            Error message if the function is blocked, None otherwise.
         """
-        if not self.blocked_tables:
-            return None
-
-        # Find all table references
-        for table in statement.find_all(exp.Table):
-            table_name = table.name.lower() if table.name else ""
+        func_name = func.name.lower() if func.name else ""
 
-            if table_name in self.blocked_tables:
-                return f"Access to table '{table_name}' is not allowed"
+        if func_name in self.blocked_functions:
+            return f"Function '{func_name}' is blocked for security reasons"
 
         return None
 
-    def _check_blocked_columns(self, statement: exp.Expression) -> str | None:
-        """Check for access to blocked columns.
+    def _visit_table(self, table: exp.Table) -> str | None:
+        """Check a table reference against the blocked tables.
 
         Args:
-            statement: Parsed SQL statement.
+            table: Table node.
 
         Returns:
-            Error message if check fails, None otherwise.
+            Error message if the table is blocked, None otherwise.
         """
-        if not self.blocked_columns:
-            return None
+        table_name = table.name.lower() if table.name else ""
+
+        if table_name in self.blocked_tables:
+            return f"Access to table '{table_name}' is not allowed"
+
+        return None
+
+    def _visit_column(self, column: exp.Column) -> str | None:
+        """Check a column reference against the blocked columns.
 
-        # Find all column references
-        for column in statement.find_all(exp.Column):
-            column_name = column.name.lower() if column.name else ""
+        Args:
+            column: Column node.
+
+        Returns:
+            Error message if the column is blocked, None otherwise.
+        """
+        column_name = column.name.lower() if column.name else ""
 
-            # Check for exact match
-            if column_name in self.blocked_columns:
-                return f"Access to column '{column_name}' is not allowed"
+        # Check for exact match
+        if column_name in self.blocked_columns:
+            return f"Access to column '{column_name}' is not allowed"
 
-            # Check for qualified column names (table.column)
-            if column.table:
-                qualified_name = f"{column.table.lower()}.{column_name}"
-                if qualified_name in self.blocked_columns:
-                    return f"Access to column '{qualified_name}' is not allowed"
+        # Check for qualified column names (table.column)
+        if column.table:
+            qualified_name = f"{column.table.lower()}.{column_name}"
+            if qualified_name in self.blocked_columns:
+                return f"Access to column '{qualified_name}' is not allowed"
 
         return None
 
-    def _check_subquery_safety(self, statement: exp.Expression) -> str | None:
-        """Check that all subqueries only contain SELECT statements.
+    def _visit_subquery(self, subquery: exp.Subquery) -> str | None:
+        """Check that a subquery only contains a SELECT statement.
 
         Args:
-            statement: Parsed SQL statement.
+            subquery: Subquery node.
 
         Returns:
             Error message if check fails, None otherwise.
         """
-        # Find all subqueries
-        for subquery in statement.find_all(exp.Subquery):
-            if subquery.this:
-                inner_stmt = subquery.this
+        inner_stmt = subquery.this
+        if not inner_stmt:
+            return None
 
-                # Check if the inner statement is a forbidden type
-                for forbidden_type in self.FORBIDDEN_STATEMENT_TYPES:
-                    if isinstance(inner_stmt, forbidden_type):
-                        stmt_name = forbidden_type.__name__.upper()
-                        return f"{stmt_name} statements in subqueries are not allowed"
+        # Check if the inner statement is a forbidden type
+        if stmt_name := self._forbidden_name(type(inner_stmt)):
+            return f"{stmt_name} statements in subqueries are not allowed"
 
-                # Ensure it's a SELECT
-                if not isinstance(inner_stmt, (exp.Select, exp.With)):
-                    return "Subqueries must contain only SELECT statements"
+        # Ensure it's a SELECT
+        if not isinstance(inner_stmt, (exp.Select, exp.With)):
+            return "Subqueries must contain only SELECT statements"
 
         return None
 
-    def normalize_sql(self, sql: str) -> str:
+    def normalize_sql(self, sql: str | SQLAnalysis) -> str:
         """Normalize SQL query to a canonical form.
 
-        This removes extra whitespace, standardizes formatting, and makes
-        queries easier to compare or cache.
+        This removes extra whitespace and comments, standardizes formatting,
+        and makes queries easier to compare or cache.
 
         Args:
-            sql: SQL query string to normalize.
+            sql: SQL query string to normalize, or its analysis.
 
         Returns:
             Normalized SQL string.
@@ -323,18 +537,14 @@ class SQLValidator:
         Raises:
             SQLParseError: If SQL cannot be parsed.
         """
-        try:
-            parsed = sqlglot.parse_one(sql, read="postgres")
-            # Generate normalized SQL
-            return parsed.sql(dialect="postgres", pretty=False)
-        except Exception as e:
-            raise SQLParseError(f"Failed to normalize SQL: {e}") from e
+        analysis = sql if isinstance(sql, SQLAnalysis) else analyze_sql(sql)
+        return analysis.normalized
 
-    def extract_tables(self, sql: str) -> list[str]:
+    def extract_tables(self, sql: str | SQLAnalysis) -> list[str]:
         """Extract all table names referenced in the SQL query.
 
         Args:
-            sql: SQL query string.
+            sql: SQL query string, or its analysis.
 
         Returns:
             List of table names (in lowercase).
@@ -342,14 +552,24 @@ class SQLValidator:
         Raises:
             SQLParseError: If SQL cannot be parsed.
         """
-        try:
-            parsed = sqlglot.parse_one(sql, read="postgres")
-            tables = []
+        analysis = sql if isinstance(sql, SQLAnalysis) else analyze_sql(sql)
+        return analysis.tables
+
+
+def _expression_types(base: type[exp.Expression]) -> list[type[exp.Expression]]:
+    """List an expression type and all of its subclasses.
+
+    Args:
+        base: sqlglot expression type.
+
+    Returns:
+        list: The type and its direct and indirect subclasses.
+    """
+    types = [base]
+    for subclass in base.__subclasses__():
+        types.extend(_expression_types(subclass))
+    return types
 
-            for table in parsed.find_all(exp.Table):
-                if table.name:
-                    tables.append(table.name.lower())
 
-            return sorted(set(tables))
-        except Exception as e:
-            raise SQLParseError(f"Failed to extract tables: {e}") from e
+for _node_type in _expression_types(exp.Expression):
+    SQLValidator._resolve_check_index(_node_type)
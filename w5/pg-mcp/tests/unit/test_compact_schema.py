@@ -0,0 +1,144 @@
+"""Unit tests for the compact schema representation.
+
+This module tests conversion between DatabaseSchema and CompactSchema, string
+pooling, partial materialization and lookups on the compact form.
+"""
+
+import gc
+
+import pytest
+
+from pg_mcp.cache.compact import CompactSchema, StringPool, as_database_schema
+from pg_mcp.cache.schema_cache import estimate_schema_bytes
+from pg_mcp.models.schema import (
+    ColumnInfo,
+    DatabaseSchema,
+    EnumTypeInfo,
+    ForeignKeyInfo,
+    IndexInfo,
+    TableInfo,
+)
+
+
+def make_table(index: int) -> TableInfo:
+    """Create a table with typical columns, a foreign key and an index."""
+    return TableInfo(
+        schema_name="public" if index % 2 else "sales",
+        table_name=f"table_{index}",
+        columns=[
+            ColumnInfo(name="id", data_type="integer", is_nullable=False, is_primary_key=True),
+            ColumnInfo(
+                name="email",
+                data_type="character varying(255)",
+                is_nullable=False,
+                is_unique=True,
+                comment="Contact address",
+            ),
+            ColumnInfo(
+                name="created_at",
+                data_type="timestamp with time zone",
+                is_nullable=True,
+                default_value="now()",
+            ),
+            ColumnInfo(name="parent_id", data_type="integer", is_nullable=True),
+        ],
+        foreign_keys=[
+            ForeignKeyInfo(
+                constraint_name=f"table_{index}_parent_fkey",
+                column_name="parent_id",
+                referenced_table=f"table_{max(index - 1, 0)}",
+                referenced_column="id",
+            )
+        ],
+        indexes=[IndexInfo(name=f"table_{index}_email_key", columns=["email"], is_unique=True)],
+        comment=f"Table number {index}" if index % 3 else None,
+        row_count_estimate=index * 100,
+    )
+
+
+@pytest.fixture
+def schema() -> DatabaseSchema:
+    """Create a schema with 30 tables and an enum type."""
+    return DatabaseSchema(
+        database_name="shop",
+        version="16.1",
+        revision=2,
+        tables=[make_table(i) for i in range(30)],
+        enum_types=[EnumTypeInfo(type_name="status", values=["new", "paid"])],
+    )
+
+
+def fresh_copy(schema: DatabaseSchema) -> DatabaseSchema:
+    """Rebuild a schema from its dump, so that no models are shared."""
+    return DatabaseSchema.model_validate(schema.model_dump())
+
+
+class TestStringPool:
+    """Test suite for StringPool."""
+
+    def test_equal_strings_share_one_object(self) -> None:
+        """Test that pooled equal strings are the same object."""
+        pool = StringPool()
+        first = pool("".join(["inte", "ger"]))
+
+        assert pool("".join(["int", "eger"])) is first
+        assert pool.optional(None) is None
+
+
+class TestCompactSchema:
+    """Test suite for CompactSchema."""
+
+    def test_round_trip_is_lossless(self, schema: DatabaseSchema) -> None:
+        """Test that materializing a compact copy reproduces the schema."""
+        compact = CompactSchema(fresh_copy(schema))
+        gc.collect()  # The source models are gone; materialization rebuilds them
+
+        restored = compact.to_schema()
+
+        assert restored == schema
+        assert restored.revision == 2
+        assert compact.column_count == 120
+
+    def test_full_materialization_is_shared(self, schema: DatabaseSchema) -> None:
+        """Test that the source or a live materialization is reused."""
+        compact = CompactSchema(schema)
+
+        assert compact.to_schema() is schema
+        assert compact.get_table("table_1") is schema.tables[1]
+
+    def test_partial_materialization(self, schema: DatabaseSchema) -> None:
+        """Test that a subset of tables is materialized in the given order."""
+        compact = CompactSchema(fresh_copy(schema))
+        gc.collect()
+
+        subset = compact.to_schema([5, 2])
+
+        assert [t.table_name for t in subset.tables] == ["table_5", "table_2"]
+        assert subset.tables[0] == schema.tables[5]
+        assert subset.database_name == "shop"
+        assert subset.enum_types == schema.enum_types
+
+    def test_lookups(self, schema: DatabaseSchema) -> None:
+        """Test table lookup and foreign key resolution."""
+        compact = CompactSchema(schema)
+
+        assert compact.get_table("table_2", "sales") is schema.tables[2]
+        assert compact.get_table("table_2") is None
+        # Same-schema table wins, otherwise any schema
+        assert compact.resolve("table_3", "public") == [compact.tables[3]]
+        assert compact.resolve("table_3", "sales") == [compact.tables[3]]
+        assert compact.resolve("missing", "public") == []
+
+    def test_strings_are_pooled_and_memory_is_smaller(self, schema: DatabaseSchema) -> None:
+        """Test that repeated names share storage and the compact form is smaller."""
+        source = fresh_copy(schema)
+        compact = CompactSchema(source)
+
+        assert compact.tables[0].column_types[0] is compact.tables[1].column_types[0]
+        assert compact.tables[0].column_names[2] is compact.tables[7].column_names[2]
+        assert estimate_schema_bytes(compact) * 2 < estimate_schema_bytes(source)
+
+    def test_as_database_schema(self, schema: DatabaseSchema) -> None:
+        """Test conversion of either representation to pydantic models."""
+        assert as_database_schema(schema) is schema
+        assert as_database_schema(CompactSchema(schema)) is schema
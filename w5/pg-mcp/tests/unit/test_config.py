@@ -162,6 +162,7 @@ class TestSecurityConfig:
         assert config.max_execution_time == 30.0
         assert "pg_sleep" in config.blocked_functions
         assert "pg_read_file" in config.blocked_functions
+        assert config.validation_cache_size == 1024
 
     def test_custom_blocked_functions(self) -> None:
         """Test custom blocked functions."""
@@ -367,6 +368,37 @@ class TestSettings:
         assert settings.database.port == 5433
         assert settings.security.allow_write_operations is True
 
+    def test_database_configs_default_to_single_database(self) -> None:
+        """Test that without a databases list the single database is served."""
+        settings = Settings(
+            openai=OpenAIConfig(api_key="sk-test"),
+            database=DatabaseConfig(name="main"),
+        )
+        assert [config.name for config in settings.database_configs] == ["main"]
+
+    def test_multiple_databases(self) -> None:
+        """Test that a databases list replaces the single database."""
+        settings = Settings(
+            openai=OpenAIConfig(api_key="sk-test"),
+            databases=[
+                DatabaseConfig(name="sales", host="sales.db"),
+                DatabaseConfig(name="hr", host="hr.db"),
+            ],
+        )
+        assert [config.name for config in settings.database_configs] == ["sales", "hr"]
+        assert settings.database_configs[1].host == "hr.db"
+
+    def test_duplicate_database_names_rejected(self) -> None:
+        """Test that two databases cannot share a name."""
+        with pytest.raises(ValidationError, match="Duplicate database names: sales"):
+            Settings(
+                openai=OpenAIConfig(api_key="sk-test"),
+                databases=[
+                    DatabaseConfig(name="sales", host="a.db"),
+                    DatabaseConfig(name="sales", host="b.db"),
+                ],
+            )
+
 
 class TestSettingsGlobalInstance:
     """Tests for global settings instance management."""
@@ -0,0 +1,176 @@
+"""Unit tests for CostGuard.
+
+This module tests checking planner estimates against the cost limits and
+caching the estimates by normalized SQL.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pg_mcp.config.settings import CostGuardConfig, DatabaseConfig
+from pg_mcp.models.errors import QueryTooExpensiveError
+from pg_mcp.services.cost_guard import CostGuard, normalize_sql
+
+
+def create_executor(
+    total_cost: float = 100.0, plan_rows: int = 10, name: str = "testdb"
+) -> MagicMock:
+    """Create an executor mock whose queries have the given estimates."""
+    executor = MagicMock()
+    executor.db_config = DatabaseConfig(name=name)
+    executor.explain = AsyncMock(
+        return_value={"Node Type": "Seq Scan", "Total Cost": total_cost, "Plan Rows": plan_rows}
+    )
+    return executor
+
+
+class TestCostGuard:
+    """Test suite for CostGuard."""
+
+    @pytest.mark.asyncio
+    async def test_cheap_query_passes(self) -> None:
+        """Test that a query within the limits passes with its estimates."""
+        guard = CostGuard(CostGuardConfig(enabled=True))
+
+        estimate = await guard.check(create_executor(), "SELECT * FROM users")
+
+        assert estimate.total_cost == 100.0
+        assert estimate.plan_rows == 10
+
+    @pytest.mark.asyncio
+    async def test_expensive_query_rejected(self) -> None:
+        """Test that a query over the cost limit is rejected with its estimates."""
+        guard = CostGuard(CostGuardConfig(enabled=True, max_total_cost=1000))
+        executor = create_executor(total_cost=150012500.0, plan_rows=100)
+
+        with pytest.raises(QueryTooExpensiveError) as exc_info:
+            await guard.check(executor, "SELECT * FROM a CROSS JOIN b")
+
+        assert "estimated cost 150012500 exceeds 1000" in exc_info.value.message
+        assert exc_info.value.details["total_cost"] == 150012500.0
+        assert exc_info.value.details["max_total_cost"] == 1000
+        assert "max_plan_rows" not in exc_info.value.details
+        assert guard.get_stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_row_estimate_rejected(self) -> None:
+        """Test that a query returning too many rows is rejected."""
+        guard = CostGuard(CostGuardConfig(enabled=True, max_plan_rows=1000))
+
+        with pytest.raises(QueryTooExpensiveError, match="estimated 5000 rows exceed 1000"):
+            await guard.check(create_executor(plan_rows=5000), "SELECT * FROM events")
+
+    @pytest.mark.asyncio
+    async def test_row_estimate_checked_before_pushed_down_limit(self) -> None:
+        """Test that the rows of a query are checked below the LIMIT pushed down into it."""
+        guard = CostGuard(CostGuardConfig(enabled=True, max_plan_rows=1000))
+        executor = create_executor()
+        executor.explain.return_value = {
+            "Node Type": "Limit",
+            "Total Cost": 4.2,
+            "Plan Rows": 101,
+            "Plans": [{"Node Type": "Seq Scan", "Total Cost": 41000.0, "Plan Rows": 2_000_000}],
+        }
+
+        estimate = await guard.check(executor, "SELECT * FROM events LIMIT 101")
+        assert estimate.unlimited_rows == 2_000_000
+
+        with pytest.raises(QueryTooExpensiveError, match="estimated 2000000 rows exceed 1000"):
+            await guard.check(executor, "SELECT * FROM events LIMIT 101", limit_pushed_down=True)
+
+    @pytest.mark.asyncio
+    async def test_limits_can_be_disabled(self) -> None:
+        """Test that limits of 0 are not enforced."""
+        guard = CostGuard(CostGuardConfig(enabled=True, max_total_cost=0, max_plan_rows=0))
+
+        await guard.check(create_executor(total_cost=1e12, plan_rows=10**12), "SELECT 1")
+
+    @pytest.mark.asyncio
+    async def test_estimates_are_cached_by_normalized_sql(self) -> None:
+        """Test that the same query, written differently, is planned once."""
+        guard = CostGuard(CostGuardConfig(enabled=True))
+        executor = create_executor()
+
+        await guard.check(executor, "SELECT id FROM users WHERE active")
+        await guard.check(executor, "select id\n  from users -- active only\n where active;")
+
+        executor.explain.assert_awaited_once()
+        assert guard.get_stats()["hits"] == 1
+        assert guard.get_stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_is_per_database(self) -> None:
+        """Test that the same SQL is planned on each database."""
+        guard = CostGuard(CostGuardConfig(enabled=True))
+        sales = create_executor(name="sales")
+        hr = create_executor(name="hr")
+
+        await guard.check(sales, "SELECT * FROM users")
+        await guard.check(hr, "SELECT * FROM users")
+
+        sales.explain.assert_awaited_once()
+        hr.explain.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rejection_is_cached(self) -> None:
+        """Test that a repeated expensive query is rejected without planning."""
+        guard = CostGuard(CostGuardConfig(enabled=True, max_total_cost=1000))
+        executor = create_executor(total_cost=1e9)
+
+        for _ in range(2):
+            with pytest.raises(QueryTooExpensiveError):
+                await guard.check(executor, "SELECT * FROM a CROSS JOIN b")
+
+        executor.explain.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_estimates_expire(self) -> None:
+        """Test that estimates are planned again after cache_ttl seconds."""
+        guard = CostGuard(CostGuardConfig(enabled=True, cache_ttl=60))
+        executor = create_executor()
+
+        with patch("pg_mcp.services.cost_guard.time.monotonic", return_value=1000.0):
+            await guard.check(executor, "SELECT 1")
+        with patch("pg_mcp.services.cost_guard.time.monotonic", return_value=1059.0):
+            await guard.check(executor, "SELECT 1")
+        with patch("pg_mcp.services.cost_guard.time.monotonic", return_value=1061.0):
+            await guard.check(executor, "SELECT 1")
+
+        assert executor.explain.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_size_is_bounded(self) -> None:
+        """Test that the least recently used estimate is evicted."""
+        guard = CostGuard(CostGuardConfig(enabled=True, cache_size=2))
+        executor = create_executor()
+
+        await guard.check(executor, "SELECT 1")
+        await guard.check(executor, "SELECT 2")
+        await guard.check(executor, "SELECT 1")  # Now the most recent
+        await guard.check(executor, "SELECT 3")
+        await guard.check(executor, "SELECT 1")
+        await guard.check(executor, "SELECT 2")
+
+        assert guard.get_stats()["cached_plans"] == 2
+        assert executor.explain.await_count == 4
+
+
+class TestNormalizeSQL:
+    """Test suite for normalize_sql."""
+
+    def test_formatting_does_not_change_key(self) -> None:
+        """Test that case, whitespace and comments are normalized away."""
+        assert normalize_sql("SELECT a FROM t WHERE b = 1") == normalize_sql(
+            "select a\nfrom t /* filter */ where b = 1;"
+        )
+
+    def test_literals_change_key(self) -> None:
+        """Test that queries differing in literals get different keys."""
+        assert normalize_sql("SELECT a FROM t WHERE b = 1") != normalize_sql(
+            "SELECT a FROM t WHERE b = 2"
+        )
+
+    def test_unparsable_sql_falls_back_to_whitespace(self) -> None:
+        """Test that SQL the parser rejects still gets a stable key."""
+        assert normalize_sql("SELECT (  FROM") == normalize_sql("SELECT (\n FROM;")
@@ -0,0 +1,142 @@
+"""Unit tests for DatabaseWarmup.
+
+This module tests starting databases in the background: per-database
+readiness, waiting with a timeout, retrying failed start-ups and the status
+report.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pg_mcp.config.settings import DatabaseConfig, StartupConfig
+from pg_mcp.models.errors import DatabaseConnectionError, DatabaseError, DatabaseNotReadyError
+from pg_mcp.services.database_warmup import DatabaseWarmup, WarmupState
+
+
+def create_schema_cache(table_count: int = 3) -> MagicMock:
+    """Create a schema cache mock without snapshots whose loads succeed."""
+    schema = MagicMock()
+    schema.tables = [MagicMock() for _ in range(table_count)]
+    cache = MagicMock()
+    cache.warm_start = AsyncMock(return_value=None)
+    cache.load = AsyncMock(return_value=schema)
+    return cache
+
+
+class TestDatabaseWarmup:
+    """Test suite for DatabaseWarmup."""
+
+    @pytest.mark.asyncio
+    async def test_databases_start_independently(self) -> None:
+        """Test that a database is ready while another is still connecting."""
+        slow_connect = asyncio.Event()
+
+        async def create_pool(config: DatabaseConfig, security_config: None) -> MagicMock:
+            if config.name == "slow":
+                await slow_connect.wait()
+            return MagicMock()
+
+        on_pool = MagicMock()
+        warmup = DatabaseWarmup(
+            [DatabaseConfig(name="fast"), DatabaseConfig(name="slow")],
+            create_schema_cache(),
+            StartupConfig(ready_timeout=0),
+            on_pool=on_pool,
+        )
+        with patch("pg_mcp.services.database_warmup.create_pool", side_effect=create_pool):
+            warmup.start()
+            await asyncio.sleep(0.01)
+
+            await warmup.wait_ready("fast")
+            with pytest.raises(DatabaseNotReadyError) as exc_info:
+                await warmup.wait_ready("slow")
+
+            assert exc_info.value.details == {"database": "slow", "state": "connecting"}
+            assert list(warmup.pools) == ["fast"]
+            on_pool.assert_called_once()
+            status = warmup.get_status()
+            assert status["ready"] is False
+            assert status["databases"]["fast"]["state"] == "ready"
+            assert status["databases"]["fast"]["tables"] == 3
+            assert status["databases"]["slow"]["state"] == "connecting"
+
+            slow_connect.set()
+            await warmup.wait_all()
+
+        assert warmup.get_status()["ready"] is True
+        assert warmup.is_ready("slow")
+
+    @pytest.mark.asyncio
+    async def test_request_waits_for_its_database(self) -> None:
+        """Test that wait_ready starts a pending database and waits for it."""
+        warmup = DatabaseWarmup(
+            [DatabaseConfig(name="db")], create_schema_cache(), StartupConfig(ready_timeout=5)
+        )
+        with patch("pg_mcp.services.database_warmup.create_pool", AsyncMock()):
+            await warmup.wait_ready("db")
+
+        assert warmup.is_ready("db")
+        assert "db" in warmup.pools
+
+    @pytest.mark.asyncio
+    async def test_failed_start_is_retried(self) -> None:
+        """Test that a failed database is reported and started again on request."""
+        schema_cache = create_schema_cache()
+        schema_cache.load.side_effect = [ConnectionResetError("connection reset"), MagicMock()]
+        warmup = DatabaseWarmup(
+            [DatabaseConfig(name="db")], schema_cache, StartupConfig(ready_timeout=5)
+        )
+        create_pool = AsyncMock()
+        with patch("pg_mcp.services.database_warmup.create_pool", create_pool):
+            with pytest.raises(DatabaseConnectionError, match="connection reset"):
+                await warmup.wait_ready("db")
+            assert warmup.get_status()["databases"]["db"]["state"] == WarmupState.FAILED
+
+            await warmup.wait_ready("db")
+
+        status = warmup.get_status()["databases"]["db"]
+        assert status["state"] == "ready"
+        assert status["attempts"] == 2
+        assert status["error"] is None
+        # The pool of the first attempt is reused
+        create_pool.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_wait_all_raises_first_failure(self) -> None:
+        """Test that eager startup fails with the error of a failed database."""
+        warmup = DatabaseWarmup([DatabaseConfig(name="db")], create_schema_cache(), StartupConfig())
+        with (
+            patch(
+                "pg_mcp.services.database_warmup.create_pool",
+                AsyncMock(side_effect=ConnectionRefusedError("connection refused")),
+            ),
+            pytest.raises(ConnectionRefusedError),
+        ):
+            await warmup.wait_all()
+
+    @pytest.mark.asyncio
+    async def test_unknown_database(self) -> None:
+        """Test that waiting for an unconfigured database fails."""
+        warmup = DatabaseWarmup([DatabaseConfig(name="db")], create_schema_cache(), StartupConfig())
+
+        with pytest.raises(DatabaseError, match="not found"):
+            await warmup.wait_ready("other")
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_start_ups(self) -> None:
+        """Test that closing stops databases that are still connecting."""
+
+        async def create_pool(config: DatabaseConfig, security_config: None) -> MagicMock:
+            await asyncio.Event().wait()
+            return MagicMock()
+
+        warmup = DatabaseWarmup([DatabaseConfig(name="db")], create_schema_cache(), StartupConfig())
+        with patch("pg_mcp.services.database_warmup.create_pool", side_effect=create_pool):
+            warmup.start()
+            await asyncio.sleep(0)
+            await warmup.close()
+
+        assert warmup.pools == {}
+        assert not warmup.is_ready("db")
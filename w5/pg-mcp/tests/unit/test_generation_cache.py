@@ -0,0 +1,138 @@
+"""Unit tests for GenerationCache.
+
+This module tests caching generated SQL by database and normalized question,
+its TTL and LRU eviction, invalidation on schema changes and matching
+similar questions.
+"""
+
+from unittest.mock import patch
+
+from pg_mcp.config.settings import GenerationCacheConfig
+from pg_mcp.models.schema import ColumnInfo, DatabaseSchema, TableInfo
+from pg_mcp.services.generation_cache import GenerationCache, normalize_question
+
+
+class TestNormalizeQuestion:
+    """Test suite for normalize_question."""
+
+    def test_case_whitespace_and_punctuation_ignored(self) -> None:
+        """Test that formatting differences give the same key."""
+        assert normalize_question("How many  users\nsigned up?") == "how many users signed up"
+        assert normalize_question("how many users signed up") == "how many users signed up"
+        assert normalize_question("本月订单总数是多少\uff1f") == "本月订单总数是多少"
+
+    def test_wording_changes_key(self) -> None:
+        """Test that different questions get different keys."""
+        assert normalize_question("How many users?") != normalize_question("How many orders?")
+
+
+class TestGenerationCache:
+    """Test suite for GenerationCache."""
+
+    def test_hit_for_same_question_and_schema(self) -> None:
+        """Test that a repeated question returns the cached SQL."""
+        cache = GenerationCache(GenerationCacheConfig(enabled=True))
+        cache.put("mydb", "v1", "How many users?", "SELECT count(*) FROM users")
+
+        assert cache.get("mydb", "v1", "how many users") == "SELECT count(*) FROM users"
+        assert cache.get("otherdb", "v1", "How many users?") is None
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_schema_change_invalidates_entry(self) -> None:
+        """Test that SQL generated for another schema version is dropped."""
+        cache = GenerationCache(GenerationCacheConfig(enabled=True))
+        cache.put("mydb", "v1", "How many users?", "SELECT count(*) FROM users")
+
+        assert cache.get("mydb", "v2", "How many users?") is None
+        assert cache.get("mydb", "v1", "How many users?") is None
+        assert cache.get_stats()["invalidated"] == 1
+
+    def test_entries_expire(self) -> None:
+        """Test that cached SQL is not reused after ttl seconds."""
+        cache = GenerationCache(GenerationCacheConfig(enabled=True, ttl=60))
+
+        with patch("pg_mcp.services.generation_cache.time.monotonic", return_value=1000.0):
+            cache.put("mydb", "v1", "How many users?", "SELECT count(*) FROM users")
+        with patch("pg_mcp.services.generation_cache.time.monotonic", return_value=1059.0):
+            assert cache.get("mydb", "v1", "How many users?") is not None
+        with patch("pg_mcp.services.generation_cache.time.monotonic", return_value=1061.0):
+            assert cache.get("mydb", "v1", "How many users?") is None
+
+    def test_size_is_bounded(self) -> None:
+        """Test that the least recently used question is evicted."""
+        cache = GenerationCache(GenerationCacheConfig(enabled=True, max_size=2))
+        cache.put("mydb", "v1", "q1", "SELECT 1")
+        cache.put("mydb", "v1", "q2", "SELECT 2")
+        cache.get("mydb", "v1", "q1")  # Now the most recent
+        cache.put("mydb", "v1", "q3", "SELECT 3")
+
+        assert cache.get("mydb", "v1", "q2") is None
+        assert cache.get("mydb", "v1", "q1") == "SELECT 1"
+        assert cache.get("mydb", "v1", "q3") == "SELECT 3"
+        assert cache.get_stats()["cached_questions"] == 2
+
+    def test_discard_and_invalidate(self) -> None:
+        """Test dropping one question, one database or everything."""
+        cache = GenerationCache(GenerationCacheConfig(enabled=True))
+        cache.put("sales", "v1", "q1", "SELECT 1")
+        cache.put("sales", "v1", "q2", "SELECT 2")
+        cache.put("hr", "v1", "q1", "SELECT 1")
+
+        cache.discard("sales", "Q1?")
+        assert cache.get("sales", "v1", "q1") is None
+        assert cache.invalidate("sales") == 1
+        assert cache.get_stats()["cached_questions"] == 1
+        assert cache.invalidate() == 1
+        assert cache.get_stats()["cached_questions"] == 0
+
+
+class TestSimilarQuestions:
+    """Test suite for matching similar questions."""
+
+    SCHEMA = DatabaseSchema(
+        database_name="mydb",
+        tables=[
+            TableInfo(
+                schema_name="public",
+                table_name="users",
+                columns=[ColumnInfo(name="country", data_type="text", is_nullable=True)],
+            )
+        ],
+    )
+
+    def test_similar_question_reuses_sql(self) -> None:
+        """Test that a reworded question gets the SQL of the cached one."""
+        cache = GenerationCache(GenerationCacheConfig(enabled=True, match_similar=True))
+        cache.put("mydb", "v1", "How many users per country?", "SELECT country, count(*) ...")
+
+        assert cache.get("mydb", "v1", "number of users for each country") is None
+        match = cache.get_similar("mydb", "v1", "number of users for each country", self.SCHEMA)
+
+        assert match is not None
+        assert match.sql == "SELECT country, count(*) ..."
+        assert match.question == "how many users per country"
+        stats = cache.get_stats()
+        assert stats["similar_hits"] == 1
+        assert stats["hit_rate"] == 1.0
+
+    def test_disabled_by_default(self) -> None:
+        """Test that only exact matches are used unless match_similar is set."""
+        cache = GenerationCache(GenerationCacheConfig(enabled=True))
+        cache.put("mydb", "v1", "How many users per country?", "SELECT 1")
+
+        assert cache.get_similar("mydb", "v1", "number of users per country", self.SCHEMA) is None
+
+    def test_stale_and_removed_entries_are_not_matched(self) -> None:
+        """Test that entries for another schema or dropped ones are not matched."""
+        cache = GenerationCache(GenerationCacheConfig(enabled=True, match_similar=True))
+        cache.put("mydb", "v1", "How many users per country?", "SELECT 1")
+        cache.put("mydb", "v1", "list users per country", "SELECT 2")
+
+        assert cache.get_similar("mydb", "v2", "number of users per country", self.SCHEMA) is None
+        cache.discard("mydb", "list users per country")
+        assert cache.get_similar("mydb", "v1", "show users per country", self.SCHEMA) is None
+        assert cache.get_stats()["cached_questions"] == 0
@@ -0,0 +1,304 @@
+"""Unit tests for schema introspection.
+
+This module tests that SchemaIntrospector assembles a DatabaseSchema from
+set-based catalog queries, that the number of round trips is independent
+of the number of tables, and that incremental introspection re-reads only
+changed relations.
+"""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pg_mcp.cache.compact import CompactSchema
+from pg_mcp.db import introspection
+from pg_mcp.db.introspection import SchemaIntrospector
+
+
+class FakeCatalog:
+    """In-memory stand-in for the PostgreSQL catalogs used by introspection."""
+
+    def __init__(self, table_count: int) -> None:
+        """Build a catalog with ``table_count`` tables, each referencing the first.
+
+        Args:
+            table_count: Number of regular tables to generate.
+        """
+        self.relations = [
+            {
+                "oid": 1000 + i,
+                "relkind": "r",
+                "schema_name": "public",
+                "table_name": f"t{i:04d}",
+                "comment": None,
+                "row_estimate": i * 10,
+                "signature": "v1",
+            }
+            for i in range(table_count)
+        ]
+        self.columns = []
+        self.primary_keys = []
+        self.unique_columns = []
+        self.foreign_keys = []
+        self.indexes = []
+        for rel in self.relations:
+            oid = rel["oid"]
+            self.columns.append(
+                {
+                    "oid": oid,
+                    "column_name": "id",
+                    "data_type": "integer",
+                    "is_nullable": False,
+                    "default_value": None,
+                    "comment": None,
+                }
+            )
+            self.columns.append(
+                {
+                    "oid": oid,
+                    "column_name": "code",
+                    "data_type": "text",
+                    "is_nullable": True,
+                    "default_value": "'x'::text",
+                    "comment": "business key",
+                }
+            )
+            self.primary_keys.append({"oid": oid, "column_name": "id"})
+            self.unique_columns.append({"oid": oid, "column_name": "code"})
+            self.indexes.append(
+                {
+                    "oid": oid,
+                    "index_name": f"{rel['table_name']}_code_key",
+                    "is_unique": True,
+                    "index_type": "btree",
+                    "columns": ["code"],
+                }
+            )
+            if oid != 1000:
+                self.foreign_keys.append(
+                    {
+                        "oid": oid,
+                        "constraint_name": f"{rel['table_name']}_parent_fkey",
+                        "column_name": "id",
+                        "referenced_table": "t0000",
+                        "referenced_column": "id",
+                    }
+                )
+
+    async def fetch(self, query: str, *args: Any) -> list[dict[str, Any]]:
+        """Return canned rows for a known catalog query."""
+        rows_by_query = {
+            introspection._RELATIONS_QUERY: self.relations,
+            introspection._COLUMNS_QUERY: self.columns,
+            introspection._PRIMARY_KEYS_QUERY: self.primary_keys,
+            introspection._UNIQUE_COLUMNS_QUERY: self.unique_columns,
+            introspection._FOREIGN_KEYS_QUERY: self.foreign_keys,
+            introspection._INDEXES_QUERY: self.indexes,
+            introspection._ENUM_TYPES_QUERY: [
+                {"schema_name": "public", "type_name": "mood", "values": ["sad", "happy"]}
+            ],
+        }
+        rows = rows_by_query[query]
+        if args:
+            wanted = set(args[0])
+            rows = [row for row in rows if row["oid"] in wanted]
+        return rows
+
+
+def create_pool(catalog: FakeCatalog) -> tuple[MagicMock, MagicMock]:
+    """Create a mock pool whose connection serves queries from ``catalog``."""
+    conn = MagicMock()
+    conn.fetch = AsyncMock(side_effect=catalog.fetch)
+    conn.fetchval = AsyncMock(return_value="PostgreSQL 16.1, compiled by gcc")
+
+    acquire_mock = MagicMock()
+    acquire_mock.__aenter__ = AsyncMock(return_value=conn)
+    acquire_mock.__aexit__ = AsyncMock(return_value=None)
+    pool = MagicMock()
+    pool.acquire = MagicMock(return_value=acquire_mock)
+    return pool, conn
+
+
+class TestSchemaIntrospector:
+    """Test suite for SchemaIntrospector."""
+
+    @pytest.mark.asyncio
+    async def test_introspect_assembles_schema(self) -> None:
+        """Test that bulk catalog rows are assembled into the expected models."""
+        pool, _ = create_pool(FakeCatalog(table_count=3))
+
+        schema = await SchemaIntrospector(pool, "test_db").introspect()
+
+        assert schema.database_name == "test_db"
+        assert schema.version == "PostgreSQL 16.1"
+        assert [t.table_name for t in schema.tables] == ["t0000", "t0001", "t0002"]
+        assert schema.enum_types[0].values == ["sad", "happy"]
+
+        table = schema.tables[1]
+        assert table.row_count_estimate == 10
+        assert [c.name for c in table.columns] == ["id", "code"]
+        id_col, code_col = table.columns
+        assert id_col.is_primary_key is True
+        assert id_col.is_unique is False
+        assert code_col.is_unique is True
+        assert code_col.default_value == "'x'::text"
+        assert code_col.comment == "business key"
+        assert table.foreign_keys[0].referenced_table == "t0000"
+        assert table.indexes[0].columns == ["code"]
+
+        # The first table has no outgoing foreign keys
+        assert schema.tables[0].foreign_keys == []
+
+    @pytest.mark.asyncio
+    async def test_round_trips_do_not_grow_with_tables(self) -> None:
+        """Test that the number of catalog queries is constant in the table count."""
+        small_pool, small_conn = create_pool(FakeCatalog(table_count=2))
+        large_pool, large_conn = create_pool(FakeCatalog(table_count=500))
+
+        await SchemaIntrospector(small_pool, "small").introspect()
+        large_schema = await SchemaIntrospector(large_pool, "large").introspect()
+
+        assert len(large_schema.tables) == 500
+        assert small_conn.fetch.call_count == large_conn.fetch.call_count
+        assert small_conn.fetchval.call_count == large_conn.fetchval.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_database(self) -> None:
+        """Test that an empty database skips per-relation queries."""
+        pool, conn = create_pool(FakeCatalog(table_count=0))
+
+        schema = await SchemaIntrospector(pool, "empty").introspect()
+
+        assert schema.tables == []
+        # Only the relations and enum queries are issued
+        assert conn.fetch.call_count == 2
+
+
+class TestIncrementalIntrospection:
+    """Test suite for SchemaIntrospector.introspect_changes."""
+
+    @pytest.mark.asyncio
+    async def test_no_changes_skips_relation_queries(self) -> None:
+        """Test that an unchanged catalog only costs the fingerprint and enum queries."""
+        catalog = FakeCatalog(table_count=50)
+        pool, conn = create_pool(catalog)
+        introspector = SchemaIntrospector(pool, "test_db")
+        schema = await introspector.introspect()
+        previous = introspector.fingerprints
+        tables = schema.tables
+        conn.fetch.reset_mock()
+
+        changed = await introspector.introspect_changes(schema, previous)
+
+        assert changed == 0
+        assert conn.fetch.call_count == 2
+        # Nothing changed: the table list and revision are kept
+        assert schema.tables is tables
+        assert schema.revision == 0
+
+    @pytest.mark.asyncio
+    async def test_estimate_change_bumps_revision_only(self) -> None:
+        """Test that a changed row estimate is patched in place without replacing tables."""
+        catalog = FakeCatalog(table_count=5)
+        pool, _ = create_pool(catalog)
+        introspector = SchemaIntrospector(pool, "test_db")
+        schema = await introspector.introspect()
+        previous = introspector.fingerprints
+        tables = schema.tables
+        catalog.relations[1]["row_estimate"] = 777
+
+        changed = await introspector.introspect_changes(schema, previous)
+
+        assert changed == 0
+        assert schema.tables is tables
+        assert schema.tables[1].row_count_estimate == 777
+        assert schema.revision == 1
+
+    @pytest.mark.asyncio
+    async def test_compact_schema_patched_in_place_or_materialized(self) -> None:
+        """Test that a compact schema is only materialized when relations changed."""
+        catalog = FakeCatalog(table_count=5)
+        pool, _ = create_pool(catalog)
+        introspector = SchemaIntrospector(pool, "test_db")
+        compact = CompactSchema(await introspector.introspect())
+        tables = compact.tables
+
+        catalog.relations[1]["row_estimate"] = 777
+        changed = await introspector.introspect_changes(compact, introspector.fingerprints)
+
+        assert changed == 0
+        assert introspector.patched_schema is compact
+        assert compact.tables is tables
+        assert compact.tables[1].row_count_estimate == 777
+        assert compact.revision == 1
+
+        catalog.relations[2]["signature"] = "v2"
+        changed = await introspector.introspect_changes(compact, introspector.fingerprints)
+
+        patched = introspector.patched_schema
+        assert changed == 1
+        assert patched is not compact
+        assert patched.revision == 2
+        assert patched.tables[1].row_count_estimate == 777
+
+    @pytest.mark.asyncio
+    async def test_altered_added_and_dropped_relations(self) -> None:
+        """Test that only added, altered and dropped relations are re-introspected."""
+        catalog = FakeCatalog(table_count=5)
+        pool, conn = create_pool(catalog)
+        introspector = SchemaIntrospector(pool, "test_db")
+        schema = await introspector.introspect()
+        previous = introspector.fingerprints
+        unchanged_table = schema.tables[3]
+
+        # Alter t0002, drop t0004, add t0005 and bump a row estimate on t0003
+        catalog.relations[2]["signature"] = "v2"
+        catalog.columns.append(
+            {
+                "oid": 1002,
+                "column_name": "added",
+                "data_type": "boolean",
+                "is_nullable": True,
+                "default_value": None,
+                "comment": None,
+            }
+        )
+        catalog.relations[3]["row_estimate"] = 12345
+        del catalog.relations[4]
+        catalog.relations.append(
+            {
+                "oid": 2000,
+                "relkind": "r",
+                "schema_name": "public",
+                "table_name": "t0005",
+                "comment": None,
+                "row_estimate": 0,
+                "signature": "v1",
+            }
+        )
+        conn.fetch.reset_mock()
+
+        changed = await introspector.introspect_changes(schema, previous)
+
+        assert changed == 3
+        assert schema.revision == 1
+        assert [t.table_name for t in schema.tables] == [
+            "t0000",
+            "t0001",
+            "t0002",
+            "t0003",
+            "t0005",
+        ]
+        assert [c.name for c in schema.tables[2].columns] == ["id", "code", "added"]
+        # Unchanged tables are kept as-is, with refreshed row estimates
+        assert schema.tables[3] is unchanged_table
+        assert unchanged_table.row_count_estimate == 12345
+        # Only changed relations were passed to the per-relation queries
+        columns_call = next(
+            call
+            for call in conn.fetch.call_args_list
+            if call.args[0] == introspection._COLUMNS_QUERY
+        )
+        assert set(columns_call.args[1]) == {1002, 2000}
+        assert introspector.fingerprints[1002].signature == "v2"
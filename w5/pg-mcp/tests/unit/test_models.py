@@ -17,7 +17,13 @@ from pg_mcp.models.errors import (
     SecurityViolationError,
     SQLParseError,
 )
-from pg_mcp.models.query import QueryRequest, QueryResponse, QueryResult, ReturnType
+from pg_mcp.models.query import (
+    QueryRequest,
+    QueryResponse,
+    QueryResult,
+    ResultFormat,
+    ReturnType,
+)
 from pg_mcp.models.schema import (
     ColumnInfo,
     DatabaseSchema,
@@ -231,6 +237,100 @@ class TestDatabaseSchema:
         not_found = schema.get_table("nonexistent")
         assert not_found is None
 
+    @pytest.fixture
+    def shop_schema(self) -> DatabaseSchema:
+        """Create a schema with foreign keys, two schemas and an enum."""
+
+        def id_column() -> ColumnInfo:
+            return ColumnInfo(
+                name="id", data_type="integer", is_nullable=False, is_primary_key=True
+            )
+
+        def fk(column: str, table: str) -> ForeignKeyInfo:
+            return ForeignKeyInfo(
+                constraint_name=f"fk_{column}",
+                column_name=column,
+                referenced_table=table,
+                referenced_column="id",
+            )
+
+        return DatabaseSchema(
+            database_name="shop",
+            tables=[
+                TableInfo(table_name="customers", columns=[id_column()]),
+                TableInfo(
+                    table_name="orders",
+                    columns=[
+                        id_column(),
+                        ColumnInfo(name="customer_id", data_type="integer", is_nullable=False),
+                    ],
+                    foreign_keys=[fk("customer_id", "customers")],
+                ),
+                TableInfo(schema_name="billing", table_name="customers", columns=[id_column()]),
+                TableInfo(
+                    schema_name="billing",
+                    table_name="invoices",
+                    columns=[id_column()],
+                    foreign_keys=[fk("customer_id", "customers"), fk("order_id", "orders")],
+                ),
+            ],
+            enum_types=[EnumTypeInfo(type_name="order_status", values=["new", "paid"])],
+        )
+
+    def test_qualified_lookups(self, shop_schema: DatabaseSchema) -> None:
+        """Test table, column and enum lookups by qualified name."""
+        assert shop_schema.get_table("customers", "billing") is shop_schema.tables[2]
+        assert [t.schema_name for t in shop_schema.find_tables("customers")] == [
+            "public",
+            "billing",
+        ]
+        column = shop_schema.get_column("orders", "customer_id")
+        assert column is shop_schema.tables[1].columns[1]
+        assert shop_schema.get_column("orders", "missing") is None
+        assert shop_schema.get_column("missing", "id") is None
+        assert shop_schema.get_enum("order_status") is shop_schema.enum_types[0]
+        assert shop_schema.get_enum("order_status", "billing") is None
+
+    def test_referencing_tables(self, shop_schema: DatabaseSchema) -> None:
+        """Test reverse foreign key lookup prefers the referencing table's schema."""
+        public_refs = shop_schema.get_referencing_tables("customers")
+        billing_refs = shop_schema.get_referencing_tables("customers", "billing")
+
+        assert [t.full_name for t in public_refs] == ["public.orders"]
+        assert [t.full_name for t in billing_refs] == ["billing.invoices"]
+        assert [t.full_name for t in shop_schema.get_referencing_tables("orders")] == [
+            "billing.invoices"
+        ]
+
+    def test_index_rebuilt_after_patch(self, shop_schema: DatabaseSchema) -> None:
+        """Test that replacing tables or bumping the revision refreshes the index."""
+        index = shop_schema.index
+        assert shop_schema.index is index
+
+        shop_schema.tables = [*shop_schema.tables, TableInfo(table_name="refunds")]
+        assert shop_schema.get_table("refunds") is shop_schema.tables[-1]
+
+        index = shop_schema.index
+        shop_schema.tables[0].columns.append(
+            ColumnInfo(name="email", data_type="text", is_nullable=True)
+        )
+        shop_schema.tables[0].columns = list(shop_schema.tables[0].columns)
+        shop_schema.revision += 1
+        assert shop_schema.index is not index
+        assert shop_schema.get_column("customers", "email") is not None
+
+    def test_index_not_part_of_model(self, shop_schema: DatabaseSchema) -> None:
+        """Test that lookup indexes stay out of equality, dumps and copies."""
+        pristine = shop_schema.model_copy(deep=True)
+        shop_schema.get_table("orders")
+        shop_schema.tables[1].get_column("id")
+        copy = shop_schema.model_copy(update={"tables": shop_schema.tables[:1]})
+
+        assert shop_schema == pristine
+        assert shop_schema.model_dump() == pristine.model_dump()
+        assert copy.get_table("orders") is None
+        assert shop_schema.get_table("orders") is not None
+
     def test_to_prompt_context(self) -> None:
         """Test full schema prompt generation."""
         schema = DatabaseSchema(
@@ -323,6 +423,36 @@ class TestQueryResult:
         assert len(result.rows) == 2
         assert result.execution_time_ms == 15.5
 
+    def test_columnar_result(self) -> None:
+        """Test that row_count of a columnar result counts column entries."""
+        result = QueryResult(
+            columns=["id", "name"],
+            column_values=[[1, 2, 3], ["a", "b", "c"]],
+            row_count=3,
+            result_format=ResultFormat.COLUMNAR,
+        )
+        assert result.row_count == 3
+        assert result.rows == []
+
+    def test_array_formats_are_smaller(self) -> None:
+        """Test that array layouts shrink the serialized result."""
+        columns = ["customer_id", "email", "lifetime_value", "created_at"]
+        rows = [[i, f"user{i}@example.com", i * 1.5, "2024-01-01T00:00:00"] for i in range(1000)]
+
+        objects = QueryResult(
+            columns=columns, rows=[dict(zip(columns, r, strict=True)) for r in rows]
+        )
+        arrays = QueryResult(columns=columns, rows=rows, result_format=ResultFormat.ARRAYS)
+        columnar = QueryResult(
+            columns=columns,
+            column_values=[list(c) for c in zip(*rows, strict=True)],
+            result_format=ResultFormat.COLUMNAR,
+        )
+
+        objects_size = len(objects.model_dump_json())
+        assert len(arrays.model_dump_json()) < objects_size * 0.6
+        assert len(columnar.model_dump_json()) < objects_size * 0.6
+
 
 class TestQueryResponse:
     """Tests for QueryResponse model."""
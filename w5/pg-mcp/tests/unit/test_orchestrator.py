@@ -4,25 +4,43 @@ This module tests the orchestrator's coordination of the query pipeline,
 including retry logic, error handling, and integration with all components.
 """
 
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
-
-from pg_mcp.config.settings import ResilienceConfig, ValidationConfig
+import sqlglot
+
+from pg_mcp.config.settings import (
+    CostGuardConfig,
+    DatabaseConfig,
+    GenerationCacheConfig,
+    ResilienceConfig,
+    SecurityConfig,
+    ValidationConfig,
+)
 from pg_mcp.models.errors import (
     DatabaseError,
+    DatabaseNotReadyError,
     LLMError,
     SecurityViolationError,
     SQLParseError,
 )
 from pg_mcp.models.query import (
     QueryRequest,
+    QueryResult,
+    ResultFormat,
     ResultValidationResult,
     ReturnType,
+    TruncationReason,
 )
 from pg_mcp.models.schema import ColumnInfo, DatabaseSchema, TableInfo
 from pg_mcp.resilience.circuit_breaker import CircuitState
+from pg_mcp.services.cost_guard import CostGuard
+from pg_mcp.services.generation_cache import GenerationCache
 from pg_mcp.services.orchestrator import QueryOrchestrator
+from pg_mcp.services.sql_executor import TruncationReport
+from pg_mcp.services.sql_rewriter import SQLRewriter
+from pg_mcp.services.sql_validator import SQLValidator
 
 
 class TestDatabaseResolution:
@@ -161,18 +179,19 @@ class TestSQLGenerationWithRetry:
         )
 
         # Execute
-        sql, validation_result, _tokens = await orchestrator._generate_sql_with_retry(
+        analysis, validation_result, _tokens = await orchestrator._generate_sql_with_retry(
             question="Get all users",
             schema=mock_schema,
             request_id="test-123",
         )
 
         # Verify
-        assert sql == "SELECT * FROM users;"
+        assert analysis.sql == "SELECT * FROM users;"
         assert validation_result.is_valid is True
         assert validation_result.is_select is True
         mock_generator.generate.assert_called_once()
-        mock_validator.validate_or_raise.assert_called_once_with("SELECT * FROM users;")
+        # The validator gets the analysis of the generated SQL, not the text
+        mock_validator.validate_or_raise.assert_called_once_with(analysis)
 
     @pytest.mark.asyncio
     async def test_generate_sql_retry_on_validation_failure(
@@ -205,14 +224,14 @@ class TestSQLGenerationWithRetry:
         )
 
         # Execute
-        sql, validation_result, _tokens = await orchestrator._generate_sql_with_retry(
+        analysis, validation_result, _tokens = await orchestrator._generate_sql_with_retry(
             question="Get all users",
             schema=mock_schema,
             request_id="test-123",
         )
 
         # Verify
-        assert sql == "SELECT * FROM users;"
+        assert analysis.sql == "SELECT * FROM users;"
         assert validation_result.is_valid is True
         assert mock_generator.generate.call_count == 2
         assert mock_validator.validate_or_raise.call_count == 2
@@ -222,6 +241,101 @@ class TestSQLGenerationWithRetry:
         assert second_call.kwargs["previous_attempt"] == "SELECT * FROM user;"
         assert 'relation "user" does not exist' in second_call.kwargs["error_feedback"]
 
+    @pytest.mark.asyncio
+    async def test_generate_sql_retry_on_cost_rejection(self, mock_schema: DatabaseSchema) -> None:
+        """Test that a query over the cost limits is regenerated with feedback."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.side_effect = [
+            "SELECT * FROM users, orders",
+            "SELECT * FROM users JOIN orders ON orders.user_id = users.id",
+        ]
+
+        mock_executor = MagicMock()
+        mock_executor.db_config = DatabaseConfig(name="test_db")
+        mock_executor.explain = AsyncMock(
+            side_effect=[
+                {"Total Cost": 5e9, "Plan Rows": 100},
+                {"Total Cost": 2500.0, "Plan Rows": 100},
+            ]
+        )
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executor=mock_executor,
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(max_retries=3),
+            validation_config=ValidationConfig(),
+            sql_rewriter=SQLRewriter(SecurityConfig(max_rows=100)),
+            cost_guard=CostGuard(CostGuardConfig(enabled=True, max_total_cost=1e6)),
+        )
+
+        analysis, _validation, _tokens = await orchestrator._generate_sql_with_retry(
+            question="List users with their orders",
+            schema=mock_schema,
+            request_id="test-123",
+            executor=mock_executor,
+        )
+
+        assert analysis.sql == "SELECT * FROM users JOIN orders ON orders.user_id = users.id"
+        # The estimates are those of the SQL as executed, with the pushed-down limit
+        assert mock_executor.explain.await_args_list[0].args[0].endswith("LIMIT 101")
+        second_call = mock_generator.generate.call_args_list[1]
+        assert second_call.kwargs["previous_attempt"] == "SELECT * FROM users, orders"
+        assert "too expensive" in second_call.kwargs["error_feedback"]
+        assert orchestrator.circuit_breaker.failure_count == 0
+
+    @pytest.mark.asyncio
+    async def test_cost_guard_checks_rows_before_pushed_down_limit(
+        self, mock_schema: DatabaseSchema
+    ) -> None:
+        """Test that the pushed-down limit does not hide a query's row estimate."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.side_effect = [
+            "SELECT * FROM events",
+            "SELECT count(*) FROM events",
+        ]
+
+        mock_executor = MagicMock()
+        mock_executor.db_config = DatabaseConfig(name="test_db")
+        mock_executor.explain = AsyncMock(
+            side_effect=[
+                {
+                    "Node Type": "Limit",
+                    "Total Cost": 2.5,
+                    "Plan Rows": 101,
+                    "Plans": [{"Node Type": "Seq Scan", "Total Cost": 2e5, "Plan Rows": 5e7}],
+                },
+                {"Node Type": "Aggregate", "Total Cost": 2e5, "Plan Rows": 1},
+            ]
+        )
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executor=mock_executor,
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(max_retries=3),
+            validation_config=ValidationConfig(),
+            sql_rewriter=SQLRewriter(SecurityConfig(max_rows=100)),
+            cost_guard=CostGuard(CostGuardConfig(enabled=True, max_plan_rows=1_000_000)),
+        )
+
+        analysis, _validation, _tokens = await orchestrator._generate_sql_with_retry(
+            question="Show all events",
+            schema=mock_schema,
+            request_id="test-123",
+            executor=mock_executor,
+        )
+
+        assert analysis.sql == "SELECT count(*) FROM events"
+        second_call = mock_generator.generate.call_args_list[1]
+        assert "estimated 50000000 rows exceed 1000000" in second_call.kwargs["error_feedback"]
+
     @pytest.mark.asyncio
     async def test_generate_sql_fails_after_max_retries(self, mock_schema: DatabaseSchema) -> None:
         """Test failure after exhausting all retries."""
@@ -533,9 +647,222 @@ class TestExecuteQueryFlow:
         assert response.data.row_count == 2
         assert len(response.data.rows) == 2
         assert response.data.columns == ["id", "name"]
+        assert response.data.truncated is False
         assert response.confidence == 90
         assert response.error is None
 
+    @pytest.mark.asyncio
+    async def test_execute_query_pushes_limit_down(self, mock_schema: DatabaseSchema) -> None:
+        """Test that the rewritten SQL is executed and truncation is reported."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "SELECT id, name FROM users ORDER BY id;"
+
+        mock_validator = MagicMock()
+        mock_validator.validate_or_raise.return_value = None
+
+        # max_rows=2: the executor read a third row and dropped it
+        mock_executor = AsyncMock()
+        mock_executor.execute.return_value = (
+            [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}],
+            3,
+        )
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executor=mock_executor,
+            result_validator=AsyncMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(enabled=False),
+            sql_rewriter=SQLRewriter(SecurityConfig(max_rows=2)),
+        )
+
+        request = QueryRequest(question="Get all users", database="test_db")
+        response = await orchestrator.execute_query(request)
+
+        mock_executor.execute.assert_called_once_with(
+            "SELECT id, name FROM users ORDER BY id LIMIT 3", report=ANY
+        )
+        assert response.success is True
+        assert response.generated_sql == "SELECT id, name FROM users ORDER BY id;"
+        assert response.data is not None
+        assert response.data.row_count == 2
+        assert response.data.truncated is True
+
+    @pytest.mark.asyncio
+    async def test_execute_query_parses_sql_once(self, mock_schema: DatabaseSchema) -> None:
+        """Test that validation, the cost guard and the rewrite share one parse."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "SELECT id, name FROM users ORDER BY id"
+
+        mock_executor = AsyncMock()
+        mock_executor.db_config = DatabaseConfig(name="test_db")
+        mock_executor.explain.return_value = {"Total Cost": 10.0, "Plan Rows": 3}
+        mock_executor.execute.return_value = ([{"id": 1, "name": "Alice"}], 1)
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=SQLValidator(SecurityConfig()),
+            sql_executor=mock_executor,
+            result_validator=AsyncMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(enabled=False),
+            sql_rewriter=SQLRewriter(SecurityConfig(max_rows=2)),
+            cost_guard=CostGuard(CostGuardConfig(enabled=True)),
+        )
+
+        with patch("pg_mcp.services.sql_analysis.sqlglot.parse", wraps=sqlglot.parse) as parse:
+            response = await orchestrator.execute_query(
+                QueryRequest(question="Get all users", database="test_db")
+            )
+
+        assert response.success is True
+        parse.assert_called_once()
+        mock_executor.explain.assert_awaited_once_with(
+            "SELECT id, name FROM users ORDER BY id LIMIT 3"
+        )
+        mock_executor.execute.assert_called_once_with(
+            "SELECT id, name FROM users ORDER BY id LIMIT 3", report=ANY
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_query_columnar(self, mock_schema: DatabaseSchema) -> None:
+        """Test that the columnar format returns column arrays and samples rows as dicts."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "SELECT id, name FROM users"
+
+        mock_executor = AsyncMock()
+        mock_executor.execute_table.return_value = (
+            ["id", "name"],
+            [[1, 2, 3], ["Alice", "Bob", "Carol"]],
+            4,
+        )
+
+        mock_result_validator = AsyncMock()
+        mock_result_validator.validate.return_value = ResultValidationResult(
+            confidence=80, explanation="Fine", suggestion=None, is_acceptable=True
+        )
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executor=mock_executor,
+            result_validator=mock_result_validator,
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(enabled=True, sample_rows=2),
+        )
+
+        request = QueryRequest(
+            question="Get all users", database="test_db", result_format=ResultFormat.COLUMNAR
+        )
+        response = await orchestrator.execute_query(request)
+
+        mock_executor.execute.assert_not_called()
+        mock_executor.execute_table.assert_called_once_with(
+            "SELECT id, name FROM users", columnar=True, report=ANY
+        )
+        assert response.data is not None
+        assert response.data.columns == ["id", "name"]
+        assert response.data.column_values == [[1, 2, 3], ["Alice", "Bob", "Carol"]]
+        assert response.data.rows == []
+        assert response.data.row_count == 3
+        assert response.data.truncated is True
+        assert response.data.result_format == ResultFormat.COLUMNAR
+        assert mock_result_validator.validate.call_args.kwargs["results"] == [
+            {"id": 1, "name": "Alice"},
+            {"id": 2, "name": "Bob"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_query_reports_truncation(self, mock_schema: DatabaseSchema) -> None:
+        """Test that the executor's truncation report is included in the result."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "SELECT id, body FROM documents"
+
+        async def execute(sql: str, report: TruncationReport) -> tuple[list[dict[str, Any]], int]:
+            report.reason = TruncationReason.MAX_RESULT_BYTES
+            report.truncated_values = 1
+            return [{"id": 1, "body": "abc...[truncated 5 characters]"}], 2
+
+        mock_executor = AsyncMock()
+        mock_executor.execute.side_effect = execute
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executor=mock_executor,
+            result_validator=AsyncMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(enabled=False),
+        )
+
+        request = QueryRequest(question="Get all documents", database="test_db")
+        response = await orchestrator.execute_query(request)
+
+        assert response.data is not None
+        assert response.data.truncated is True
+        assert response.data.truncation_reason == TruncationReason.MAX_RESULT_BYTES
+        assert response.data.truncated_values == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_query_paged(self, mock_schema: DatabaseSchema) -> None:
+        """Test that a page_size returns the pager's first page and cursor."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "SELECT id FROM users"
+
+        mock_executor = AsyncMock()
+        mock_pager = AsyncMock()
+        mock_pager.open_result.return_value = QueryResult(
+            columns=["id"], rows=[{"id": 1}, {"id": 2}], cursor="token-1"
+        )
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executor=mock_executor,
+            result_validator=AsyncMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(enabled=False),
+            result_pager=mock_pager,
+        )
+
+        request = QueryRequest(question="Get all users", database="test_db", page_size=2)
+        response = await orchestrator.execute_query(request, client_id="client-1")
+
+        mock_executor.execute.assert_not_called()
+        mock_pager.open_result.assert_awaited_once_with(
+            mock_executor, "SELECT id FROM users", 2, ResultFormat.OBJECTS, "client-1"
+        )
+        assert response.success is True
+        assert response.data is not None
+        assert response.data.rows == [{"id": 1}, {"id": 2}]
+        assert response.data.cursor == "token-1"
+
     @pytest.mark.asyncio
     async def test_execute_query_schema_not_cached(self) -> None:
         """Test loading schema when not in cache."""
@@ -767,3 +1094,296 @@ class TestExecuteQueryFlow:
         assert response.success is True
         # Verify schema was fetched for auto-selected database
         mock_cache.get.assert_called_once_with("only_db")
+
+    @pytest.mark.asyncio
+    async def test_execute_query_routes_to_database_executor(
+        self, mock_schema: DatabaseSchema
+    ) -> None:
+        """Test that a request runs on the executor of its database."""
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = mock_schema
+
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = "SELECT id FROM users;"
+
+        mock_validator = MagicMock()
+        mock_validator.validate_or_raise.return_value = None
+
+        executors = {name: AsyncMock() for name in ("sales", "hr")}
+        for name, executor in executors.items():
+            executor.execute.return_value = ([{"id": name}], 1)
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executor=executors["sales"],
+            result_validator=MagicMock(),
+            schema_cache=mock_cache,
+            pools={"sales": MagicMock(), "hr": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(enabled=False),
+            sql_executors=executors,
+        )
+
+        response = await orchestrator.execute_query(
+            QueryRequest(question="List user ids", database="hr")
+        )
+
+        assert response.success is True
+        assert response.data is not None
+        assert response.data.rows == [{"id": "hr"}]
+        mock_cache.get.assert_called_once_with("hr")
+        executors["sales"].execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_query_database_not_ready(self) -> None:
+        """Test that a request for a starting database fails with a retryable error."""
+        warmup = MagicMock()
+        warmup.database_names = ["sales", "hr"]
+        warmup.wait_ready = AsyncMock(
+            side_effect=DatabaseNotReadyError(
+                "Database 'hr' is still starting; retry shortly",
+                details={"database": "hr", "state": "loading_schema"},
+            )
+        )
+        mock_generator = AsyncMock()
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=MagicMock(),
+            sql_executor=None,
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={},  # Filled as databases start
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(),
+            sql_executors={},
+            warmup=warmup,
+        )
+
+        response = await orchestrator.execute_query(
+            QueryRequest(question="List user ids", database="hr")
+        )
+
+        assert response.success is False
+        assert response.error is not None
+        assert response.error.code == "database_not_ready"
+        warmup.wait_ready.assert_awaited_once_with("hr")
+        mock_generator.generate.assert_not_called()
+
+
+class TestSchemaPruning:
+    """Test schema pruning integration in SQL generation."""
+
+    @pytest.mark.asyncio
+    async def test_retries_fall_back_to_full_schema(self) -> None:
+        """Test that retries after a failed attempt use the full schema."""
+        full_schema = DatabaseSchema(database_name="test_db", tables=[])
+        pruned_schema = DatabaseSchema(database_name="test_db", tables=[])
+        mock_generator = AsyncMock()
+        mock_generator.generate.side_effect = ["SELECT * FROM user;", "SELECT * FROM users;"]
+        mock_validator = MagicMock()
+        mock_validator.validate_or_raise.side_effect = [SQLParseError("bad"), None]
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=mock_validator,
+            sql_executor=MagicMock(),
+            result_validator=MagicMock(),
+            schema_cache=MagicMock(),
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(max_retries=3),
+            validation_config=ValidationConfig(),
+        )
+
+        analysis, _validation, _tokens = await orchestrator._generate_sql_with_retry(
+            question="Get all users",
+            schema=pruned_schema,
+            request_id="test-123",
+            fallback_schema=full_schema,
+        )
+
+        assert analysis.sql == "SELECT * FROM users;"
+        first_call, retry_call = mock_generator.generate.call_args_list
+        assert first_call.kwargs["schema"] is pruned_schema
+        assert retry_call.kwargs["schema"] is full_schema
+
+
+class TestGenerationCaching:
+    """Test reusing cached SQL for repeated questions."""
+
+    @staticmethod
+    def create_orchestrator(
+        generated_sql: str = "SELECT id, name FROM users", match_similar: bool = False
+    ) -> tuple[QueryOrchestrator, AsyncMock, AsyncMock]:
+        """Create an orchestrator with a generation cache, generator and executor."""
+        mock_generator = AsyncMock()
+        mock_generator.generate.return_value = generated_sql
+
+        mock_executor = AsyncMock()
+        mock_executor.execute.return_value = ([{"id": 1, "name": "Alice"}], 1)
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = DatabaseSchema(database_name="test_db", tables=[])
+        mock_cache.get_fingerprint.return_value = "v1"
+
+        orchestrator = QueryOrchestrator(
+            sql_generator=mock_generator,
+            sql_validator=SQLValidator(SecurityConfig()),
+            sql_executor=mock_executor,
+            result_validator=AsyncMock(),
+            schema_cache=mock_cache,
+            pools={"test_db": MagicMock()},
+            resilience_config=ResilienceConfig(),
+            validation_config=ValidationConfig(enabled=False),
+            generation_cache=GenerationCache(
+                GenerationCacheConfig(enabled=True, match_similar=match_similar)
+            ),
+        )
+        return orchestrator, mock_generator, mock_executor
+
+    @pytest.mark.asyncio
+    async def test_repeated_question_skips_generation(self) -> None:
+        """Test that a repeated question reuses the SQL without calling the LLM."""
+        orchestrator, mock_generator, mock_executor = self.create_orchestrator()
+
+        first = await orchestrator.execute_query(
+            QueryRequest(question="How many users?", database="test_db")
+        )
+        second = await orchestrator.execute_query(
+            QueryRequest(question="how  many users", database="test_db")
+        )
+
+        assert first.success is True
+        assert second.success is True
+        assert second.generated_sql == first.generated_sql
+        assert second.validation is not None
+        assert second.validation.is_valid is True
+        mock_generator.generate.assert_awaited_once()
+        assert mock_executor.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_opt_out_always_generates(self) -> None:
+        """Test that use_cache=False neither reads nor fills the cache."""
+        orchestrator, mock_generator, _executor = self.create_orchestrator()
+        request = QueryRequest(question="How many users?", database="test_db", use_cache=False)
+
+        await orchestrator.execute_query(request)
+        await orchestrator.execute_query(request)
+
+        assert mock_generator.generate.await_count == 2
+        assert orchestrator.generation_cache is not None
+        assert orchestrator.generation_cache.get_stats()["cached_questions"] == 0
+
+    @pytest.mark.asyncio
+    async def test_schema_change_regenerates(self) -> None:
+        """Test that SQL cached for an earlier schema is not reused."""
+        orchestrator, mock_generator, _executor = self.create_orchestrator()
+        request = QueryRequest(question="How many users?", database="test_db")
+
+        await orchestrator.execute_query(request)
+        orchestrator.schema_cache.get_fingerprint.return_value = "v2"  # type: ignore[attr-defined]
+        await orchestrator.execute_query(request)
+
+        assert mock_generator.generate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_sql_is_validated_again(self) -> None:
+        """Test that cached SQL failing current validation is dropped and regenerated."""
+        orchestrator, mock_generator, mock_executor = self.create_orchestrator()
+        cache = orchestrator.generation_cache
+        assert cache is not None
+        cache.put("test_db", "v1", "How many users?", "SELECT pg_sleep(10)")
+
+        response = await orchestrator.execute_query(
+            QueryRequest(question="How many users?", database="test_db")
+        )
+
+        assert response.success is True
+        assert response.generated_sql == "SELECT id, name FROM users"
+        mock_generator.generate.assert_awaited_once()
+        mock_executor.execute.assert_awaited_once_with("SELECT id, name FROM users", report=ANY)
+
+    @pytest.mark.asyncio
+    async def test_failed_execution_is_not_cached(self) -> None:
+        """Test that SQL whose execution failed is generated again next time."""
+        orchestrator, mock_generator, mock_executor = self.create_orchestrator()
+        mock_executor.execute.side_effect = DatabaseError("relation does not exist")
+        request = QueryRequest(question="How many users?", database="test_db")
+
+        assert (await orchestrator.execute_query(request)).success is False
+        assert (await orchestrator.execute_query(request)).success is False
+
+        assert mock_generator.generate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sql_only_request_is_not_cached(self) -> None:
+        """Test that SQL returned without executing it is not reused."""
+        orchestrator, mock_generator, mock_executor = self.create_orchestrator()
+        mock_executor.execute.side_effect = [
+            DatabaseError("relation does not exist"),
+            ([{"id": 1, "name": "Alice"}], 1),
+        ]
+
+        sql_only = await orchestrator.execute_query(
+            QueryRequest(question="How many users?", database="test_db", return_type=ReturnType.SQL)
+        )
+        failed = await orchestrator.execute_query(
+            QueryRequest(question="How many users?", database="test_db")
+        )
+        retried = await orchestrator.execute_query(
+            QueryRequest(question="How many users?", database="test_db")
+        )
+
+        assert sql_only.success is True
+        assert failed.success is False
+        assert retried.success is True
+        assert mock_generator.generate.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_cached_sql_is_discarded(self) -> None:
+        """Test that cached SQL whose execution fails is generated again next time."""
+        orchestrator, mock_generator, mock_executor = self.create_orchestrator()
+        request = QueryRequest(question="How many users?", database="test_db")
+
+        assert (await orchestrator.execute_query(request)).success is True
+        mock_executor.execute.side_effect = DatabaseError("relation does not exist")
+        assert (await orchestrator.execute_query(request)).success is False
+        mock_executor.execute.side_effect = None
+        assert (await orchestrator.execute_query(request)).success is True
+
+        assert mock_generator.generate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_similar_question_skips_generation(self) -> None:
+        """Test that a reworded question reuses the SQL of a similar cached one."""
+        orchestrator, mock_generator, _executor = self.create_orchestrator(match_similar=True)
+
+        await orchestrator.execute_query(
+            QueryRequest(question="How many users per country?", database="test_db")
+        )
+        response = await orchestrator.execute_query(
+            QueryRequest(question="number of users for each country", database="test_db")
+        )
+
+        assert response.success is True
+        assert response.generated_sql == "SELECT id, name FROM users"
+        mock_generator.generate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_similar_match_is_validated(self) -> None:
+        """Test that SQL matched through a similar question is validated before it runs."""
+        orchestrator, mock_generator, mock_executor = self.create_orchestrator(match_similar=True)
+        cache = orchestrator.generation_cache
+        assert cache is not None
+        cache.put("test_db", "v1", "How many users per country?", "SELECT pg_sleep(10)")
+
+        response = await orchestrator.execute_query(
+            QueryRequest(question="number of users for each country", database="test_db")
+        )
+
+        assert response.success is True
+        mock_generator.generate.assert_awaited_once()
+        mock_executor.execute.assert_awaited_once_with("SELECT id, name FROM users", report=ANY)
+        # The matched entry failed validation and was dropped
+        assert cache.get("test_db", "v1", "How many users per country?") is None
@@ -0,0 +1,58 @@
+"""Unit tests for connection pool management.
+
+This module tests creating the pools of several databases at once.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pg_mcp.config.settings import DatabaseConfig, SecurityConfig
+from pg_mcp.db.pool import create_pools
+
+
+class TestCreatePools:
+    """Test suite for create_pools."""
+
+    @pytest.mark.asyncio
+    async def test_pools_are_created_concurrently(self) -> None:
+        """Test that every pool is being created before any has finished."""
+        configs = [DatabaseConfig(name=f"db{i}") for i in range(3)]
+        started: list[str] = []
+        all_started = asyncio.Event()
+
+        async def create_pool(config: DatabaseConfig, security_config: SecurityConfig) -> MagicMock:
+            started.append(config.name)
+            if len(started) == len(configs):
+                all_started.set()
+            await asyncio.wait_for(all_started.wait(), timeout=1.0)
+            pool = MagicMock()
+            pool.name = config.name
+            return pool
+
+        with patch("pg_mcp.db.pool.create_pool", side_effect=create_pool):
+            pools = await create_pools(configs, SecurityConfig())
+
+        assert list(pools) == ["db0", "db1", "db2"]
+        assert all(pool.name == name for name, pool in pools.items())
+
+    @pytest.mark.asyncio
+    async def test_failure_closes_created_pools(self) -> None:
+        """Test that a failing database raises and closes the other pools."""
+        configs = [DatabaseConfig(name="good"), DatabaseConfig(name="bad")]
+        good_pool = MagicMock()
+        good_pool.close = AsyncMock()
+
+        async def create_pool(config: DatabaseConfig, security_config: None) -> MagicMock:
+            if config.name == "bad":
+                raise ConnectionRefusedError("connection refused")
+            return good_pool
+
+        with (
+            patch("pg_mcp.db.pool.create_pool", side_effect=create_pool),
+            pytest.raises(ConnectionRefusedError),
+        ):
+            await create_pools(configs)
+
+        good_pool.close.assert_awaited_once()
@@ -0,0 +1,102 @@
+"""Unit tests for QuestionIndex.
+
+This module tests reducing questions to terms and ranking cached questions
+by similarity, including the guards on schema identifiers, numbers and
+negation.
+"""
+
+from pg_mcp.models.schema import ColumnInfo, DatabaseSchema, TableInfo
+from pg_mcp.services.question_index import QuestionIndex, question_terms, schema_identifiers
+
+IDENTIFIERS = frozenset({"user", "id", "signup", "country", "order", "customer", "active"})
+
+
+def create_index(*questions: str) -> QuestionIndex:
+    """Create an index of the given questions."""
+    index = QuestionIndex()
+    for question in questions:
+        index.add(question, question_terms(question))
+    return index
+
+
+class TestQuestionTerms:
+    """Test suite for question_terms."""
+
+    def test_paraphrases_share_terms(self) -> None:
+        """Test that filler words and aggregate wording are normalized away."""
+        assert question_terms("How many users are there per country?") == question_terms(
+            "number of users for each country"
+        )
+
+    def test_shape_words_are_kept(self) -> None:
+        """Test that counting and listing the same rows give different terms."""
+        assert question_terms("how many orders") != question_terms("list orders")
+        assert "not" in question_terms("users without orders")
+
+
+class TestSchemaIdentifiers:
+    """Test suite for schema_identifiers."""
+
+    def test_table_and_column_name_terms(self) -> None:
+        """Test that table and column names are split into terms."""
+        schema = DatabaseSchema(
+            database_name="test_db",
+            tables=[
+                TableInfo(
+                    schema_name="public",
+                    table_name="user_accounts",
+                    columns=[
+                        ColumnInfo(name="id", data_type="integer", is_nullable=False),
+                        ColumnInfo(name="signedUpAt", data_type="timestamp", is_nullable=True),
+                    ],
+                )
+            ],
+        )
+
+        assert schema_identifiers(schema) == {"user", "account", "id", "signed", "up"}
+
+
+class TestQuestionIndex:
+    """Test suite for QuestionIndex."""
+
+    def test_paraphrase_ranks_first(self) -> None:
+        """Test that a reworded question matches its cached form."""
+        index = create_index("how many users per country", "list users per country")
+
+        ranked = index.rank(question_terms("number of users for each country?"), IDENTIFIERS, 0.9)
+
+        assert ranked == [("how many users per country", 1.0)]
+
+    def test_threshold_excludes_partial_matches(self) -> None:
+        """Test that a question with an extra filter is not similar enough."""
+        index = create_index("how many users signed up")
+
+        terms = question_terms("how many users signed up today")
+        assert index.rank(terms, IDENTIFIERS, 0.9) == []
+        assert index.rank(terms, IDENTIFIERS, 0.5) != []
+
+    def test_different_numbers_never_match(self) -> None:
+        """Test that questions differing only in a number are not matched."""
+        index = create_index("how many users signed up in 2023")
+
+        assert index.rank(question_terms("users signed up in 2024"), IDENTIFIERS, 0.1) == []
+
+    def test_different_identifiers_never_match(self) -> None:
+        """Test that questions about other tables or columns are not matched."""
+        index = create_index("how many active users per country")
+
+        assert index.rank(question_terms("how many users per country"), IDENTIFIERS, 0.1) == []
+
+    def test_negation_never_matches(self) -> None:
+        """Test that a negated question is not matched with the plain one."""
+        index = create_index("customers with orders")
+
+        assert index.rank(question_terms("customers without orders"), IDENTIFIERS, 0.1) == []
+
+    def test_remove(self) -> None:
+        """Test that removed questions are no longer ranked."""
+        index = create_index("how many users per country")
+        index.remove("how many users per country")
+
+        assert len(index) == 0
+        assert index.rank(question_terms("how many users per country"), IDENTIFIERS, 0.1) == []
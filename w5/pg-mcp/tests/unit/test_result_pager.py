@@ -0,0 +1,229 @@
+"""Unit tests for ResultPager.
+
+This module tests paging through server-held result cursors: page tokens,
+result formats, cursor ownership, TTL expiry and the limits on open cursors.
+"""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pg_mcp.config.settings import DatabaseConfig, PagingConfig, SecurityConfig
+from pg_mcp.models.errors import CursorNotFoundError, DatabaseError
+from pg_mcp.models.query import ResultFormat
+from pg_mcp.services.result_pager import ResultPager
+from pg_mcp.services.sql_executor import SQLExecutor
+
+
+def create_record(data: dict[str, Any]) -> MagicMock:
+    """Create a mock asyncpg.Record."""
+    record = MagicMock()
+    record.__iter__ = MagicMock(return_value=iter(data.items()))
+    record.keys = MagicMock(return_value=list(data.keys()))
+    record.values = MagicMock(return_value=list(data.values()))
+    record.__getitem__ = lambda self, key: data[key]
+    return record
+
+
+def create_executor(row_count: int) -> tuple[SQLExecutor, MagicMock]:
+    """Create an executor whose queries each return ``row_count`` rows.
+
+    Returns:
+        tuple: (executor, pool mock).
+    """
+
+    async def open_cursor(sql: str) -> MagicMock:
+        rows = iter(create_record({"id": i, "label": f"row {i}"}) for i in range(row_count))
+
+        async def fetch(n: int) -> list[MagicMock]:
+            return [row for _, row in zip(range(n), rows, strict=False)]
+
+        cursor = MagicMock()
+        cursor.fetch = AsyncMock(side_effect=fetch)
+        return cursor
+
+    transaction = MagicMock()
+    transaction.start = AsyncMock()
+    transaction.rollback = AsyncMock()
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.cursor = AsyncMock(side_effect=open_cursor)
+    conn.transaction = MagicMock(return_value=transaction)
+
+    pool = MagicMock()
+    pool.acquire = AsyncMock(return_value=conn)
+    pool.release = AsyncMock()
+    executor = SQLExecutor(pool, SecurityConfig(), DatabaseConfig(name="testdb"))
+    return executor, pool
+
+
+class TestResultPager:
+    """Test suite for ResultPager."""
+
+    @pytest.mark.asyncio
+    async def test_pages_through_result(self) -> None:
+        """Test that fetch_more returns the following pages until the last."""
+        executor, pool = create_executor(row_count=5)
+        pager = ResultPager(PagingConfig())
+
+        first = await pager.open_result(executor, "SELECT * FROM t", page_size=2)
+        assert [row["id"] for row in first.rows] == [0, 1]
+        assert first.cursor is not None
+        assert pager.get_stats()["open_cursors"] == 1
+
+        second = await pager.fetch_more(first.cursor)
+        last = await pager.fetch_more(second.cursor)
+
+        assert second.cursor == first.cursor
+        assert [row["id"] for row in second.rows] == [2, 3]
+        assert [row["id"] for row in last.rows] == [4]
+        assert last.cursor is None
+        assert last.truncated is False
+        # The query ran once; its connection went back after the last page
+        assert pool.acquire.await_count == 1
+        pool.release.assert_awaited_once()
+        assert pager.get_stats()["open_cursors"] == 0
+
+        with pytest.raises(CursorNotFoundError):
+            await pager.fetch_more(first.cursor)
+
+    @pytest.mark.asyncio
+    async def test_single_page_result_holds_no_cursor(self) -> None:
+        """Test that a result that fits one page is closed at once."""
+        executor, pool = create_executor(row_count=3)
+        pager = ResultPager(PagingConfig())
+
+        page = await pager.open_result(executor, "SELECT * FROM t", page_size=3)
+
+        assert page.row_count == 3
+        assert page.cursor is None
+        pool.release.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_columnar_pages(self) -> None:
+        """Test that every page keeps the result format of the query."""
+        executor, _ = create_executor(row_count=3)
+        pager = ResultPager(PagingConfig())
+
+        first = await pager.open_result(
+            executor, "SELECT * FROM t", page_size=2, result_format=ResultFormat.COLUMNAR
+        )
+        second = await pager.fetch_more(first.cursor)
+
+        assert first.column_values == [[0, 1], ["row 0", "row 1"]]
+        assert first.row_count == 2
+        assert second.column_values == [[2], ["row 2"]]
+        assert second.result_format == ResultFormat.COLUMNAR
+
+    @pytest.mark.asyncio
+    async def test_page_size_is_capped(self) -> None:
+        """Test that pages are no larger than max_page_size."""
+        executor, _ = create_executor(row_count=50)
+        pager = ResultPager(PagingConfig(max_page_size=10))
+
+        page = await pager.open_result(executor, "SELECT * FROM t", page_size=1000)
+
+        assert page.row_count == 10
+
+    @pytest.mark.asyncio
+    async def test_cursor_belongs_to_its_client(self) -> None:
+        """Test that another client cannot read a cursor."""
+        executor, _ = create_executor(row_count=5)
+        pager = ResultPager(PagingConfig())
+
+        first = await pager.open_result(executor, "SELECT * FROM t", 2, client_id="alice")
+
+        with pytest.raises(CursorNotFoundError):
+            await pager.fetch_more(first.cursor, client_id="bob")
+        assert (await pager.fetch_more(first.cursor, client_id="alice")).row_count == 2
+
+    @pytest.mark.asyncio
+    async def test_per_client_limit_closes_oldest_cursor(self) -> None:
+        """Test that a client over its limit loses its least recently used cursor."""
+        executor, pool = create_executor(row_count=10)
+        pager = ResultPager(PagingConfig(max_cursors_per_client=2))
+
+        first = await pager.open_result(executor, "SELECT 1", 2, client_id="alice")
+        second = await pager.open_result(executor, "SELECT 2", 2, client_id="alice")
+        other = await pager.open_result(executor, "SELECT 3", 2, client_id="bob")
+        await pager.fetch_more(first.cursor, client_id="alice")  # Now the most recent
+        await pager.open_result(executor, "SELECT 4", 2, client_id="alice")
+
+        with pytest.raises(CursorNotFoundError):
+            await pager.fetch_more(second.cursor, client_id="alice")
+        assert (await pager.fetch_more(first.cursor, client_id="alice")).row_count == 2
+        assert (await pager.fetch_more(other.cursor, client_id="bob")).row_count == 2
+        assert pager.get_stats()["evicted"] == 1
+        assert pool.release.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_open_cursors_are_bounded(self) -> None:
+        """Test that no more than max_open_cursors cursors are held open."""
+        executor, pool = create_executor(row_count=10)
+        pager = ResultPager(PagingConfig(max_open_cursors=2, max_cursors_per_client=2))
+
+        pages = [
+            await pager.open_result(executor, "SELECT 1", 2, client_id=f"client{i}")
+            for i in range(3)
+        ]
+
+        assert pager.get_stats()["open_cursors"] == 2
+        assert pool.acquire.await_count - pool.release.await_count == 2
+        with pytest.raises(CursorNotFoundError):
+            await pager.fetch_more(pages[0].cursor, client_id="client0")
+
+    @pytest.mark.asyncio
+    async def test_unused_cursors_expire(self) -> None:
+        """Test that cursors unused for cursor_ttl seconds are closed."""
+        executor, pool = create_executor(row_count=10)
+        pager = ResultPager(PagingConfig(cursor_ttl=60))
+
+        with patch("pg_mcp.services.result_pager.time.monotonic", return_value=1000.0):
+            page = await pager.open_result(executor, "SELECT 1", 2)
+        with patch("pg_mcp.services.result_pager.time.monotonic", return_value=1061.0):
+            assert await pager.evict_expired() == 1
+
+        pool.release.assert_awaited_once()
+        with pytest.raises(CursorNotFoundError):
+            await pager.fetch_more(page.cursor)
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_closes_cursor(self) -> None:
+        """Test that a cursor is closed when reading a page fails."""
+        executor, pool = create_executor(row_count=10)
+        pager = ResultPager(PagingConfig())
+        page = await pager.open_result(executor, "SELECT 1", 2)
+        held = pager._cursors[page.cursor]
+        held.cursor._cursor.fetch.side_effect = ConnectionError("connection lost")
+
+        with pytest.raises(ConnectionError):
+            await pager.fetch_more(page.cursor)
+
+        pool.release.assert_awaited_once()
+        assert pager.get_stats()["open_cursors"] == 0
+
+    @pytest.mark.asyncio
+    async def test_close_releases_all_cursors(self) -> None:
+        """Test that closing the pager closes every open cursor."""
+        executor, pool = create_executor(row_count=10)
+        pager = ResultPager(PagingConfig())
+        await pager.start_eviction()
+        for i in range(2):
+            await pager.open_result(executor, "SELECT 1", 2, client_id=f"client{i}")
+
+        await pager.close()
+
+        assert pool.release.await_count == 2
+        assert pager.get_stats()["open_cursors"] == 0
+
+    @pytest.mark.asyncio
+    async def test_open_failure_propagates(self) -> None:
+        """Test that a failing query raises and holds no cursor."""
+        executor, _ = create_executor(row_count=0)
+        executor.open_cursor = AsyncMock(side_effect=DatabaseError("Database query failed"))
+        pager = ResultPager(PagingConfig())
+
+        with pytest.raises(DatabaseError):
+            await pager.open_result(executor, "SELECT * FROM missing", 10)
+        assert pager.get_stats()["open_cursors"] == 0
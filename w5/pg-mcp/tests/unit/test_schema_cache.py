@@ -6,13 +6,17 @@ expiration, and auto-refresh capabilities.
 
 import asyncio
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
-from pg_mcp.cache.schema_cache import SchemaCache
-from pg_mcp.config.settings import CacheConfig
-from pg_mcp.models.schema import DatabaseSchema, TableInfo
+from pg_mcp.cache.compact import CompactSchema
+from pg_mcp.cache.schema_cache import SchemaCache, estimate_schema_bytes
+from pg_mcp.cache.snapshot import SchemaSnapshotStore
+from pg_mcp.config.settings import CacheConfig, PromptConfig
+from pg_mcp.models.schema import ColumnInfo, DatabaseSchema, RelationFingerprint, TableInfo
+from pg_mcp.prompts.schema_context import SchemaContextRenderer
 
 
 class TestSchemaCache:
@@ -185,6 +189,118 @@ class TestSchemaCache:
             assert new_age is not None
             assert new_age < 60  # Should be very recent
 
+    @pytest.mark.asyncio
+    async def test_refresh_is_incremental_when_fingerprints_known(
+        self,
+        cache: SchemaCache,
+        mock_pool: Mock,
+        sample_schema: DatabaseSchema,
+    ):
+        """Test that refresh patches the cached schema instead of reloading it."""
+        previous = {
+            1: RelationFingerprint(oid=1, schema_name="public", table_name="users", signature="a")
+        }
+        current = {
+            1: RelationFingerprint(oid=1, schema_name="public", table_name="users", signature="b")
+        }
+        cache._cache["test_db"] = sample_schema
+        cache._cache_timestamps["test_db"] = datetime.now(UTC) - timedelta(minutes=30)
+        cache._fingerprints["test_db"] = previous
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.introspect_changes.return_value = 1
+            mock_introspector.fingerprints = current
+            mock_introspector_class.return_value = mock_introspector
+
+            await cache.refresh("test_db", mock_pool)
+
+            mock_introspector.introspect.assert_not_called()
+            mock_introspector.introspect_changes.assert_awaited_once_with(sample_schema, previous)
+            assert cache._fingerprints["test_db"] is current
+            assert cache.get("test_db") is sample_schema
+            assert cache.get_cache_age("test_db") < 60
+
+    @pytest.mark.asyncio
+    async def test_refresh_of_cleared_entry_is_not_recorded(
+        self,
+        cache: SchemaCache,
+        mock_pool: Mock,
+        sample_schema: DatabaseSchema,
+    ):
+        """Test that a refresh finishing after its entry was cleared leaves no state behind."""
+        previous = {
+            1: RelationFingerprint(oid=1, schema_name="public", table_name="users", signature="a")
+        }
+        cache._cache["test_db"] = sample_schema
+        cache._cache_timestamps["test_db"] = datetime.now(UTC)
+        cache._fingerprints["test_db"] = previous
+
+        async def clear_during_refresh(schema, fingerprints):
+            cache.clear("test_db")
+            return 0
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.introspect_changes.side_effect = clear_during_refresh
+            mock_introspector.fingerprints = {}
+            mock_introspector_class.return_value = mock_introspector
+
+            await cache.refresh("test_db", mock_pool)
+
+        assert "test_db" not in cache._fingerprints
+        assert "test_db" not in cache._cache_timestamps
+        assert "test_db" not in cache._pools
+
+    @pytest.mark.asyncio
+    async def test_refresh_full_reload_when_incremental_disabled(
+        self,
+        mock_pool: Mock,
+        sample_schema: DatabaseSchema,
+    ):
+        """Test that refresh reloads in full when incremental refresh is disabled."""
+        cache = SchemaCache(CacheConfig(incremental_refresh=False))
+        cache._cache["test_db"] = sample_schema
+        cache._cache_timestamps["test_db"] = datetime.now(UTC)
+        cache._fingerprints["test_db"] = {
+            1: RelationFingerprint(oid=1, schema_name="public", table_name="users", signature="a")
+        }
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.introspect.return_value = sample_schema
+            mock_introspector.fingerprints = {}
+            mock_introspector_class.return_value = mock_introspector
+
+            await cache.refresh("test_db", mock_pool)
+
+            mock_introspector.introspect.assert_awaited_once()
+            mock_introspector.introspect_changes.assert_not_called()
+
+    def test_get_fingerprint_changes_with_relation_signatures(self, cache: SchemaCache):
+        """Test that the schema fingerprint follows the relation fingerprints."""
+        assert cache.get_fingerprint("test_db") is None
+
+        cache._fingerprints["test_db"] = {
+            1: RelationFingerprint(oid=1, schema_name="public", table_name="users", signature="a")
+        }
+        first = cache.get_fingerprint("test_db")
+        assert first is not None
+        assert cache.get_fingerprint("test_db") == first
+
+        # A refresh replaces the relation fingerprints
+        cache._fingerprints["test_db"] = {
+            1: RelationFingerprint(oid=1, schema_name="public", table_name="users", signature="a")
+        }
+        assert cache.get_fingerprint("test_db") == first
+        cache._fingerprints["test_db"] = {
+            1: RelationFingerprint(oid=1, schema_name="public", table_name="users", signature="b")
+        }
+        assert cache.get_fingerprint("test_db") != first
+
+        cache.clear("test_db")
+        assert cache.get_fingerprint("test_db") is None
+
     def test_clear_removes_specific_database(
         self, cache: SchemaCache, sample_schema: DatabaseSchema
     ):
@@ -356,3 +472,430 @@ class TestSchemaCache:
             await cache.stop_auto_refresh()
 
             assert cache._stop_refresh is True
+
+
+class TestSchemaSnapshots:
+    """Test suite for on-disk schema snapshots and warm startup."""
+
+    @pytest.fixture
+    def sample_schema(self) -> DatabaseSchema:
+        """Create sample database schema for testing."""
+        return DatabaseSchema(
+            database_name="test_db",
+            tables=[
+                TableInfo(
+                    schema_name="public",
+                    table_name="users",
+                    columns=[
+                        ColumnInfo(name="id", data_type="integer", is_nullable=False),
+                    ],
+                    row_count_estimate=42,
+                )
+            ],
+            version="PostgreSQL 16.0",
+        )
+
+    @pytest.fixture
+    def fingerprints(self) -> dict[int, RelationFingerprint]:
+        """Create relation fingerprints for the sample schema."""
+        return {
+            16384: RelationFingerprint(
+                oid=16384, schema_name="public", table_name="users", signature="abc"
+            )
+        }
+
+    def test_snapshot_round_trip(
+        self,
+        tmp_path: Path,
+        sample_schema: DatabaseSchema,
+        fingerprints: dict[int, RelationFingerprint],
+    ):
+        """Test that a saved snapshot loads back identically."""
+        store = SchemaSnapshotStore(tmp_path)
+
+        store.save(sample_schema, fingerprints)
+        snapshot = store.load("test_db")
+
+        assert snapshot is not None
+        assert snapshot.schema == sample_schema
+        assert snapshot.fingerprints == fingerprints
+
+    def test_snapshot_missing_or_incompatible(
+        self,
+        tmp_path: Path,
+        sample_schema: DatabaseSchema,
+        fingerprints: dict[int, RelationFingerprint],
+    ):
+        """Test that missing, corrupt and old-format snapshots are ignored."""
+        store = SchemaSnapshotStore(tmp_path)
+        assert store.load("test_db") is None
+
+        path = store.save(sample_schema, fingerprints)
+        with patch("pg_mcp.cache.snapshot.SNAPSHOT_FORMAT_VERSION", 999):
+            assert store.load("test_db") is None
+
+        path.write_bytes(b"not gzip")
+        assert store.load("test_db") is None
+
+    @pytest.mark.asyncio
+    async def test_load_writes_snapshot_and_warm_start_serves_it(
+        self,
+        tmp_path: Path,
+        sample_schema: DatabaseSchema,
+        fingerprints: dict[int, RelationFingerprint],
+    ):
+        """Test that a new cache serves the snapshot and revalidates in background."""
+        config = CacheConfig(snapshot_dir=str(tmp_path))
+        mock_pool = MagicMock()
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            mock_introspector = AsyncMock()
+            mock_introspector.introspect.return_value = sample_schema
+            mock_introspector.introspect_changes.return_value = 0
+            mock_introspector.fingerprints = fingerprints
+            mock_introspector_class.return_value = mock_introspector
+
+            await SchemaCache(config).load("test_db", mock_pool)
+
+            restarted = SchemaCache(config)
+            schema = await restarted.warm_start("test_db", mock_pool)
+            await asyncio.gather(*restarted._background_tasks)
+
+            assert schema == sample_schema
+            assert restarted.get("test_db") is schema
+            mock_introspector.introspect.assert_awaited_once()
+            mock_introspector.introspect_changes.assert_awaited_once_with(schema, fingerprints)
+
+    @pytest.mark.asyncio
+    async def test_warm_start_without_snapshot(self, tmp_path: Path):
+        """Test that warm_start returns None when no snapshot exists."""
+        cache = SchemaCache(CacheConfig(snapshot_dir=str(tmp_path)))
+
+        assert await cache.warm_start("test_db", MagicMock()) is None
+        assert await SchemaCache(CacheConfig()).warm_start("test_db", MagicMock()) is None
+
+
+class TestSingleFlightAndStaleWhileRevalidate:
+    """Test suite for single-flight loading and stale-while-revalidate."""
+
+    @pytest.fixture
+    def sample_schema(self) -> DatabaseSchema:
+        """Create sample database schema for testing."""
+        return DatabaseSchema(database_name="test_db", tables=[], version="PostgreSQL 16.0")
+
+    @pytest.fixture
+    def mock_introspector(self, sample_schema: DatabaseSchema):
+        """Patch SchemaIntrospector with a slow introspection."""
+
+        async def slow_introspect() -> DatabaseSchema:
+            await asyncio.sleep(0.01)
+            return sample_schema
+
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            introspector = AsyncMock()
+            introspector.introspect.side_effect = slow_introspect
+            introspector.introspect_changes.return_value = 0
+            introspector.fingerprints = {
+                1: RelationFingerprint(
+                    oid=1, schema_name="public", table_name="users", signature="a"
+                )
+            }
+            mock_introspector_class.return_value = introspector
+            yield introspector
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_share_one_introspection(
+        self, mock_introspector: AsyncMock, sample_schema: DatabaseSchema
+    ):
+        """Test that concurrent misses coalesce into a single load."""
+        cache = SchemaCache(CacheConfig())
+
+        results = await asyncio.gather(*(cache.load("test_db", MagicMock()) for _ in range(10)))
+
+        assert all(result is sample_schema for result in results)
+        mock_introspector.introspect.assert_awaited_once()
+        stats = cache.get_stats()
+        assert stats["coalesced_loads"] == 9
+        assert stats["loads"] == 1
+        assert stats["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_shared_and_retried(self, mock_introspector: AsyncMock):
+        """Test that a failed load fails all waiters and is not cached."""
+        mock_introspector.introspect.side_effect = RuntimeError("connection lost")
+        cache = SchemaCache(CacheConfig())
+
+        results = await asyncio.gather(
+            *(cache.load("test_db", MagicMock()) for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert mock_introspector.introspect.await_count == 1
+        assert cache.get_stats()["inflight"] == 0
+
+        with pytest.raises(RuntimeError):
+            await cache.load("test_db", MagicMock())
+        assert mock_introspector.introspect.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_one_refresh_runs(
+        self, mock_introspector: AsyncMock, sample_schema: DatabaseSchema
+    ):
+        """Test that expired entries are served while a single refresh runs."""
+        cache = SchemaCache(CacheConfig(stale_while_revalidate=True))
+        await cache.load("test_db", MagicMock())
+        cache._cache_timestamps["test_db"] = datetime.now(UTC) - timedelta(hours=2)
+
+        results = [cache.get("test_db") for _ in range(5)]
+        await asyncio.gather(*cache._inflight.values())
+
+        assert all(result is sample_schema for result in results)
+        mock_introspector.introspect_changes.assert_awaited_once()
+        assert cache.get_cache_age("test_db") < 60
+        assert cache.get("test_db") is sample_schema
+        stats = cache.get_stats()
+        assert stats["stale_hits"] == 5
+        assert stats["hits"] == 1
+        assert stats["refreshes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_a_miss_without_stale_mode(self, mock_introspector: AsyncMock):
+        """Test that expired entries are evicted when stale serving is disabled."""
+        cache = SchemaCache(CacheConfig())
+        await cache.load("test_db", MagicMock())
+        cache._cache_timestamps["test_db"] = datetime.now(UTC) - timedelta(hours=2)
+
+        assert cache.get("test_db") is None
+        assert cache.get("test_db") is None
+        assert cache._inflight == {}
+        assert cache.get_stats()["misses"] == 2
+
+
+class TestBoundedCache:
+    """Test suite for LRU eviction by entry count and memory."""
+
+    @pytest.fixture
+    def sample_schema(self) -> DatabaseSchema:
+        """Create sample database schema for testing."""
+        return DatabaseSchema(database_name="test_db", tables=[], version="PostgreSQL 16.0")
+
+    @pytest.fixture(autouse=True)
+    def mock_introspector(self, sample_schema: DatabaseSchema):
+        """Patch SchemaIntrospector to return the sample schema."""
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            introspector = AsyncMock()
+            introspector.introspect.return_value = sample_schema
+            introspector.fingerprints = {}
+            mock_introspector_class.return_value = introspector
+            yield introspector
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_over_max_size(self):
+        """Test that the least recently used entry is evicted past max_size."""
+        cache = SchemaCache(CacheConfig(max_size=2))
+
+        await cache.load("db_a", MagicMock())
+        await cache.load("db_b", MagicMock())
+        assert cache.get("db_a") is not None  # db_b is now least recently used
+        await cache.load("db_c", MagicMock())
+
+        assert cache.get_cached_databases() == ["db_a", "db_c"]
+        assert cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_until_within_memory_budget(self):
+        """Test that entries are evicted once their combined weight exceeds the budget."""
+        cache = SchemaCache(CacheConfig(max_memory_mb=1), weigher=lambda _: 400 * 1024)
+
+        for name in ("db_a", "db_b", "db_c"):
+            await cache.load(name, MagicMock())
+
+        assert cache.get_cached_databases() == ["db_b", "db_c"]
+        assert cache.get_cache_bytes() == 800 * 1024
+        assert cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_oversize_schema_is_returned_but_not_cached(self, sample_schema: DatabaseSchema):
+        """Test that a schema larger than the whole budget is not cached."""
+        cache = SchemaCache(CacheConfig(max_memory_mb=1), weigher=lambda _: 2 * 1024 * 1024)
+
+        schema = await cache.load("huge_db", MagicMock())
+
+        assert schema is sample_schema
+        assert cache.get("huge_db") is None
+        assert cache.get_cache_bytes() == 0
+
+    @pytest.mark.asyncio
+    async def test_refresh_reweighs_only_changed_schemas(self, mock_introspector: AsyncMock):
+        """Test that a refresh that finds no changed relations does not weigh the schema."""
+        weigher = MagicMock(return_value=1024)
+        cache = SchemaCache(CacheConfig(max_memory_mb=1), weigher=weigher)
+        mock_introspector.fingerprints = {
+            1: RelationFingerprint(oid=1, schema_name="public", table_name="t", signature="a")
+        }
+        await cache.load("test_db", MagicMock())
+        assert weigher.call_count == 1
+
+        mock_introspector.introspect_changes.return_value = 0
+        await cache.refresh("test_db", MagicMock())
+        assert weigher.call_count == 1
+
+        mock_introspector.introspect_changes.return_value = 1
+        await cache.refresh("test_db", MagicMock())
+        assert weigher.call_count == 2
+
+    def test_estimate_schema_bytes_grows_with_tables(self, sample_schema: DatabaseSchema):
+        """Test that the size estimate reflects schema contents."""
+        larger = sample_schema.model_copy(
+            update={
+                "tables": [
+                    TableInfo(
+                        schema_name="public",
+                        table_name=f"table_{i}",
+                        columns=[ColumnInfo(name="id", data_type="integer", is_nullable=False)],
+                    )
+                    for i in range(10)
+                ]
+            }
+        )
+
+        assert estimate_schema_bytes(larger) > estimate_schema_bytes(sample_schema) > 0
+
+
+class TestCompactStorage:
+    """Test suite for caching schemas in compact form."""
+
+    @pytest.fixture
+    def sample_schema(self) -> DatabaseSchema:
+        """Create sample database schema for testing."""
+        return DatabaseSchema(
+            database_name="test_db",
+            tables=[
+                TableInfo(
+                    table_name=f"table_{i}",
+                    columns=[ColumnInfo(name="id", data_type="integer", is_nullable=False)],
+                )
+                for i in range(5)
+            ],
+        )
+
+    @pytest.fixture(autouse=True)
+    def mock_introspector(self, sample_schema: DatabaseSchema):
+        """Patch SchemaIntrospector to return the sample schema."""
+        with patch("pg_mcp.cache.schema_cache.SchemaIntrospector") as mock_introspector_class:
+            introspector = AsyncMock()
+            introspector.introspect.return_value = sample_schema
+            introspector.fingerprints = {
+                1: RelationFingerprint(
+                    oid=1, schema_name="public", table_name="table_0", signature="a"
+                )
+            }
+            mock_introspector_class.return_value = introspector
+            yield introspector
+
+    @pytest.mark.asyncio
+    async def test_entries_stored_compactly_and_materialized_on_get(
+        self, sample_schema: DatabaseSchema
+    ):
+        """Test that get returns models while the entry is held compactly."""
+        cache = SchemaCache(CacheConfig(compact_storage=True))
+
+        loaded = await cache.load("test_db", MagicMock())
+        stored = cache.get("test_db", materialize=False)
+
+        assert loaded is sample_schema
+        assert isinstance(stored, CompactSchema)
+        assert cache.get_cache_bytes() == estimate_schema_bytes(stored)
+        assert cache.get("test_db") == sample_schema
+
+    @pytest.mark.asyncio
+    async def test_incremental_refresh_recompacts_changed_schema(
+        self, mock_introspector: AsyncMock
+    ):
+        """Test that a patched schema replaces the compact entry."""
+        cache = SchemaCache(CacheConfig(compact_storage=True))
+        await cache.load("test_db", MagicMock())
+        before = cache.get("test_db", materialize=False)
+
+        async def patch_schema(schema: CompactSchema, previous: dict) -> int:
+            patched = schema.to_schema()
+            patched.tables = [*patched.tables, TableInfo(table_name="added")]
+            patched.revision += 1
+            mock_introspector.patched_schema = patched
+            return 1
+
+        mock_introspector.introspect_changes.side_effect = patch_schema
+        await cache.refresh("test_db", MagicMock())
+        after = cache.get("test_db", materialize=False)
+
+        assert isinstance(after, CompactSchema)
+        assert after is not before
+        assert [t.table_name for t in after.tables][-1] == "added"
+        assert after.revision == 1
+
+    @pytest.mark.asyncio
+    async def test_incremental_refresh_without_structural_change_patches_in_place(
+        self, mock_introspector: AsyncMock
+    ):
+        """Test that new row estimates reach the compact entry without materializing it."""
+        cache = SchemaCache(CacheConfig(compact_storage=True))
+        await cache.load("test_db", MagicMock())
+        before = cache.get("test_db", materialize=False)
+
+        async def update_estimates(schema: CompactSchema, previous: dict) -> int:
+            assert schema is before
+            schema.tables[2].row_count_estimate = 42
+            schema.revision += 1
+            return 0
+
+        mock_introspector.introspect_changes.side_effect = update_estimates
+        with patch.object(CompactSchema, "to_schema") as to_schema:
+            await cache.refresh("test_db", MagicMock())
+            to_schema.assert_not_called()
+        after = cache.get("test_db", materialize=False)
+
+        assert after is before
+        assert after.revision == 1
+        assert cache.get("test_db").tables[2].row_count_estimate == 42
+        assert cache.get("test_db").revision == 1
+
+    @pytest.mark.asyncio
+    async def test_materialized_schema_is_reused(self, mock_introspector: AsyncMock):
+        """Test that repeated gets reuse one materialized schema and its rendered sections."""
+        # Not referenced by the test, so only the cache can keep it alive
+        mock_introspector.introspect.return_value = DatabaseSchema(
+            database_name="test_db",
+            tables=[
+                TableInfo(
+                    table_name=f"table_{i}",
+                    columns=[ColumnInfo(name="id", data_type="integer", is_nullable=False)],
+                )
+                for i in range(5)
+            ],
+        )
+        cache = SchemaCache(CacheConfig(compact_storage=True))
+        await cache.load("test_db", MagicMock())
+        mock_introspector.introspect.return_value = None
+        renderer = SchemaContextRenderer(PromptConfig(schema_format="compact"))
+
+        for _ in range(3):
+            renderer.render(cache.get("test_db"))
+
+        assert cache.get("test_db") is cache.get("test_db")
+        stats = renderer.get_stats()
+        assert stats["context_hits"] == 2
+        assert stats["section_misses"] == 5
+
+        async def update_estimates(schema: CompactSchema, previous: dict) -> int:
+            schema.tables[2].row_count_estimate = 42
+            schema.revision += 1
+            return 0
+
+        mock_introspector.introspect_changes.side_effect = update_estimates
+        await cache.refresh("test_db", MagicMock())
+        renderer.render(cache.get("test_db"))
+
+        stats = renderer.get_stats()
+        assert stats["context_misses"] == 2
+        assert stats["section_misses"] == 6
+        assert stats["section_hits"] == 4
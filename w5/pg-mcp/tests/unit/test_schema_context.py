@@ -0,0 +1,274 @@
+"""Unit tests for schema context rendering.
+
+This module tests the compact DDL-like schema renderer and how it degrades
+detail to fit a token budget.
+"""
+
+import gc
+
+import pytest
+
+from pg_mcp.config.settings import PromptConfig
+from pg_mcp.models.schema import (
+    ColumnInfo,
+    DatabaseSchema,
+    EnumTypeInfo,
+    ForeignKeyInfo,
+    IndexInfo,
+    TableInfo,
+)
+from pg_mcp.prompts.schema_context import (
+    SchemaContextRenderer,
+    SchemaDetail,
+    estimate_tokens,
+    render_compact_context,
+    render_schema_context,
+    render_table_compact,
+)
+
+
+@pytest.fixture
+def orders_table() -> TableInfo:
+    """Create a table exercising every rendered detail."""
+    return TableInfo(
+        table_name="orders",
+        comment="Customer orders",
+        row_count_estimate=1200,
+        columns=[
+            ColumnInfo(name="id", data_type="integer", is_nullable=False, is_primary_key=True),
+            ColumnInfo(name="customer_id", data_type="bigint", is_nullable=False),
+            ColumnInfo(
+                name="status",
+                data_type="character varying(20)",
+                is_nullable=True,
+                default_value="'new'::character varying",
+                comment="Lifecycle state",
+            ),
+            ColumnInfo(name="tags", data_type="text[]", is_nullable=True, is_unique=True),
+        ],
+        foreign_keys=[
+            ForeignKeyInfo(
+                constraint_name="orders_customer_id_fkey",
+                column_name="customer_id",
+                referenced_table="customers",
+                referenced_column="id",
+            )
+        ],
+        indexes=[IndexInfo(name="orders_status_idx", columns=["status"])],
+    )
+
+
+@pytest.fixture
+def wide_schema(orders_table: TableInfo) -> DatabaseSchema:
+    """Create a schema with many tables after the orders table."""
+    filler = [
+        TableInfo(
+            table_name=f"table_{i:02d}",
+            comment="Filler table with a fairly long description",
+            columns=[
+                ColumnInfo(name=f"column_{j}", data_type="text", is_nullable=True) for j in range(6)
+            ],
+        )
+        for i in range(30)
+    ]
+    return DatabaseSchema(
+        database_name="shop",
+        version="PostgreSQL 16.1",
+        enum_types=[EnumTypeInfo(type_name="mood", values=["sad", "happy"])],
+        tables=[orders_table, *filler],
+    )
+
+
+@pytest.fixture
+def enum_schema() -> DatabaseSchema:
+    """Create a schema with many enum types, a quarter of them used by columns."""
+    return DatabaseSchema(
+        database_name="shop",
+        enum_types=[
+            EnumTypeInfo(type_name=f"enum_{i:03d}", values=[f"value_{j}" for j in range(20)])
+            for i in range(200)
+        ],
+        tables=[
+            TableInfo(
+                table_name=f"table_{i:02d}",
+                columns=[ColumnInfo(name="state", data_type=f"enum_{i * 4:03d}", is_nullable=True)],
+            )
+            for i in range(50)
+        ],
+    )
+
+
+class TestRenderTableCompact:
+    """Test suite for render_table_compact."""
+
+    def test_full_detail(self, orders_table: TableInfo) -> None:
+        """Test the DDL-like line at full detail."""
+        assert render_table_compact(orders_table) == (
+            "TABLE orders(id int PK, customer_id int8 NOT NULL REF customers.id, "
+            "status varchar(20) DEFAULT 'new'::character varying /* Lifecycle state */, "
+            "tags text[] UNIQUE) -- Customer orders; ~1,200 rows; btree idx(status)"
+        )
+
+    def test_detail_levels(self, orders_table: TableInfo) -> None:
+        """Test that each level drops one more kind of detail."""
+        no_indexes = render_table_compact(orders_table, SchemaDetail.NO_INDEXES)
+        no_defaults = render_table_compact(orders_table, SchemaDetail.NO_DEFAULTS)
+        no_comments = render_table_compact(orders_table, SchemaDetail.NO_COMMENTS)
+
+        assert "idx(" not in no_indexes and "rows" not in no_indexes
+        assert "DEFAULT" in no_indexes and "DEFAULT" not in no_defaults
+        assert "Lifecycle state" in no_defaults and "Lifecycle state" not in no_comments
+        assert no_comments.endswith("tags text[] UNIQUE)")
+
+
+class TestRenderCompactContext:
+    """Test suite for render_compact_context."""
+
+    def test_unlimited_budget_keeps_full_detail(self, wide_schema: DatabaseSchema) -> None:
+        """Test the header and table lines without a budget."""
+        lines = render_compact_context(wide_schema).splitlines()
+
+        assert lines[0] == "Database: shop (PostgreSQL 16.1)"
+        assert lines[1] == "Enums: mood('sad','happy')"
+        assert len(lines) == 2 + len(wide_schema.tables)
+
+    @pytest.mark.parametrize("schema_fixture", ["wide_schema", "enum_schema"])
+    @pytest.mark.parametrize("budget", [2000, 600, 300, 150, 60, 30])
+    def test_budget_is_never_exceeded(
+        self, request: pytest.FixtureRequest, schema_fixture: str, budget: int
+    ) -> None:
+        """Test that the rendered context fits budgets above the irreducible minimum."""
+        schema = request.getfixturevalue(schema_fixture)
+        context = render_compact_context(schema, token_budget=budget)
+
+        assert estimate_tokens(context) <= budget
+
+    def test_unused_enums_are_dropped_first(self, enum_schema: DatabaseSchema) -> None:
+        """Test that only the enums columns use are listed once over budget."""
+        context = render_compact_context(enum_schema, token_budget=4000)
+        enums = context.splitlines()[1]
+
+        assert "enum_004('value_0'" in enums
+        assert "enum_001" not in enums
+        assert "Other tables" not in context
+
+    def test_enums_are_reduced_to_names_before_collapsing_tables(
+        self, enum_schema: DatabaseSchema
+    ) -> None:
+        """Test that enum values and then enum names go before any table is collapsed."""
+        context = render_compact_context(enum_schema, token_budget=500)
+        lines = context.splitlines()
+
+        assert lines[1].startswith("Enums: enum_000, enum_004, ")
+        assert lines[1].endswith(" +8 more")
+        assert "value_0" not in context
+        assert "Other tables" not in context
+
+    def test_tiny_budget_keeps_header_and_table_count(self, wide_schema: DatabaseSchema) -> None:
+        """Test the minimal output when not even table names fit."""
+        context = render_compact_context(wide_schema, token_budget=5)
+
+        assert context.splitlines()[-1] == "Other tables: +31 more"
+
+    def test_collapses_lowest_priority_tables_first(self, wide_schema: DatabaseSchema) -> None:
+        """Test that tables at the end are collapsed to names after all levels."""
+        context = render_compact_context(wide_schema, token_budget=300)
+        lines = context.splitlines()
+
+        # The mood enum is unused, so its header line went first
+        assert lines[1].startswith("TABLE orders(")
+        assert "Lifecycle state" not in context
+        assert lines[-1].startswith("Other tables: ")
+        assert lines[-1].endswith("table_29")
+
+    def test_degrades_detail_before_collapsing(self, wide_schema: DatabaseSchema) -> None:
+        """Test that a budget just below full size only drops indexes."""
+        wide_schema.tables[1].columns[0].data_type = "mood"
+        full = render_compact_context(wide_schema)
+        context = render_compact_context(wide_schema, token_budget=estimate_tokens(full) - 1)
+
+        assert "idx(" not in context
+        assert "Lifecycle state" in context
+        assert "Other tables" not in context
+
+
+class TestRenderSchemaContext:
+    """Test suite for render_schema_context."""
+
+    def test_formats(self, wide_schema: DatabaseSchema) -> None:
+        """Test that the configured format is used."""
+        assert render_schema_context(wide_schema) == wide_schema.to_prompt_context()
+        assert render_schema_context(
+            wide_schema, PromptConfig(schema_format="compact")
+        ) == render_compact_context(wide_schema)
+
+        budgeted = render_schema_context(
+            wide_schema, PromptConfig(schema_format="compact", schema_token_budget=100)
+        )
+        assert estimate_tokens(budgeted) <= 100
+
+
+class TestSchemaContextRenderer:
+    """Test suite for the memoizing SchemaContextRenderer."""
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            PromptConfig(),
+            PromptConfig(schema_format="compact"),
+            PromptConfig(schema_format="compact", schema_token_budget=300),
+        ],
+    )
+    def test_output_matches_uncached_rendering(
+        self, wide_schema: DatabaseSchema, config: PromptConfig
+    ) -> None:
+        """Test that cached rendering is identical to rendering from scratch."""
+        renderer = SchemaContextRenderer(config)
+
+        first = renderer.render(wide_schema)
+        second = renderer.render(wide_schema)
+
+        assert first == second == render_schema_context(wide_schema, config)
+        assert renderer.get_stats()["context_hits"] == 1
+
+    def test_options_are_cached_separately(self, wide_schema: DatabaseSchema) -> None:
+        """Test that each rendering option set has its own cached context."""
+        renderer = SchemaContextRenderer()
+        compact = PromptConfig(schema_format="compact")
+
+        verbose_context = renderer.render(wide_schema)
+        compact_context = renderer.render(wide_schema, compact)
+
+        assert verbose_context == wide_schema.to_prompt_context()
+        assert compact_context == render_compact_context(wide_schema)
+        assert renderer.get_stats()["cached_contexts"] == 2
+
+    def test_refresh_rerenders_only_changed_tables(self, wide_schema: DatabaseSchema) -> None:
+        """Test that a patched schema only re-renders replaced or updated tables."""
+        renderer = SchemaContextRenderer()
+        renderer.render(wide_schema)
+        misses = renderer.get_stats()["section_misses"]
+
+        # Simulate an incremental refresh: one table replaced, one row estimate updated
+        replaced = wide_schema.tables[5].model_copy(update={"comment": "Changed"})
+        wide_schema.tables = [*wide_schema.tables[:5], replaced, *wide_schema.tables[6:]]
+        wide_schema.tables[0].row_count_estimate = 5000
+        wide_schema.revision += 1
+        context = renderer.render(wide_schema)
+
+        assert renderer.get_stats()["section_misses"] == misses + 2
+        assert context == wide_schema.to_prompt_context()
+        assert "Approximate rows: 5,000" in context
+
+    def test_entries_released_with_schema(self, wide_schema: DatabaseSchema) -> None:
+        """Test that cached entries do not keep schemas alive."""
+        renderer = SchemaContextRenderer()
+        schema = wide_schema.model_copy(deep=True)
+        renderer.render(schema)
+        assert renderer.get_stats()["cached_tables"] == len(schema.tables)
+
+        del schema
+        gc.collect()
+
+        assert renderer.get_stats()["cached_contexts"] == 0
+        assert renderer.get_stats()["cached_tables"] == 0
@@ -0,0 +1,126 @@
+"""Unit tests for relevance-based schema pruning.
+
+This module tests tokenization, BM25 ranking, foreign key expansion and the
+fallbacks to the full schema in SchemaRetriever.
+"""
+
+import pytest
+
+from pg_mcp.cache.compact import CompactSchema
+from pg_mcp.config.settings import SchemaRetrievalConfig
+from pg_mcp.models.schema import ColumnInfo, DatabaseSchema, ForeignKeyInfo, TableInfo
+from pg_mcp.services.schema_retriever import SchemaRetriever, tokenize
+
+
+def make_table(name: str, columns: list[str], references: list[str] | None = None) -> TableInfo:
+    """Create a table with integer columns and foreign keys to ``references``."""
+    return TableInfo(
+        table_name=name,
+        columns=[ColumnInfo(name=col, data_type="integer", is_nullable=True) for col in columns],
+        foreign_keys=[
+            ForeignKeyInfo(
+                constraint_name=f"{name}_{ref}_fkey",
+                column_name=f"{ref}_id",
+                referenced_table=ref,
+                referenced_column="id",
+            )
+            for ref in references or []
+        ],
+    )
+
+
+@pytest.fixture
+def shop_schema() -> DatabaseSchema:
+    """Create a shop schema padded with unrelated tables."""
+    tables = [
+        make_table("customers", ["id", "email", "full_name"]),
+        make_table("orders", ["id", "customer_id", "total_amount"], ["customers"]),
+        make_table(
+            "order_items", ["id", "order_id", "product_id", "quantity"], ["orders", "products"]
+        ),
+        make_table("products", ["id", "sku", "price", "category_id"], ["categories"]),
+        make_table("categories", ["id", "title"]),
+        make_table("warehouses", ["id", "city"]),
+    ]
+    tables += [make_table(f"audit_log_{i}", ["id", "payload", "logged_at"]) for i in range(20)]
+    return DatabaseSchema(database_name="shop", tables=tables)
+
+
+class TestTokenize:
+    """Test suite for tokenize."""
+
+    def test_splits_identifiers_and_singularizes(self) -> None:
+        """Test identifier splitting, stopwords and plural stripping."""
+        assert tokenize("orderItems per_customer") == ["order", "item", "customer"]
+        assert tokenize("How many categories?") == ["category"]
+
+    def test_cjk_bigrams(self) -> None:
+        """Test that CJK runs are indexed as character bigrams."""
+        assert tokenize("订单数量") == ["订单", "单数", "数量"]
+
+
+class TestSchemaRetriever:
+    """Test suite for SchemaRetriever."""
+
+    def test_selects_relevant_tables_and_join_path(self, shop_schema: DatabaseSchema) -> None:
+        """Test that seeds are connected through junction and parent tables."""
+        retriever = SchemaRetriever(SchemaRetrievalConfig(enabled=True, top_k=2, fk_depth=0))
+
+        pruned = retriever.select("Which customers bought products?", shop_schema)
+
+        # Ranked tables come first, then order_items and orders connecting them
+        assert [t.table_name for t in pruned.tables][:2] == ["customers", "products"]
+        assert [t.table_name for t in pruned.tables][2:] == ["orders", "order_items"]
+        assert pruned.database_name == "shop"
+        assert len(shop_schema.tables) == 26
+
+    def test_follows_references_to_lookup_tables(self, shop_schema: DatabaseSchema) -> None:
+        """Test that tables referenced by selected tables are included."""
+        retriever = SchemaRetriever(SchemaRetrievalConfig(enabled=True, top_k=1, fk_depth=1))
+
+        pruned = retriever.select("Average product price", shop_schema)
+
+        assert [t.table_name for t in pruned.tables] == ["products", "categories"]
+
+    def test_falls_back_to_full_schema(self, shop_schema: DatabaseSchema) -> None:
+        """Test fallbacks: disabled (the default), small schema, and no lexical match."""
+        disabled = SchemaRetriever(SchemaRetrievalConfig())
+        small_schema_threshold = SchemaRetriever(SchemaRetrievalConfig(enabled=True, min_tables=50))
+        no_match = SchemaRetriever(SchemaRetrievalConfig(enabled=True))
+
+        assert disabled.select("products", shop_schema) is shop_schema
+        assert small_schema_threshold.select("products", shop_schema) is shop_schema
+        assert no_match.select("有多少用户", shop_schema) is shop_schema
+
+    def test_index_rebuilt_when_tables_replaced(self, shop_schema: DatabaseSchema) -> None:
+        """Test that the index and foreign key graph follow schema refreshes."""
+        retriever = SchemaRetriever(SchemaRetrievalConfig(enabled=True, top_k=1, fk_depth=0))
+        assert retriever.select("warehouse city", shop_schema).tables[0].table_name == "warehouses"
+        _, index, graph = retriever._indexes["shop"]
+
+        retriever.select("warehouse city", shop_schema)
+        assert retriever._indexes["shop"][1] is index
+        assert retriever._indexes["shop"][2] is graph
+
+        shop_schema.tables = [*shop_schema.tables, make_table("depots", ["id", "city", "depot"])]
+        pruned = retriever.select("depot city", shop_schema)
+
+        assert retriever._indexes["shop"][1] is not index
+        assert retriever._indexes["shop"][2] is not graph
+        assert pruned.tables[0].table_name == "depots"
+
+    @pytest.mark.parametrize(
+        "question",
+        ["Which customers bought products?", "Average product price", "有多少用户"],
+    )
+    def test_compact_schema_selects_same_tables(
+        self, shop_schema: DatabaseSchema, question: str
+    ) -> None:
+        """Test that compact schemas are pruned like their pydantic form."""
+        retriever = SchemaRetriever(SchemaRetrievalConfig(enabled=True, top_k=2))
+        compact = CompactSchema(shop_schema)
+
+        pruned = retriever.select(question, compact)
+
+        assert isinstance(pruned, DatabaseSchema)
+        assert pruned == retriever.select(question, shop_schema)
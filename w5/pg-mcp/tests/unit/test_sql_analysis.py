@@ -0,0 +1,79 @@
+"""Unit tests for SQLAnalysis.
+
+This module tests parsing SQL once into an analysis and the facts derived
+from its AST.
+"""
+
+from unittest.mock import patch
+
+import pytest
+import sqlglot
+
+from pg_mcp.models.errors import SQLParseError
+from pg_mcp.services.sql_analysis import SQLAnalysis, analyze_sql
+
+
+class TestAnalyzeSQL:
+    """Test suite for analyze_sql and SQLAnalysis."""
+
+    def test_single_statement(self) -> None:
+        """Test that a query is parsed into one statement."""
+        analysis = analyze_sql("SELECT * FROM users;")
+
+        assert analysis.sql == "SELECT * FROM users;"
+        assert len(analysis.statements) == 1
+        assert analysis.statement is analysis.statements[0]
+
+    def test_multiple_statements(self) -> None:
+        """Test that multiple statements are kept but have no single statement."""
+        analysis = analyze_sql("SELECT 1; SELECT 2")
+
+        assert len(analysis.statements) == 2
+        assert analysis.statement is None
+
+    @pytest.mark.parametrize("sql", ["", "   \n"])
+    def test_empty_sql(self, sql: str) -> None:
+        """Test that empty SQL is rejected."""
+        with pytest.raises(SQLParseError, match="cannot be empty"):
+            analyze_sql(sql)
+
+    def test_unparsable_sql(self) -> None:
+        """Test that SQL the parser rejects raises SQLParseError."""
+        with pytest.raises(SQLParseError, match="Failed to parse SQL"):
+            analyze_sql("SELECT * FROM WHERE")
+
+    def test_tables_columns_and_functions(self) -> None:
+        """Test the referenced tables, columns and functions."""
+        analysis = analyze_sql(
+            "SELECT u.name, COUNT(o.id), pg_sleep(1) FROM public.users u "
+            "JOIN Orders o ON o.user_id = u.id "
+            "WHERE u.id IN (SELECT user_id FROM payments) GROUP BY u.name"
+        )
+
+        assert analysis.tables == ["orders", "payments", "users"]
+        assert analysis.columns == ["o.id", "o.user_id", "u.id", "u.name", "user_id"]
+        assert analysis.functions == ["count", "pg_sleep"]
+
+    def test_normalized_ignores_formatting(self) -> None:
+        """Test that case, whitespace and comments do not change the normalized SQL."""
+        assert (
+            analyze_sql("SELECT a FROM t WHERE b = 1").normalized
+            == analyze_sql("select a\nfrom t /* filter */ where b = 1;").normalized
+        )
+
+    def test_derived_facts_do_not_parse_again(self) -> None:
+        """Test that the SQL is parsed once however many facts are read."""
+        with patch("pg_mcp.services.sql_analysis.sqlglot.parse", wraps=sqlglot.parse) as parse:
+            analysis = analyze_sql("SELECT id FROM users WHERE lower(name) = 'a'")
+            _ = analysis.normalized, analysis.tables, analysis.columns, analysis.functions
+
+        parse.assert_called_once()
+
+    def test_from_statement(self) -> None:
+        """Test that an analysis of a parsed statement gets its SQL from the AST."""
+        statement = sqlglot.parse_one("select id from users", read="postgres")
+
+        analysis = SQLAnalysis.from_statement(statement)
+
+        assert analysis.sql == "SELECT id FROM users"
+        assert analysis.statement is statement
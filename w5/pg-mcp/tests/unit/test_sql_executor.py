@@ -15,8 +15,10 @@ import asyncpg
 import pytest
 
 from pg_mcp.config.settings import DatabaseConfig, SecurityConfig
+from pg_mcp.db.pool import session_setup
 from pg_mcp.models.errors import DatabaseError, ExecutionTimeoutError
-from pg_mcp.services.sql_executor import SQLExecutor
+from pg_mcp.models.query import TruncationReason
+from pg_mcp.services.sql_executor import SQLExecutor, TruncationReport, _serialize_value
 
 
 def create_mock_record(data: dict[str, Any]) -> MagicMock:
@@ -351,6 +353,44 @@ class TestSQLExecutor:
         assert "invalid readonly_role" in str(exc_info.value.message).lower()
 
 
+class TestExplain:
+    """Test suite for planning queries without running them."""
+
+    @pytest.mark.asyncio
+    async def test_explain_returns_root_plan(
+        self, executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that explain runs EXPLAIN (FORMAT JSON) and returns the root node."""
+        mock_connection.fetchval = AsyncMock(
+            return_value='[{"Plan": {"Node Type": "Nested Loop", '
+            '"Total Cost": 150012500.5, "Plan Rows": 10000000000}}]'
+        )
+
+        plan = await executor.explain("SELECT * FROM a CROSS JOIN b")
+
+        assert plan["Total Cost"] == 150012500.5
+        assert plan["Plan Rows"] == 10000000000
+        mock_connection.fetchval.assert_awaited_once_with(
+            "EXPLAIN (FORMAT JSON) SELECT * FROM a CROSS JOIN b"
+        )
+        # Planned with the same session settings as queries
+        mock_connection.execute.assert_any_call("SET statement_timeout = 30000")
+
+    @pytest.mark.asyncio
+    async def test_explain_planning_error(
+        self, executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that planning errors are wrapped like query errors."""
+        pg_error = asyncpg.PostgresError('column "nme" does not exist')
+        pg_error.sqlstate = "42703"
+        mock_connection.fetchval = AsyncMock(side_effect=pg_error)
+
+        with pytest.raises(DatabaseError) as exc_info:
+            await executor.explain("SELECT nme FROM users")
+
+        assert exc_info.value.details["error_code"] == "42703"
+
+
 class TestResultSerialization:
     """Test suite for result serialization."""
 
@@ -562,6 +602,51 @@ class TestResultSerialization:
         assert serialized[0]["binary_data"] == "010203"
         assert serialized[0]["optional_field"] is None
 
+    def test_column_wise_matches_per_value(
+        self,
+        executor_for_serialization: SQLExecutor,
+    ) -> None:
+        """Test that column-wise conversion equals converting each value."""
+        tz = datetime.timezone(datetime.timedelta(hours=2))
+        rows = [
+            {
+                "id": i,
+                "created_at": datetime.datetime(2024, 1, 1, i, tzinfo=tz),
+                # NULL in the first row: the converter comes from a later row
+                "price": decimal.Decimal(i) / 3 if i else None,
+                "external_id": asyncpg.pgproto.pgproto.UUID(str(uuid.UUID(int=i))),
+                "tags": ["a", None, "b"],
+                # Arrays of one column may differ in dimensions
+                "amounts": [decimal.Decimal(i)] if i % 2 else [[decimal.Decimal(i), None]],
+                "location": asyncpg.Point(i, -i),
+                "payload": {"at": datetime.date(2024, 1, i + 1), "ids": [uuid.UUID(int=i)]},
+                "settings": '{"theme": "dark"}',
+                "data": bytes([i]),
+            }
+            for i in range(4)
+        ]
+        expected = [{key: _serialize_value(value) for key, value in row.items()} for row in rows]
+
+        serialized = executor_for_serialization._serialize_results(rows)
+
+        assert serialized == expected
+        assert serialized[1]["external_id"] == str(uuid.UUID(int=1))
+        assert serialized[2]["amounts"] == [[2.0, None]]
+        assert serialized[3]["location"] == [3.0, -3.0]
+
+    def test_json_compatible_columns_are_skipped(
+        self,
+        executor_for_serialization: SQLExecutor,
+    ) -> None:
+        """Test that rows of natively JSON-compatible values are left as they are."""
+        rows = [{"id": i, "name": f"user {i}", "active": True, "score": 0.5} for i in range(3)]
+        names = [row["name"] for row in rows]
+
+        serialized = executor_for_serialization._serialize_results(rows)
+
+        assert serialized is rows
+        assert all(row["name"] is name for row, name in zip(serialized, names, strict=True))
+
 
 class TestRowLimiting:
     """Test suite for row limiting functionality."""
@@ -614,3 +699,505 @@ class TestRowLimiting:
         # Assert
         assert count == 10
         assert len(results) == 10  # All results returned
+
+
+class TestArrayResults:
+    """Test suite for results returned as row or column arrays."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("columnar", [False, True])
+    async def test_execute_table(
+        self, executor: SQLExecutor, mock_connection: MagicMock, columnar: bool
+    ) -> None:
+        """Test that values are laid out by row or by column and serialized."""
+        mock_connection.fetch.return_value = [
+            create_mock_record({"id": 1, "price": decimal.Decimal("9.50")}),
+            create_mock_record({"id": 2, "price": None}),
+        ]
+
+        columns, data, count = await executor.execute_table(
+            "SELECT id, price FROM items", columnar=columnar
+        )
+
+        assert columns == ["id", "price"]
+        assert count == 2
+        if columnar:
+            assert data == [[1, 2], [9.5, None]]
+        else:
+            assert data == [[1, 9.5], [2, None]]
+
+    @pytest.mark.asyncio
+    async def test_execute_table_limits_rows(
+        self, executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that max_rows applies and the total count is reported."""
+        mock_connection.fetch.return_value = [create_mock_record({"id": i}) for i in range(5)]
+
+        columns, data, count = await executor.execute_table(
+            "SELECT id FROM t", max_rows=3, columnar=True
+        )
+
+        assert columns == ["id"]
+        assert data == [[0, 1, 2]]
+        assert count == 5
+
+    @pytest.mark.asyncio
+    async def test_execute_table_empty(
+        self, executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that an empty result has no columns and no values."""
+        mock_connection.fetch.return_value = []
+
+        assert await executor.execute_table("SELECT 1 WHERE false") == ([], [], 0)
+
+
+class TestByteBudget:
+    """Test suite for the result byte budget and per-value size cap."""
+
+    @pytest.fixture
+    def budget_executor(self, mock_pool: MagicMock, db_config: DatabaseConfig) -> SQLExecutor:
+        """Create an executor with a 1000-byte budget and 100-character values."""
+        return SQLExecutor(
+            pool=mock_pool,
+            security_config=SecurityConfig(max_result_bytes=1000, max_cell_bytes=100),
+            db_config=db_config,
+        )
+
+    @pytest.mark.asyncio
+    async def test_long_values_are_truncated(
+        self, budget_executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that text and binary values over the cap end in a marker."""
+        mock_connection.fetch.return_value = [
+            create_mock_record({"id": 1, "body": "x" * 250, "raw": b"\xab" * 80}),
+            create_mock_record({"id": 2, "body": "short", "raw": None}),
+        ]
+        report = TruncationReport()
+
+        results, count = await budget_executor.execute("SELECT * FROM docs", report=report)
+
+        assert count == 2
+        assert results[0]["body"] == "x" * 100 + "...[truncated 150 characters]"
+        assert results[0]["raw"] == "ab" * 50 + "...[truncated 60 characters]"
+        assert results[1] == {"id": 2, "body": "short", "raw": None}
+        assert report.truncated_values == 2
+        assert report.reason is None
+
+    @pytest.mark.asyncio
+    async def test_cap_counts_utf8_bytes(
+        self, budget_executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that multi-byte text is cut to the cap in bytes, on a character boundary."""
+        mock_connection.fetch.return_value = [
+            create_mock_record({"id": 1, "body": None}),
+            create_mock_record({"id": 2, "body": "\u6570\u636e" * 30}),  # 3 bytes each
+            create_mock_record({"id": 3, "body": "\U0001f600" * 26}),  # 4 bytes each
+            create_mock_record({"id": 4, "body": "\u00e9" * 50}),  # 100 bytes, fits
+        ]
+        report = TruncationReport()
+
+        results, _ = await budget_executor.execute("SELECT * FROM docs", report=report)
+
+        assert results[1]["body"] == "\u6570\u636e" * 16 + "\u6570...[truncated 27 characters]"
+        assert results[2]["body"] == "\U0001f600" * 25 + "...[truncated 1 characters]"
+        assert results[3]["body"] == "\u00e9" * 50
+        assert report.truncated_values == 2
+
+    @pytest.mark.asyncio
+    async def test_text_values_truncated_in_mixed_columns(
+        self, budget_executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that long text is truncated even if the column starts with other types."""
+        mock_connection.fetch.return_value = [
+            create_mock_record({"id": 1, "doc": {"kind": "object"}}),
+            create_mock_record({"id": 2, "doc": "z" * 150}),
+        ]
+
+        _, data, _ = await budget_executor.execute_table("SELECT * FROM docs", columnar=True)
+
+        assert data[1] == [{"kind": "object"}, "z" * 100 + "...[truncated 50 characters]"]
+
+    @pytest.mark.asyncio
+    async def test_rows_past_budget_are_dropped(
+        self, budget_executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that rows stop at the byte budget and the reason is reported."""
+        # Each row counts as 16 + 142 bytes: the value is cut to 100 characters and a marker
+        mock_connection.fetch.return_value = [
+            create_mock_record({"id": i, "body": "y" * 5000}) for i in range(20)
+        ]
+        report = TruncationReport()
+
+        columns, data, count = await budget_executor.execute_table(
+            "SELECT * FROM docs", columnar=True, report=report
+        )
+
+        assert columns == ["id", "body"]
+        assert data[0] == list(range(6))
+        assert count == 20
+        assert report.reason == TruncationReason.MAX_RESULT_BYTES
+        assert report.truncated_values == 6
+
+    @pytest.mark.asyncio
+    async def test_row_limit_is_reported(
+        self, budget_executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that a result within the budget but over max_rows reports max_rows."""
+        mock_connection.fetch.return_value = [create_mock_record({"id": i}) for i in range(5)]
+        report = TruncationReport()
+
+        results, count = await budget_executor.execute("SELECT id", max_rows=3, report=report)
+
+        assert len(results) == 3
+        assert count == 5
+        assert report.reason == TruncationReason.MAX_ROWS
+
+    @pytest.mark.asyncio
+    async def test_streaming_stops_at_budget(
+        self, mock_pool: MagicMock, mock_connection: MagicMock, db_config: DatabaseConfig
+    ) -> None:
+        """Test that no batch is fetched after the budget is exhausted."""
+        executor = SQLExecutor(
+            pool=mock_pool,
+            security_config=SecurityConfig(
+                stream_results=True, fetch_batch_size=4, max_result_bytes=1000
+            ),
+            db_config=db_config,
+        )
+        rows = iter(create_mock_record({"body": "z" * 198}) for _ in range(1000))
+
+        async def fetch(n: int) -> list[MagicMock]:
+            return [row for _, row in zip(range(n), rows, strict=False)]
+
+        cursor = MagicMock()
+        cursor.fetch = AsyncMock(side_effect=fetch)
+        mock_connection.cursor = AsyncMock(return_value=cursor)
+        report = TruncationReport()
+
+        results, count = await executor.execute("SELECT body FROM docs", report=report)
+
+        assert len(results) == 5  # 200 bytes per row
+        assert count == 8
+        assert cursor.fetch.await_count == 2
+        assert report.reason == TruncationReason.MAX_RESULT_BYTES
+
+    @pytest.mark.asyncio
+    async def test_limits_can_be_disabled(
+        self, mock_pool: MagicMock, mock_connection: MagicMock, db_config: DatabaseConfig
+    ) -> None:
+        """Test that zero disables the budget and the value cap."""
+        executor = SQLExecutor(
+            pool=mock_pool,
+            security_config=SecurityConfig(max_result_bytes=0, max_cell_bytes=0),
+            db_config=db_config,
+        )
+        mock_connection.fetch.return_value = [
+            create_mock_record({"body": "w" * 100_000}) for _ in range(200)
+        ]
+        report = TruncationReport()
+
+        results, count = await executor.execute("SELECT body FROM docs", report=report)
+
+        assert len(results) == count == 200
+        assert results[0]["body"] == "w" * 100_000
+        assert report.reason is None
+        assert report.truncated_values == 0
+
+
+def create_cursor_pool(row_count: int) -> tuple[MagicMock, MagicMock, AsyncMock]:
+    """Create a pool whose connection opens a cursor over ``row_count`` rows.
+
+    Returns:
+        tuple: (pool, connection, asyncpg cursor mock).
+    """
+    rows = iter(create_mock_record({"id": i, "name": f"n{i}"}) for i in range(row_count))
+
+    async def fetch(n: int) -> list[MagicMock]:
+        return [row for _, row in zip(range(n), rows, strict=False)]
+
+    cursor = MagicMock()
+    cursor.fetch = AsyncMock(side_effect=fetch)
+
+    transaction = MagicMock()
+    transaction.start = AsyncMock()
+    transaction.rollback = AsyncMock()
+
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.cursor = AsyncMock(return_value=cursor)
+    conn.transaction = MagicMock(return_value=transaction)
+
+    pool = MagicMock()
+    pool.acquire = AsyncMock(return_value=conn)
+    pool.release = AsyncMock()
+    return pool, conn, cursor
+
+
+class TestResultCursor:
+    """Test suite for results held open and read in pages."""
+
+    @pytest.mark.asyncio
+    async def test_pages_through_result(self, db_config: DatabaseConfig) -> None:
+        """Test that pages are read in order with one row of look-ahead."""
+        pool, conn, cursor = create_cursor_pool(row_count=5)
+        executor = SQLExecutor(pool, SecurityConfig(), db_config)
+
+        result = await executor.open_cursor("SELECT id, name FROM t")
+        first = await result.fetch(2)
+        assert result.has_more is True
+        columns, second = await result.fetch_table(2)
+        assert result.has_more is True
+        third = await result.fetch(2)
+
+        assert [row["id"] for row in first] == [0, 1]
+        assert columns == ["id", "name"]
+        assert second == [[2, "n2"], [3, "n3"]]
+        assert third == [{"id": 4, "name": "n4"}]
+        assert result.has_more is False
+        assert [c.args[0] for c in cursor.fetch.call_args_list] == [3, 2, 2]
+        conn.transaction.assert_called_once_with(readonly=True)
+        pool.release.assert_not_called()
+
+        await result.close()
+        pool.release.assert_awaited_once_with(conn)
+
+    @pytest.mark.asyncio
+    async def test_result_ends_at_max_rows(self, db_config: DatabaseConfig) -> None:
+        """Test that rows past max_rows are not returned and the reason is reported."""
+        pool, _, _ = create_cursor_pool(row_count=100)
+        executor = SQLExecutor(pool, SecurityConfig(), db_config)
+        report = TruncationReport()
+
+        result = await executor.open_cursor("SELECT id, name FROM t", max_rows=3)
+        await result.fetch(2)
+        last = await result.fetch(2, report=report)
+
+        assert [row["id"] for row in last] == [2]
+        assert result.has_more is False
+        assert report.reason == TruncationReason.MAX_ROWS
+
+    @pytest.mark.asyncio
+    async def test_byte_budget_shortens_pages(self, db_config: DatabaseConfig) -> None:
+        """Test that rows past the byte budget are left for the next page."""
+        pool, _, _ = create_cursor_pool(row_count=10)
+        executor = SQLExecutor(pool, SecurityConfig(max_result_bytes=60), db_config)
+
+        result = await executor.open_cursor("SELECT id, name FROM t")
+        page = await result.fetch(5)  # About 20 bytes per row
+
+        assert [row["id"] for row in page] == [0, 1, 2]
+        assert result.has_more is True
+        assert [row["id"] for row in await result.fetch(5)] == [3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_open_failure_releases_connection(self, db_config: DatabaseConfig) -> None:
+        """Test that a failing query returns the connection to the pool."""
+        pool, conn, _ = create_cursor_pool(row_count=0)
+        conn.cursor.side_effect = asyncpg.PostgresError("relation does not exist")
+        executor = SQLExecutor(pool, SecurityConfig(), db_config)
+
+        with pytest.raises(DatabaseError, match="Database query failed"):
+            await executor.open_cursor("SELECT * FROM missing")
+
+        pool.release.assert_awaited_once_with(conn)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_open_releases_connection(self, db_config: DatabaseConfig) -> None:
+        """Test that cancelling a request while the cursor opens returns the connection."""
+        pool, conn, _ = create_cursor_pool(row_count=0)
+        started = asyncio.Event()
+
+        async def slow_cursor(sql: str) -> MagicMock:
+            started.set()
+            await asyncio.sleep(10)
+            return MagicMock()
+
+        conn.cursor.side_effect = slow_cursor
+        executor = SQLExecutor(pool, SecurityConfig(), db_config)
+
+        task = asyncio.create_task(executor.open_cursor("SELECT * FROM slow"))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        pool.release.assert_awaited_once_with(conn)
+
+
+class TestStreamingExecution:
+    """Test suite for cursor-based streaming execution."""
+
+    @pytest.fixture
+    def streaming_executor(self, mock_pool: MagicMock, db_config: DatabaseConfig) -> SQLExecutor:
+        """Create an executor that streams results in batches of 4 rows."""
+        return SQLExecutor(
+            pool=mock_pool,
+            security_config=SecurityConfig(stream_results=True, fetch_batch_size=4),
+            db_config=db_config,
+        )
+
+    @staticmethod
+    def attach_cursor(mock_connection: MagicMock, row_count: int) -> AsyncMock:
+        """Attach a cursor over ``row_count`` rows to the connection."""
+        rows = iter(create_mock_record({"id": i}) for i in range(row_count))
+
+        async def fetch(n: int) -> list[MagicMock]:
+            return [row for _, row in zip(range(n), rows, strict=False)]
+
+        cursor = MagicMock()
+        cursor.fetch = AsyncMock(side_effect=fetch)
+        mock_connection.cursor = AsyncMock(return_value=cursor)
+        return cursor
+
+    @pytest.mark.asyncio
+    async def test_stops_reading_after_max_rows(
+        self, streaming_executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that only max_rows + 1 rows are read from a large result."""
+        cursor = self.attach_cursor(mock_connection, row_count=1_000_000)
+
+        results, count = await streaming_executor.execute("SELECT id FROM huge", max_rows=10)
+
+        assert [row["id"] for row in results] == list(range(10))
+        assert count == 11  # Truncated: one row past the limit was seen
+        assert [c.args[0] for c in cursor.fetch.call_args_list] == [4, 4, 3]
+        mock_connection.cursor.assert_awaited_once_with("SELECT id FROM huge")
+        mock_connection.fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_small_result_is_not_truncated(
+        self, streaming_executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that a result below the limit is read completely."""
+        cursor = self.attach_cursor(mock_connection, row_count=5)
+
+        results, count = await streaming_executor.execute("SELECT id FROM small", max_rows=10)
+
+        assert len(results) == count == 5
+        assert cursor.fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_flag_overrides_config(
+        self, streaming_executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that stream=False falls back to fetching the whole result."""
+        mock_connection.fetch.return_value = [create_mock_record({"id": 1})]
+
+        _, count = await streaming_executor.execute("SELECT 1", stream=False)
+
+        assert count == 1
+        mock_connection.fetch.assert_called_once_with("SELECT 1")
+
+    @pytest.mark.asyncio
+    async def test_streaming_timeout(
+        self, streaming_executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that a slow cursor fetch raises ExecutionTimeoutError."""
+        cursor = self.attach_cursor(mock_connection, row_count=100)
+
+        async def slow_fetch(n: int) -> list[MagicMock]:
+            await asyncio.sleep(10)
+            return []
+
+        cursor.fetch = slow_fetch
+
+        with pytest.raises(ExecutionTimeoutError):
+            await streaming_executor.execute("SELECT id FROM slow", timeout=0.1)
+
+
+class TestPoolSessionSetup:
+    """Test suite for per-connection session setup of pools."""
+
+    def test_server_settings(self, security_config: SecurityConfig) -> None:
+        """Test that settings are sent at connect time and no hooks are needed."""
+        setup = session_setup(security_config)
+
+        assert setup == {
+            "server_settings": {
+                "statement_timeout": "30000",
+                "search_path": "public",
+                "default_transaction_read_only": "on",
+            }
+        }
+
+    @pytest.mark.asyncio
+    async def test_role_set_on_connect_and_release(
+        self, security_config_with_role: SecurityConfig
+    ) -> None:
+        """Test that the role is set on new connections and restored on release."""
+        setup = session_setup(security_config_with_role)
+        conn = MagicMock()
+        conn.execute = AsyncMock()
+        conn.get_reset_query = MagicMock(return_value="RESET ALL;")
+
+        await setup["init"](conn)
+        await setup["reset"](conn)
+
+        assert [c.args[0] for c in conn.execute.call_args_list] == [
+            "SET ROLE readonly_user",
+            "RESET ALL;\nSET ROLE readonly_user;",
+        ]
+
+    def test_invalid_role_rejected(self) -> None:
+        """Test that unsafe role names are rejected before connecting."""
+        config = SecurityConfig(readonly_role="admin; DROP TABLE users;--")
+
+        with pytest.raises(DatabaseError, match="Invalid readonly_role"):
+            session_setup(config)
+
+
+class TestPreconfiguredSession:
+    """Test suite for executors on pools with per-connection session setup."""
+
+    @pytest.fixture
+    def preconfigured_executor(
+        self, mock_pool: MagicMock, security_config: SecurityConfig, db_config: DatabaseConfig
+    ) -> SQLExecutor:
+        """Create an executor whose pool sets up sessions."""
+        return SQLExecutor(
+            pool=mock_pool,
+            security_config=security_config,
+            db_config=db_config,
+            session_preconfigured=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_query_is_single_round_trip(
+        self, preconfigured_executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that no SET statements or transaction precede the query."""
+        mock_connection.fetch.return_value = [create_mock_record({"column": 1})]
+
+        results, count = await preconfigured_executor.execute("SELECT 1")
+
+        assert results == [{"column": 1}]
+        assert count == 1
+        mock_connection.fetch.assert_called_once_with("SELECT 1")
+        mock_connection.execute.assert_not_called()
+        mock_connection.transaction.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_non_default_timeout_is_set(
+        self, preconfigured_executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that only a timeout other than the configured one costs a SET."""
+        mock_connection.fetch.return_value = []
+
+        await preconfigured_executor.execute("SELECT 1", timeout=30.0)
+        mock_connection.execute.assert_not_called()
+
+        await preconfigured_executor.execute("SELECT 1", timeout=5.0)
+        mock_connection.execute.assert_called_once_with("SET statement_timeout = 5000")
+
+    @pytest.mark.asyncio
+    async def test_streaming_keeps_transaction(
+        self, preconfigured_executor: SQLExecutor, mock_connection: MagicMock
+    ) -> None:
+        """Test that cursors still run inside a read-only transaction."""
+        TestStreamingExecution.attach_cursor(mock_connection, row_count=3)
+
+        _, count = await preconfigured_executor.execute("SELECT id FROM t", stream=True)
+
+        assert count == 3
+        mock_connection.transaction.assert_called_once_with(readonly=True)
+        mock_connection.execute.assert_not_called()
@@ -9,7 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from pydantic import SecretStr
 
-from pg_mcp.config.settings import OpenAIConfig
+from pg_mcp.config.settings import OpenAIConfig, PromptConfig
 from pg_mcp.models.errors import LLMError, LLMTimeoutError, LLMUnavailableError
 from pg_mcp.models.schema import (
     ColumnInfo,
@@ -545,3 +545,22 @@ LIMIT 10;"""
 
             assert "OpenAI API request failed" in str(exc_info.value)
             assert exc_info.value.details["error"] == "Unknown error occurred"
+
+    @pytest.mark.asyncio
+    async def test_generate_uses_compact_schema_format(
+        self, config: OpenAIConfig, mock_schema: DatabaseSchema
+    ) -> None:
+        """Test that the compact schema format is used when configured."""
+        generator = SQLGenerator(config, PromptConfig(schema_format="compact"))
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="```sql\nSELECT 1;\n```"))]
+
+        with patch.object(
+            generator.client.chat.completions, "create", new=AsyncMock(return_value=mock_response)
+        ) as mock_create:
+            await generator.generate("Test query", mock_schema)
+
+            user_prompt = mock_create.call_args.kwargs["messages"][1]["content"]
+            assert "Database: test_db (15.0)" in user_prompt
+            assert "TABLE users(" in user_prompt
+            assert "PostgreSQL Version:" not in user_prompt
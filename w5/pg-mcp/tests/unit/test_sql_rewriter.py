@@ -0,0 +1,110 @@
+"""Unit tests for SQL rewriter.
+
+Tests cover:
+- LIMIT injection on plain queries, set operations and CTEs
+- Tightening and keeping existing LIMIT and FETCH FIRST clauses
+- Limits that cannot be compared with the cap
+- Statements that are not rewritten
+"""
+
+import pytest
+
+from pg_mcp.config.settings import SecurityConfig
+from pg_mcp.services.sql_analysis import analyze_sql
+from pg_mcp.services.sql_rewriter import SQLRewriter
+
+
+@pytest.fixture
+def rewriter() -> SQLRewriter:
+    """Create a rewriter with max_rows=10."""
+    return SQLRewriter(SecurityConfig(max_rows=10))
+
+
+class TestLimitPushdown:
+    """Test cases for pushing max_rows down as an outer LIMIT."""
+
+    @pytest.mark.parametrize(
+        ("sql", "expected"),
+        [
+            ("SELECT * FROM users", "SELECT * FROM users LIMIT 11"),
+            (
+                "SELECT name FROM users ORDER BY created_at DESC",
+                "SELECT name FROM users ORDER BY created_at DESC LIMIT 11",
+            ),
+            (
+                "SELECT id FROM a UNION SELECT id FROM b ORDER BY 1",
+                "SELECT id FROM a UNION SELECT id FROM b ORDER BY 1 LIMIT 11",
+            ),
+            (
+                "WITH recent AS (SELECT * FROM orders LIMIT 100) SELECT * FROM recent",
+                "WITH recent AS (SELECT * FROM orders LIMIT 100) SELECT * FROM recent LIMIT 11",
+            ),
+            (
+                "WITH RECURSIVE r(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM r) SELECT n FROM r",
+                "WITH RECURSIVE r(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM r) "
+                "SELECT n FROM r LIMIT 11",
+            ),
+        ],
+    )
+    def test_injects_limit(self, rewriter: SQLRewriter, sql: str, expected: str) -> None:
+        """Test that unlimited queries get an outer LIMIT max_rows + 1."""
+        assert rewriter.push_down_limit(sql) == expected
+
+    @pytest.mark.parametrize(
+        ("sql", "expected"),
+        [
+            ("SELECT * FROM users LIMIT 500", "SELECT * FROM users LIMIT 11"),
+            ("SELECT * FROM users LIMIT 500 OFFSET 20", "SELECT * FROM users LIMIT 11 OFFSET 20"),
+            ("SELECT * FROM users LIMIT ALL", "SELECT * FROM users LIMIT 11"),
+            ("SELECT * FROM users FETCH FIRST 50 ROWS ONLY", "SELECT * FROM users LIMIT 11"),
+        ],
+    )
+    def test_tightens_limit(self, rewriter: SQLRewriter, sql: str, expected: str) -> None:
+        """Test that limits above the cap are lowered to it."""
+        assert rewriter.push_down_limit(sql) == expected
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "SELECT * FROM users LIMIT 5",
+            "SELECT * FROM users LIMIT 11",
+            "SELECT * FROM users FETCH FIRST ROW ONLY",
+            "SELECT * FROM users FETCH FIRST 50 ROWS WITH TIES",
+            "SELECT * FROM users LIMIT 5 + 5",
+            "EXPLAIN SELECT * FROM users",
+            "SELECT * FROM",
+        ],
+    )
+    def test_keeps_sql(self, rewriter: SQLRewriter, sql: str) -> None:
+        """Test that fitting, undeterminable and non-query limits are left as written."""
+        assert rewriter.push_down_limit(sql) is sql
+
+    def test_max_rows_override(self, rewriter: SQLRewriter) -> None:
+        """Test that an explicit max_rows overrides the configured one."""
+        assert rewriter.push_down_limit("SELECT 1", max_rows=1) == "SELECT 1 LIMIT 2"
+
+    def test_disabled(self) -> None:
+        """Test that the rewrite can be turned off."""
+        rewriter = SQLRewriter(SecurityConfig(limit_pushdown=False))
+
+        assert rewriter.push_down_limit("SELECT * FROM users") == "SELECT * FROM users"
+
+
+class TestRewriteAnalysis:
+    """Test cases for rewriting an analyzed query."""
+
+    def test_rewrite_leaves_analysis_unchanged(self, rewriter: SQLRewriter) -> None:
+        """Test that the rewrite returns a new analysis and keeps the original AST."""
+        analysis = analyze_sql("SELECT * FROM users")
+
+        rewritten = rewriter.rewrite(analysis)
+
+        assert rewritten.sql == "SELECT * FROM users LIMIT 11"
+        assert rewritten.normalized == "SELECT * FROM users LIMIT 11"
+        assert analysis.normalized == "SELECT * FROM users"
+
+    def test_rewrite_keeps_fitting_query(self, rewriter: SQLRewriter) -> None:
+        """Test that a query that needs no rewrite keeps its analysis."""
+        analysis = analyze_sql("SELECT * FROM users LIMIT 5")
+
+        assert rewriter.rewrite(analysis) is analysis
@@ -7,13 +7,18 @@ Tests cover:
 - Sensitive resource protection
 - Multi-statement detection
 - Edge cases and malformed SQL
+- Collecting all violations in a single pass
+- Caching verdicts by SQL fingerprint
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from pg_mcp.config.settings import SecurityConfig
 from pg_mcp.models.errors import SecurityViolationError, SQLParseError
-from pg_mcp.services.sql_validator import SQLValidator
+from pg_mcp.services.sql_analysis import analyze_sql
+from pg_mcp.services.sql_validator import SQLValidator, sql_fingerprint
 
 
 class TestValidStatements:
@@ -659,3 +664,151 @@ class TestSubqueryWithForbiddenOperations:
         is_valid, error = validator.validate(sql)
         assert is_valid
         assert error is None
+
+
+class TestSinglePassChecks:
+    """Test that all violations are collected in one walk over the AST."""
+
+    @pytest.fixture
+    def validator(self) -> SQLValidator:
+        """Create validator with blocked tables and columns."""
+        return SQLValidator(
+            config=SecurityConfig(),
+            blocked_tables=["secrets"],
+            blocked_columns=["password"],
+        )
+
+    def test_all_violations_reported(self, validator: SQLValidator) -> None:
+        """Test that the error names the first violation and details list all of them."""
+        sql = """
+            SELECT password, pg_sleep(1)
+            FROM users
+            WHERE id IN (SELECT user_id FROM secrets)
+        """
+        with pytest.raises(SecurityViolationError) as exc_info:
+            validator.validate_or_raise(sql)
+
+        # Reported in check order: functions, tables, columns
+        assert exc_info.value.message == "Function 'pg_sleep' is blocked for security reasons"
+        assert exc_info.value.details["violations"] == [
+            "Function 'pg_sleep' is blocked for security reasons",
+            "Access to table 'secrets' is not allowed",
+            "Access to column 'password' is not allowed",
+        ]
+
+    def test_safe_statement_has_no_violations(self, validator: SQLValidator) -> None:
+        """Test that a safe statement yields no violations."""
+        statement = analyze_sql("SELECT name, count(*) FROM users GROUP BY name").statement
+        assert statement is not None
+
+        assert validator.find_violations(statement) == []
+
+    def test_checks_without_blocked_names_are_skipped(self) -> None:
+        """Test that table and column checks are off when nothing is blocked."""
+        validator = SQLValidator(config=SecurityConfig())
+        statement = analyze_sql("SELECT password FROM secrets").statement
+        assert statement is not None
+
+        assert validator.find_violations(statement) == []
+
+
+class TestVerdictCache:
+    """Test caching validation verdicts by SQL fingerprint."""
+
+    @pytest.fixture
+    def validator(self) -> SQLValidator:
+        """Create validator with a small verdict cache."""
+        return SQLValidator(config=SecurityConfig(validation_cache_size=2))
+
+    def test_valid_sql_is_checked_once(self, validator: SQLValidator) -> None:
+        """Test that repeated and whitespace-variant SQL is served from the cache."""
+        validator.validate_or_raise("SELECT id, name FROM users WHERE status = 'active'")
+        with patch("pg_mcp.services.sql_validator.analyze_sql") as analyze:
+            validator.validate_or_raise("SELECT id, name FROM users WHERE status = 'active'")
+            validator.validate_or_raise(
+                "  SELECT id,\n       name\n  FROM users\n WHERE status = 'active'\n"
+            )
+
+        analyze.assert_not_called()
+        assert validator.get_stats()["hits"] == 2
+        assert validator.get_stats()["misses"] == 1
+        assert validator.get_stats()["hit_rate"] == pytest.approx(2 / 3)
+
+    def test_rejection_is_cached(self, validator: SQLValidator) -> None:
+        """Test that a cached rejection raises the same error again."""
+        sql = "SELECT pg_sleep(10)"
+        with pytest.raises(SecurityViolationError) as first:
+            validator.validate_or_raise(sql)
+        with pytest.raises(SecurityViolationError) as second:
+            validator.validate_or_raise(sql)
+
+        assert second.value is not first.value
+        assert second.value.message == first.value.message
+        assert second.value.details == first.value.details
+        assert validator.get_stats()["hits"] == 1
+
+    def test_parse_error_is_cached(self, validator: SQLValidator) -> None:
+        """Test that SQL that cannot be parsed is rejected from the cache."""
+        for _ in range(2):
+            with pytest.raises(SQLParseError):
+                validator.validate_or_raise("SELECT * FROM WHERE")
+
+        assert validator.get_stats()["hits"] == 1
+
+    def test_whitespace_in_literals_and_comments_matters(self, validator: SQLValidator) -> None:
+        """Test that folding whitespace cannot turn a comment into code."""
+        validator.validate_or_raise("SELECT 1 -- ; DELETE FROM users")
+
+        with pytest.raises(SecurityViolationError, match="Multiple statements"):
+            validator.validate_or_raise("SELECT 1 --\n; DELETE FROM users")
+
+    def test_configuration_change_clears_cache(self, validator: SQLValidator) -> None:
+        """Test that verdicts are not reused after the blocked names change."""
+        validator.validate_or_raise("SELECT * FROM secrets")
+
+        validator.blocked_tables.add("secrets")
+
+        with pytest.raises(SecurityViolationError, match="secrets"):
+            validator.validate_or_raise("SELECT * FROM secrets")
+
+    def test_cache_size_is_bounded(self, validator: SQLValidator) -> None:
+        """Test that the least recently used verdict is evicted."""
+        for sql in ("SELECT 1", "SELECT 2", "SELECT 1", "SELECT 3", "SELECT 2"):
+            validator.validate_or_raise(sql)
+
+        assert validator.get_stats()["cached_verdicts"] == 2
+        assert validator.get_stats()["misses"] == 4
+
+    def test_cache_can_be_disabled(self) -> None:
+        """Test that a cache size of 0 validates every time."""
+        validator = SQLValidator(config=SecurityConfig(validation_cache_size=0))
+
+        validator.validate_or_raise("SELECT 1")
+        validator.validate_or_raise("SELECT 1")
+
+        assert validator.get_stats()["hits"] == 0
+        assert validator.get_stats()["cached_verdicts"] == 0
+
+
+class TestSQLFingerprint:
+    """Test SQL fingerprints for the verdict cache."""
+
+    def test_whitespace_is_folded(self) -> None:
+        """Test that whitespace between tokens does not change the fingerprint."""
+        assert sql_fingerprint("SELECT a\n  FROM t\tWHERE b = 1 ") == sql_fingerprint(
+            "SELECT a FROM t WHERE b = 1"
+        )
+
+    @pytest.mark.parametrize(
+        ("sql", "variant"),
+        [
+            ("SELECT 'a  b'", "SELECT 'a b'"),
+            ('SELECT "a  b" FROM t', 'SELECT "a b" FROM t'),
+            ("SELECT 1 -- x\nFROM t", "SELECT 1 -- x FROM t"),
+            ("SELECT $$a  b$$", "SELECT $$a b$$"),
+            ("SELECT 1 /* a */  FROM t", "SELECT 1 /* a */ FROM t"),
+        ],
+    )
+    def test_quoted_text_and_comments_are_kept(self, sql: str, variant: str) -> None:
+        """Test that whitespace that can be significant is not folded."""
+        assert sql_fingerprint(sql) != sql_fingerprint(variant)